@@ -9,6 +9,7 @@ from threading import Event
 from time import sleep
 
 from app.scripts.config import loader as config_loader
+from app.scripts.core.exporter import TimeRange
 from app.scripts.core.logging_setup import init_logging
 from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
 
@@ -24,6 +25,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument("--config", required=True, help="Path to ApplicationConfig.xml")
     p.add_argument("--duration", type=int, default=10, help="Run seconds (MVP demo)")
     p.add_argument("--log-level", default="INFO", help="Logging level")
+    p.add_argument(
+        "--export-dir",
+        default=None,
+        help="Export buffered results here on exit (format: Export@default_format)",
+    )
     return p
 
 
@@ -39,9 +45,35 @@ def main(argv: list[str] | None = None) -> int:
     orch = Orchestrator(
         OrchestratorConfig(
             camera_ids=[c.id for c in config.cameras],
+            camera_sources={c.id: c.url for c in config.cameras},
             target_fps=config.inference.target_fps,
             worker_latency_ms=2.0,
             aggregator_capacity=config.buffer.results_max_entries,
+            export_format=config.export.default_format,
+            spill_dir=config.spill.dir if config.spill.enabled else None,
+            spill_segment_records=config.spill.segment_records,
+            spill_partition_sec=config.spill.partition_sec,
+            spill_max_mb_per_camera=config.spill.max_mb_per_camera,
+            spill_max_age_sec=config.spill.max_age_sec,
+            result_batch_max_records=config.buffer.result_batch_records,
+            result_batch_max_delay_ms=config.buffer.result_batch_max_delay_ms,
+            pacing_policy=config.inference.pacing,
+            frame_prefetch=config.buffer.frame_prefetch,
+            frame_ring_slots=config.buffer.frame_ring_slots,
+            aggregator_storage=config.buffer.results_storage,
+            inference_backend=config.inference.backend,
+            inference_batch_size=config.inference.batch_size,
+            keypoint_mode=config.inference.keypoints,
+            keypoint_filter=config.inference.keypoint_filter,
+            latency_p95_target_ms=(
+                config.perf.latency_p95_target_ms if config.perf.adaptive_skip else None
+            ),
+            min_fps=config.perf.min_fps,
+            max_restarts_per_camera=config.restart.max_restarts_per_camera,
+            restart_window_sec=config.restart.restart_window_sec,
+            restart_backoff_sec=config.restart.backoff_base_sec,
+            restart_backoff_max_sec=config.restart.backoff_max_sec,
+            standby_workers=config.restart.standby_workers,
         )
     )
     orch.start()
@@ -54,11 +86,14 @@ def main(argv: list[str] | None = None) -> int:
     while remaining > 0 and not _shutdown_event.is_set():
         sleep(1)
         remaining -= 1
-        # 簡易統計出力
-        snap = orch.aggregator.snapshot_stats()
-        if snap:
-            print("[STATS]", snap)
-
+        # 簡易統計出力 (dispatcher が公開したスナップショットをロックなしで参照)
+        snap = orch.aggregator.latest_snapshot()
+        if snap and snap.stats:
+            print("[STATS]", {cam: dict(entry) for cam, entry in snap.stats.items()})
+
+    if args.export_dir:
+        report = orch.export(TimeRange(), Path(args.export_dir)).result()
+        print("[EXPORT]", report.fmt, report.records, "records ->", report.dest)
     orch.stop()
     listener.stop()
     return 0
@@ -16,9 +16,19 @@ from __future__ import annotations
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from app.scripts.core.errors import ConfigValidationError
+from app.scripts.core.frame_source import DEFAULT_PREFETCH
+from app.scripts.core.inference import BACKEND_STUB, INFERENCE_BACKENDS
+from app.scripts.core.keypoint_filter import FILTER_NONE, KEYPOINT_FILTERS
+from app.scripts.core.keypoints import KEYPOINT_MODES, KEYPOINTS_OFF
+from app.scripts.core.pacing import PACING_POLICIES, PACING_SKIP
+from app.scripts.core.result_store import STORAGE_KINDS, STORAGE_OBJECT
+
+# Spill 要素の属性省略時の既定値
+_SPILL_SEGMENT_RECORDS = 65_536
+_SPILL_PARTITION_SEC = 3600
 
 # ------------------------------ dataclass 群 ------------------------------ #
 
@@ -38,8 +48,22 @@ class ModelConfig:
 
 @dataclass(frozen=True, slots=True)
 class InferenceConfig:
+    """推論設定。
+
+    pacing はフレーム開始期限に追い付かない場合の方針 (skip / catch_up, 属性省略時は skip)。
+    backend は推論バックエンド (stub / numpy_keypoint, 省略時 stub = 擬似レイテンシ)、
+    batch_size は infer_batch 1 回当たりのフレーム数 (省略時 1)。
+    keypoints は結果へのキーポイント同梱方式 (off / inline / shared, 省略時 off)。
+    keypoint_filter は同梱前のキーポイント平滑化 (none / one_euro, 省略時 none)。
+    """
+
     target_fps: int
     device: str
+    pacing: str = PACING_SKIP
+    backend: str = BACKEND_STUB
+    batch_size: int = 1
+    keypoints: str = KEYPOINTS_OFF
+    keypoint_filter: str = FILTER_NONE
 
 
 @dataclass(frozen=True, slots=True)
@@ -50,7 +74,22 @@ class RetryConfig:
 
 @dataclass(frozen=True, slots=True)
 class BufferConfig:
+    """結果バッファ設定。
+
+    result_batch_records / result_batch_max_delay_ms は worker→親 の結果バッチ
+    (ResultBatch) の最大件数と最大送出遅延。属性省略時は 1 (バッチなし) / 20ms。
+    frame_prefetch はフレーム入力 (FrameSource) の先読み件数 (0 = 先読みなし, 省略時 2)。
+    frame_ring_slots は録画 / プレビュー用の共有メモリフレームリングのスロット数
+    (0 = 無効, 省略時 0)。
+    results_storage は集約側の結果保持形式 (object / columnar, 省略時 object)。
+    """
+
     results_max_entries: int
+    result_batch_records: int = 1
+    result_batch_max_delay_ms: float = 20.0
+    frame_prefetch: int = DEFAULT_PREFETCH
+    frame_ring_slots: int = 0
+    results_storage: str = STORAGE_OBJECT
 
 
 @dataclass(frozen=True, slots=True)
@@ -64,10 +103,35 @@ class ExportConfig:
     default_format: str
 
 
+@dataclass(frozen=True, slots=True)
+class SpillConfig:
+    """リング押し出しレコードのディスク退避設定 (Spill 要素は省略可 = 無効)。
+
+    max_mb_per_camera / max_age_sec は 0 で無制限。
+    """
+
+    enabled: bool
+    dir: str
+    segment_records: int
+    partition_sec: int
+    max_mb_per_camera: int
+    max_age_sec: int
+
+
 @dataclass(frozen=True, slots=True)
 class RestartConfig:
+    """worker プロセスの自動再起動設定 (プロセスモード)。
+
+    backoff_base_sec は窓内で最初の再起動までの遅延 (再起動毎に 2 倍, 上限
+    backoff_max_sec)。属性省略時は 0.5 / 30.0。standby_workers はモデルをロード済みで
+    待機させる予備 worker プロセス数で、終了したカメラを遅延なしで引き継ぐ (省略時 0)。
+    """
+
     max_restarts_per_camera: int
     restart_window_sec: int
+    backoff_base_sec: float = 0.5
+    backoff_max_sec: float = 30.0
+    standby_workers: int = 0
 
 
 @dataclass(frozen=True, slots=True)
@@ -79,8 +143,16 @@ class HealthConfig:
 
 @dataclass(frozen=True, slots=True)
 class PerfConfig:
+    """性能目標。
+
+    adaptive_skip=True で worker の適応フレーム間引きを有効にし、処理レイテンシ p95 を
+    latency_p95_target_ms 以下に保つ (実効サンプリング率の下限 min_fps)。省略時は無効 / 1.0。
+    """
+
     latency_p95_target_ms: int
     drop_rate_warn: float
+    adaptive_skip: bool = False
+    min_fps: float = 1.0
 
 
 @dataclass(frozen=True, slots=True)
@@ -103,6 +175,7 @@ class Config:
     buffer: BufferConfig
     recording: RecordingConfig
     export: ExportConfig
+    spill: SpillConfig
     restart: RestartConfig
     health: HealthConfig
     perf: PerfConfig
@@ -169,6 +242,15 @@ def load(path: Path) -> Config:  # noqa: D401 - Google Docstring では単純な
     inference = InferenceConfig(
         target_fps=_int_attr(inf_elem, "target_fps", min_value=1),
         device=_req_attr(inf_elem, "device"),
+        pacing=_opt_choice_attr(inf_elem, "pacing", PACING_SKIP, PACING_POLICIES),
+        backend=_opt_choice_attr(inf_elem, "backend", BACKEND_STUB, INFERENCE_BACKENDS),
+        batch_size=_opt_int_attr(inf_elem, "batch_size", 1, min_value=1),
+        keypoints=_opt_choice_attr(
+            inf_elem, "keypoints", KEYPOINTS_OFF, KEYPOINT_MODES
+        ),
+        keypoint_filter=_opt_choice_attr(
+            inf_elem, "keypoint_filter", FILTER_NONE, KEYPOINT_FILTERS
+        ),
     )
 
     # Retry
@@ -184,6 +266,19 @@ def load(path: Path) -> Config:  # noqa: D401 - Google Docstring では単純な
     buffer_elem = _req(root, "Buffer")
     buffer = BufferConfig(
         results_max_entries=_int_attr(buffer_elem, "results_max_entries", min_value=1),
+        result_batch_records=_opt_int_attr(
+            buffer_elem, "result_batch_records", 1, min_value=1
+        ),
+        result_batch_max_delay_ms=_opt_float_attr(
+            buffer_elem, "result_batch_max_delay_ms", 20.0, min_value=0.0
+        ),
+        frame_prefetch=_opt_int_attr(
+            buffer_elem, "frame_prefetch", DEFAULT_PREFETCH, min_value=0
+        ),
+        frame_ring_slots=_opt_int_attr(buffer_elem, "frame_ring_slots", 0, min_value=0),
+        results_storage=_opt_choice_attr(
+            buffer_elem, "results_storage", STORAGE_OBJECT, STORAGE_KINDS
+        ),
     )
 
     # Recording
@@ -197,6 +292,33 @@ def load(path: Path) -> Config:  # noqa: D401 - Google Docstring では単純な
     exp_elem = _req(root, "Export")
     export = ExportConfig(default_format=_req_attr(exp_elem, "default_format"))
 
+    # Spill (任意要素)
+    spill_elem = root.find("Spill")
+    if spill_elem is None:
+        spill = SpillConfig(
+            enabled=False,
+            dir="results/spill",
+            segment_records=_SPILL_SEGMENT_RECORDS,
+            partition_sec=_SPILL_PARTITION_SEC,
+            max_mb_per_camera=0,
+            max_age_sec=0,
+        )
+    else:
+        spill = SpillConfig(
+            enabled=_bool_attr(spill_elem, "enabled"),
+            dir=_req_attr(spill_elem, "dir"),
+            segment_records=_opt_int_attr(
+                spill_elem, "segment_records", _SPILL_SEGMENT_RECORDS, min_value=1
+            ),
+            partition_sec=_opt_int_attr(
+                spill_elem, "partition_sec", _SPILL_PARTITION_SEC, min_value=1
+            ),
+            max_mb_per_camera=_opt_int_attr(
+                spill_elem, "max_mb_per_camera", 0, min_value=0
+            ),
+            max_age_sec=_opt_int_attr(spill_elem, "max_age_sec", 0, min_value=0),
+        )
+
     # Restart
     res_elem = _req(root, "Restart")
     restart = RestartConfig(
@@ -204,7 +326,18 @@ def load(path: Path) -> Config:  # noqa: D401 - Google Docstring では単純な
             res_elem, "max_restarts_per_camera", min_value=0
         ),
         restart_window_sec=_int_attr(res_elem, "restart_window_sec", min_value=1),
+        backoff_base_sec=_opt_float_attr(
+            res_elem, "backoff_base_sec", 0.5, min_value=0.0
+        ),
+        backoff_max_sec=_opt_float_attr(
+            res_elem, "backoff_max_sec", 30.0, min_value=0.0
+        ),
+        standby_workers=_opt_int_attr(res_elem, "standby_workers", 0, min_value=0),
     )
+    if restart.backoff_max_sec < restart.backoff_base_sec:
+        raise ConfigValidationError(
+            "Restart@backoff_max_sec は backoff_base_sec 以上である必要があります"
+        )
 
     # Health
     health_elem = _req(root, "Health")
@@ -223,6 +356,8 @@ def load(path: Path) -> Config:  # noqa: D401 - Google Docstring では単純な
         drop_rate_warn=_float_attr(
             perf_elem, "drop_rate_warn", min_value=0.0, max_value=1.0
         ),
+        adaptive_skip=_opt_bool_attr(perf_elem, "adaptive_skip", False),
+        min_fps=_opt_float_attr(perf_elem, "min_fps", 1.0, min_value=0.01),
     )
 
     # GUI
@@ -243,6 +378,7 @@ def load(path: Path) -> Config:  # noqa: D401 - Google Docstring では単純な
         buffer=buffer,
         recording=recording,
         export=export,
+        spill=spill,
         restart=restart,
         health=health,
         perf=perf,
@@ -276,6 +412,14 @@ def _int_attr(
     return val
 
 
+def _opt_int_attr(
+    elem, name: str, default: int, *, min_value: int | None = None
+) -> int:
+    if elem.get(name) is None:
+        return default
+    return _int_attr(elem, name, min_value=min_value)
+
+
 def _float_attr(
     elem, name: str, *, min_value: float | None = None, max_value: float | None = None
 ) -> float:
@@ -291,6 +435,23 @@ def _float_attr(
     return val
 
 
+def _opt_float_attr(
+    elem, name: str, default: float, *, min_value: float | None = None
+) -> float:
+    if elem.get(name) is None:
+        return default
+    return _float_attr(elem, name, min_value=min_value)
+
+
+def _opt_choice_attr(elem, name: str, default: str, choices: Tuple[str, ...]) -> str:
+    raw = elem.get(name)
+    if raw is None:
+        return default
+    if raw not in choices:
+        raise ConfigValidationError(f"属性 {name} は {choices} のいずれか: '{raw}'")
+    return raw
+
+
 def _bool_attr(elem, name: str) -> bool:
     raw = _req_attr(elem, name).lower()
     if raw in {"true", "1", "yes"}:
@@ -300,6 +461,12 @@ def _bool_attr(elem, name: str) -> bool:
     raise ConfigValidationError(f"属性 {name} は bool (true/false) である必要: '{raw}'")
 
 
+def _opt_bool_attr(elem, name: str, default: bool) -> bool:
+    if elem.get(name) is None:
+        return default
+    return _bool_attr(elem, name)
+
+
 __all__ = [
     "CameraConfig",
     "ModelConfig",
@@ -308,6 +475,7 @@ __all__ = [
     "BufferConfig",
     "RecordingConfig",
     "ExportConfig",
+    "SpillConfig",
     "RestartConfig",
     "HealthConfig",
     "PerfConfig",
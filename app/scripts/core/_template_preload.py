@@ -0,0 +1,16 @@
+"""forkserver の preload 専用モジュール (worker_template.worker_context が登録する)。
+
+import すると worker スタックを読み込み、テンプレート用のバックエンドを事前ロードする。
+副作用があるため他のモジュールから import しない。
+
+orchestrator も読み込む: fork された worker は起動時に親のメインモジュールを
+__mp_main__ として import し直し、メインモジュールは通常 orchestrator を import する
+(テンプレートで済ませておくと再起動から最初の結果までが約半分になる)。
+"""
+
+from __future__ import annotations
+
+from . import orchestrator, process_worker_entry  # noqa: F401  (import を済ませる)
+from .worker_template import preload_template_backends
+
+preload_template_backends()
@@ -4,88 +4,580 @@ Phase2 で以下の高度統計を追加済:
     - latency_p50_ms / latency_p95_ms (1秒窓レイテンシ分位点)
     - ema_fps (指数移動平均 FPS, alpha=0.2)
     - StatsMessage による fps / avg_latency_ms / drop_rate オーバーライド
+    - カメラ毎の増分窓状態 (_CameraWindow) により snapshot_stats は O(カメラ数)
+    - 分位点は固定メモリのストリーミングスケッチ (latency_sketch) から算出
+      (1s/10s/60s/5m 窓, p50/p95/p99/p999, カメラ横断マージ可)
+    - 結果保持ストアを選択可能 (object=ResultRecord 保持 / columnar=列指向省メモリ)
+    - thread_safe モード: 単一書込み (dispatcher) + 多読者 (GUI / metrics / export / CLI)
+    - tick 単位の統計キャッシュ (stats_refresh_sec 周期, EMA は 1 tick に 1 回だけ更新)
+    - export: CSV / JSONL / バイナリへのチャンク単位ストリーミング出力 (exporter 参照)
+    - ディスク階層 (spill): リングから押し出されたレコードを mmap セグメントへ退避し、
+      query / export はリングとディスクの両階層を透過的に参照 (spill_store 参照)
+      ディスク階層は追記のみのため、その最新時刻より古い遅着は破棄し件数を
+      spill_dropped (統計 / spill_dropped()) に数える
+    - ラベル集計: 1m/10m/1h 窓のラベル件数・平均信頼度・遷移回数を push 時に増分更新
+      (label_stats 参照, label_stats() で生レコードを走査せずに取得)
+    - フリート集計: per-camera 統計と同じ tick で合計 FPS / 全体分位点 / 悪化カメラ上位 K 件を
+      算出しスナップショットへ同梱 (fleet_stats 参照)。全体分位点のマージ結果は tick 前進時に
+      作り直し、tick 内の再計算ではカメラ分を差替える (O(再計算カメラ数 × バケット数))
 
 責務:
-    * カメラ毎リングバッファ保持 (最新優先 / capacity 超で古い順自動破棄)
-    * クエリ (since 指定)
+    * カメラ毎リングバッファ保持 (最新優先 / capacity 超で古い順自動破棄, result_store 参照)
+      spill 指定時は破棄せずディスク階層へ退避 (保持期間・容量は SpillStore の保持ポリシ)
+    * クエリ (時刻範囲 since/until の二分探索, limit / reverse / ラベル・信頼度フィルタ)
+    * 期間指定エクスポート (カメラ毎ファイル, カメラ並列)
     * スナップショット統計算出 (瞬間FPS, EMA FPS, 平均/分位レイテンシ, drop_rate, 最終更新時刻)
     * StatsMessage 適用 (worker 事前集計値優先統合)
 
-注意:
-    - 現時点でマルチスレッド排他は不要 (単一 dispatcher スレッド想定)。
-    - マルチプロセス化時は親プロセス専有アクセスを前提とし Lock を後付け可能。
+スレッド安全性 (thread_safe=True):
+    - 書込み (push_result / apply_stats_message / 統計計算) は _write_lock で直列化。
+      ロック取得者は通常 dispatcher のみのため実質無競合。
+    - 統計は publish() で不変 AggregatorSnapshot を生成し参照差替え (アトミック) で公開。
+      読者は latest_snapshot() でロックなしに参照する。
+    - query はリングの seqlock 方式楽観読出し。競合が続いた場合のみロックへフォールバック。
+    - thread_safe=False (既定) は従来通り単一スレッド専用でロックコストなし。
+
+統計キャッシュ:
+    tick = floor(now の epoch ns / stats_refresh_sec) とし、同一 tick 内の snapshot_stats /
+    publish は計算済みスナップショットを返す。呼出し元の数に関係なく計算は 1 tick 1 回で、
+    EMA FPS も 1 tick に 1 回だけ進む (決定的)。StatsMessage 適用時は該当カメラのみ
+    同一 tick の EMA 起点 (前 tick 終了時の値) から再計算する。tick 内に初めて結果が届いた
+    カメラも同様に該当カメラのみ計算して追加する。
+    stats_refresh_sec=0 (既定) は now そのものを tick とみなす (同一 now の呼出しのみ共有)。
 """
 
 from __future__ import annotations
 
+import threading
+from bisect import insort
 from collections import deque
-from dataclasses import dataclass
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Deque, Dict, Iterable, List, Optional
+from itertools import chain, groupby, islice
+from operator import attrgetter
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Any,
+    ContextManager,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from . import utils_time
-from .messages import StatsMessage
+from .exporter import (
+    DEFAULT_CHUNK_RECORDS,
+    DEFAULT_EXPORT_WORKERS,
+    ExportReport,
+    ResultExporter,
+    TimeRange,
+)
+from .fleet_stats import DEFAULT_FLEET_TOP_K, FleetSummary, summarize_fleet
+from .label_stats import LABEL_WINDOWS, LabelCounts, WindowedLabelStats
+from .latency_sketch import (
+    DEFAULT_QUANTILES,
+    LATENCY_WINDOWS,
+    LatencyHistogram,
+    WindowedLatencySketch,
+    quantile_key,
+)
+from .messages import ResultRecord, StatsMessage
+from .result_store import (
+    STORAGE_COLUMNAR,
+    STORAGE_KINDS,
+    STORAGE_OBJECT,
+    ColumnarResultRing,
+    LabelInterner,
+    ObjectResultRing,
+    ResultRing,
+)
+from .spill_store import CameraSpill, SpillStore
+
+# 統計窓の長さ (fps / avg_latency / 分位点で共通)
+_STATS_WINDOW = timedelta(seconds=1)
+# thread_safe モードの楽観読出し再試行回数 (超過でロック読出し)
+_OPTIMISTIC_READ_RETRIES = 4
+_camera_of = attrgetter("camera_id")
+
+
+@dataclass(slots=True)
+class _CameraWindow:
+    """カメラ毎の 1 秒窓増分状態。
+
+    push_result で追加・期限切れ除去を行い、snapshot_stats は保持済み集計値を
+    読むだけにする (バッファ全走査を排除)。
+
+    Attributes:
+        entries (Deque[Tuple[datetime, Optional[float]]]): 窓内 (時刻, latency) を時刻昇順で保持。
+        latency_sum (float): 窓内 latency 合計 (None 除外)。
+        latency_count (int): 窓内 latency 件数 (None 除外)。
+        last_ts (Optional[datetime]): 受信済み最大時刻キャッシュ。
+        sketch (WindowedLatencySketch): 多窓レイテンシ分布 (分位点用)。
+        labels (WindowedLabelStats): 多窓ラベル件数・信頼度・遷移回数。
+    """
+
+    entries: Deque[Tuple[datetime, Optional[float]]] = field(default_factory=deque)
+    latency_sum: float = 0.0
+    latency_count: int = 0
+    last_ts: Optional[datetime] = None
+    sketch: WindowedLatencySketch = field(default_factory=WindowedLatencySketch)
+    labels: WindowedLabelStats = field(default_factory=WindowedLabelStats)
+
+    def add(self, record: ResultRecord, capacity: int) -> None:
+        """レコードを窓へ追加し、最新時刻基準で期限切れを除去する。"""
+        ts, latency_ms = record.timestamp_utc, record.latency_ms
+        ts_sec = ts.timestamp()
+        self.labels.record(ts_sec, record.gesture_label, record.confidence)
+        entry = (ts, latency_ms)
+        if not self.entries or self.entries[-1][0] <= ts:
+            self.entries.append(entry)
+        else:
+            # 遅着 (時刻逆転) は稀なため挿入コスト O(窓長) を許容
+            insort(self.entries, entry, key=lambda e: e[0])
+        if latency_ms is not None:
+            self.latency_sum += latency_ms
+            self.latency_count += 1
+            self.sketch.record(ts_sec, latency_ms)
+        if self.last_ts is None or ts > self.last_ts:
+            self.last_ts = ts
+        self.expire(self.last_ts - _STATS_WINDOW)
+        # リングバッファから押し出されたレコードは窓にも残さない (従来の全走査と同値)
+        while len(self.entries) > capacity:
+            self._pop_oldest()
+
+    def add_many(self, records: Sequence[ResultRecord], capacity: int) -> None:
+        """同一カメラのレコード列を追加する (一括反映用)。
+
+        ラベル / 分位点スケッチは run 単位で更新し、期限切れと容量超過の除去は最後に 1 回
+        行う。時刻順に届く限り add を順に呼ぶのと同値 (遅着と容量超過が重なる場合のみ、
+        除去されるエントリが異なり得る)。
+        """
+        if not records:
+            return
+        stamps = [(r.timestamp_utc, r.timestamp_utc.timestamp()) for r in records]
+        self.labels.record_many(
+            [(s, r.gesture_label, r.confidence) for (_, s), r in zip(stamps, records)]
+        )
+        latencies = [
+            (s, r.latency_ms)
+            for (_, s), r in zip(stamps, records)
+            if r.latency_ms is not None
+        ]
+        self.sketch.record_many(latencies)
+        entries = self.entries
+        for (ts, _), r in zip(stamps, records):
+            if not entries or entries[-1][0] <= ts:
+                entries.append((ts, r.latency_ms))
+            else:
+                insort(entries, (ts, r.latency_ms), key=lambda e: e[0])
+        self.latency_sum += sum(v for _, v in latencies)
+        self.latency_count += len(latencies)
+        newest = max(ts for ts, _ in stamps)
+        if self.last_ts is None or newest > self.last_ts:
+            self.last_ts = newest
+        self.expire(self.last_ts - _STATS_WINDOW)
+        while len(entries) > capacity:
+            self._pop_oldest()
+
+    def expire(self, window_start: datetime) -> None:
+        """window_start 以前 (<=) のエントリを除去する。"""
+        entries = self.entries
+        while entries and entries[0][0] <= window_start:
+            self._pop_oldest()
+
+    def _pop_oldest(self) -> None:
+        _, latency_ms = self.entries.popleft()
+        if latency_ms is not None:
+            self.latency_count -= 1
+            self.latency_sum -= latency_ms
+        if self.latency_count == 0:
+            # 浮動小数の加減算誤差を窓が空になる度にリセット
+            self.latency_sum = 0.0
 
 
 @dataclass(frozen=True, slots=True)
-class ResultRecord:
-    """単一推論結果レコード。
+class AggregatorSnapshot:
+    """publish() が生成する不変の統計スナップショット。
 
     Attributes:
-        camera_id (str): カメラID。
-        timestamp_utc (datetime): 推論完了UTC時刻 (tz-aware)。
-        gesture_label (str): 予測ラベル。
-        confidence (float): 信頼度 0.0-1.0。
-        latency_ms (Optional[float]): 前処理+推論時間 (ms)。
+        seq (int): 公開連番 (1 始まり)。
+        taken_at (datetime): 統計計算の基準時刻 (now)。
+        stats (Mapping[str, Mapping[str, Any]]): snapshot_stats と同形式 (読取専用)。
+        fleet (FleetSummary): stats と同じ tick の全カメラ集計。
     """
 
-    camera_id: str
-    timestamp_utc: datetime
-    gesture_label: str
-    confidence: float
-    latency_ms: Optional[float]
+    seq: int
+    taken_at: datetime
+    stats: Mapping[str, Mapping[str, Any]]
+    fleet: FleetSummary
 
 
 class Aggregator:
     """結果集約と軽量統計計算を行うコンポーネント。
 
-    スレッド安全性: Phase1 では単一スレッド利用 (ResultDispatcherThread 内) 想定のため
-    ロック不要。将来マルチスレッド化する際は per-camera Lock もしくは RWLock 追加検討。
+    スレッド安全性: 既定 (thread_safe=False) は単一スレッド利用 (ResultDispatcherThread 内)
+    前提でロックなし。複数スレッドから参照する場合は thread_safe=True (モジュール docstring 参照)。
     """
 
-    def __init__(self, capacity: int) -> None:
+    def __init__(
+        self,
+        capacity: int,
+        latency_window: str = "1s",
+        storage: str = STORAGE_OBJECT,
+        thread_safe: bool = False,
+        stats_refresh_sec: float = 0.0,
+        spill: Optional[SpillStore] = None,
+        fleet_top_k: int = DEFAULT_FLEET_TOP_K,
+    ) -> None:
         if capacity <= 0:
             raise ValueError("capacity は正数である必要があります")
+        if latency_window not in LATENCY_WINDOWS:
+            raise ValueError(f"latency_window が不正: {latency_window}")
+        if storage not in STORAGE_KINDS:
+            raise ValueError(f"storage が不正: {storage} (有効: {STORAGE_KINDS})")
+        if stats_refresh_sec < 0:
+            raise ValueError("stats_refresh_sec は 0 以上である必要があります")
+        if fleet_top_k < 0:
+            raise ValueError("fleet_top_k は 0 以上である必要があります")
         self._capacity = capacity
-        self._buffers: Dict[str, Deque[ResultRecord]] = {}
+        self._storage = storage
+        # columnar ストア用ラベル ID 表 (全カメラ共有)
+        self._labels = LabelInterner()
+        # snapshot_stats の分位点に用いる窓
+        self._latency_window = latency_window
+        self._buffers: Dict[str, ResultRing] = {}
+        # リングから押し出されたレコードの退避先 (None なら従来通り破棄)
+        self._spill = spill
+        # 退避先の最新時刻より古く退避できなかった (破棄した) 件数 (カメラ毎)
+        self._spill_dropped: Dict[str, int] = {}
+        self._windows: Dict[str, _CameraWindow] = {}
+        # 直近の統計計算で用いた分位点窓ヒストグラム (フリート分位点のマージ元)
+        self._latency_hists: Dict[str, LatencyHistogram] = {}
+        # 公開中スナップショットの全カメラ分をマージしたヒストグラム (フリート分位点)
+        self._fleet_hist = LatencyHistogram()
+        self._fleet_top_k = fleet_top_k
         # StatsMessage オーバーライド保持
         self._stats_overrides: Dict[str, StatsMessage] = {}
-        # EMA FPS 保持
+        # EMA FPS 保持 (_ema_fps: 現 tick の値 / _ema_prev: 前 tick 終了時の値 = EMA 起点)
         self._ema_fps: Dict[str, float] = {}
+        self._ema_prev: Dict[str, float] = {}
         self._ema_alpha: float = 0.2
+        # 並行アクセス制御 (thread_safe=False ではロックなし)
+        self._thread_safe = thread_safe
+        self._write_lock: ContextManager[Any] = (
+            threading.Lock() if thread_safe else nullcontext()
+        )
+        self._published: Optional[AggregatorSnapshot] = None
+        self._publish_seq = 0
+        # tick キャッシュ状態 (_dirty: 現 tick 内に StatsMessage を受けた / 新規登録のカメラ)
+        self._refresh_ns = int(stats_refresh_sec * 1_000_000_000)
+        self._tick: Optional[int] = None
+        self._dirty: Set[str] = set()
+
+    @property
+    def thread_safe(self) -> bool:
+        return self._thread_safe
+
+    @property
+    def stats_refresh_sec(self) -> float:
+        return self._refresh_ns / 1_000_000_000
 
     # ------------------------------ 公開 API ------------------------------ #
     def push_result(self, record: ResultRecord) -> None:
         """結果を対応するカメラバッファへ追加する。
 
-        古いデータは deque(maxlen) により自動破棄される。
+        古いデータはリングバッファの上書きにより自動破棄される。
         """
-        buf = self._buffers.get(record.camera_id)
+        with self._write_lock:
+            buf, win = self._camera_state(record.camera_id)
+            if self._spill is not None and len(buf) == buf.capacity:
+                self._push_spilling(buf, record, self._spill)
+            else:
+                buf.append(record)
+            win.add(record, self._capacity)
+
+    def push_results(self, records: Iterable[ResultRecord]) -> None:
+        """複数結果をまとめて追加する (ResultBatch / dispatcher の 1 巡分)。
+
+        書込みロック取得は 1 回、カメラ状態の解決と統計窓の更新 (_CameraWindow.add_many) は
+        連続する同一カメラ分 (run) で 1 回にまとめる。それ以外は push_result を順に呼ぶのと
+        同値。
+        """
+        spill = self._spill
+        capacity = self._capacity
+        with self._write_lock:
+            for cam, group in groupby(records, key=_camera_of):
+                run = list(group)
+                buf, win = self._camera_state(cam)
+                for record in run:
+                    if spill is not None and len(buf) == buf.capacity:
+                        self._push_spilling(buf, record, spill)
+                    else:
+                        buf.append(record)
+                win.add_many(run, capacity)
+
+    def _camera_state(self, camera_id: str) -> Tuple[ResultRing, _CameraWindow]:
+        buf = self._buffers.get(camera_id)
         if buf is None:
-            buf = deque(maxlen=self._capacity)
-            self._buffers[record.camera_id] = buf
-        buf.append(record)
+            # 窓を先に登録 (読者が buffers 経由で参照する時点で窓が存在するように)
+            win = self._windows[camera_id] = _CameraWindow()
+            buf = self._new_ring(camera_id)
+            self._buffers[camera_id] = buf
+            # 現 tick のスナップショットにも新規カメラを含める
+            self._dirty.add(camera_id)
+            return buf, win
+        return buf, self._windows[camera_id]
 
-    def query(
-        self, camera_id: str, since: Optional[datetime] = None
-    ) -> List[ResultRecord]:
-        """カメラIDでフィルタし (オプションで since 以降) の結果を返す。"""
+    def _push_spilling(
+        self, buf: ResultRing, record: ResultRecord, spill: SpillStore
+    ) -> None:
+        tier = spill.camera(record.camera_id)
+        ts = utils_time.to_epoch_ns(record.timestamp_utc)
+        oldest = buf.oldest_ns()
+        late = oldest is not None and ts < oldest
+        if late:
+            # 満杯で保持中の全件より古い遅着: リングには入らないので直接退避
+            row = (ts, record.gesture_label, record.confidence, record.latency_ms)
+        else:
+            row = buf.row_at(0)
+        # リングで上書きする前に退避する (読者はディスク側を先に確認できる)
+        if not tier.append(row):
+            # ディスク階層の最新時刻より古い (追記のみで挿入不可): 破棄して件数を数える
+            cam = record.camera_id
+            self._spill_dropped[cam] = self._spill_dropped.get(cam, 0) + 1
+        if not late:
+            buf.append(record)
+
+    def iter_query(
+        self,
+        camera_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        *,
+        limit: Optional[int] = None,
+        reverse: bool = False,
+        labels: Optional[Iterable[str]] = None,
+        min_confidence: Optional[float] = None,
+    ) -> Iterator[ResultRecord]:
+        """時刻範囲 [since, until) の結果をコピーせず順に返すイテレータ。
+
+        範囲の特定はリング内時刻列の二分探索 (O(log n))。以降は該当範囲のみ走査する。
+        spill 指定時、範囲がディスク階層へ掛かる場合はディスク側 (古い) → リングの順に
+        連結して返す (ディスク側は mmap から遅延読出し)。
+        thread_safe=False ではリングを直接参照する遅延イテレータ (コピーなし) のため、
+        走査中に push_result しないこと。thread_safe=True では該当範囲のみを
+        楽観読出しでコピーした整合結果を返す (書込みをブロックしない)。
+
+        Args:
+            camera_id (str): カメラID。
+            since (Optional[datetime]): 下限 (含む)。
+            until (Optional[datetime]): 上限 (含まない)。
+            limit (Optional[int]): 最大件数 (フィルタ適用後)。
+            reverse (bool): True なら新しい順。
+            labels (Optional[Iterable[str]]): 一致させる gesture_label 集合。
+            min_confidence (Optional[float]): confidence 下限 (含む)。
+
+        Returns:
+            Iterator[ResultRecord]: 条件に一致したレコード。
+
+        Raises:
+            ValueError: limit が負数。
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit は 0 以上である必要があります")
+        if limit == 0:
+            return iter(())
+        since_ns = None if since is None else utils_time.to_epoch_ns(since)
+        until_ns = None if until is None else utils_time.to_epoch_ns(until)
+        label_set = None if labels is None else frozenset(labels)
+        tier = self._spill_tier(camera_id, since_ns)
         buf = self._buffers.get(camera_id)
+        if tier is not None:
+            return self._query_tiers(
+                buf, tier, since_ns, until_ns, limit, reverse, label_set, min_confidence
+            )
         if not buf:
-            return []
-        if since is None:
-            return list(buf)
-        return [r for r in buf if r.timestamp_utc >= since]
+            return iter(())
+        if self._thread_safe:
+            out = self._read_consistent(
+                buf, since_ns, until_ns, limit, reverse, label_set, min_confidence
+            )
+            # 読出し中に範囲内のレコードが退避された場合はディスク階層込みで読み直す
+            tier = self._spill_tier(camera_id, since_ns)
+            if tier is not None:
+                return self._query_tiers(
+                    buf,
+                    tier,
+                    since_ns,
+                    until_ns,
+                    limit,
+                    reverse,
+                    label_set,
+                    min_confidence,
+                )
+            return iter(out)
+        lo, hi = buf.index_range(since_ns, until_ns)
+        it = buf.scan(
+            lo, hi, reverse=reverse, labels=label_set, min_confidence=min_confidence
+        )
+        return it if limit is None else islice(it, limit)
+
+    def _spill_tier(
+        self, camera_id: str, since_ns: Optional[int]
+    ) -> Optional[CameraSpill]:
+        """範囲 [since, ...) がディスク階層に掛かる場合のみ該当カメラの階層を返す。"""
+        if self._spill is None:
+            return None
+        tier = self._spill.get(camera_id)
+        if tier is None:
+            return None
+        last = tier.last_ts_ns
+        if last is None or (since_ns is not None and since_ns > last):
+            return None
+        return tier
+
+    def _query_tiers(
+        self,
+        buf: Optional[ResultRing],
+        tier: CameraSpill,
+        since_ns: Optional[int],
+        until_ns: Optional[int],
+        limit: Optional[int],
+        reverse: bool,
+        labels: Optional[FrozenSet[str]],
+        min_confidence: Optional[float],
+    ) -> Iterator[ResultRecord]:
+        ring: Iterable[ResultRecord] = ()
+        # 退避件数とリング内容を同時点で確定させる (退避は書込みロック下で行われる)。
+        # ディスク側は通し番号 upto 未満に限定するため、以降の退避分と重複しない。
+        with self._write_lock:
+            upto = tier.count
+            if buf:
+                if self._thread_safe:
+                    copied = buf.try_read(
+                        since_ns,
+                        until_ns,
+                        limit=limit,
+                        reverse=reverse,
+                        labels=labels,
+                        min_confidence=min_confidence,
+                    )
+                    assert copied is not None  # ロック下では書込みがないため必ず整合
+                    ring = copied
+                else:
+                    lo, hi = buf.index_range(since_ns, until_ns)
+                    ring = buf.scan(
+                        lo,
+                        hi,
+                        reverse=reverse,
+                        labels=labels,
+                        min_confidence=min_confidence,
+                    )
+        older = tier.scan(
+            since_ns,
+            until_ns,
+            upto=upto,
+            reverse=reverse,
+            labels=labels,
+            min_confidence=min_confidence,
+        )
+        it = chain(ring, older) if reverse else chain(older, ring)
+        return it if limit is None else islice(it, limit)
+
+    def _read_consistent(
+        self,
+        buf: ResultRing,
+        since_ns: Optional[int],
+        until_ns: Optional[int],
+        limit: Optional[int],
+        reverse: bool,
+        labels: Optional[FrozenSet[str]],
+        min_confidence: Optional[float],
+    ) -> List[ResultRecord]:
+        kwargs: Dict[str, Any] = {
+            "limit": limit,
+            "reverse": reverse,
+            "labels": labels,
+            "min_confidence": min_confidence,
+        }
+        for _ in range(_OPTIMISTIC_READ_RETRIES):
+            out = buf.try_read(since_ns, until_ns, **kwargs)
+            if out is not None:
+                return out
+        # 高頻度書込みで楽観読出しが収束しない場合のみ書込みを短時間止めて読む
+        with self._write_lock:
+            out = buf.try_read(since_ns, until_ns, **kwargs)
+        assert out is not None  # ロック下では書込みがないため必ず整合
+        return out
+
+    def query(
+        self,
+        camera_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        *,
+        limit: Optional[int] = None,
+        reverse: bool = False,
+        labels: Optional[Iterable[str]] = None,
+        min_confidence: Optional[float] = None,
+    ) -> List[ResultRecord]:
+        """iter_query の結果をリストで返す (引数は iter_query と同じ)。"""
+        return list(
+            self.iter_query(
+                camera_id,
+                since,
+                until,
+                limit=limit,
+                reverse=reverse,
+                labels=labels,
+                min_confidence=min_confidence,
+            )
+        )
+
+    def export(
+        self,
+        fmt: str,
+        time_range: TimeRange,
+        dest: Path,
+        *,
+        cameras: Optional[Iterable[str]] = None,
+        chunk_records: int = DEFAULT_CHUNK_RECORDS,
+        max_workers: int = DEFAULT_EXPORT_WORKERS,
+    ) -> ExportReport:
+        """時刻範囲の結果をカメラ毎ファイルへ書出し、完了まで待つ。
+
+        書出しはスレッドプール上でカメラ並列に行い、各カメラは chunk_records 件単位で
+        読出し・書込みする。呼出し元をブロックしたくない場合は ResultExporter.submit を使う。
+
+        Args:
+            fmt (str): "csv" / "jsonl" / "bin"。
+            time_range (TimeRange): 対象範囲 [since, until)。
+            dest (Path): 出力ディレクトリ。
+            cameras (Optional[Iterable[str]]): 対象カメラ (省略時は全カメラ)。
+            chunk_records (int): 1 チャンクの最大件数。
+            max_workers (int): 並列書出しスレッド数。
+
+        Returns:
+            ExportReport: カメラ毎の出力パス・件数・バイト数。
+
+        Raises:
+            ValueError: 未対応の形式。
+            OSError: 書込み失敗。
+        """
+        with ResultExporter(
+            self, max_workers=max_workers, chunk_records=chunk_records
+        ) as exporter:
+            return exporter.submit(fmt, time_range, dest, cameras).result()
 
     def snapshot_stats(
         self, now: Optional[datetime] = None
@@ -97,39 +589,113 @@ class Aggregator:
             avg_latency_ms: 同じ1秒窓内レコードの平均 (latency_ms が None は除外)
             last_update: 最終結果時刻 ISO8601
             drop_rate: None (Phase2 で計算導入)
+            latency_p50_ms / latency_p95_ms / latency_p99_ms: latency_window 窓の分位点
+            spill_dropped: 退避できず破棄した遅着レコード数 (spill 指定時のみ)
+
+        計算量は O(カメラ数 + 期限切れ件数)。窓集計は push_result 時に増分更新済み。
+        now は呼出し間で単調非減少を想定 (期限切れエントリは破棄されるため)。
+        結果は publish() 経由の tick キャッシュから得る (同一 tick 内は再計算しない)。
+        戻り値は呼出し側で変更可能なコピー。ロックなしで読みたい読者は latest_snapshot() を使う。
+        """
+        snap = self.publish(now)
+        return {cam: dict(entry) for cam, entry in snap.stats.items()}
+
+    def publish(self, now: Optional[datetime] = None) -> AggregatorSnapshot:
+        """現 tick の統計を不変スナップショットとして公開する (参照差替え)。
+
+        now の tick が公開済み tick 以下であれば、公開済みスナップショットをそのまま返す。
+        ただし tick 内に StatsMessage を受けたカメラや新規カメラがあれば、そのカメラだけ計算して
+        新しいスナップショットを公開する。
+
+        Args:
+            now (Optional[datetime]): 基準時刻 (省略時は現在)。
+
+        Returns:
+            AggregatorSnapshot: 公開中のスナップショット。
         """
         if now is None:
             now = utils_time.now_utc()
-        window_start = now - timedelta(seconds=1)
+        tick = self._tick_of(now)
+        with self._write_lock:
+            cached = self._published
+            if cached is not None and self._tick is not None and tick <= self._tick:
+                if not self._dirty:
+                    return cached
+                stats = {cam: dict(entry) for cam, entry in cached.stats.items()}
+                hists = self._latency_hists
+                old = {cam: hists[cam] for cam in self._dirty if cam in stats}
+                fresh = self._compute_stats(cached.taken_at, self._dirty)
+                # フリート分位点: 再計算したカメラのヒストグラムだけ入替える
+                for cam in fresh:
+                    if cam in old:
+                        self._fleet_hist.subtract(old[cam])
+                    self._fleet_hist.merge(hists[cam])
+                stats.update(fresh)
+                now = cached.taken_at
+            else:
+                # tick 前進: 前 tick の EMA を起点として確定させる
+                self._ema_prev = dict(self._ema_fps)
+                self._tick = tick
+                stats = self._compute_stats(now, None)
+                self._fleet_hist = LatencyHistogram.merged(
+                    self._latency_hists[cam] for cam in stats
+                )
+            self._dirty.clear()
+            self._publish_seq += 1
+            fleet = summarize_fleet(stats, (self._fleet_hist,), self._fleet_top_k)
+            snap = AggregatorSnapshot(
+                seq=self._publish_seq,
+                taken_at=now,
+                stats=MappingProxyType(
+                    {cam: MappingProxyType(entry) for cam, entry in stats.items()}
+                ),
+                fleet=fleet,
+            )
+            self._published = snap
+        return snap
+
+    def fleet_summary(self, now: Optional[datetime] = None) -> FleetSummary:
+        """全カメラ集計を返す (publish() と同じ tick キャッシュを共有)。
+
+        Args:
+            now (Optional[datetime]): 基準時刻 (省略時は現在)。
+
+        Returns:
+            FleetSummary: 合計 FPS / 全体分位点 / 悪化カメラ上位 K 件。
+        """
+        return self.publish(now).fleet
+
+    def latest_snapshot(self) -> Optional[AggregatorSnapshot]:
+        """最後に公開されたスナップショットを返す (ロックなし / 未公開なら None)。"""
+        return self._published
+
+    def _tick_of(self, now: datetime) -> int:
+        ns = utils_time.to_epoch_ns(now)
+        return ns // self._refresh_ns if self._refresh_ns else ns
+
+    def _compute_stats(
+        self, now: datetime, cameras: Optional[Iterable[str]]
+    ) -> Dict[str, Dict[str, Any]]:
+        window_start = now - _STATS_WINDOW
+        now_sec = now.timestamp()
         out: Dict[str, Dict[str, Any]] = {}
-        for cam, buf in self._buffers.items():
-            if not buf:
+        targets = self._windows if cameras is None else cameras
+        for cam in targets:
+            win = self._windows.get(cam)
+            if win is None or win.last_ts is None:
                 continue
-            # FPS 計算
-            recent = [r for r in buf if r.timestamp_utc > window_start]
-            fps = float(len(recent))
-            # 平均レイテンシ (同じ 1 秒窓)
-            latencies = [r.latency_ms for r in recent if r.latency_ms is not None]
-            avg_latency = sum(latencies) / len(latencies) if latencies else None
-            p50 = p95 = None
-            if latencies:
-                sorted_l = sorted(latencies)
-                def _pct(values: List[float], pct: float) -> float:
-                    if not values:
-                        return float("nan")
-                    k = (len(values) - 1) * pct
-                    i = int(k)
-                    if i == k:
-                        return values[i]
-                    return values[i] + (values[i + 1] - values[i]) * (k - i)
-                p50 = _pct(sorted_l, 0.5)
-                p95 = _pct(sorted_l, 0.95)
-            # バッファ挿入順と時刻順が一致しない場合があるため明示的に最大時刻を計算
-            last_ts = max(r.timestamp_utc for r in buf)
-            # EMA FPS
-            prev = self._ema_fps.get(cam)
+            win.expire(window_start)
+            fps = float(len(win.entries))
+            avg_latency = (
+                win.latency_sum / win.latency_count if win.latency_count else None
+            )
+            hist = win.sketch.histogram(self._latency_window, now_sec)
+            self._latency_hists[cam] = hist
+            p50, p95, p99 = hist.quantiles((0.5, 0.95, 0.99))
+            last_ts = win.last_ts
+            # EMA FPS (起点は前 tick 終了時の値。同一 tick 内の再計算でも二重に進めない)
+            prev = self._ema_prev.get(cam)
             ema_fps = fps if prev is None else prev + self._ema_alpha * (fps - prev)
-            self._ema_fps[cam] = ema_fps
 
             entry: Dict[str, Any] = {
                 "fps": fps,
@@ -138,34 +704,133 @@ class Aggregator:
                 "drop_rate": None,
                 "latency_p50_ms": p50,
                 "latency_p95_ms": p95,
+                "latency_p99_ms": p99,
                 "ema_fps": ema_fps,
             }
             override = self._stats_overrides.get(cam)
             if override:
                 if override.fps is not None:
                     # override fps を使い EMA も更新して表示
-                    self._ema_fps[cam] = self._ema_fps[cam] + self._ema_alpha * (override.fps - self._ema_fps[cam])
+                    ema_fps = ema_fps + self._ema_alpha * (override.fps - ema_fps)
                     entry["fps"] = override.fps
-                    entry["ema_fps"] = self._ema_fps[cam]
+                    entry["ema_fps"] = ema_fps
                 if override.avg_latency_ms is not None:
                     entry["avg_latency_ms"] = override.avg_latency_ms
                 entry["drop_rate"] = override.drop_rate
+            if self._spill is not None:
+                entry["spill_dropped"] = self._spill_dropped.get(cam, 0)
+            self._ema_fps[cam] = ema_fps
             out[cam] = entry
         return out
 
+    def latency_quantiles(
+        self,
+        camera_id: Optional[str] = None,
+        window: str = "1s",
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Optional[float]]:
+        """指定窓のレイテンシ分位点を返す。
+
+        Args:
+            camera_id (Optional[str]): 対象カメラ。None なら全カメラをマージした全体値。
+            window (str): 窓名 (1s / 10s / 60s / 5m)。
+            quantiles (Sequence[float]): 0.0-1.0 の分位点。
+            now (Optional[datetime]): 窓末尾時刻 (省略時は現在)。
+
+        Returns:
+            Dict[str, Optional[float]]: {"p50": ..., "p95": ..., "count": 件数}。
+
+        Raises:
+            ValueError: 未定義の窓名。
+        """
+        if window not in LATENCY_WINDOWS:
+            raise ValueError(f"未定義の窓: {window}")
+        if now is None:
+            now = utils_time.now_utc()
+        now_sec = now.timestamp()
+        if camera_id is None:
+            targets = list(self._windows.values())
+        else:
+            win = self._windows.get(camera_id)
+            targets = [win] if win else []
+        with self._write_lock:
+            hist = LatencyHistogram.merged(
+                [w.sketch.histogram(window, now_sec) for w in targets]
+            )
+        out: Dict[str, Optional[float]] = {
+            quantile_key(q): v for q, v in zip(quantiles, hist.quantiles(quantiles))
+        }
+        out["count"] = float(hist.count)
+        return out
+
+    def label_stats(
+        self,
+        camera_id: Optional[str] = None,
+        window: str = "10m",
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """指定窓のラベル件数・平均信頼度・遷移回数を返す (生レコードは走査しない)。
+
+        Args:
+            camera_id (Optional[str]): 対象カメラ。None なら全カメラを合算。
+            window (str): 窓名 (1m / 10m / 1h)。窓境界はスライス粒度で丸められる。
+            now (Optional[datetime]): 窓末尾時刻 (省略時は現在)。
+
+        Returns:
+            Dict[str, Any]: {"count": 総件数, "counts": {label: 件数},
+            "mean_confidence": {label: 平均}, "transitions": {前ラベル: {次ラベル: 回数}}}。
+
+        Raises:
+            ValueError: 未定義の窓名。
+        """
+        if window not in LABEL_WINDOWS:
+            raise ValueError(f"未定義の窓: {window}")
+        if now is None:
+            now = utils_time.now_utc()
+        now_sec = now.timestamp()
+        if camera_id is None:
+            targets = list(self._windows.values())
+        else:
+            win = self._windows.get(camera_id)
+            targets = [win] if win else []
+        with self._write_lock:
+            merged = LabelCounts.merged(
+                w.labels.window(window, now_sec) for w in targets
+            )
+        return {
+            "count": merged.total,
+            "counts": merged.counts(),
+            "mean_confidence": merged.mean_confidence(),
+            "transitions": merged.transitions(),
+        }
+
     # ------------------------------ 補助/検査 ------------------------------ #
+    def _new_ring(self, camera_id: str) -> ResultRing:
+        if self._storage == STORAGE_COLUMNAR:
+            return ColumnarResultRing(camera_id, self._capacity, self._labels)
+        return ObjectResultRing(self._capacity)
+
     def cameras(self) -> Iterable[str]:  # pragma: no cover - 極小ヘルパ
-        return self._buffers.keys()
+        cams = list(self._buffers)
+        if self._spill is not None:
+            # ディスク階層のみに履歴があるカメラ (前回起動分) も含める
+            cams.extend(c for c in self._spill.cameras() if c not in self._buffers)
+        return cams
 
     def apply_stats_message(self, msg: StatsMessage) -> None:
-        """StatsMessage を適用し snapshot_stats 出力へ反映。"""
-        self._stats_overrides[msg.camera_id] = msg
+        """StatsMessage を適用し snapshot_stats 出力へ反映 (現 tick 内でも該当カメラを再計算)。"""
+        with self._write_lock:
+            self._stats_overrides[msg.camera_id] = msg
+            self._dirty.add(msg.camera_id)
+
+    def spill_dropped(self, camera_id: str) -> int:
+        """ディスク階層へ退避できずに破棄した遅着レコード数 (spill 無効時は 0)。"""
+        return self._spill_dropped.get(camera_id, 0)
 
     def last_update_dt(self, camera_id: str) -> Optional[datetime]:
-        buf = self._buffers.get(camera_id)
-        if not buf:
-            return None
-        return max(r.timestamp_utc for r in buf)
+        win = self._windows.get(camera_id)
+        return win.last_ts if win else None
 
 
-__all__ = ["ResultRecord", "Aggregator"]
+__all__ = ["ResultRecord", "Aggregator", "AggregatorSnapshot"]
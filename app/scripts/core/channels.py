@@ -0,0 +1,289 @@
+"""worker→親 のカメラ別結果チャネルと優先ステータスチャネル。
+
+従来は全 worker が 1 本の結果キューを共有し、満杯時の「最古 1 件破棄」が他カメラの
+レコードや StatsMessage / ExitNotice / PING 応答まで消していた (1 台の過負荷カメラが
+他カメラと死活監視を巻き込む)。
+
+構成:
+    結果チャネル: カメラ毎の有界キュー (ResultRecord / ResultBatch)。満杯時の最古破棄は
+        同じカメラの結果だけに作用する。
+    ステータスチャネル: StatsMessage / StatusUpdate / ExitNotice 用のキュー。上限なし
+        (件数は 1 秒周期の統計と PING 応答程度)。結果より優先して受信する。
+        status は親プロセス内 (監視スレッド / スレッド worker) の共有。worker プロセスは
+        add_status でプロセス毎のキューを持つ。書込み中に強制終了されたプロセスは
+        キューの書込みロックを保持したまま / ストリームを壊したままになり得るため、
+        共有すると他の全 worker の統計・PING 応答・ExitNotice が止まる。
+
+受信 (ResultChannels.poll):
+    1. ステータスチャネルを空になるまで受信 (優先)。
+    2. 結果チャネルを Deficit Round Robin で 1 巡受信する。各カメラは 1 巡毎に quantum
+       レコード分の受信枠を得て、枠が残る間だけ受信する (ResultBatch は件数分を消費)。
+       流量の多いカメラも 1 巡当たり約 quantum レコードに制限され、他カメラを待たせない。
+       FrameDescriptor (フレームリング) は枠を消費せず、別に 1 巡 quantum 件までとする。
+       開始カメラは巡毎にずらす。
+    3. 1 巡で何も受信しなければ、全キューの受信側パイプ (multiprocessing.Queue._reader) を
+       multiprocessing.connection.wait で timeout まで同時に待ち、届いたら 1 巡受信する。
+       アイドル時に全キューを空読みし続けない (起床は届いた時のみ)。
+       受信側パイプを持たないキュー (queue.Queue 等) が混ざる場合は、ステータスチャネルを
+       待つ。待ち時間は idle_wait_sec から空の巡毎に倍にし timeout で頭打ち、受信で戻す
+       (結果の受信遅延はその待ち時間分)。
+
+同一プロセス内モード (queue_factory=None, スレッドモード):
+    各キューは put 時に共有の受信箱へカメラ ID (ステータスは None) を通知する (NotifyingQueue)。
+    poll は受信箱を待ち、通知のあったカメラだけを上記と同じ枠で受信する。1 巡毎に全カメラの
+    キューを空読みしないため、カメラ数が多くても受信コストは届いた件数に比例し、アイドル時の
+    ポーリングもない。枠を使い切って残りがあるカメラは次巡の末尾へ回す。
+"""
+
+from __future__ import annotations
+
+import queue
+from multiprocessing.connection import wait as wait_connections
+from typing import Any, Callable, Dict, Final, List, Optional, Protocol
+
+from .messages import FrameDescriptor, ResultBatch
+
+DEFAULT_DISPATCH_QUANTUM: Final = 64
+DEFAULT_IDLE_WAIT_SEC: Final = 0.005
+
+
+class NotifyingQueue(queue.Queue):  # type: ignore[type-arg]
+    """put 時に受信箱へ key を通知する queue.Queue (同一プロセス内の複数キュー待ち用)。"""
+
+    def __init__(
+        self, maxsize: int, key: Optional[str], inbox: "queue.SimpleQueue[Any]"
+    ) -> None:
+        super().__init__(maxsize)
+        self._key = key
+        self._inbox = inbox
+
+    def _put(self, item: Any) -> None:
+        super()._put(item)
+        self._inbox.put(self._key)
+
+
+class _QueueLike(Protocol):  # pragma: no cover - 型補助
+    def put_nowait(self, item: Any) -> None: ...
+    def get_nowait(self) -> Any: ...
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any: ...
+
+
+QueueFactory = Callable[[int], _QueueLike]
+
+
+class ResultChannels:
+    """カメラ別結果キュー群とステータスキューを保持し、公平に受信する。
+
+    Attributes:
+        status (_QueueLike): 親プロセス内で共有するステータスチャネル。
+    """
+
+    def __init__(
+        self,
+        queue_factory: Optional[QueueFactory],
+        result_maxsize: int,
+        *,
+        quantum: int = DEFAULT_DISPATCH_QUANTUM,
+        idle_wait_sec: float = DEFAULT_IDLE_WAIT_SEC,
+    ) -> None:
+        """
+        Args:
+            queue_factory (Optional[QueueFactory]): maxsize を受けてキューを返す
+                (multiprocessing.Queue 等)。None は同一プロセス内モード (通知付きキュー)。
+            result_maxsize (int): カメラ毎の結果キュー上限 (0 = 上限なし)。
+            quantum (int): 1 巡当たりのカメラ毎受信枠 (レコード数)。
+            idle_wait_sec (float): 受信側パイプを持たないキューでの、1 巡で受信がない
+                場合のステータス待ちの初期値 (秒)。空の巡毎に倍にする。
+        """
+        if quantum < 1:
+            raise ValueError("quantum は 1 以上である必要があります")
+        self._factory = queue_factory
+        self._result_maxsize = result_maxsize
+        self._quantum = quantum
+        self._idle_wait = idle_wait_sec
+        self._backoff = idle_wait_sec  # 現在の待ち時間 (受信で idle_wait_sec へ戻す)
+        self._inbox: Optional["queue.SimpleQueue[Optional[str]]"] = None
+        if queue_factory is None:
+            self._inbox = queue.SimpleQueue()
+        self._ready: Dict[Optional[str], bool] = {}  # 通知済み (未受信の可能性あり)
+        self.status: _QueueLike = self._new_queue(0, None)
+        self._worker_status: Dict[str, _QueueLike] = {}
+        self._results: Dict[str, _QueueLike] = {}
+        self._order: List[str] = []
+        self._deficit: Dict[str, int] = {}
+        self._start = 0
+
+    def _new_queue(self, maxsize: int, key: Optional[str]) -> _QueueLike:
+        if self._inbox is not None:
+            return NotifyingQueue(maxsize, key, self._inbox)
+        assert self._factory is not None
+        return self._factory(maxsize)
+
+    def add(self, camera_id: str) -> _QueueLike:
+        """カメラの結果チャネルを作成して返す (登録済みなら既存を返す)。"""
+        q = self._results.get(camera_id)
+        if q is None:
+            q = self._new_queue(self._result_maxsize, camera_id)
+            self._results[camera_id] = q
+            self._order.append(camera_id)
+            self._deficit[camera_id] = 0
+        return q
+
+    def renew(self, camera_id: str, q: Optional[_QueueLike] = None) -> _QueueLike:
+        """カメラの結果チャネルを新しいキューに置き換えて返す (worker プロセス再起動用)。
+
+        異常終了した worker が書込み中だったキューはロック / ストリームが壊れている
+        可能性があるため使い続けない。旧キューに残っていた結果は破棄される。
+
+        Args:
+            camera_id (str): カメラ ID。
+            q (Optional[_QueueLike]): 置換先 (待機 worker が作成時から持つキュー)。
+                None なら新規作成。
+        """
+        if q is None:
+            q = self._new_queue(self._result_maxsize, camera_id)
+        self._results[camera_id] = q
+        return q
+
+    def add_status(self, key: str, q: Optional[_QueueLike] = None) -> _QueueLike:
+        """worker プロセス専用のステータスチャネルを登録して返す (登録済みなら置換)。
+
+        プロセスの起動 / 再起動毎に呼び、異常終了したプロセスのキューは使い続けない。
+        旧キューに残っていたメッセージは破棄される。
+
+        Args:
+            key (str): worker プロセス名。
+            q (Optional[_QueueLike]): 置換先 (待機 worker が作成時から持つキュー)。
+                None なら新規作成。
+        """
+        if q is None:
+            q = self._new_queue(0, None)
+        # 受信側 (dispatcher) が走査中でも安全なように置換で更新する
+        self._worker_status = {**self._worker_status, key: q}
+        return q
+
+    def result_queue(self, camera_id: str) -> _QueueLike:
+        return self._results[camera_id]
+
+    @property
+    def camera_ids(self) -> List[str]:
+        return list(self._order)
+
+    def poll(self, handle: Callable[[Any], None], timeout: float) -> int:
+        """ステータス優先 + 結果の公平受信を 1 巡行い、受信した各メッセージで handle を呼ぶ。
+
+        Args:
+            handle (Callable[[Any], None]): メッセージ処理 (dispatcher の振分け)。
+            timeout (float): 受信がない場合の待ち上限 (秒)。
+
+        Returns:
+            int: 処理したメッセージ数。
+        """
+        if self._inbox is not None:
+            return self._poll_notified(self._inbox, handle, timeout)
+        handled = self._round(handle)
+        if handled:
+            self._backoff = self._idle_wait
+            return handled
+        readers = self._readers()
+        if readers is not None:
+            if not wait_connections(readers, timeout):
+                return 0
+            return self._round(handle)
+        wait = min(timeout, self._backoff)
+        self._backoff = min(self._backoff * 2, max(timeout, self._idle_wait))
+        try:
+            item = self.status.get(timeout=wait)
+        except queue.Empty:
+            return 0
+        self._backoff = self._idle_wait
+        handle(item)
+        return 1 + self._drain_status(handle)
+
+    def _round(self, handle: Callable[[Any], None]) -> int:
+        handled = self._drain_status(handle)
+        order = self._order
+        n = len(order)
+        for k in range(n):
+            cam = order[(self._start + k) % n]
+            handled += self._serve(cam, handle)
+        if n:
+            self._start = (self._start + 1) % n
+        return handled
+
+    def _readers(self) -> Optional[List[Any]]:
+        """全キューの受信側パイプ (1 つでも持たないキューがあれば None)。"""
+        queues = [self.status, *self._worker_status.values(), *self._results.values()]
+        readers = [getattr(q, "_reader", None) for q in queues]
+        return None if any(r is None for r in readers) else readers
+
+    def _poll_notified(
+        self,
+        inbox: "queue.SimpleQueue[Optional[str]]",
+        handle: Callable[[Any], None],
+        timeout: float,
+    ) -> int:
+        ready = self._ready
+        if not ready:
+            try:
+                ready[inbox.get(timeout=timeout)] = True
+            except queue.Empty:
+                return 0
+        while True:
+            try:
+                ready[inbox.get_nowait()] = True
+            except queue.Empty:
+                break
+        ready.pop(None, None)  # ステータスは毎回先に全件受信する
+        handled = self._drain_status(handle)
+        for cam in list(ready):
+            del ready[cam]
+            handled += self._serve(cam, handle)
+            if cam not in ready and self._results[cam].qsize():
+                ready[cam] = True  # 枠を使い切って残りがあるカメラは末尾へ (次巡)
+        return handled
+
+    def _drain_status(self, handle: Callable[[Any], None]) -> int:
+        handled = 0
+        for q in [self.status, *self._worker_status.values()]:
+            while True:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                handle(item)
+                handled += 1
+        return handled
+
+    def _serve(self, camera_id: str, handle: Callable[[Any], None]) -> int:
+        q = self._results[camera_id]
+        deficit = self._deficit[camera_id] + self._quantum
+        handled = 0
+        frames = 0
+        while deficit > 0:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                deficit = 0  # 空のカメラは枠を持ち越さない (DRR)
+                break
+            handle(item)
+            handled += 1
+            if isinstance(item, FrameDescriptor):
+                # フレーム記述子は結果の枠を消費しない (1 巡当たり quantum 件まで)
+                frames += 1
+                if frames >= self._quantum:
+                    deficit = min(deficit, self._quantum)
+                    break
+                continue
+            deficit -= len(item) if isinstance(item, ResultBatch) else 1
+        self._deficit[camera_id] = deficit
+        return handled
+
+
+__all__ = [
+    "DEFAULT_DISPATCH_QUANTUM",
+    "DEFAULT_IDLE_WAIT_SEC",
+    "NotifyingQueue",
+    "QueueFactory",
+    "ResultChannels",
+]
@@ -0,0 +1,429 @@
+"""推論結果のストリーミング・エクスポート (CSV / JSON Lines / 長さ前置バイナリ)。
+
+設計要点:
+    - カメラ毎に 1 ファイル (``<dest>/<camera_id>.<ext>``)。時刻範囲 [since, until) を
+      chunk_records 件ずつ Aggregator.query で読出し、チャンク単位でエンコードして書込む。
+      メモリ使用量はチャンクサイズで上限が決まり、総件数に依存しない。
+    - 読出しは Aggregator の通常クエリ経路 (thread_safe=True では楽観読出し) を用いるため
+      dispatcher の push_result を長時間ブロックしない。
+    - ResultExporter はバックグラウンドのスレッドプールで動作し、複数カメラを並列に書出す。
+    - 書込み中は ``*.part`` に出力し、完了時にリネームする (途中失敗時は削除し例外を伝播)。
+
+バイナリ形式 (リトルエンディアン):
+    ヘッダ: MAGIC(4) + u16 カメラID長 + カメラID (UTF-8)
+    レコード: u16 ペイロード長 + [i64 epoch ns, f32 confidence, f32 latency_ms, ラベル UTF-8]
+    latency_ms=None は NaN で表現する。read_binary で ResultRecord へ復元できる。
+
+注意:
+    エクスポート中もリングへの書込みは継続するため、チャンク読出しまでに capacity 超過で
+    破棄されたレコードは出力されない (ライブバッファに対するベストエフォート)。
+    thread_safe=False の Aggregator では書込みと並行してエクスポートしないこと。
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+import struct
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from . import utils_time
+from .messages import ResultRecord
+
+if TYPE_CHECKING:  # 実行時は循環 import を避ける (aggregator が本モジュールを参照)
+    from .aggregator import Aggregator
+
+FORMAT_CSV: Final = "csv"
+FORMAT_JSONL: Final = "jsonl"
+FORMAT_BINARY: Final = "bin"
+EXPORT_FORMATS: Final = (FORMAT_CSV, FORMAT_JSONL, FORMAT_BINARY)
+DEFAULT_CHUNK_RECORDS: Final = 8192
+DEFAULT_EXPORT_WORKERS: Final = 4
+BINARY_MAGIC: Final = b"GRX1"
+CSV_COLUMNS: Final = (
+    "camera_id",
+    "timestamp_utc",
+    "gesture_label",
+    "confidence",
+    "latency_ms",
+)
+
+_LEN = struct.Struct("<H")
+_FIXED = struct.Struct("<qff")
+
+
+@dataclass(frozen=True, slots=True)
+class TimeRange:
+    """エクスポート対象の時刻範囲 [since, until) (None は無制限)。"""
+
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+
+
+@dataclass(frozen=True, slots=True)
+class CameraExport:
+    """カメラ 1 台分のエクスポート結果。"""
+
+    camera_id: str
+    path: Path
+    records: int
+    bytes_written: int
+
+
+@dataclass(frozen=True, slots=True)
+class ExportReport:
+    """エクスポート全体の結果。
+
+    Attributes:
+        fmt (str): 出力形式。
+        dest (Path): 出力ディレクトリ。
+        files (Tuple[CameraExport, ...]): カメラ毎の結果 (カメラID順)。
+        elapsed_sec (float): 所要時間 (秒)。
+    """
+
+    fmt: str
+    dest: Path
+    files: Tuple[CameraExport, ...]
+    elapsed_sec: float
+
+    @property
+    def records(self) -> int:
+        return sum(f.records for f in self.files)
+
+    @property
+    def bytes_written(self) -> int:
+        return sum(f.bytes_written for f in self.files)
+
+
+# ------------------------------ エンコーダ ------------------------------ #
+def _csv_header(camera_id: str) -> bytes:
+    return (",".join(CSV_COLUMNS) + "\r\n").encode("utf-8")
+
+
+def _csv_chunk(records: Sequence[ResultRecord]) -> bytes:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    iso = utils_time.isoformat_utc
+    writer.writerows(
+        (
+            r.camera_id,
+            iso(r.timestamp_utc),
+            r.gesture_label,
+            r.confidence,
+            "" if r.latency_ms is None else r.latency_ms,
+        )
+        for r in records
+    )
+    return buf.getvalue().encode("utf-8")
+
+
+def _jsonl_header(camera_id: str) -> bytes:
+    return b""
+
+
+def _jsonl_chunk(records: Sequence[ResultRecord]) -> bytes:
+    iso = utils_time.isoformat_utc
+    dumps = json.dumps
+    lines = [
+        dumps(
+            {
+                "camera_id": r.camera_id,
+                "timestamp_utc": iso(r.timestamp_utc),
+                "gesture_label": r.gesture_label,
+                "confidence": r.confidence,
+                "latency_ms": r.latency_ms,
+            },
+            ensure_ascii=False,
+        )
+        for r in records
+    ]
+    lines.append("")
+    return "\n".join(lines).encode("utf-8")
+
+
+def _binary_header(camera_id: str) -> bytes:
+    cam = camera_id.encode("utf-8")
+    return BINARY_MAGIC + _LEN.pack(len(cam)) + cam
+
+
+def _binary_chunk(records: Sequence[ResultRecord]) -> bytes:
+    to_ns = utils_time.to_epoch_ns
+    pack_len = _LEN.pack
+    pack_fixed = _FIXED.pack
+    nan = math.nan
+    label_bytes: Dict[str, bytes] = {}
+    parts: List[bytes] = []
+    for r in records:
+        label = label_bytes.get(r.gesture_label)
+        if label is None:
+            label = label_bytes[r.gesture_label] = r.gesture_label.encode("utf-8")
+        lat = nan if r.latency_ms is None else r.latency_ms
+        parts.append(pack_len(_FIXED.size + len(label)))
+        parts.append(pack_fixed(to_ns(r.timestamp_utc), r.confidence, lat))
+        parts.append(label)
+    return b"".join(parts)
+
+
+# 形式 -> (拡張子, ヘッダ生成, チャンクエンコード)
+_ENCODERS: Final[
+    Dict[
+        str,
+        Tuple[
+            str, Callable[[str], bytes], Callable[[Sequence[ResultRecord]], bytes]
+        ],
+    ]
+] = {
+    FORMAT_CSV: ("csv", _csv_header, _csv_chunk),
+    FORMAT_JSONL: ("jsonl", _jsonl_header, _jsonl_chunk),
+    FORMAT_BINARY: ("bin", _binary_header, _binary_chunk),
+}
+
+
+def read_binary(path: Path) -> Iterator[ResultRecord]:
+    """バイナリ形式ファイルを ResultRecord 列として読出す。
+
+    Raises:
+        ValueError: MAGIC 不一致または途中で切れたファイル。
+    """
+    data = path.read_bytes()
+    if data[:4] != BINARY_MAGIC:
+        raise ValueError(f"バイナリエクスポート形式ではありません: {path}")
+    (cam_len,) = _LEN.unpack_from(data, 4)
+    pos = 4 + _LEN.size
+    camera_id = data[pos : pos + cam_len].decode("utf-8")
+    pos += cam_len
+    end = len(data)
+    while pos < end:
+        if pos + _LEN.size > end:
+            raise ValueError(f"レコード長が途中で切れています: {path}")
+        (n,) = _LEN.unpack_from(data, pos)
+        pos += _LEN.size
+        if pos + n > end or n < _FIXED.size:
+            raise ValueError(f"レコードが途中で切れています: {path}")
+        ts_ns, conf, lat = _FIXED.unpack_from(data, pos)
+        label = data[pos + _FIXED.size : pos + n].decode("utf-8")
+        pos += n
+        yield ResultRecord(
+            camera_id=camera_id,
+            timestamp_utc=utils_time.from_epoch_ns(ts_ns),
+            gesture_label=label,
+            confidence=conf,
+            latency_ms=None if math.isnan(lat) else lat,
+        )
+
+
+# ------------------------------ 読出し / 書出し ------------------------------ #
+def iter_chunks(
+    aggregator: "Aggregator",
+    camera_id: str,
+    time_range: TimeRange,
+    chunk_records: int = DEFAULT_CHUNK_RECORDS,
+) -> Iterator[List[ResultRecord]]:
+    """[since, until) を時刻順に最大 chunk_records 件ずつ返す。
+
+    次チャンクは直前チャンク末尾の時刻から再開する。同時刻レコードがチャンク境界を
+    跨ぐ場合は出力済み件数をスキップして重複を防ぐ。
+
+    Raises:
+        ValueError: chunk_records が 0 以下。
+    """
+    if chunk_records <= 0:
+        raise ValueError("chunk_records は正数である必要があります")
+    cursor = time_range.since
+    skip = 0
+    while True:
+        # 同時刻の出力済み件数 skip を読み飛ばすため、その分だけ多めに読む
+        chunk = aggregator.query(
+            camera_id, cursor, time_range.until, limit=chunk_records + skip
+        )[skip:]
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < chunk_records:
+            return
+        last = chunk[-1].timestamp_utc
+        same = 0
+        for r in reversed(chunk):
+            if r.timestamp_utc != last:
+                break
+            same += 1
+        skip = same + (skip if last == cursor else 0)
+        cursor = last
+
+
+def export_camera(
+    aggregator: "Aggregator",
+    fmt: str,
+    camera_id: str,
+    time_range: TimeRange,
+    dest: Path,
+    chunk_records: int = DEFAULT_CHUNK_RECORDS,
+) -> CameraExport:
+    """1 カメラ分を ``dest/<camera_id>.<ext>`` へチャンク単位で書出す。
+
+    Raises:
+        ValueError: 未対応の形式。
+        OSError: 書込み失敗 (途中ファイルは削除して伝播)。
+    """
+    ext, header, encode = _encoder(fmt)
+    path = dest / f"{camera_id}.{ext}"
+    part = path.with_name(path.name + ".part")
+    records = 0
+    written = 0
+    try:
+        with part.open("wb") as f:
+            written += f.write(header(camera_id))
+            for chunk in iter_chunks(aggregator, camera_id, time_range, chunk_records):
+                written += f.write(encode(chunk))
+                records += len(chunk)
+        part.replace(path)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    return CameraExport(
+        camera_id=camera_id, path=path, records=records, bytes_written=written
+    )
+
+
+def _encoder(
+    fmt: str,
+) -> Tuple[str, Callable[[str], bytes], Callable[[Sequence[ResultRecord]], bytes]]:
+    enc = _ENCODERS.get(fmt)
+    if enc is None:
+        raise ValueError(f"未対応のエクスポート形式: {fmt} (有効: {EXPORT_FORMATS})")
+    return enc
+
+
+class ResultExporter:
+    """バックグラウンドでカメラ並列にエクスポートするスレッドプール。
+
+    Attributes:
+        chunk_records (int): 1 チャンクの最大件数 (メモリ上限を決める)。
+    """
+
+    def __init__(
+        self,
+        aggregator: "Aggregator",
+        *,
+        max_workers: int = DEFAULT_EXPORT_WORKERS,
+        chunk_records: int = DEFAULT_CHUNK_RECORDS,
+    ) -> None:
+        if max_workers <= 0 or chunk_records <= 0:
+            raise ValueError("max_workers / chunk_records は正数である必要があります")
+        self._aggregator = aggregator
+        self.chunk_records = chunk_records
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="Exporter"
+        )
+
+    def submit(
+        self,
+        fmt: str,
+        time_range: TimeRange,
+        dest: Path,
+        cameras: Optional[Iterable[str]] = None,
+    ) -> "Future[ExportReport]":
+        """エクスポートを開始し、全カメラ完了で解決する Future を返す。
+
+        Args:
+            fmt (str): 出力形式 (EXPORT_FORMATS のいずれか)。
+            time_range (TimeRange): 対象時刻範囲。
+            dest (Path): 出力ディレクトリ (無ければ作成)。
+            cameras (Optional[Iterable[str]]): 対象カメラ (省略時は全カメラ)。
+
+        Returns:
+            Future[ExportReport]: 失敗時は最初の例外 (OSError 等) を保持する。
+
+        Raises:
+            ValueError: 未対応の形式 (即時検証)。
+        """
+        _encoder(fmt)
+        cams = sorted(self._aggregator.cameras() if cameras is None else cameras)
+        dest.mkdir(parents=True, exist_ok=True)
+        started = perf_counter()
+        parts = [
+            self._pool.submit(
+                export_camera,
+                self._aggregator,
+                fmt,
+                cam,
+                time_range,
+                dest,
+                self.chunk_records,
+            )
+            for cam in cams
+        ]
+        done: "Future[ExportReport]" = Future()
+        remaining = [len(parts)]
+        lock = threading.Lock()
+
+        def _finish(_: "Future[CameraExport]") -> None:
+            # 最後に完了したカメラの完了コールバックで全体を確定させる
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            errors = [p.exception() for p in parts if p.exception() is not None]
+            if errors:
+                done.set_exception(errors[0])  # type: ignore[arg-type]
+                return
+            done.set_result(
+                ExportReport(
+                    fmt=fmt,
+                    dest=dest,
+                    files=tuple(p.result() for p in parts),
+                    elapsed_sec=perf_counter() - started,
+                )
+            )
+
+        if not parts:
+            done.set_result(ExportReport(fmt=fmt, dest=dest, files=(), elapsed_sec=0.0))
+        for p in parts:
+            p.add_done_callback(_finish)
+        return done
+
+    def close(self, wait: bool = True) -> None:
+        """プールを停止する (wait=True なら実行中のエクスポート完了を待つ)。"""
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "ResultExporter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+__all__ = [
+    "FORMAT_CSV",
+    "FORMAT_JSONL",
+    "FORMAT_BINARY",
+    "EXPORT_FORMATS",
+    "DEFAULT_CHUNK_RECORDS",
+    "DEFAULT_EXPORT_WORKERS",
+    "TimeRange",
+    "CameraExport",
+    "ExportReport",
+    "ResultExporter",
+    "export_camera",
+    "iter_chunks",
+    "read_binary",
+]
@@ -0,0 +1,123 @@
+"""全カメラ横断 (フリート) の集計サマリ。
+
+per-camera 統計と同じ tick で算出し、AggregatorSnapshot.fleet として公開する。
+
+構成:
+    FleetSummary: 合計 FPS / フリート全体のレイテンシ分位点 / 平均ドロップ率 /
+        悪化カメラ上位 K 件 (p95 レイテンシ, ドロップ率)。
+    summarize_fleet: per-camera 統計とレイテンシヒストグラムから FleetSummary を組立てる。
+
+計算量:
+    O(カメラ数 × (使用バケット数 + log K))。分位点は per-camera ヒストグラムをマージして
+    求め (per-camera p95 の平均ではない)、上位 K 件はサイズ K のヒープで選ぶため全体ソートしない。
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import Any, Dict, Final, Iterable, List, Mapping, Optional, Tuple
+
+from .latency_sketch import LatencyHistogram
+
+DEFAULT_FLEET_TOP_K: Final = 5
+
+# (camera_id, 値) の降順列
+Ranking = Tuple[Tuple[str, float], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class FleetSummary:
+    """全カメラの集計値。
+
+    Attributes:
+        cameras (int): 統計対象カメラ数。
+        total_fps (float): fps の合計 (StatsMessage 上書き後の値)。
+        total_ema_fps (float): ema_fps の合計。
+        latency_count (int): 分位点算出に用いたサンプル数。
+        latency_p50_ms / latency_p95_ms / latency_p99_ms (Optional[float]):
+            全カメラのヒストグラムをマージした分位点 (サンプル 0 件なら None)。
+        mean_drop_rate (Optional[float]): drop_rate を持つカメラの平均 (該当なしは None)。
+        worst_latency (Ranking): latency_p95_ms 上位 K カメラ (降順)。
+        worst_drop_rate (Ranking): drop_rate 上位 K カメラ (降順)。
+    """
+
+    cameras: int = 0
+    total_fps: float = 0.0
+    total_ema_fps: float = 0.0
+    latency_count: int = 0
+    latency_p50_ms: Optional[float] = None
+    latency_p95_ms: Optional[float] = None
+    latency_p99_ms: Optional[float] = None
+    mean_drop_rate: Optional[float] = None
+    worst_latency: Ranking = ()
+    worst_drop_rate: Ranking = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ログ / JSON 出力用の辞書 (ランキングは {camera: 値} の降順)。"""
+        return {
+            "cameras": self.cameras,
+            "total_fps": self.total_fps,
+            "total_ema_fps": self.total_ema_fps,
+            "latency_count": self.latency_count,
+            "latency_p50_ms": self.latency_p50_ms,
+            "latency_p95_ms": self.latency_p95_ms,
+            "latency_p99_ms": self.latency_p99_ms,
+            "mean_drop_rate": self.mean_drop_rate,
+            "worst_latency": dict(self.worst_latency),
+            "worst_drop_rate": dict(self.worst_drop_rate),
+        }
+
+
+def _top(k: int, items: List[Tuple[float, str]]) -> Ranking:
+    # heapq.nlargest はサイズ k のヒープで選択する (O(n log k))。同値はカメラ ID 降順
+    return tuple((cam, value) for value, cam in heapq.nlargest(k, items))
+
+
+def summarize_fleet(
+    stats: Mapping[str, Mapping[str, Any]],
+    histograms: Iterable[LatencyHistogram],
+    top_k: int = DEFAULT_FLEET_TOP_K,
+) -> FleetSummary:
+    """per-camera 統計からフリート集計を求める。
+
+    Args:
+        stats (Mapping[str, Mapping[str, Any]]): snapshot_stats と同形式の per-camera 統計。
+        histograms (Iterable[LatencyHistogram]): 各カメラの分位点窓ヒストグラム。
+        top_k (int): 悪化カメラのランキング件数 (0 ならランキングなし)。
+
+    Returns:
+        FleetSummary: 集計結果。
+    """
+    total_fps = 0.0
+    total_ema = 0.0
+    drop_sum = 0.0
+    by_latency: List[Tuple[float, str]] = []
+    by_drop: List[Tuple[float, str]] = []
+    for cam, entry in stats.items():
+        total_fps += entry.get("fps") or 0.0
+        total_ema += entry.get("ema_fps") or 0.0
+        p95 = entry.get("latency_p95_ms")
+        if p95 is not None:
+            by_latency.append((p95, cam))
+        drop = entry.get("drop_rate")
+        if drop is not None:
+            drop_sum += drop
+            by_drop.append((drop, cam))
+    hist = LatencyHistogram.merged(histograms)
+    p50, p95, p99 = hist.quantiles((0.5, 0.95, 0.99))
+    return FleetSummary(
+        cameras=len(stats),
+        total_fps=total_fps,
+        total_ema_fps=total_ema,
+        latency_count=hist.count,
+        latency_p50_ms=p50,
+        latency_p95_ms=p95,
+        latency_p99_ms=p99,
+        mean_drop_rate=drop_sum / len(by_drop) if by_drop else None,
+        worst_latency=_top(top_k, by_latency),
+        worst_drop_rate=_top(top_k, by_drop),
+    )
+
+
+__all__ = ["DEFAULT_FLEET_TOP_K", "FleetSummary", "summarize_fleet"]
@@ -0,0 +1,233 @@
+"""worker→親 のフレーム受け渡し用 共有メモリリング (ゼロコピー)。
+
+録画 / GUI プレビューへフレームを multiprocessing.Queue で送ると 1 フレーム毎に数 MB を
+pickle しパイプへ書くことになる。FrameRing はカメラ毎の共有メモリ上に固定長スロットを
+確保し、worker は取得フレームをスロットへコピーして、位置 (messages.FrameDescriptor,
+数十バイト) だけを結果キューで送る。親はスロットを numpy ビューとして参照する (コピーなし)。
+
+共有メモリ配置 (multiprocessing.shared_memory, 64 バイト境界):
+    ヘッダ (64B): magic / スロット数 / 次元数 / スロット長 / shape
+    スロット表 (スロット毎 64B): seq / index / pts_ns (-1 = なし) / captured_ns
+    データ: スロット毎にフレーム 1 枚 (uint8, shape はヘッダ記載)
+
+seqlock 方式 (書込み 1 / 読出し多):
+    書込みは seq を奇数にしてから画素とメタ情報を書き、最後に偶数 (+2) にする。
+    読出しは記述子の seq (偶数) とスロットの現在 seq が一致する間だけ有効。ビュー
+    (view) は読み終えた後に is_current で確認し、不一致なら上書き途中 / 上書き済みとして
+    破棄する。read はコピーを作ってから確認する (有効なコピーか None)。
+    スロット数を超えて遅れた読出しは上書きされる (古いフレームは失ってよい用途向け)。
+    注意: 順序保証は Python の逐次実行と x86 の TSO に依存する (弱い順序の CPU では
+    is_current の確認が有効性の判定として厳密でない)。
+
+寿命:
+    worker が create し、close 時に unlink する。親は記述子の ring_name で attach する
+    (unlink 後も attach 済みのビューは有効)。親と worker は同じ resource_tracker を使う
+    (プロセス起動前に ensure_running)。attach 時の登録は worker の unlink で解除される。
+"""
+
+from __future__ import annotations
+
+import struct
+from multiprocessing import shared_memory
+from threading import Lock
+from typing import Callable, Dict, Final, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .messages import FrameDescriptor
+
+DEFAULT_RING_SLOTS: Final = 8
+RING_MAGIC: Final = b"FRNG0001"
+
+_ALIGN = 64
+_HEADER = struct.Struct("<8sIIQ4I")  # magic, slots, ndim, slot_bytes, shape[4]
+_TABLE_COLS = _ALIGN // 8  # int64 x 8 = 64B / スロット
+_SEQ, _INDEX, _PTS, _CAPTURED = range(4)
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class FrameRing:
+    """カメラ 1 台分の共有メモリフレームリング。
+
+    Attributes:
+        name (str): 共有メモリ名 (FrameDescriptor.ring_name)。
+        slots (int): スロット数。
+        shape (Tuple[int, ...]): フレーム shape (uint8)。
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        """create / attach を使う。"""
+        magic, slots, ndim, slot_bytes, *dims = _HEADER.unpack_from(shm.buf, 0)
+        if magic != RING_MAGIC or not 0 < ndim <= 4:
+            shm.close()
+            raise ValueError(f"FrameRing ではない共有メモリ: {shm.name}")
+        self._shm: Optional[shared_memory.SharedMemory] = shm
+        self._owner = owner
+        self.name: str = shm.name
+        self.slots: int = slots
+        self.shape: Tuple[int, ...] = tuple(dims[:ndim])
+        self._table = np.ndarray(
+            (slots, _TABLE_COLS), np.int64, shm.buf, offset=_ALIGN
+        )
+        data_off = _ALIGN + slots * _ALIGN
+        stride = _align(slot_bytes)
+        self._views: List[np.ndarray] = []
+        for i in range(slots):
+            v = np.ndarray(self.shape, np.uint8, shm.buf, offset=data_off + i * stride)
+            if not owner:
+                v.flags.writeable = False
+            self._views.append(v)
+        self._next = 0
+
+    @classmethod
+    def create(
+        cls,
+        shape: Sequence[int],
+        slots: int = DEFAULT_RING_SLOTS,
+        name: Optional[str] = None,
+    ) -> "FrameRing":
+        """書込み側 (worker) としてリングを作成する。"""
+        shape = tuple(int(d) for d in shape)
+        if slots < 1:
+            raise ValueError("slots は 1 以上である必要があります")
+        if not 0 < len(shape) <= 4 or min(shape) < 1:
+            raise ValueError(f"shape が不正: {shape}")
+        slot_bytes = int(np.prod(shape))
+        size = _ALIGN + slots * _ALIGN + slots * _align(slot_bytes)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        dims = shape + (0,) * (4 - len(shape))
+        _HEADER.pack_into(shm.buf, 0, RING_MAGIC, slots, len(shape), slot_bytes, *dims)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "FrameRing":
+        """読出し側 (親) として既存リングに接続する (FileNotFoundError: unlink 済み)。"""
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    def write(
+        self, data: np.ndarray, index: int, pts_ns: Optional[int], captured_ns: int
+    ) -> Tuple[int, int]:
+        """次のスロットへフレームを書き、(slot, seq) を返す。"""
+        if not self._owner:
+            raise ValueError("attach したリングには書き込めません")
+        slot = self._next
+        self._next = (slot + 1) % self.slots
+        row = self._table[slot]
+        seq = int(row[_SEQ]) + 2
+        row[_SEQ] = seq - 1  # 書込み中 (奇数)
+        np.copyto(self._views[slot], data.reshape(self.shape))
+        row[_INDEX] = index
+        row[_PTS] = -1 if pts_ns is None else pts_ns
+        row[_CAPTURED] = captured_ns
+        row[_SEQ] = seq
+        return slot, seq
+
+    def view(self, slot: int) -> np.ndarray:
+        """スロットの画素ビュー (コピーなし)。使用後に is_current で有効性を確認する。"""
+        return self._views[slot]
+
+    def is_current(self, slot: int, seq: int) -> bool:
+        """スロットが記述子の書込み (seq) のまま上書きされていなければ True。"""
+        return int(self._table[slot, _SEQ]) == seq
+
+    def read(self, slot: int, seq: int) -> Optional[np.ndarray]:
+        """スロットのコピーを返す (コピー中に上書きされた / 上書き済みなら None)。"""
+        if not self.is_current(slot, seq):
+            return None
+        out = self._views[slot].copy()
+        return out if self.is_current(slot, seq) else None
+
+    def close(self) -> None:
+        """マッピングを閉じ、作成側なら共有メモリを削除する (冪等)。"""
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        self._views = []
+        del self._table
+        if self._owner:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        try:
+            shm.close()
+        except BufferError:
+            # 呼出し側がビューを保持中: 参照解放時に GC で閉じられる
+            pass
+
+
+FrameListener = Callable[[FrameDescriptor, np.ndarray], None]
+
+
+class FrameRingHub:
+    """親側: 記述子を受けてリングへ attach し、最新フレーム参照とリスナ通知を提供する。
+
+    publish は dispatcher スレッドから、latest は GUI 等の任意スレッドから呼ばれる。
+    リスナ (録画等) は dispatcher スレッド上でビュー (コピーなし) を受け取るため、
+    保持・遅延処理する場合は読み終えた後に ring(desc).is_current で確認するか copy する。
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._rings: Dict[str, FrameRing] = {}  # camera_id -> 現在のリング
+        self._latest: Dict[str, FrameDescriptor] = {}
+        self._listeners: List[FrameListener] = []
+
+    def add_listener(self, listener: FrameListener) -> None:
+        self._listeners.append(listener)
+
+    def ring(self, desc: FrameDescriptor) -> Optional[FrameRing]:
+        """記述子のリング (未 attach なら attach, worker 終了済みなら None)。"""
+        with self._lock:
+            ring = self._rings.get(desc.camera_id)
+            if ring is not None and ring.name == desc.ring_name:
+                return ring
+            try:
+                new = FrameRing.attach(desc.ring_name)
+            except (FileNotFoundError, ValueError):
+                return None
+            if ring is not None:  # worker 再起動で新しいリング
+                ring.close()
+            self._rings[desc.camera_id] = new
+            return new
+
+    def publish(self, desc: FrameDescriptor) -> None:
+        ring = self.ring(desc)
+        if ring is None:
+            return
+        self._latest[desc.camera_id] = desc
+        for listener in self._listeners:
+            listener(desc, ring.view(desc.slot))
+
+    def latest(
+        self, camera_id: str
+    ) -> Optional[Tuple[FrameDescriptor, np.ndarray]]:
+        """カメラの最新フレーム (記述子, コピー)。未受信 / 上書き済みなら None。"""
+        desc = self._latest.get(camera_id)
+        if desc is None:
+            return None
+        with self._lock:
+            ring = self._rings.get(camera_id)
+            if ring is None or ring.name != desc.ring_name:
+                return None
+            data = ring.read(desc.slot, desc.seq)
+        return None if data is None else (desc, data)
+
+    def close(self) -> None:
+        with self._lock:
+            for ring in self._rings.values():
+                ring.close()
+            self._rings.clear()
+            self._latest.clear()
+
+
+__all__ = [
+    "DEFAULT_RING_SLOTS",
+    "RING_MAGIC",
+    "FrameListener",
+    "FrameRing",
+    "FrameRingHub",
+]
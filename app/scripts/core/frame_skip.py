@@ -0,0 +1,113 @@
+"""処理レイテンシ駆動の適応フレーム間引き (取得時点の負荷制限)。
+
+過負荷は従来、処理済み結果が結果キュー満杯で破棄される形でしか現れず、最も高価な
+推論処理が無駄になっていた。AdaptiveFrameSkipper は worker 自身の直近処理レイテンシの
+p95 を目標 (PerfConfig.latency_p95_target_ms) と比べ、過負荷時はフレームを取得直後に
+間引く (推論しない)。
+
+制御:
+    stride: stride フレームに 1 フレームだけ処理する (1 = 間引きなし)。
+    window 件の処理レイテンシ毎に p95 を評価し、
+        p95 > 目標: stride を 2 倍 (素早く負荷を落とす)
+        p95 < 目標 × low_ratio: stride を 1 減らす (ゆっくり戻す)
+        その間: 維持 (ヒステリシス帯。目標付近での振動を防ぐ)
+    評価毎に窓をクリアするため、変更後の stride でのレイテンシだけで次を判断する。
+    stride の上限は target_fps / min_fps (実効サンプリング率が min_fps を下回らない)。
+
+利用例:
+    worker.CaptureInferenceWorker (latency_target_ms 指定時)。
+"""
+
+from __future__ import annotations
+
+from typing import Final, List, Optional
+
+DEFAULT_SKIP_WINDOW: Final = 16
+DEFAULT_LOW_RATIO: Final = 0.7
+
+
+class AdaptiveFrameSkipper:
+    """目標 p95 レイテンシに合わせてフレームの間引き間隔 (stride) を調整する。
+
+    Attributes:
+        stride (int): 現在の間引き間隔 (stride フレームに 1 フレーム処理)。
+        skipped (int): admit() が False を返した累計。
+        latency_p95_ms (Optional[float]): 直近評価時の p95 (未評価なら None)。
+    """
+
+    __slots__ = (
+        "stride",
+        "skipped",
+        "latency_p95_ms",
+        "_target_fps",
+        "_target_ms",
+        "_low_ms",
+        "_max_stride",
+        "_window",
+        "_samples",
+        "_count",
+    )
+
+    def __init__(
+        self,
+        target_fps: float,
+        latency_target_ms: float,
+        *,
+        min_fps: float = 1.0,
+        window: int = DEFAULT_SKIP_WINDOW,
+        low_ratio: float = DEFAULT_LOW_RATIO,
+    ) -> None:
+        if target_fps <= 0 or latency_target_ms <= 0:
+            raise ValueError("target_fps / latency_target_ms は正数である必要があります")
+        if not 0 < min_fps <= target_fps:
+            raise ValueError("min_fps は 0 < min_fps <= target_fps である必要があります")
+        if window < 1:
+            raise ValueError("window は 1 以上である必要があります")
+        if not 0 < low_ratio < 1:
+            raise ValueError("low_ratio は 0 < low_ratio < 1 である必要があります")
+        self.stride = 1
+        self.skipped = 0
+        self.latency_p95_ms: Optional[float] = None
+        self._target_fps = target_fps
+        self._target_ms = latency_target_ms
+        self._low_ms = latency_target_ms * low_ratio
+        self._max_stride = max(1, int(target_fps // min_fps))
+        self._window = window
+        self._samples: List[float] = []
+        self._count = 0
+
+    @property
+    def effective_fps(self) -> float:
+        """現在のサンプリング率 (target_fps / stride)。"""
+        return self._target_fps / self.stride
+
+    def admit(self) -> bool:
+        """取得したフレームを処理するなら True (間引くなら False, skipped に加算)。"""
+        keep = self._count % self.stride == 0
+        self._count += 1
+        if not keep:
+            self.skipped += 1
+        return keep
+
+    def record(self, latency_ms: float) -> None:
+        """処理したフレームのレイテンシを記録し、window 件毎に stride を見直す。"""
+        samples = self._samples
+        samples.append(latency_ms)
+        if len(samples) < self._window:
+            return
+        samples.sort()
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        samples.clear()
+        self.latency_p95_ms = p95
+        if p95 > self._target_ms:
+            stride = min(self._max_stride, self.stride * 2)
+        elif p95 < self._low_ms:
+            stride = max(1, self.stride - 1)
+        else:
+            return
+        if stride != self.stride:
+            self.stride = stride
+            self._count = 0  # 次の取得フレームから新しい間隔で処理
+
+
+__all__ = ["DEFAULT_SKIP_WINDOW", "DEFAULT_LOW_RATIO", "AdaptiveFrameSkipper"]
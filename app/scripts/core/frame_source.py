@@ -0,0 +1,679 @@
+"""フレーム入力層 (FrameSource) と合成 / ファイル入力実装。
+
+CaptureInferenceWorker はフレームを FrameSource.read() で取得する。RTSP 以外の入力
+(合成フレーム / 録画ファイルの再解析 = UC-04 / 画像列) を同じ経路で扱い、取得・デコード
+コストを推論処理と分けて計測できるようにする。
+
+構成:
+    Frame: 1 フレーム (連番 / ストリーム上の提示時刻 / 取得時刻 / 画素 ndarray)。
+    FrameSpec: 解像度・画素形式・FPS・総フレーム数。
+    FrameSource: worker が利用するプロトコル (read / close / spec)。
+    SyntheticFrameSource: numpy による合成フレーム (解像度・パターン指定, ベンチマーク用)。
+    RawVideoSource: 固定長フレームを連結した生映像ファイル (gray / rgb24 / bgr24 / i420)。
+    Y4MSource: YUV4MPEG2 ファイル (C420* / C422 / C444 / Cmono)。
+    ImageSequenceSource: 画像ファイル列 (.npy / .pgm / .ppm, 他形式は decoder 指定)。
+    open_frame_source: URL / パスから上記を生成する。
+
+ゼロコピー:
+    RawVideoSource / Y4MSource はファイルを読取専用 mmap し、各フレームは mmap 上の
+    ndarray ビュー (書込み不可) として返す。.npy は np.load(mmap_mode="r")。
+
+先読み (prefetch):
+    全ソースは prefetch 件のバッファを持ち、別スレッドで次フレームを取得しておく
+    (取得・デコードと推論処理が重なる)。prefetch=0 なら read() 呼出し時に同期取得。
+    終端では read() が None を返す。取得スレッドの例外は read() で再送出する。
+
+画素形式 (Frame.data の shape, dtype は uint8):
+    gray: (H, W) / rgb24・bgr24: (H, W, 3) / i420 (= Y4M C420*): (H * 3 // 2, W)
+    yuv422p (Y4M C422): (H * 2, W) / yuv444p (Y4M C444): (3, H, W)
+"""
+
+from __future__ import annotations
+
+import mmap
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from . import utils_time
+from .errors import StreamConnectionError
+
+PIXEL_GRAY: Final = "gray"
+PIXEL_RGB24: Final = "rgb24"
+PIXEL_BGR24: Final = "bgr24"
+PIXEL_I420: Final = "i420"
+PIXEL_YUV422P: Final = "yuv422p"
+PIXEL_YUV444P: Final = "yuv444p"
+DEFAULT_PREFETCH: Final = 2
+SYNTHETIC_PATTERNS: Final[Tuple[str, ...]] = ("gradient", "noise")
+
+_Y4M_MAGIC: Final = b"YUV4MPEG2 "
+_Y4M_FRAME: Final = b"FRAME"
+_Y4M_COLORSPACES: Final[Dict[str, str]] = {
+    "420": PIXEL_I420,
+    "420jpeg": PIXEL_I420,
+    "420paldv": PIXEL_I420,
+    "420mpeg2": PIXEL_I420,
+    "422": PIXEL_YUV422P,
+    "444": PIXEL_YUV444P,
+    "mono": PIXEL_GRAY,
+}
+
+
+def frame_shape(pixel_format: str, width: int, height: int) -> Tuple[int, ...]:
+    """画素形式と解像度から Frame.data の shape を返す。
+
+    Raises:
+        ValueError: 未対応の画素形式 / 解像度が不正 (4:2:0 は偶数のみ)。
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError(f"解像度が不正: {width}x{height}")
+    if pixel_format == PIXEL_GRAY:
+        return (height, width)
+    if pixel_format in (PIXEL_RGB24, PIXEL_BGR24):
+        return (height, width, 3)
+    if pixel_format == PIXEL_I420:
+        if width % 2 or height % 2:
+            raise ValueError(f"i420 は偶数解像度のみ: {width}x{height}")
+        return (height * 3 // 2, width)
+    if pixel_format == PIXEL_YUV422P:
+        if width % 2:
+            raise ValueError(f"yuv422p は偶数幅のみ: {width}")
+        return (height * 2, width)
+    if pixel_format == PIXEL_YUV444P:
+        return (3, height, width)
+    raise ValueError(f"未対応の画素形式: {pixel_format}")
+
+
+@dataclass(frozen=True, slots=True)
+class FrameSpec:
+    """ソースのフレーム仕様。
+
+    Attributes:
+        width (int): 幅 (px)。
+        height (int): 高さ (px)。
+        pixel_format (str): 画素形式 (PIXEL_*)。
+        fps (Optional[float]): ソース上の FPS (不明なら None)。
+        frame_count (Optional[int]): 総フレーム数 (無限 / 不明なら None)。
+    """
+
+    width: int
+    height: int
+    pixel_format: str
+    fps: Optional[float] = None
+    frame_count: Optional[int] = None
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return frame_shape(self.pixel_format, self.width, self.height)
+
+    @property
+    def frame_bytes(self) -> int:
+        return int(np.prod(self.shape))
+
+
+@dataclass(frozen=True, slots=True)
+class Frame:
+    """取得済みフレーム。
+
+    Attributes:
+        index (int): ソース内の 0 始まり連番。
+        pts_ns (Optional[int]): ストリーム上の提示時刻 (index / fps, FPS 不明なら None)。
+        captured_ns (int): 取得完了時刻 (モノトニック ns)。
+        data (np.ndarray): 画素 (uint8, shape はモジュール docstring 参照)。
+            ファイル由来は読取専用ビューのため変更する場合は copy() する。
+    """
+
+    index: int
+    pts_ns: Optional[int]
+    captured_ns: int
+    data: np.ndarray
+
+
+class FrameSource(Protocol):
+    """worker が利用するフレーム入力。"""
+
+    @property
+    def spec(self) -> FrameSpec: ...
+
+    def read(self) -> Optional[Frame]:
+        """次フレームを返す (終端なら None)。"""
+        ...
+
+    def close(self) -> None: ...
+
+
+_END = object()
+
+
+class _PrefetchingSource:
+    """先読みスレッドと Frame 組立てを共通化した基底。
+
+    派生クラスは spec を設定し _next_data (次フレームの画素, 終端なら None) を実装する。
+    _next_data は先読みスレッド (prefetch > 0) または read() の呼出しスレッドで実行される。
+    """
+
+    def __init__(self, spec: FrameSpec, prefetch: int) -> None:
+        if prefetch < 0:
+            raise ValueError("prefetch は 0 以上である必要があります")
+        self._spec = spec
+        self._prefetch = prefetch
+        self._index = 0
+        self._frame_ns = None if not spec.fps else round(1_000_000_000 / spec.fps)
+        self._buffer: Optional["queue.Queue[object]"] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self._ended = False
+
+    @property
+    def spec(self) -> FrameSpec:
+        return self._spec
+
+    def _next_data(self) -> Optional[np.ndarray]:  # pragma: no cover - 抽象
+        raise NotImplementedError
+
+    def _release(self) -> None:
+        """close 時の資源解放 (先読みスレッド停止後に呼ばれる)。"""
+
+    def _capture(self) -> Optional[Frame]:
+        data = self._next_data()
+        if data is None:
+            return None
+        index = self._index
+        self._index += 1
+        pts = None if self._frame_ns is None else index * self._frame_ns
+        return Frame(index, pts, utils_time.monotonic_ns(), data)
+
+    def _run_prefetch(self) -> None:
+        buf = self._buffer
+        assert buf is not None
+        while not self._closed.is_set():
+            try:
+                item: object = self._capture()
+            except Exception as e:  # noqa: BLE001 - read() 側で再送出
+                item = e
+            if item is None:
+                item = _END
+            # 満杯時は close を確認しながら待つ
+            while not self._closed.is_set():
+                try:
+                    buf.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if item is _END or isinstance(item, Exception):
+                return
+
+    def read(self) -> Optional[Frame]:
+        """次フレームを返す (終端 / close 済みなら None)。
+
+        Raises:
+            StreamConnectionError 等: 取得・デコードでの例外 (先読みスレッドの例外を含む)。
+        """
+        if self._ended or self._closed.is_set():
+            return None
+        if self._prefetch == 0:
+            frame = self._capture()
+            self._ended = frame is None
+            return frame
+        if self._thread is None:
+            self._buffer = queue.Queue(maxsize=self._prefetch)
+            self._thread = threading.Thread(
+                target=self._run_prefetch, name="FramePrefetch", daemon=True
+            )
+            self._thread.start()
+        assert self._buffer is not None
+        item = self._buffer.get()
+        if item is _END:
+            self._ended = True
+            return None
+        if isinstance(item, Exception):
+            self._ended = True
+            raise item
+        assert isinstance(item, Frame)
+        return item
+
+    def close(self) -> None:
+        """先読みを停止し資源を解放する (冪等)。"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._buffer = None
+        self._release()
+
+    def __enter__(self) -> "_PrefetchingSource":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class SyntheticFrameSource(_PrefetchingSource):
+    """合成フレーム (gradient: フレーム毎に 1 ずつ明るさが変わる勾配 / noise: 一様乱数)。"""
+
+    def __init__(
+        self,
+        width: int = 640,
+        height: int = 480,
+        pixel_format: str = PIXEL_BGR24,
+        *,
+        frames: Optional[int] = None,
+        pattern: str = "gradient",
+        fps: Optional[float] = None,
+        seed: int = 0,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> None:
+        if pattern not in SYNTHETIC_PATTERNS:
+            raise ValueError(f"pattern が不正: {pattern} (有効: {SYNTHETIC_PATTERNS})")
+        if frames is not None and frames < 0:
+            raise ValueError("frames は 0 以上である必要があります")
+        spec = FrameSpec(width, height, pixel_format, fps, frames)
+        super().__init__(spec, prefetch)
+        shape = spec.shape
+        self._pattern = pattern
+        self._rng = np.random.default_rng(seed)
+        # 勾配の基底 (横方向 0-255)。broadcast ビューのままだと加算が 10 倍以上遅いため連続化
+        ramp = np.linspace(0, 255, width, dtype=np.float32).astype(np.uint8)
+        if pixel_format in (PIXEL_RGB24, PIXEL_BGR24):
+            ramp = ramp[:, np.newaxis]
+        self._base = np.ascontiguousarray(np.broadcast_to(ramp, shape))
+        self._generated = 0
+
+    def _next_data(self) -> Optional[np.ndarray]:
+        frames = self._spec.frame_count
+        if frames is not None and self._generated >= frames:
+            return None
+        n = self._generated
+        self._generated += 1
+        if self._pattern == "noise":
+            return self._rng.integers(0, 256, self._base.shape, dtype=np.uint8)
+        out = np.empty(self._base.shape, dtype=np.uint8)
+        np.add(self._base, np.uint8(n & 0xFF), out=out)  # uint8 の桁あふれ = 循環
+        return out
+
+
+class _MappedFile:
+    """読取専用 mmap (フレームはこの上のビューとして返す)。"""
+
+    def __init__(self, path: Path) -> None:
+        try:
+            with path.open("rb") as f:
+                self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:  # ValueError: 空ファイル
+            raise StreamConnectionError(f"映像ファイルを開けません: {path} ({e})") from e
+
+    def view(self, offset: int, shape: Tuple[int, ...]) -> np.ndarray:
+        count = int(np.prod(shape))
+        return np.frombuffer(self.mm, np.uint8, count, offset).reshape(shape)
+
+    def close(self) -> None:
+        try:
+            self.mm.close()
+        except BufferError:
+            # 呼出し側がフレームビューを保持中: 参照解放時に GC で閉じられる
+            pass
+
+
+class RawVideoSource(_PrefetchingSource):
+    """固定長フレームを連結した生映像ファイル (ヘッダなし)。
+
+    ファイル長がフレーム長の倍数でない場合、末尾の端数は無視する。
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        width: int,
+        height: int,
+        pixel_format: str = PIXEL_I420,
+        *,
+        fps: Optional[float] = None,
+        loop: bool = False,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> None:
+        shape = frame_shape(pixel_format, width, height)
+        self._file = _MappedFile(Path(path))
+        frame_bytes = int(np.prod(shape))
+        count = len(self._file.mm) // frame_bytes
+        super().__init__(
+            FrameSpec(width, height, pixel_format, fps, None if loop else count),
+            prefetch,
+        )
+        self._shape = shape
+        self._frame_bytes = frame_bytes
+        self._count = count
+        self._loop = loop
+        self._pos = 0
+
+    def _next_data(self) -> Optional[np.ndarray]:
+        if self._pos >= self._count:
+            if not self._loop or self._count == 0:
+                return None
+            self._pos = 0
+        data = self._file.view(self._pos * self._frame_bytes, self._shape)
+        self._pos += 1
+        return data
+
+    def _release(self) -> None:
+        self._file.close()
+
+
+class Y4MSource(_PrefetchingSource):
+    """YUV4MPEG2 ファイル。
+
+    ストリームヘッダの W / H / F / C を解釈する (C 省略時は 420jpeg)。インタレース・
+    アスペクト等は無視する。フレームヘッダ (FRAME + 任意パラメータ) は開始時に走査して
+    各フレームの画素オフセットを求める。
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        loop: bool = False,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> None:
+        path = Path(path)
+        self._file = _MappedFile(path)
+        mm = self._file.mm
+        eol = mm.find(b"\n")
+        if not mm[: len(_Y4M_MAGIC)] == _Y4M_MAGIC or eol < 0:
+            self._file.close()
+            raise StreamConnectionError(f"Y4M ヘッダが不正: {path}")
+        try:
+            width, height, fps, pixel_format = self._parse_header(
+                mm[len(_Y4M_MAGIC) : eol].decode("ascii")
+            )
+            shape = frame_shape(pixel_format, width, height)
+        except (ValueError, UnicodeDecodeError) as e:
+            self._file.close()
+            raise StreamConnectionError(f"Y4M ヘッダが不正: {path} ({e})") from e
+        frame_bytes = int(np.prod(shape))
+        offsets = self._scan_frames(mm, eol + 1, frame_bytes)
+        super().__init__(
+            FrameSpec(width, height, pixel_format, fps, None if loop else len(offsets)),
+            prefetch,
+        )
+        self._shape = shape
+        self._offsets = offsets
+        self._loop = loop
+        self._pos = 0
+
+    @staticmethod
+    def _parse_header(header: str) -> Tuple[int, int, Optional[float], str]:
+        width = height = 0
+        fps: Optional[float] = None
+        colorspace = "420jpeg"
+        for token in header.split():
+            tag, value = token[0], token[1:]
+            if tag == "W":
+                width = int(value)
+            elif tag == "H":
+                height = int(value)
+            elif tag == "F":
+                num, _, den = value.partition(":")
+                fps = int(num) / int(den or 1) if int(num) else None
+            elif tag == "C":
+                colorspace = value
+        if colorspace not in _Y4M_COLORSPACES:
+            raise ValueError(f"未対応の色空間: C{colorspace}")
+        return width, height, fps, _Y4M_COLORSPACES[colorspace]
+
+    @staticmethod
+    def _scan_frames(mm: mmap.mmap, pos: int, frame_bytes: int) -> List[int]:
+        offsets: List[int] = []
+        size = len(mm)
+        while pos < size:
+            if mm[pos : pos + len(_Y4M_FRAME)] != _Y4M_FRAME:
+                break
+            eol = mm.find(b"\n", pos)
+            if eol < 0 or eol + 1 + frame_bytes > size:
+                break  # 書込み途中の末尾フレームは無視
+            offsets.append(eol + 1)
+            pos = eol + 1 + frame_bytes
+        return offsets
+
+    def _next_data(self) -> Optional[np.ndarray]:
+        if self._pos >= len(self._offsets):
+            if not self._loop or not self._offsets:
+                return None
+            self._pos = 0
+        data = self._file.view(self._offsets[self._pos], self._shape)
+        self._pos += 1
+        return data
+
+    def _release(self) -> None:
+        self._file.close()
+
+
+ImageDecoder = Callable[[Path], np.ndarray]
+
+
+def _load_npy(path: Path) -> np.ndarray:
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def _load_pnm(path: Path) -> np.ndarray:
+    """バイナリ PGM (P5) / PPM (P6), maxval <= 255 を読む。"""
+    raw = path.read_bytes()
+    fields: List[bytes] = []
+    pos = 0
+    while len(fields) < 4:
+        while pos < len(raw) and raw[pos : pos + 1].isspace():
+            pos += 1
+        if raw[pos : pos + 1] == b"#":  # コメント行
+            pos = raw.index(b"\n", pos) + 1
+            continue
+        end = pos
+        while end < len(raw) and not raw[end : end + 1].isspace():
+            end += 1
+        fields.append(raw[pos:end])
+        pos = end
+    magic, width, height, maxval = fields[0], *(int(f) for f in fields[1:])
+    if magic not in (b"P5", b"P6") or maxval > 255:
+        raise ValueError(f"未対応の PNM: {path} ({magic!r}, maxval={maxval})")
+    shape = (height, width) if magic == b"P5" else (height, width, 3)
+    return np.frombuffer(raw, np.uint8, int(np.prod(shape)), pos + 1).reshape(shape)
+
+
+IMAGE_DECODERS: Final[Dict[str, ImageDecoder]] = {
+    ".npy": _load_npy,
+    ".pgm": _load_pnm,
+    ".ppm": _load_pnm,
+}
+
+
+class ImageSequenceSource(_PrefetchingSource):
+    """画像ファイル列 (ファイル名順)。
+
+    decoder 省略時は拡張子 (大文字小文字を区別しない) で IMAGE_DECODERS から選ぶ
+    (.npy / .pgm / .ppm)。他形式 (JPEG / PNG 等) は decoder に画像ライブラリの読込関数を
+    渡す。ディレクトリ指定時、decoder 省略なら対応拡張子のファイル、指定ありなら全ての
+    通常ファイルを読む。
+    解像度・画素形式は先頭画像から決め (3 次元は 3 チャネルのみ)、以降の画像が異なる
+    場合は StreamConnectionError。
+    """
+
+    def __init__(
+        self,
+        paths: Union[str, Path, Sequence[Path]],
+        *,
+        decoder: Optional[ImageDecoder] = None,
+        fps: Optional[float] = None,
+        loop: bool = False,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> None:
+        files = self._resolve(paths, any_file=decoder is not None)
+        if not files:
+            raise StreamConnectionError(f"画像がありません: {paths}")
+        self._files = files
+        self._decoder = decoder
+        first = self._decode(files[0])
+        if first.ndim == 3 and first.shape[2] != 3:
+            raise StreamConnectionError(
+                f"未対応のチャネル数 (3 のみ): {files[0]} {first.shape}"
+            )
+        height, width = first.shape[:2]
+        pixel_format = PIXEL_GRAY if first.ndim == 2 else PIXEL_RGB24
+        super().__init__(
+            FrameSpec(width, height, pixel_format, fps, None if loop else len(files)),
+            prefetch,
+        )
+        self._first: Optional[np.ndarray] = first
+        self._loop = loop
+        self._pos = 0
+
+    @staticmethod
+    def _resolve(
+        paths: Union[str, Path, Sequence[Path]], any_file: bool = False
+    ) -> List[Path]:
+        if isinstance(paths, (str, Path)):
+            p = Path(paths)
+            if p.is_dir():
+                return sorted(
+                    f
+                    for f in p.iterdir()
+                    if f.is_file()
+                    and (any_file or f.suffix.lower() in IMAGE_DECODERS)
+                )
+            return sorted(p.parent.glob(p.name))
+        return [Path(p) for p in paths]
+
+    def _decode(self, path: Path) -> np.ndarray:
+        decoder = self._decoder or IMAGE_DECODERS.get(path.suffix.lower())
+        if decoder is None:
+            raise StreamConnectionError(f"デコーダ未指定の画像形式: {path}")
+        try:
+            data = decoder(path)
+        except (OSError, ValueError) as e:
+            raise StreamConnectionError(f"画像を読めません: {path} ({e})") from e
+        if data.dtype != np.uint8 or data.ndim not in (2, 3):
+            raise StreamConnectionError(f"未対応の画像 (uint8 2/3 次元のみ): {path}")
+        return data
+
+    def _next_data(self) -> Optional[np.ndarray]:
+        if self._pos >= len(self._files):
+            if not self._loop:
+                return None
+            self._pos = 0
+        path = self._files[self._pos]
+        self._pos += 1
+        if self._first is not None:
+            data, self._first = self._first, None
+            return data
+        data = self._decode(path)
+        if data.shape != self._spec.shape:
+            raise StreamConnectionError(
+                f"解像度が先頭画像と異なる: {path} {data.shape} != {self._spec.shape}"
+            )
+        return data
+
+
+# パスを画像列 (glob パターン) とみなすファイル名中の文字
+_GLOB_CHARS: Final = "*?["
+
+
+def open_frame_source(
+    url: str, *, prefetch: int = DEFAULT_PREFETCH, loop: bool = False
+) -> Optional[FrameSource]:
+    """URL / パスから FrameSource を生成する。
+
+    対応形式:
+        synthetic://<W>x<H>[?format=bgr24&frames=N&pattern=gradient&fps=30&seed=0]
+        <path>.y4m / file://<path>.y4m
+        <path>.<ext>?size=<W>x<H>&format=i420[&fps=30]  (raw: 拡張子は任意)
+        <ディレクトリ> / <glob パターン> (画像列: .npy / .pgm / .ppm) [?fps=30]
+
+    画像列とみなすのはディレクトリか、ファイル名に glob 文字 (* ? [) を含むパスのみ。
+
+    Returns:
+        Optional[FrameSource]: 生成したソース。rtsp:// 等の未対応スキームと、上記以外の
+        ファイル (.mp4 等のコンテナ形式) は None (呼出し側は従来のフレームなし動作を続ける)。
+
+    Raises:
+        ValueError: パラメータ不正。
+        StreamConnectionError: ファイルを開けない / 形式不正。
+    """
+    parts = urlsplit(url)
+    query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+    fps = float(query["fps"]) if "fps" in query else None
+    if parts.scheme == "synthetic":
+        width, height = _parse_size(parts.netloc)
+        return SyntheticFrameSource(
+            width,
+            height,
+            query.get("format", PIXEL_BGR24),
+            frames=int(query["frames"]) if "frames" in query else None,
+            pattern=query.get("pattern", "gradient"),
+            fps=fps,
+            seed=int(query.get("seed", 0)),
+            prefetch=prefetch,
+        )
+    if parts.scheme not in ("", "file"):
+        return None
+    path = Path(parts.netloc + parts.path) if parts.scheme == "file" else Path(
+        parts.path
+    )
+    if "size" in query:
+        width, height = _parse_size(query["size"])
+        return RawVideoSource(
+            path,
+            width,
+            height,
+            query.get("format", PIXEL_I420),
+            fps=fps,
+            loop=loop,
+            prefetch=prefetch,
+        )
+    if path.suffix.lower() == ".y4m":
+        return Y4MSource(path, loop=loop, prefetch=prefetch)
+    if path.is_dir() or any(c in path.name for c in _GLOB_CHARS):
+        return ImageSequenceSource(path, fps=fps, loop=loop, prefetch=prefetch)
+    return None
+
+
+def _parse_size(text: str) -> Tuple[int, int]:
+    w, sep, h = text.lower().partition("x")
+    if not sep:
+        raise ValueError(f"解像度は <W>x<H> 形式: {text}")
+    return int(w), int(h)
+
+
+__all__ = [
+    "PIXEL_GRAY",
+    "PIXEL_RGB24",
+    "PIXEL_BGR24",
+    "PIXEL_I420",
+    "PIXEL_YUV422P",
+    "PIXEL_YUV444P",
+    "DEFAULT_PREFETCH",
+    "SYNTHETIC_PATTERNS",
+    "IMAGE_DECODERS",
+    "Frame",
+    "FrameSpec",
+    "FrameSource",
+    "ImageDecoder",
+    "SyntheticFrameSource",
+    "RawVideoSource",
+    "Y4MSource",
+    "ImageSequenceSource",
+    "frame_shape",
+    "open_frame_source",
+]
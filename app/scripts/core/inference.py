@@ -0,0 +1,330 @@
+"""推論バックエンド (InferenceBackend) と NumPy 参照キーポイントモデル。
+
+CaptureInferenceWorker はフレーム (frame_source.Frame.data) をバッチにまとめて
+InferenceBackend.infer_batch へ渡し、結果 (ラベル / 信頼度 / キーポイント) を
+ResultRecord にする。OpenVINO バックエンド導入前でも前処理・推論・後処理・バッチ効果・
+worker 当たりメモリを任意の Linux 環境で計測できるよう、CPU のみで動く参照モデルを持つ。
+
+構成:
+    InferenceResult: 1 フレームの推論結果。
+    InferenceBackend: worker が利用するプロトコル (load / warmup / infer_batch)。
+    NumpyKeypointBackend: NumPy 参照キーポイントモデル (下記)。
+    create_inference_backend: 名前 (<Inference backend>) からバックエンドを生成する。
+
+NumpyKeypointBackend:
+    前処理: 輝度抽出 (YUV は Y 面, RGB/BGR は重み付き和) → 最近傍縮小 (input_size 角)
+        → float32 正規化。
+    本体: 3x3 畳込み 3 層 (stride 2, 2, 1 / ReLU, 行列積) → 1x1 畳込みで
+        キーポイント毎のヒートマップ, 大域平均プーリング → 全結合でラベル分類。
+        既定 (input_size=192, channels=16/32/32, keypoints=21) で約 35M MAC / フレーム。
+    後処理: ヒートマップの argmax → 正規化座標 (x, y) と sigmoid スコア, softmax で信頼度。
+    重みは seed から決定的に生成する (weights_path 指定時は .npz から読む)。
+    推論結果の値自体に意味はなく、計算量とデータの流れを実モデルに近づけることが目的。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Dict,
+    Final,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .errors import InferenceError, ModelLoadError
+from .frame_source import (
+    PIXEL_BGR24,
+    PIXEL_GRAY,
+    PIXEL_I420,
+    PIXEL_RGB24,
+    PIXEL_YUV422P,
+    PIXEL_YUV444P,
+)
+
+BACKEND_STUB: Final = "stub"
+BACKEND_NUMPY_KEYPOINT: Final = "numpy_keypoint"
+INFERENCE_BACKENDS: Final[Tuple[str, ...]] = (BACKEND_STUB, BACKEND_NUMPY_KEYPOINT)
+DEFAULT_LABELS: Final[Tuple[str, ...]] = ("gesture_a", "gesture_b", "gesture_c")
+
+# (出力チャネル, stride) — 3x3 畳込み層の構成
+_CONV_LAYERS: Final[Tuple[Tuple[int, int], ...]] = ((16, 2), (32, 2), (32, 1))
+# 入力チャネルがこれ未満の層は im2col, 以上はタップ毎の行列積累積 (計測で速い方)
+_IM2COL_MAX_CHANNELS: Final = 8
+
+
+@dataclass(frozen=True, slots=True)
+class InferenceResult:
+    """1 フレームの推論結果。
+
+    Attributes:
+        label (str): 予測ラベル。
+        confidence (float): 信頼度 0.0-1.0。
+        keypoints (np.ndarray): (K, 3) float32。列は正規化座標 x, y (0-1) とスコア。
+    """
+
+    label: str
+    confidence: float
+    keypoints: np.ndarray
+
+
+class InferenceBackend(Protocol):
+    """worker が利用する推論バックエンド。"""
+
+    def load(self) -> None:
+        """モデルを読み込む (ModelLoadError: 失敗)。"""
+        ...
+
+    def warmup(self, runs: int = 1) -> None:
+        """初回実行コスト (メモリ確保等) を計測前に済ませる。"""
+        ...
+
+    def infer_batch(
+        self, frames: Sequence[np.ndarray], pixel_format: str
+    ) -> List[InferenceResult]:
+        """フレーム列を推論し、入力順に結果を返す (InferenceError: 失敗)。"""
+        ...
+
+
+class NumpyKeypointBackend:
+    """NumPy 参照キーポイントモデル (モジュール docstring 参照)。
+
+    Attributes:
+        input_size (int): 入力画像の一辺 (px, 4 の倍数)。
+        keypoints (int): キーポイント数。
+        labels (Tuple[str, ...]): 分類ラベル。
+    """
+
+    def __init__(
+        self,
+        *,
+        input_size: int = 192,
+        keypoints: int = 21,
+        labels: Sequence[str] = DEFAULT_LABELS,
+        weights_path: Optional[Union[str, Path]] = None,
+        seed: int = 0,
+    ) -> None:
+        if input_size < 8 or input_size % 4:
+            raise ValueError("input_size は 8 以上の 4 の倍数である必要があります")
+        if keypoints < 1 or not labels:
+            raise ValueError("keypoints と labels は 1 つ以上必要です")
+        self.input_size = input_size
+        self.keypoints = keypoints
+        self.labels = tuple(labels)
+        self._weights_path = Path(weights_path) if weights_path else None
+        self._seed = seed
+        self._weights: Optional[Dict[str, np.ndarray]] = None
+        # 最近傍縮小の行 / 列インデックス (入力解像度毎)
+        self._resize_index: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def weight_bytes(self) -> int:
+        """読込済み重みのバイト数 (未読込なら 0)。"""
+        return sum(w.nbytes for w in (self._weights or {}).values())
+
+    def load(self) -> None:
+        """重みを生成 / 読込む。
+
+        Raises:
+            ModelLoadError: weights_path が読めない / 形状が構成と合わない。
+        """
+        expected = self._weight_shapes()
+        if self._weights_path is None:
+            rng = np.random.default_rng(self._seed)
+            weights = {
+                key: (rng.standard_normal(shape) * np.sqrt(2.0 / shape[0])).astype(
+                    np.float32
+                )
+                for key, shape in expected.items()
+            }
+        else:
+            try:
+                with np.load(self._weights_path, allow_pickle=False) as npz:
+                    weights = {k: npz[k].astype(np.float32) for k in expected}
+            except (OSError, KeyError, ValueError) as e:
+                raise ModelLoadError(
+                    f"重みを読めません: {self._weights_path} ({e})"
+                ) from e
+        for key, shape in expected.items():
+            if weights[key].shape != shape:
+                raise ModelLoadError(
+                    f"重み {key} の形状不一致: {weights[key].shape} != {shape}"
+                )
+        self._weights = weights
+
+    def save_weights(self, path: Union[str, Path]) -> None:
+        """読込済み重みを .npz へ保存する (weights_path で再利用可能)。"""
+        np.savez(path, **self._require_weights())
+
+    def warmup(self, runs: int = 1) -> None:
+        blank = np.zeros((self.input_size, self.input_size), dtype=np.uint8)
+        for _ in range(runs):
+            self.infer_batch([blank], PIXEL_GRAY)
+
+    def infer_batch(
+        self, frames: Sequence[np.ndarray], pixel_format: str
+    ) -> List[InferenceResult]:
+        """フレーム列をまとめて推論する。
+
+        Args:
+            frames (Sequence[np.ndarray]): uint8 フレーム (shape は pixel_format に従う)。
+            pixel_format (str): frame_source.PIXEL_*。
+
+        Raises:
+            InferenceError: 未読込 / フレーム形状が pixel_format と合わない。
+        """
+        if not frames:
+            return []
+        weights = self._require_weights()
+        x = self.preprocess(frames, pixel_format)[..., np.newaxis]  # (N, S, S, 1)
+        for i in range(len(_CONV_LAYERS)):
+            x = self._conv3x3(x, weights[f"conv{i}"], _CONV_LAYERS[i][1])
+        n, h, w, c = x.shape
+        flat = x.reshape(n, h * w, c)
+        heat = flat @ weights["heatmap"]  # (N, P, K)
+        logits = flat.mean(axis=1) @ weights["classifier"] + weights["bias"]
+        return self._postprocess(heat, logits, w, h)
+
+    def preprocess(self, frames: Sequence[np.ndarray], pixel_format: str) -> np.ndarray:
+        """輝度抽出 + 最近傍縮小 + 正規化 → (N, S, S) float32。"""
+        size = self.input_size
+        out = np.empty((len(frames), size, size), dtype=np.float32)
+        for i, frame in enumerate(frames):
+            luma = _luma_plane(frame, pixel_format)
+            rows, cols = self._index_for(luma.shape[:2])
+            small = luma[rows[:, np.newaxis], cols]
+            if small.ndim == 3:
+                rgb = (0.299, 0.587, 0.114)
+                weights = rgb if pixel_format == PIXEL_RGB24 else rgb[::-1]
+                np.dot(small, np.asarray(weights, np.float32), out=out[i])
+            else:
+                out[i] = small
+        out *= 1.0 / 255.0
+        out -= 0.5
+        return out
+
+    # ---------------------------- 内部処理 ---------------------------- #
+    def _weight_shapes(self) -> Dict[str, Tuple[int, ...]]:
+        shapes: Dict[str, Tuple[int, ...]] = {}
+        in_ch = 1
+        for i, (out_ch, _) in enumerate(_CONV_LAYERS):
+            shapes[f"conv{i}"] = (9 * in_ch, out_ch)
+            in_ch = out_ch
+        shapes["heatmap"] = (in_ch, self.keypoints)
+        shapes["classifier"] = (in_ch, len(self.labels))
+        shapes["bias"] = (len(self.labels),)
+        return shapes
+
+    def _require_weights(self) -> Dict[str, np.ndarray]:
+        if self._weights is None:
+            raise InferenceError("モデル未読込 (load() を先に呼ぶ)")
+        return self._weights
+
+    def _index_for(self, shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        index = self._resize_index.get(shape)
+        if index is None:
+            size = self.input_size
+            index = (
+                np.arange(size) * shape[0] // size,
+                np.arange(size) * shape[1] // size,
+            )
+            self._resize_index[shape] = index
+        return index
+
+    @staticmethod
+    def _conv3x3(x: np.ndarray, weight: np.ndarray, stride: int) -> np.ndarray:
+        # (N, H, W, C) → (N, Ho, Wo, Cout), ReLU。重みの行は (C, dy, dx) 順
+        padded = np.pad(x, ((0, 0), (1, 1), (1, 1), (0, 0)))
+        n, h, w, c = x.shape
+        ho, wo = (h - 1) // stride + 1, (w - 1) // stride + 1
+        if c < _IM2COL_MAX_CHANNELS:
+            # 少チャネル: im2col (窓を 1 行列に展開) + 行列積 1 回
+            windows = sliding_window_view(padded, (3, 3), axis=(1, 2))
+            cols = windows[:, ::stride, ::stride].reshape(n * ho * wo, -1)
+            out = (cols @ weight).reshape(n, ho, wo, weight.shape[1])
+        else:
+            # 多チャネル: 9 タップ毎の行列積を累積 (展開行列 9 倍のコピーを避ける)
+            taps = weight.reshape(c, 3, 3, weight.shape[1])
+            out = np.zeros((n, ho, wo, weight.shape[1]), dtype=np.float32)
+            for dy in range(3):
+                for dx in range(3):
+                    rows = slice(dy, dy + stride * ho, stride)
+                    cols = slice(dx, dx + stride * wo, stride)
+                    shifted = padded[:, rows, cols]
+                    out += shifted @ taps[:, dy, dx]
+        np.maximum(out, 0.0, out=out)
+        return out
+
+    def _postprocess(
+        self, heat: np.ndarray, logits: np.ndarray, width: int, height: int
+    ) -> List[InferenceResult]:
+        peak = heat.argmax(axis=1)  # (N, K)
+        score = np.take_along_axis(heat, peak[:, np.newaxis], axis=1)[:, 0]
+        kps = np.empty(peak.shape + (3,), dtype=np.float32)
+        kps[..., 0] = (peak % width) / max(width - 1, 1)
+        kps[..., 1] = (peak // width) / max(height - 1, 1)
+        kps[..., 2] = 1.0 / (1.0 + np.exp(-score))
+        logits = logits - logits.max(axis=1, keepdims=True)
+        prob = np.exp(logits)
+        prob /= prob.sum(axis=1, keepdims=True)
+        best = prob.argmax(axis=1)
+        return [
+            InferenceResult(self.labels[b], float(prob[i, b]), kps[i])
+            for i, b in enumerate(best)
+        ]
+
+
+def _luma_plane(frame: np.ndarray, pixel_format: str) -> np.ndarray:
+    """輝度面 (YUV: Y 面, gray: そのまま) または RGB/BGR (H, W, 3) を返す (コピーなし)。"""
+    try:
+        if pixel_format == PIXEL_I420:
+            return frame[: frame.shape[0] * 2 // 3]
+        if pixel_format == PIXEL_YUV422P:
+            return frame[: frame.shape[0] // 2]
+        if pixel_format == PIXEL_YUV444P:
+            return frame[0]
+        if pixel_format in (PIXEL_RGB24, PIXEL_BGR24) and frame.ndim == 3:
+            return frame
+        if pixel_format == PIXEL_GRAY and frame.ndim == 2:
+            return frame
+    except IndexError:
+        pass
+    raise InferenceError(f"フレーム形状が {pixel_format} と合わない: {frame.shape}")
+
+
+def create_inference_backend(
+    name: str, **options: object
+) -> Optional[InferenceBackend]:
+    """名前からバックエンドを生成する (未読込。load は呼出し側)。
+
+    Returns:
+        Optional[InferenceBackend]: stub は None (worker は従来の擬似レイテンシで動作)。
+
+    Raises:
+        ValueError: 未知の名前。
+    """
+    if name == BACKEND_STUB:
+        return None
+    if name == BACKEND_NUMPY_KEYPOINT:
+        return NumpyKeypointBackend(**options)  # type: ignore[arg-type]
+    raise ValueError(f"未知の推論バックエンド: {name} (有効: {INFERENCE_BACKENDS})")
+
+
+__all__ = [
+    "BACKEND_STUB",
+    "BACKEND_NUMPY_KEYPOINT",
+    "INFERENCE_BACKENDS",
+    "DEFAULT_LABELS",
+    "InferenceResult",
+    "InferenceBackend",
+    "NumpyKeypointBackend",
+    "create_inference_backend",
+]
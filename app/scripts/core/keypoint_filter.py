@@ -0,0 +1,253 @@
+"""キーポイントの時間方向平滑化 (One-Euro フィルタ) とフレーム間の手の対応付け。
+
+フレーム毎のキーポイントは揺らぐため、そのままではジェスチャ判定がちらつく。
+CaptureInferenceWorker は推論結果を ResultRecord にする前に本フィルタを通す
+(<Inference keypoint_filter>, keypoint_mode が off 以外の場合のみ)。
+
+状態 (worker = カメラ毎に 1 インスタンス):
+    手のトラック (最大 max_tracks) 毎に平滑化済み座標 / 速度 (max_tracks, K, 2) と
+    最終更新時刻を NumPy 配列で保持する。update は 1 フレームの全手・全キーポイントを
+    配列演算 1 回で更新する (点毎の Python ループなし)。フィルタは時間方向の漸化式のため、
+    複数フレーム (update_batch) はフレーム順に update を適用する。
+
+One-Euro (Casiez et al. 2012, x / y のみ。score は平滑化しない):
+    dx = (x - x_prev) / dt,  dx_hat = a(d_cutoff) * dx + (1 - a) * dx_hat_prev
+    cutoff = min_cutoff + beta * |dx_hat|,  x_hat = x_prev + a(cutoff) * (x - x_prev)
+    a(fc) = 1 / (1 + 1 / (2π fc dt))。低速時は強く平滑化し、高速時は遅れを抑える。
+
+手の対応付け:
+    前フレームのトラック重心 (平滑化済み座標の平均) と今回の手の重心の距離が
+    match_distance (正規化座標) 以下の組を距離の小さい順に貪欲に割り当てる。
+    割り当てのない手は空きトラックを新しい ID で開始する (状態は今回の座標で初期化)。
+    max_missed フレーム連続で見つからないトラックは終了する。空きがない手は平滑化せず
+    ID -1 で返す。
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Final, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .keypoints import KEYPOINT_DTYPE, KEYPOINTS_PER_HAND
+from .result_store import MAX_HANDS
+
+FILTER_NONE: Final = "none"
+FILTER_ONE_EURO: Final = "one_euro"
+KEYPOINT_FILTERS: Final[Tuple[str, ...]] = (FILTER_NONE, FILTER_ONE_EURO)
+
+# 正規化座標 (0-1) / 秒単位での既定値
+DEFAULT_MIN_CUTOFF: Final = 1.0
+DEFAULT_BETA: Final = 10.0
+DEFAULT_D_CUTOFF: Final = 1.0
+DEFAULT_MATCH_DISTANCE: Final = 0.15
+DEFAULT_MAX_MISSED: Final = 3
+_MIN_DT: Final = 1e-4
+
+
+def _alpha(cutoff: Any, dt: Any) -> Any:
+    return 1.0 / (1.0 + 1.0 / (2.0 * math.pi * cutoff * dt))
+
+
+class OneEuroKeypointFilter:
+    """手キーポイントの One-Euro 平滑化 + トラック対応付け (カメラ 1 台分)。
+
+    トラック数は高々 MAX_HANDS 程度のため、対応付け・寿命管理は Python のリストで行い
+    (小さな配列への NumPy 呼び出しはオーバーヘッドの方が大きい)、座標の更新だけを
+    (hands, K, 2) の配列演算にまとめる。
+    """
+
+    def __init__(
+        self,
+        keypoints: int = KEYPOINTS_PER_HAND,
+        max_tracks: int = MAX_HANDS,
+        *,
+        min_cutoff: float = DEFAULT_MIN_CUTOFF,
+        beta: float = DEFAULT_BETA,
+        d_cutoff: float = DEFAULT_D_CUTOFF,
+        match_distance: float = DEFAULT_MATCH_DISTANCE,
+        max_missed: int = DEFAULT_MAX_MISSED,
+    ) -> None:
+        if keypoints < 1 or max_tracks < 1:
+            raise ValueError("keypoints と max_tracks は 1 以上である必要があります")
+        if min_cutoff <= 0 or d_cutoff <= 0 or beta < 0:
+            raise ValueError("min_cutoff / d_cutoff は正数, beta は 0 以上である必要があります")
+        self.keypoints = keypoints
+        self._inv_k = 1.0 / keypoints  # 重心 = sum * inv_k (mean より呼出しが軽い)
+        self._min_cutoff = min_cutoff
+        self._beta = beta
+        self._d_cutoff = d_cutoff
+        self._match_distance = match_distance
+        self._max_missed = max_missed
+        shape = (max_tracks, keypoints, 2)
+        self._x = np.zeros(shape, KEYPOINT_DTYPE)  # 平滑化済み座標
+        self._dx = np.zeros(shape, KEYPOINT_DTYPE)  # 平滑化済み速度
+        self._t: List[float] = [0.0] * max_tracks  # 最終更新時刻 (秒)
+        self._centroid: List[Tuple[float, float]] = [(0.0, 0.0)] * max_tracks
+        self._active: List[bool] = [False] * max_tracks
+        self._missed: List[int] = [0] * max_tracks
+        self._ids: List[int] = [-1] * max_tracks
+        self._next_id = 0
+
+    @property
+    def active_tracks(self) -> int:
+        return sum(self._active)
+
+    def update(
+        self, keypoints: np.ndarray, t_sec: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """1 フレーム分を平滑化する。
+
+        Args:
+            keypoints (np.ndarray): (K, 3) (1 手) または (hands, K, 3)。
+            t_sec (float): フレーム時刻 (秒, 単調増加)。
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 平滑化済み (hands, K, 3) float32 と
+            手毎のトラック ID (hands,) int64 (-1 = トラックなし)。
+
+        Raises:
+            ValueError: shape が不正。
+        """
+        arr = np.asarray(keypoints, dtype=KEYPOINT_DTYPE)
+        if arr.ndim == 2:
+            arr = arr[np.newaxis]
+        if arr.ndim != 3 or arr.shape[1:] != (self.keypoints, 3):
+            raise ValueError(f"keypoints の shape が不正: {arr.shape}")
+        out = arr.copy()
+        xy = out[..., :2]
+        centroids = (xy.sum(axis=1) * self._inv_k).tolist()
+        tracks, fresh = self._associate(centroids)
+        hands = [h for h, row in enumerate(tracks) if row >= 0 and not fresh[h]]
+        if hands:
+            self._smooth(xy, hands, [tracks[h] for h in hands], t_sec)
+        for h, row in enumerate(tracks):
+            if fresh[h]:
+                self._x[row] = xy[h]
+                self._dx[row] = 0.0
+                self._centroid[row] = tuple(centroids[h])
+        assigned = [row for row in tracks if row >= 0]
+        for row in assigned:
+            self._t[row] = t_sec
+        self._expire(assigned)
+        ids = np.array([self._ids[row] if row >= 0 else -1 for row in tracks], np.int64)
+        return out, ids
+
+    def update_batch(
+        self, frames: Sequence[np.ndarray], times_sec: Sequence[float]
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """複数フレームを時刻順に update する (推論バッチの結果用)。"""
+        return [self.update(kp, t) for kp, t in zip(frames, times_sec)]
+
+    def reset(self) -> None:
+        """全トラックを終了する (ID は継続して採番)。"""
+        n = len(self._active)
+        self._active = [False] * n
+        self._missed = [0] * n
+
+    def _smooth(
+        self, xy: np.ndarray, hands: List[int], rows: List[int], t_sec: float
+    ) -> None:
+        # 連続する行 / 全手ならスライス (ビュー) で扱い fancy index のコピーを避ける
+        n = len(rows)
+        row_idx: Any = slice(rows[0], rows[0] + n)
+        if rows != list(range(rows[0], rows[0] + n)):
+            row_idx = rows
+        hand_idx: Any = slice(None) if hands == list(range(len(xy))) else hands
+        dts = [max(t_sec - self._t[row], _MIN_DT) for row in rows]
+        dt: Any = dts[0]
+        if dts.count(dt) != n:  # 再出現したトラックだけ dt が異なる
+            dt = np.array(dts, KEYPOINT_DTYPE)[:, None, None]
+        a_d = _alpha(self._d_cutoff, dt)
+        k = 2.0 * math.pi * dt
+        x = xy[hand_idx]
+        x_prev = self._x[row_idx]
+        diff = x - x_prev
+        dx_hat = diff * (a_d / dt)
+        dx_hat += (1.0 - a_d) * self._dx[row_idx]
+        # a(fc) = fc k / (fc k + 1),  fc k = min_cutoff k + beta k |dx_hat|
+        ck = np.abs(dx_hat)
+        ck *= self._beta * k
+        ck += self._min_cutoff * k
+        diff *= ck / (ck + 1.0)
+        diff += x_prev
+        self._x[row_idx] = diff
+        self._dx[row_idx] = dx_hat
+        xy[hand_idx] = diff
+        for row, c in zip(rows, (diff.sum(axis=1) * self._inv_k).tolist()):
+            self._centroid[row] = tuple(c)
+
+    def _associate(
+        self, centroids: List[List[float]]
+    ) -> Tuple[List[int], List[bool]]:
+        hands = len(centroids)
+        tracks = [-1] * hands
+        fresh = [False] * hands
+        active = [row for row, on in enumerate(self._active) if on]
+        if active and hands:
+            pairs = sorted(
+                (math.dist(c, self._centroid[row]), h, row)
+                for h, c in enumerate(centroids)
+                for row in active
+            )
+            used = set()
+            for dist, h, row in pairs:
+                if dist > self._match_distance:
+                    break
+                if tracks[h] < 0 and row not in used:
+                    tracks[h] = row
+                    used.add(row)
+        free = (row for row, on in enumerate(self._active) if not on)
+        for h in range(hands):
+            if tracks[h] >= 0:
+                continue
+            row_free: Optional[int] = next(free, None)
+            if row_free is None:
+                break
+            tracks[h], fresh[h] = row_free, True
+            self._active[row_free] = True
+            self._ids[row_free] = self._next_id
+            self._next_id += 1
+        return tracks, fresh
+
+    def _expire(self, assigned: List[int]) -> None:
+        for row, on in enumerate(self._active):
+            if not on:
+                continue
+            if row in assigned:
+                self._missed[row] = 0
+                continue
+            self._missed[row] += 1
+            if self._missed[row] > self._max_missed:
+                self._active[row] = False
+                self._missed[row] = 0
+
+
+def create_keypoint_filter(
+    name: str, keypoints: int = KEYPOINTS_PER_HAND
+) -> Optional[OneEuroKeypointFilter]:
+    """名前 (<Inference keypoint_filter>) からフィルタを生成する (none は None)。
+
+    Raises:
+        ValueError: 未知の名前。
+    """
+    if name == FILTER_NONE:
+        return None
+    if name == FILTER_ONE_EURO:
+        return OneEuroKeypointFilter(keypoints)
+    raise ValueError(f"keypoint_filter が不正: {name} (有効: {KEYPOINT_FILTERS})")
+
+
+__all__ = [
+    "FILTER_NONE",
+    "FILTER_ONE_EURO",
+    "KEYPOINT_FILTERS",
+    "DEFAULT_MIN_CUTOFF",
+    "DEFAULT_BETA",
+    "DEFAULT_D_CUTOFF",
+    "DEFAULT_MATCH_DISTANCE",
+    "DEFAULT_MAX_MISSED",
+    "OneEuroKeypointFilter",
+    "create_keypoint_filter",
+]
@@ -0,0 +1,207 @@
+"""手キーポイントの省メモリ表現 (messages.KeypointPayload の生成・復元・共有メモリ参照)。
+
+推論結果のキーポイントは手毎に (K, 3) float32 (x, y, score。既定 K=21)。数値のタプル列で
+ResultRecord に載せると 1 手当たり 63 個の float オブジェクトになり、pickle サイズ・
+Aggregator の保持メモリとも膨らむ。本モジュールは固定 dtype 配列 + 手の数で扱う。
+
+転送方式 (KEYPOINT_MODES, <Inference keypoints>):
+    off: キーポイントを送らない (既定。従来どおり)。
+    inline: ResultRecord.keypoints に float32 バイト列として同梱する (pickle はバイト列 1 個)。
+    shared: worker の共有メモリリング (frame_ring.FrameRing) へ書き、位置だけを送る。
+        親の dispatcher が KeypointResolver で inline へ解決してから Aggregator へ渡す。
+        結果キュー上の滞留がスロット数を超えると上書き済みとなり、そのレコードの
+        キーポイントは欠落 (None) として扱う (KeypointResolver.stale に計上)。
+
+保持:
+    Aggregator の columnar ストア (result_store.ColumnarResultRing) は手の数列と
+    (MAX_HANDS, K, 3) float32 列で保持する。MAX_HANDS を超える手は切り捨てる。
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Final, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .frame_ring import FrameRing
+from .messages import KeypointPayload, ResultRecord
+from .result_store import MAX_HANDS
+
+KEYPOINTS_OFF: Final = "off"
+KEYPOINTS_INLINE: Final = "inline"
+KEYPOINTS_SHARED: Final = "shared"
+KEYPOINT_MODES: Final[Tuple[str, ...]] = (
+    KEYPOINTS_OFF,
+    KEYPOINTS_INLINE,
+    KEYPOINTS_SHARED,
+)
+KEYPOINT_DTYPE: Final = np.dtype("<f4")
+KEYPOINTS_PER_HAND: Final = 21
+# 結果バッチ / キュー滞留を吸収できる程度 (1 スロット = MAX_HANDS x 21 x 12B ≒ 0.5KB)
+DEFAULT_KEYPOINT_SLOTS: Final = 512
+
+
+def pack_keypoints(
+    keypoints: np.ndarray, track_ids: Sequence[int] = ()
+) -> KeypointPayload:
+    """(K, 3) (1 手) または (hands, K, 3) の配列を inline の KeypointPayload にする。
+
+    Raises:
+        ValueError: shape が不正。
+    """
+    arr = np.asarray(keypoints, dtype=KEYPOINT_DTYPE)
+    if arr.ndim == 2:
+        arr = arr[np.newaxis]
+    if arr.ndim != 3 or arr.shape[2] != 3:
+        raise ValueError(f"keypoints の shape が不正: {arr.shape}")
+    ids = tuple(int(i) for i in track_ids)
+    return KeypointPayload(arr.shape[0], arr.tobytes(), track_ids=ids)
+
+
+def unpack_keypoints(payload: KeypointPayload) -> np.ndarray:
+    """inline の KeypointPayload を (hands, K, 3) float32 の読取専用配列にする (コピーなし)。
+
+    Raises:
+        ValueError: 未解決の共有メモリ参照。
+    """
+    if payload.ring_name is not None:
+        raise ValueError("共有メモリ参照は KeypointResolver で解決してから復元する")
+    if payload.hands == 0:
+        return np.empty((0, KEYPOINTS_PER_HAND, 3), KEYPOINT_DTYPE)
+    return np.frombuffer(payload.data, KEYPOINT_DTYPE).reshape(payload.hands, -1, 3)
+
+
+class KeypointWriter:
+    """worker 側: 推論結果のキーポイントを転送方式に応じた KeypointPayload にする。
+
+    shared のリングは最初の pack で (max_hands, K) から作成し、close で削除する。
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        slots: int = DEFAULT_KEYPOINT_SLOTS,
+        max_hands: int = MAX_HANDS,
+    ) -> None:
+        if mode not in KEYPOINT_MODES:
+            raise ValueError(f"keypoints が不正: {mode} (有効: {KEYPOINT_MODES})")
+        self.mode = mode
+        self._slots = slots
+        self._max_hands = max_hands
+        self._ring: Optional[FrameRing] = None
+        self._scratch: Optional[np.ndarray] = None  # (max_hands, K, 3) 書込み用
+
+    def pack(
+        self, keypoints: np.ndarray, track_ids: Sequence[int] = ()
+    ) -> Optional[KeypointPayload]:
+        if self.mode == KEYPOINTS_OFF:
+            return None
+        if self.mode == KEYPOINTS_INLINE:
+            return pack_keypoints(keypoints, track_ids)
+        arr = np.asarray(keypoints, dtype=KEYPOINT_DTYPE)
+        if arr.ndim == 2:
+            arr = arr[np.newaxis]
+        if self._ring is None:
+            self._scratch = np.zeros(
+                (self._max_hands, arr.shape[1], 3), KEYPOINT_DTYPE
+            )
+            self._ring = FrameRing.create(
+                self._scratch.view(np.uint8).shape, self._slots
+            )
+        scratch = self._scratch
+        assert scratch is not None
+        if arr.shape[1:] != scratch.shape[1:]:
+            raise ValueError(f"keypoints の shape が不正: {arr.shape}")
+        hands = min(arr.shape[0], self._max_hands)
+        scratch[:hands] = arr[:hands]
+        slot, seq = self._ring.write(scratch.view(np.uint8), 0, None, 0)
+        ids = tuple(int(i) for i in track_ids[:hands])
+        return KeypointPayload(hands, b"", self._ring.name, slot, seq, ids)
+
+    def close(self) -> None:
+        if self._ring is not None:
+            self._ring.close()
+
+
+def _with_keypoints(
+    record: ResultRecord, keypoints: Optional[KeypointPayload]
+) -> ResultRecord:
+    # dataclasses.replace はフィールド走査を伴うため直接構築する
+    return ResultRecord(
+        record.camera_id,
+        record.timestamp_utc,
+        record.gesture_label,
+        record.confidence,
+        record.latency_ms,
+        keypoints,
+    )
+
+
+class KeypointResolver:
+    """親側 (dispatcher スレッド専用): 共有メモリ参照の KeypointPayload を inline へ解決する。
+
+    Attributes:
+        stale (int): 読出し前に上書き済み / リング削除済みで欠落させた件数。
+    """
+
+    def __init__(self) -> None:
+        self._rings: Dict[str, FrameRing] = {}  # camera_id -> 現在のリング
+        self.stale = 0
+
+    def resolve(self, record: ResultRecord) -> ResultRecord:
+        """参照を含むレコードを inline に置き換えて返す (それ以外はそのまま)。"""
+        kp = record.keypoints
+        if kp is None or kp.ring_name is None:
+            return record
+        ring = self._ring(record.camera_id, kp.ring_name)
+        data = None
+        if ring is not None:
+            view = ring.view(kp.slot).view(KEYPOINT_DTYPE)[: kp.hands]
+            data = view.tobytes()
+            if not ring.is_current(kp.slot, kp.seq):
+                data = None
+        if data is None:
+            self.stale += 1
+            return _with_keypoints(record, None)
+        resolved = KeypointPayload(kp.hands, data, track_ids=kp.track_ids)
+        return _with_keypoints(record, resolved)
+
+    def resolve_all(self, records: Sequence[ResultRecord]) -> Iterable[ResultRecord]:
+        """resolve を順に適用する (参照を含まなければ records をそのまま返す)。"""
+        if all(r.keypoints is None or r.keypoints.ring_name is None for r in records):
+            return records
+        out: List[ResultRecord] = [self.resolve(r) for r in records]
+        return out
+
+    def _ring(self, camera_id: str, name: str) -> Optional[FrameRing]:
+        ring = self._rings.get(camera_id)
+        if ring is not None and ring.name == name:
+            return ring
+        try:
+            new = FrameRing.attach(name)
+        except (FileNotFoundError, ValueError):
+            return None
+        if ring is not None:  # worker 再起動で新しいリング
+            ring.close()
+        self._rings[camera_id] = new
+        return new
+
+    def close(self) -> None:
+        for ring in self._rings.values():
+            ring.close()
+        self._rings.clear()
+
+
+__all__ = [
+    "KEYPOINTS_OFF",
+    "KEYPOINTS_INLINE",
+    "KEYPOINTS_SHARED",
+    "KEYPOINT_MODES",
+    "KEYPOINT_DTYPE",
+    "KEYPOINTS_PER_HAND",
+    "DEFAULT_KEYPOINT_SLOTS",
+    "KeypointResolver",
+    "KeypointWriter",
+    "pack_keypoints",
+    "unpack_keypoints",
+]
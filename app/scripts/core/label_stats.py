@@ -0,0 +1,150 @@
+"""ジェスチャラベルの多窓ローリング集計 (件数 / 平均信頼度 / 遷移回数)。
+
+構成:
+    LabelCounts: ラベル毎の [件数, confidence 合計] と直前ラベル -> ラベルの遷移回数。
+        加算的なのでスライス間・カメラ間でそのまま merge 可能。
+    WindowedLabelStats: 1m / 10m / 1h の各窓を SliceRing で保持するカメラ単位集計。
+
+計算量:
+    record: O(窓数) = O(1)。
+    record_many: 同上 (1 件当たり)。時刻が同じスライスに留まる間はスライスを引き直さない。
+    読出し: O(スライス数 × (ラベル種別数 + 遷移種別数))。生レコードは走査しない。
+
+遷移:
+    直前に受信したレコードのラベルから当該レコードのラベルへの遷移を、当該レコードの
+    時刻のスライスへ計上する (同一ラベルの継続も自己遷移として数える)。
+    遅着レコードも受信順で数えるため、時刻逆転時は近似となる。
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Final, Iterable, List, Optional, Sequence, Tuple
+
+from .windowing import SliceRing
+
+# 窓名 -> (スライス幅秒, スライス数)
+LABEL_WINDOWS: Final[Dict[str, Tuple[float, int]]] = {
+    "1m": (5.0, 12),
+    "10m": (30.0, 20),
+    "1h": (300.0, 12),
+}
+
+
+class LabelCounts:
+    """マージ可能なラベル件数・信頼度合計・遷移回数。"""
+
+    __slots__ = ("_labels", "_transitions", "_total")
+
+    def __init__(self) -> None:
+        # label -> [件数, confidence 合計]
+        self._labels: Dict[str, List[float]] = {}
+        self._transitions: Dict[Tuple[str, str], int] = {}
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def record(self, label: str, confidence: float, prev: Optional[str]) -> None:
+        """1 件を追加する (prev は直前ラベル, 無ければ None)。"""
+        cell = self._labels.get(label)
+        if cell is None:
+            self._labels[label] = [1, confidence]
+        else:
+            cell[0] += 1
+            cell[1] += confidence
+        if prev is not None:
+            key = (prev, label)
+            self._transitions[key] = self._transitions.get(key, 0) + 1
+        self._total += 1
+
+    def merge(self, other: "LabelCounts") -> "LabelCounts":
+        """other を自身へ加算し self を返す。"""
+        for label, (n, conf_sum) in other._labels.items():
+            cell = self._labels.get(label)
+            if cell is None:
+                self._labels[label] = [n, conf_sum]
+            else:
+                cell[0] += n
+                cell[1] += conf_sum
+        for key, n in other._transitions.items():
+            self._transitions[key] = self._transitions.get(key, 0) + n
+        self._total += other._total
+        return self
+
+    @classmethod
+    def merged(cls, parts: Iterable["LabelCounts"]) -> "LabelCounts":
+        out = cls()
+        for p in parts:
+            out.merge(p)
+        return out
+
+    def counts(self) -> Dict[str, int]:
+        """ラベル -> 件数 (件数降順)。"""
+        items = sorted(self._labels.items(), key=lambda kv: (-kv[1][0], kv[0]))
+        return {label: int(n) for label, (n, _) in items}
+
+    def mean_confidence(self) -> Dict[str, float]:
+        """ラベル -> 平均 confidence。"""
+        return {label: s / n for label, (n, s) in self._labels.items()}
+
+    def transitions(self) -> Dict[str, Dict[str, int]]:
+        """直前ラベル -> {次ラベル: 回数}。"""
+        out: Dict[str, Dict[str, int]] = {}
+        for (prev, cur), n in self._transitions.items():
+            out.setdefault(prev, {})[cur] = n
+        return out
+
+
+class WindowedLabelStats:
+    """複数時間窓のラベル集計を固定スライス数で保持するカメラ単位集計。"""
+
+    __slots__ = ("_rings", "_last_label")
+
+    def __init__(self) -> None:
+        self._rings: Dict[str, SliceRing[LabelCounts]] = {
+            name: SliceRing(slice_sec, slices, LabelCounts)
+            for name, (slice_sec, slices) in LABEL_WINDOWS.items()
+        }
+        self._last_label: Optional[str] = None
+
+    def record(self, ts_sec: float, label: str, confidence: float) -> None:
+        """時刻 ts_sec (epoch 秒) のレコードを全窓へ追加する。"""
+        prev = self._last_label
+        for ring in self._rings.values():
+            counts = ring.slot(ts_sec)
+            if counts is not None:
+                counts.record(label, confidence, prev)
+        self._last_label = label
+
+    def record_many(self, samples: Sequence[Tuple[float, str, float]]) -> None:
+        """(ts_sec, label, confidence) 列を順に record するのと同値に全窓へ追加する。"""
+        if not samples:
+            return
+        prevs = [self._last_label] + [label for _, label, _ in samples[:-1]]
+        for ring in self._rings.values():
+            width = ring.slice_sec
+            k_cur = None
+            counts: Optional[LabelCounts] = None
+            for (ts, label, confidence), prev in zip(samples, prevs):
+                k = int(ts // width)
+                if k != k_cur:
+                    k_cur = k
+                    counts = ring.slot(ts)
+                if counts is not None:
+                    counts.record(label, confidence, prev)
+        self._last_label = samples[-1][1]
+
+    def window(self, window: str, now_sec: float) -> LabelCounts:
+        """window 内のスライスを合成した集計を返す。
+
+        Raises:
+            ValueError: 未定義の窓名。
+        """
+        ring = self._rings.get(window)
+        if ring is None:
+            raise ValueError(f"未定義の窓: {window} (有効: {list(LABEL_WINDOWS)})")
+        return LabelCounts.merged(ring.live(now_sec))
+
+
+__all__ = ["LABEL_WINDOWS", "LabelCounts", "WindowedLabelStats"]
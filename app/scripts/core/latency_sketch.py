@@ -0,0 +1,211 @@
+"""固定メモリのストリーミング・レイテンシ分位点スケッチ。
+
+構成:
+    LatencyHistogram: 対数バケット (相対幅 2%) のスパースヒストグラム。
+        バケット毎に件数と合計を持ち、分位点はバケット平均値を順位補間 (k=(n-1)*p) して
+        求める。値が別バケットに分かれている限り従来のソート方式と同値になる。
+        加算的なのでカメラ間・スライス間でそのまま merge 可能。
+    WindowedLatencySketch: 1s/10s/60s/5m の各窓を SliceRing で保持するカメラ単位スケッチ。
+
+計算量:
+    record: O(窓数) = O(1)。フレームレートに依存しない。
+    record_many: 同上 (1 件当たり)。バケットは 1 回だけ計算し、スライスは時刻が同じスライスに
+        留まる間は引き直さない (dispatcher の一括反映用)。
+    分位点: O(スライス数 × 使用バケット数)。
+メモリ:
+    バケット数は値域 [MIN_LATENCY_MS, MAX_LATENCY_MS] で上限が決まり、スライス数も固定。
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from typing import Dict, Final, Iterable, List, Optional, Sequence, Tuple
+
+from .windowing import SliceRing
+
+MIN_LATENCY_MS: Final = 0.001
+MAX_LATENCY_MS: Final = 3_600_000.0
+_GAMMA: Final = 1.02
+_LOG_GAMMA: Final = math.log(_GAMMA)
+_MAX_BUCKET: Final = int(math.log(MAX_LATENCY_MS / MIN_LATENCY_MS) / _LOG_GAMMA) + 1
+
+# 窓名 -> (スライス幅秒, スライス数)
+LATENCY_WINDOWS: Final[Dict[str, Tuple[float, int]]] = {
+    "1s": (0.1, 10),
+    "10s": (1.0, 10),
+    "60s": (5.0, 12),
+    "5m": (10.0, 30),
+}
+DEFAULT_QUANTILES: Final[Tuple[float, ...]] = (0.5, 0.95, 0.99, 0.999)
+
+
+def _bucket_of(value_ms: float) -> int:
+    if value_ms <= MIN_LATENCY_MS:
+        return 0
+    idx = int(math.log(value_ms / MIN_LATENCY_MS) / _LOG_GAMMA) + 1
+    return idx if idx < _MAX_BUCKET else _MAX_BUCKET
+
+
+def quantile_key(q: float) -> str:
+    """分位点 q を表示キーへ変換する (0.5 -> "p50", 0.999 -> "p999")。"""
+    digits = f"{q * 100:.6g}".replace(".", "")
+    return f"p{digits}"
+
+
+class LatencyHistogram:
+    """マージ可能な対数バケット・ヒストグラム。"""
+
+    __slots__ = ("_buckets", "_count")
+
+    def __init__(self) -> None:
+        # bucket -> [件数, 合計]
+        self._buckets: Dict[int, List[float]] = {}
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, value_ms: float) -> None:
+        """1 サンプルを追加する。"""
+        b = _bucket_of(value_ms)
+        cell = self._buckets.get(b)
+        if cell is None:
+            self._buckets[b] = [1, value_ms]
+        else:
+            cell[0] += 1
+            cell[1] += value_ms
+        self._count += 1
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """other を自身へ加算し self を返す。"""
+        for b, (n, total) in other._buckets.items():
+            cell = self._buckets.get(b)
+            if cell is None:
+                self._buckets[b] = [n, total]
+            else:
+                cell[0] += n
+                cell[1] += total
+        self._count += other._count
+        return self
+
+    def subtract(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """merge 済みの other を自身から差し引き self を返す (増分マージの入替え用)。
+
+        other は self に加算済みであること。件数が 0 になったバケットは削除する。
+        """
+        for b, (n, total) in other._buckets.items():
+            cell = self._buckets[b]
+            cell[0] -= n
+            if cell[0] <= 0:
+                del self._buckets[b]
+            else:
+                cell[1] -= total
+        self._count -= other._count
+        return self
+
+    @classmethod
+    def merged(cls, histograms: Iterable["LatencyHistogram"]) -> "LatencyHistogram":
+        out = cls()
+        for h in histograms:
+            out.merge(h)
+        return out
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """分位点群を返す。サンプル 0 件なら全て None。
+
+        Args:
+            qs (Sequence[float]): 0.0-1.0 の分位点。
+
+        Returns:
+            List[Optional[float]]: qs と同順の推定値 (ms)。
+        """
+        n = self._count
+        if n == 0:
+            return [None for _ in qs]
+        ends: List[int] = []
+        means: List[float] = []
+        cum = 0
+        for b in sorted(self._buckets):
+            cnt, total = self._buckets[b]
+            cum += int(cnt)
+            ends.append(cum)
+            means.append(total / cnt)
+
+        def _at(rank: int) -> float:
+            return means[bisect_right(ends, rank)]
+
+        out: List[Optional[float]] = []
+        for q in qs:
+            k = (n - 1) * q
+            i = int(k)
+            lo = _at(i)
+            out.append(lo if i == k else lo + (_at(i + 1) - lo) * (k - i))
+        return out
+
+
+def _add(hist: LatencyHistogram, bucket: int, value_ms: float) -> None:
+    # LatencyHistogram.record のバケット計算済み版
+    cell = hist._buckets.get(bucket)
+    if cell is None:
+        hist._buckets[bucket] = [1, value_ms]
+    else:
+        cell[0] += 1
+        cell[1] += value_ms
+    hist._count += 1
+
+
+class WindowedLatencySketch:
+    """複数時間窓のレイテンシ分布を固定メモリで保持するカメラ単位スケッチ。"""
+
+    __slots__ = ("_rings",)
+
+    def __init__(self) -> None:
+        self._rings: Dict[str, SliceRing[LatencyHistogram]] = {
+            name: SliceRing(slice_sec, slices, LatencyHistogram)
+            for name, (slice_sec, slices) in LATENCY_WINDOWS.items()
+        }
+
+    def record(self, ts_sec: float, value_ms: float) -> None:
+        """時刻 ts_sec (epoch 秒) のサンプルを全窓へ追加する。"""
+        b = _bucket_of(value_ms)
+        for ring in self._rings.values():
+            hist = ring.slot(ts_sec)
+            if hist is not None:
+                _add(hist, b, value_ms)
+
+    def record_many(self, samples: Sequence[Tuple[float, float]]) -> None:
+        """(ts_sec, value_ms) 列を順に record するのと同値に全窓へ追加する。"""
+        bucketed = [(ts, _bucket_of(v), v) for ts, v in samples]
+        for ring in self._rings.values():
+            width = ring.slice_sec
+            k_cur = None
+            hist: Optional[LatencyHistogram] = None
+            for ts, b, v in bucketed:
+                k = int(ts // width)
+                if k != k_cur:  # 同じスライスの間は slot を引き直さない
+                    k_cur = k
+                    hist = ring.slot(ts)
+                if hist is not None:
+                    _add(hist, b, v)
+
+    def histogram(self, window: str, now_sec: float) -> LatencyHistogram:
+        """window 内のスライスを合成したヒストグラムを返す。
+
+        Raises:
+            ValueError: 未定義の窓名。
+        """
+        ring = self._rings.get(window)
+        if ring is None:
+            raise ValueError(f"未定義の窓: {window} (有効: {list(LATENCY_WINDOWS)})")
+        return LatencyHistogram.merged(ring.live(now_sec))
+
+
+__all__ = [
+    "LATENCY_WINDOWS",
+    "DEFAULT_QUANTILES",
+    "LatencyHistogram",
+    "WindowedLatencySketch",
+    "quantile_key",
+]
@@ -46,7 +46,11 @@ class JsonFormatter(logging.Formatter):
             "ema_fps",
             "latency_p50_ms",
             "latency_p95_ms",
+            "latency_p99_ms",
             "drop_rate",
+            "cameras",
+            "worst_latency",
+            "worst_drop_rate",
         ):
             v = getattr(record, k, None)
             if v is not None:
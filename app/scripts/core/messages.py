@@ -8,18 +8,25 @@
 拡張指針:
 - 新規フィールド追加時は後方互換性を考慮 (受信側での default 処理)。
 - 大量転送性能問題発生時は __getstate__ の最適化や msgpack 化を検討。
+  ResultBatch は __reduce__ で列形式 (時刻 ns / ラベル / 信頼度 / レイテンシ) に分解して転送する。
+- キーポイントは KeypointPayload (float32 固定長バイト列 or 共有メモリ参照) で運ぶ
+  (数値のタプル列は pickle・保持とも要素毎のオブジェクトになるため使わない。keypoints 参照)。
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import utils_time
 
 # Control 種別の定数 (typo 防止用)
 CONTROL_START = "START"
 CONTROL_STOP = "STOP"
 CONTROL_RELOAD = "RELOAD"
 CONTROL_PING = "PING"
+CONTROL_ASSIGN = "ASSIGN"  # 待機 worker へのカメラ割当 (payload: camera_id, source_url)
 
 StatusType = str  # 実装段階で Enum 化も検討可能
 
@@ -29,7 +36,7 @@ class ControlMessage:
     """親→子 制御メッセージ。
 
     Attributes:
-        type (str): 制御種別 (START/STOP/RELOAD/PING)。
+        type (str): 制御種別 (START/STOP/RELOAD/PING/ASSIGN)。
         payload (Dict[str, Any]): 付帯情報 (例: ping_id 等)。
     """
 
@@ -65,12 +72,168 @@ class StatsMessage:
         fps (float): 推定 FPS。
         avg_latency_ms (Optional[float]): 平均レイテンシ (ms)。
         drop_rate (Optional[float]): ドロップ率 (0.0-1.0)。
+        avg_capture_ms (Optional[float]): 平均フレーム取得待ち時間 (ms, フレーム入力なしは None)。
+        effective_fps (Optional[float]): 適応フレーム間引きの現在のサンプリング率 (無効時 None)。
+        skipped_frames (int): 統計窓内で間引いた (処理しなかった) フレーム数。
     """
 
     camera_id: str
     fps: float
     avg_latency_ms: Optional[float]
     drop_rate: Optional[float]
+    avg_capture_ms: Optional[float] = None
+    effective_fps: Optional[float] = None
+    skipped_frames: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class KeypointPayload:
+    """1 フレーム分の手キーポイント (keypoints モジュールで生成・復元する)。
+
+    inline: data に float32 リトルエンディアンの (hands, K, 3) 配列 (x, y, score) を保持。
+    参照: data は空で、共有メモリリング (keypoints.KeypointWriter) の位置を保持する。
+        親の dispatcher が keypoints.KeypointResolver で inline へ解決してから集約する。
+
+    Attributes:
+        hands (int): 手の数 (0 = 検出なし)。
+        data (bytes): inline 時の配列バイト列 (参照時は空)。
+        ring_name (Optional[str]): 参照時の共有メモリ名 (inline は None)。
+        slot (int): 参照時のスロット番号。
+        seq (int): 参照時の書込み連番 (frame_ring.FrameRing と同じ seqlock)。
+        track_ids (Tuple[int, ...]): 手毎のトラック ID (keypoint_filter の対応付け。
+            空 = 対応付けなし, -1 = トラックなし)。
+    """
+
+    hands: int
+    data: bytes = b""
+    ring_name: Optional[str] = None
+    slot: int = -1
+    seq: int = -1
+    track_ids: Tuple[int, ...] = ()
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        # slots dataclass 既定の属性毎 setstate より軽いコンストラクタ呼出しで復元する
+        return (
+            KeypointPayload,
+            (
+                self.hands,
+                self.data,
+                self.ring_name,
+                self.slot,
+                self.seq,
+                self.track_ids,
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ResultRecord:
+    """単一推論結果レコード。
+
+    Attributes:
+        camera_id (str): カメラID。
+        timestamp_utc (datetime): 推論完了UTC時刻 (tz-aware)。
+        gesture_label (str): 予測ラベル。
+        confidence (float): 信頼度 0.0-1.0。
+        latency_ms (Optional[float]): 前処理+推論時間 (ms)。
+        keypoints (Optional[KeypointPayload]): 手キーポイント (未送信なら None)。
+    """
+
+    camera_id: str
+    timestamp_utc: datetime
+    gesture_label: str
+    confidence: float
+    latency_ms: Optional[float]
+    keypoints: Optional[KeypointPayload] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ResultBatch:
+    """子→親 結果バッチ (同一カメラの ResultRecord を生成順にまとめたもの)。
+
+    1 件毎の put / pickle / パイプ書込みを件数分まとめるための転送単位。
+    pickle 時は列形式に分解し、受信側で ResultRecord を再構築する。
+
+    Attributes:
+        camera_id (str): カメラ識別子 (全レコード共通)。
+        records (Tuple[ResultRecord, ...]): 生成順のレコード列。
+    """
+
+    camera_id: str
+    records: Tuple[ResultRecord, ...]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        to_ns = utils_time.to_epoch_ns
+        recs = self.records
+        return (
+            _batch_from_columns,
+            (
+                self.camera_id,
+                [to_ns(r.timestamp_utc) for r in recs],
+                [r.gesture_label for r in recs],
+                [r.confidence for r in recs],
+                [r.latency_ms for r in recs],
+                _keypoint_column(recs),
+            ),
+        )
+
+
+def _keypoint_column(
+    records: Tuple[ResultRecord, ...]
+) -> Optional[List[Optional[KeypointPayload]]]:
+    # キーポイントなしのバッチは列ごと省略 (従来と同じ転送量)
+    if all(r.keypoints is None for r in records):
+        return None
+    return [r.keypoints for r in records]
+
+
+def _batch_from_columns(
+    camera_id: str,
+    ts_ns: List[int],
+    labels: List[str],
+    confidences: List[float],
+    latencies: List[Optional[float]],
+    keypoints: Optional[List[Optional[KeypointPayload]]] = None,
+) -> ResultBatch:
+    from_ns = utils_time.from_epoch_ns
+    kps = keypoints or [None] * len(ts_ns)
+    return ResultBatch(
+        camera_id,
+        tuple(
+            ResultRecord(camera_id, from_ns(ts), label, conf, lat, kp)
+            for ts, label, conf, lat, kp in zip(
+                ts_ns, labels, confidences, latencies, kps
+            )
+        ),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class FrameDescriptor:
+    """子→親 共有メモリ上のフレーム位置 (frame_ring.FrameRing)。
+
+    画素はキューを通らず、この記述子 (数十バイト) だけを結果キューで送る。
+
+    Attributes:
+        camera_id (str): カメラ識別子。
+        ring_name (str): 共有メモリ名 (受信側は名前で attach する)。
+        slot (int): リング内のスロット番号。
+        seq (int): 書込み完了時のスロット連番 (偶数)。読出し後に一致すれば有効。
+        index (int): ソース内のフレーム連番。
+        pts_ns (Optional[int]): 提示時刻 (ns)。
+        captured_ns (int): 取得完了時刻 (モノトニック ns)。
+    """
+
+    camera_id: str
+    ring_name: str
+    slot: int
+    seq: int
+    index: int
+    pts_ns: Optional[int]
+    captured_ns: int
 
 
 @dataclass(frozen=True, slots=True)
@@ -93,8 +256,13 @@ __all__ = [
     "CONTROL_STOP",
     "CONTROL_RELOAD",
     "CONTROL_PING",
+    "CONTROL_ASSIGN",
     "ControlMessage",
+    "KeypointPayload",
+    "ResultRecord",
+    "ResultBatch",
     "StatusUpdate",
     "StatsMessage",
     "ExitNotice",
+    "FrameDescriptor",
 ]
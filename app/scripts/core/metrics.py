@@ -1,8 +1,10 @@
 """MetricsThread: Aggregator から周期的に統計を取得しログ出力/簡易異常検知を行う。
 
 機能:
-    * interval_s 毎に Aggregator.snapshot_stats()
-    * DEBUG ログ (event=METRIC_SNAPSHOT)
+    * interval_s 毎に統計取得 (thread_safe Aggregator では公開済みスナップショットをロックなし参照,
+      それ以外は publish())
+    * DEBUG ログ (event=METRIC_SNAPSHOT, カメラ毎)
+    * INFO ログ (event=METRIC_FLEET, 合計 FPS / 全体分位点 / 悪化カメラ上位 K 件)
     * last_update_age_sec > (3/target_fps + 1.0) で WARNING (event=CAMERA_STALL)
 
 注意: 以前 `_stop` という属性名が `threading.Thread._stop` (callable) と衝突し
@@ -14,8 +16,9 @@ from __future__ import annotations
 import logging
 import threading
 
-from .aggregator import Aggregator
 from . import utils_time
+from .aggregator import Aggregator
+from .fleet_stats import FleetSummary
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +37,11 @@ class MetricsThread(threading.Thread):
     def run(self) -> None:  # pragma: no cover - ループ本体は他テストで間接検証
         while not self._stop_event.wait(self._interval):
             now = utils_time.now_utc()
-            stats = self._agg.snapshot_stats(now=now)
-            for cam, data in stats.items():
+            snap = self._agg.latest_snapshot() if self._agg.thread_safe else None
+            if snap is None:
+                snap = self._agg.publish(now)
+            self._log_fleet(snap.fleet)
+            for cam, data in snap.stats.items():
                 logger.debug(
                     "metrics snapshot",
                     extra={
@@ -46,6 +52,7 @@ class MetricsThread(threading.Thread):
                         "latency_ms": data.get("avg_latency_ms"),
                         "latency_p50_ms": data.get("latency_p50_ms"),
                         "latency_p95_ms": data.get("latency_p95_ms"),
+                        "latency_p99_ms": data.get("latency_p99_ms"),
                         "drop_rate": data.get("drop_rate"),
                     },
                 )
@@ -64,5 +71,25 @@ class MetricsThread(threading.Thread):
                         },
                     )
 
+    @staticmethod
+    def _log_fleet(fleet: FleetSummary) -> None:
+        if fleet.cameras == 0:
+            return
+        logger.info(
+            "fleet summary",
+            extra={
+                "event": "METRIC_FLEET",
+                "cameras": fleet.cameras,
+                "fps": fleet.total_fps,
+                "ema_fps": fleet.total_ema_fps,
+                "latency_p50_ms": fleet.latency_p50_ms,
+                "latency_p95_ms": fleet.latency_p95_ms,
+                "latency_p99_ms": fleet.latency_p99_ms,
+                "drop_rate": fleet.mean_drop_rate,
+                "worst_latency": dict(fleet.worst_latency),
+                "worst_drop_rate": dict(fleet.worst_drop_rate),
+            },
+        )
+
 
 __all__ = ["MetricsThread"]
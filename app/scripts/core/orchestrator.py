@@ -6,31 +6,78 @@ Features:
     - Ping RTT (last_rtt_ms) tracking
     - simulate_hang_on_stop flag (process workers) for termination path tests
     - enable_central_logging placeholder (no-op for now)
+    - Background result export (ExportConfig.default_format) off the dispatcher thread
+    - Optional spill tier: results evicted from the aggregator ring go to on-disk segments
+    - Optional result batching: workers send ResultBatch (size / max-delay flush), pushed in bulk
+    - Workers pace frames on absolute deadlines and block on their control queue while idle
+    - Optional per-camera FrameSource (camera_sources): synthetic / raw / Y4M / image-sequence input with prefetch
+    - Optional InferenceBackend (inference_backend) running batched inference on FrameSource frames
+    - Optional latency-driven adaptive frame skipping in workers (latency_p95_target_ms / min_fps)
+    - Per-camera bounded result channels + priority status channels (one per worker process), drained fairly (ResultChannels)
+    - Optional camera packing in process mode (cameras_per_process): K camera threads per worker process
+    - Optional single-thread timer-heap runtime for thread-mode workers (thread_runtime="scheduler")
+    - Optional zero-copy frame hand-off through per-camera shared-memory rings (frame_ring_slots, frames hub)
+    - Optional compact hand keypoints in results, inline or by shared-memory reference (keypoint_mode)
+    - Optional worker-side One-Euro keypoint smoothing with hand-track association (keypoint_filter)
+    - Selectable worker start method; "forkserver" forks workers from a warm template (stack imported, model loaded)
+    - Optional restart supervisor (max_restarts_per_camera): sentinel-based exit detection, jittered backoff, DOWN after limit
+    - Optional hot-standby worker pool (standby_workers): warm idle processes take over a crashed camera at once
+    - Dispatcher routes messages through a type -> handler table and applies each round's results in one aggregator call
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
 import logging
 import time
-from multiprocessing import Event as MpEvent, Process, Queue as MpQueue, get_start_method, set_start_method
-from queue import Empty, Queue
-from threading import Event, Thread
-from typing import Dict, Iterable, Optional, Union
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing import get_start_method, set_start_method
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from queue import Queue
+from threading import Event, Lock, Thread, Timer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from .aggregator import Aggregator, ResultRecord
-from .messages import CONTROL_PING, CONTROL_STOP, ControlMessage, ExitNotice, StatsMessage, StatusUpdate
+from .channels import DEFAULT_DISPATCH_QUANTUM, ResultChannels
+from .exporter import ExportReport, ResultExporter, TimeRange
+from .frame_ring import FrameRingHub
+from .frame_source import DEFAULT_PREFETCH
+from .inference import BACKEND_STUB
+from .keypoint_filter import FILTER_NONE, KEYPOINT_FILTERS
+from .keypoints import KEYPOINT_MODES, KEYPOINTS_OFF, KEYPOINTS_SHARED, KeypointResolver
+from .logging_setup import configure_worker_logging, init_logging  # added
+from .messages import (
+    CONTROL_ASSIGN,
+    CONTROL_PING,
+    CONTROL_STOP,
+    ControlMessage,
+    ExitNotice,
+    FrameDescriptor,
+    ResultBatch,
+    StatsMessage,
+    StatusUpdate,
+)
 from .metrics import MetricsThread
+from .pacing import PACING_SKIP
+from .process_worker_entry import open_worker_backend, open_worker_source
+from .result_store import STORAGE_OBJECT
+from .scheduler import RUNTIME_SCHEDULER, RUNTIME_THREADS, THREAD_RUNTIMES, WorkerScheduler
+from .spill_store import SpillStore
+from .supervisor import ProcessSupervisor, RestartPolicy
 from .worker import CaptureInferenceWorker
-from .logging_setup import init_logging, configure_worker_logging  # added
+from .worker_template import START_DEFAULT, WORKER_START_METHODS, worker_context
+
+_DISPATCH_WAIT_SEC = 0.2  # max dispatcher wait when a round receives nothing
 
 
 @dataclass(slots=True)
 class OrchestratorConfig:
     camera_ids: Iterable[str]
-    result_queue_maxsize: int = 256
+    result_queue_maxsize: int = 256  # per camera (each camera has its own bounded result channel)
     target_fps: int = 10
     worker_latency_ms: float = 2.0
     aggregator_capacity: int = 1000
+    aggregator_storage: str = STORAGE_OBJECT  # result ring kind (object / columnar; columnar also stores keypoints compactly)
     use_process: bool = False
     ping_interval_sec: float = 5.0
     ping_timeout_sec: float = 10.0
@@ -39,21 +86,102 @@ class OrchestratorConfig:
     stop_grace_wait_sec: float = 0.05  # WAIT time after STOP before setting stop_event
     enable_central_logging: bool = False  # placeholder not implemented
     simulate_hang_on_stop: bool = False  # test helper for termination path
+    stats_refresh_sec: float = 1.0  # stats tick period (snapshot cache / EMA advance)
+    export_format: str = "csv"  # default format for export() (ExportConfig.default_format)
+    spill_dir: Optional[str] = None  # enables the on-disk tier for evicted results (SpillConfig)
+    spill_segment_records: int = 65_536
+    spill_partition_sec: int = 3600
+    spill_max_mb_per_camera: int = 0  # 0 = unlimited
+    spill_max_age_sec: int = 0  # 0 = unlimited
+    result_batch_max_records: int = 1  # 1 = one ResultRecord per queue message (no batching)
+    result_batch_max_delay_ms: float = 20.0  # max time a result waits in a worker-side batch
+    pacing_policy: str = PACING_SKIP  # late-frame policy of the worker deadline pacer (skip / catch_up)
+    camera_sources: Optional[Dict[str, str]] = None  # camera_id -> FrameSource URL (see open_frame_source)
+    frame_prefetch: int = DEFAULT_PREFETCH  # frames each source reads ahead on its prefetch thread
+    inference_backend: str = BACKEND_STUB  # InferenceBackend name; used only for cameras with a FrameSource
+    inference_batch_size: int = 1  # frames per infer_batch call
+    latency_p95_target_ms: Optional[float] = None  # enables worker adaptive frame skipping (None = off)
+    min_fps: float = 1.0  # floor of the adaptive skipper's effective sampling rate
+    dispatch_quantum: int = DEFAULT_DISPATCH_QUANTUM  # records taken per camera per dispatcher round
+    dispatch_max_records: int = 4096  # results buffered by the dispatcher before one bulk aggregator push (per round at most)
+    cameras_per_process: int = 1  # process mode: cameras hosted per worker process (one thread per camera)
+    thread_runtime: str = RUNTIME_THREADS  # thread mode: one thread per camera / one timer-heap scheduler thread
+    frame_ring_slots: int = 0  # >0: workers hand frames to the parent via a shared-memory ring (see frames)
+    keypoint_mode: str = KEYPOINTS_OFF  # off / inline / shared (refs resolved by the dispatcher before aggregation)
+    keypoint_filter: str = FILTER_NONE  # worker-side temporal smoothing + hand tracking of emitted keypoints (none / one_euro)
+    worker_start_method: str = START_DEFAULT  # process mode: default / spawn / forkserver (warm template, see worker_template)
+    max_restarts_per_camera: int = 0  # process mode: >0 respawns exited workers (RestartConfig); limit per restart_window_sec
+    restart_window_sec: float = 300.0  # exceeding the limit within this window marks the camera DOWN for good
+    restart_backoff_sec: float = 0.5  # first respawn delay in the window; doubled per restart, jittered +-20%
+    restart_backoff_max_sec: float = 30.0
+    standby_workers: int = 0  # process mode: warm idle workers that take over a crashed camera (needs restarts, 1 camera/process)
+    standby_refill_delay_sec: float = 0.5  # delay before replacing a used spare, so its startup does not slow the takeover
+
+
+@dataclass(frozen=True, slots=True)
+class _StandbyWorker:
+    # the queues exist before the process starts (inherited); on takeover they become the camera's channels
+    process: BaseProcess
+    result_queue: Any
+    control_queue: Any
+    status_queue: Any
 
 
 class Orchestrator:
     def __init__(self, cfg: OrchestratorConfig) -> None:
+        if cfg.thread_runtime not in THREAD_RUNTIMES:
+            raise ValueError(f"thread_runtime must be one of {THREAD_RUNTIMES}: {cfg.thread_runtime}")
+        if cfg.keypoint_mode not in KEYPOINT_MODES:
+            raise ValueError(f"keypoint_mode must be one of {KEYPOINT_MODES}: {cfg.keypoint_mode}")
+        if cfg.keypoint_filter not in KEYPOINT_FILTERS:
+            raise ValueError(f"keypoint_filter must be one of {KEYPOINT_FILTERS}: {cfg.keypoint_filter}")
+        if cfg.worker_start_method not in WORKER_START_METHODS:
+            raise ValueError(f"worker_start_method must be one of {WORKER_START_METHODS}: {cfg.worker_start_method}")
+        if cfg.dispatch_max_records < 1:
+            raise ValueError("dispatch_max_records must be >= 1")
+        if cfg.use_process and cfg.standby_workers > 0 and (cfg.max_restarts_per_camera <= 0 or cfg.cameras_per_process > 1):
+            raise ValueError("standby_workers requires max_restarts_per_camera > 0 and cameras_per_process == 1")
         self._cfg = cfg
+        self._mp = None  # multiprocessing context of the worker processes (process mode only)
         if cfg.use_process:
-            try:  # pragma: no cover
-                get_start_method()
-            except RuntimeError:  # pragma: no cover
-                set_start_method("spawn")
-            self._result_q = MpQueue(maxsize=cfg.result_queue_maxsize)
+            if cfg.worker_start_method == START_DEFAULT:
+                try:  # pragma: no cover
+                    get_start_method()
+                except RuntimeError:  # pragma: no cover
+                    set_start_method("spawn")
+            # queues / events must come from the workers' context (SemLocks cannot cross start methods)
+            self._mp = worker_context(cfg.worker_start_method, (cfg.inference_backend,))
+            queue_factory = self._mp.Queue
         else:
-            self._result_q = Queue(maxsize=cfg.result_queue_maxsize)
+            queue_factory = None  # in-process channels: puts notify the dispatcher (no per-camera polling)
+        # one bounded result channel per camera (a flooding camera only evicts its own results)
+        # and unbounded status channels (stats / ping replies / ExitNotice are never evicted): one shared by the parent's
+        # threads, one per worker process (added when the process starts)
+        self._channels = ResultChannels(queue_factory, cfg.result_queue_maxsize, quantum=cfg.dispatch_quantum)
+        for cam in cfg.camera_ids:
+            self._channels.add(cam)
         # below lines must remain indented within __init__
-        self._aggregator = Aggregator(capacity=cfg.aggregator_capacity)
+        # dispatcher (writer) + metrics/CLI/GUI (readers) share it -> thread-safe mode
+        self._spill: Optional[SpillStore] = None
+        if cfg.spill_dir:
+            self._spill = SpillStore(
+                Path(cfg.spill_dir),
+                segment_records=cfg.spill_segment_records,
+                partition_sec=cfg.spill_partition_sec,
+                max_bytes_per_camera=cfg.spill_max_mb_per_camera * 1024 * 1024 or None,
+                max_age_sec=cfg.spill_max_age_sec or None,
+            )
+        self._aggregator = Aggregator(
+            capacity=cfg.aggregator_capacity,
+            storage=cfg.aggregator_storage,
+            thread_safe=True,
+            stats_refresh_sec=cfg.stats_refresh_sec,
+            spill=self._spill,
+        )
+        # dispatcher wait per empty round: at most one stats tick so publish() keeps up, but never 0
+        # (stats_refresh_sec=0 means "no tick cache", and a 0 wait would busy-spin the dispatcher)
+        refresh = cfg.stats_refresh_sec
+        self._dispatch_wait_sec = min(_DISPATCH_WAIT_SEC, refresh) if refresh > 0 else _DISPATCH_WAIT_SEC
         self._stop_event = Event()
         # internal holders (avoid newer syntax for max compatibility)
         self._dispatcher_thread = None
@@ -61,11 +189,45 @@ class Orchestrator:
         self._ping_thread = None
         self._worker_threads = []
         self._worker_procs = []
+        self._proc_groups: Dict[str, List[str]] = {}  # worker process name -> hosted cameras
+        self._supervisor: Optional[ProcessSupervisor] = None
+        if cfg.use_process and cfg.max_restarts_per_camera > 0:
+            policy = RestartPolicy(
+                max_restarts=cfg.max_restarts_per_camera,
+                window_sec=cfg.restart_window_sec,
+                backoff_base_sec=cfg.restart_backoff_sec,
+                backoff_max_sec=cfg.restart_backoff_max_sec,
+            )
+            failover = self._failover_to_standby if cfg.standby_workers > 0 else None
+            self._supervisor = ProcessSupervisor(
+                policy, self._respawn_worker_process, self._on_worker_exit, failover=failover, clean_exit=self._is_clean_worker_exit
+            )
+        self._standby: List[_StandbyWorker] = []
+        self._standby_seq = 0
+        self._standby_lock = Lock()  # refill timer vs stop()
+        self._standby_closed = False
+        self._standby_refill: Optional[Timer] = None
         self._proc_stop_event = None
         self._control_queues = {}
         self._ping_state = {}
         self._exit_notices = {}
+        self._camera_status: Dict[str, StatusUpdate] = {}  # latest non-ping StatusUpdate (RETRYING / DOWN ...) per camera
+        self._exporter: Optional[ResultExporter] = None
+        self._frames = FrameRingHub()
+        self._keypoints: Optional[KeypointResolver] = KeypointResolver() if cfg.keypoint_mode == KEYPOINTS_SHARED else None
         self._logger = logging.getLogger(__name__)
+        # dispatcher: message type -> handler (exact type first; subclasses resolve via the MRO and are cached);
+        # results are buffered and pushed once per round (one lock acquire)
+        self._pending_results: List[ResultRecord] = []
+        self._handlers: Dict[type, Callable[[Any], None]] = {
+            ResultRecord: self._queue_result,
+            ResultBatch: self._queue_batch,
+            StatsMessage: self._aggregator.apply_stats_message,
+            StatusUpdate: self._handle_status_update,
+            FrameDescriptor: self._frames.publish,
+            ExitNotice: self._record_exit_notice,
+        }
+        self._unhandled: Dict[str, int] = {}  # message type name -> count of items with no handler (dropped)
 
     def start(self) -> None:
         if self._dispatcher_thread is not None:
@@ -92,12 +254,28 @@ class Orchestrator:
         self._ping_thread.start()
         if self._cfg.use_process:
             self._spawn_process_workers()
+        elif self._cfg.thread_runtime == RUNTIME_SCHEDULER:
+            scheduler = WorkerScheduler()
+            for cam in self._channels.camera_ids:
+                self._spawn_thread_worker(cam, scheduler)
+            # stop() joins it like a worker thread; it exits once every worker has handled STOP
+            t = Thread(target=self._run_scheduler, args=(scheduler,), name="WorkerScheduler", daemon=True)
+            t.start()
+            self._worker_threads.append(t)
         else:
-            for cam in self._cfg.camera_ids:
+            for cam in self._channels.camera_ids:
                 self._spawn_thread_worker(cam)
 
     def stop(self, timeout: float = 5.0) -> None:
-        for cam, q in self._control_queues.items():
+        if self._supervisor is not None:  # workers exiting on STOP must not be respawned
+            self._supervisor.stop(timeout)
+        with self._standby_lock:  # no spare may start or take over a camera after this point
+            self._standby_closed = True
+            if self._standby_refill is not None:
+                self._standby_refill.cancel()
+            standby = list(self._standby)
+        control_queues = list(self._control_queues.values()) + [s.control_queue for s in standby]
+        for q in control_queues:
             try:
                 q.put_nowait(ControlMessage(type=CONTROL_STOP, payload={}))
             except Exception:  # pragma: no cover
@@ -107,7 +285,7 @@ class Orchestrator:
             t.join(timeout=timeout)
             if t.is_alive():  # pragma: no cover
                 self._logger.warning("worker thread join timeout", extra={"event": "WORKER_JOIN_TIMEOUT", "thread": t.name})
-        for p in list(self._worker_procs):
+        for p in list(self._worker_procs) + [s.process for s in standby]:
             p.join(timeout)
             if p.is_alive():  # pragma: no cover
                 self._logger.warning("worker process join timeout", extra={"event": "WORKER_JOIN_TIMEOUT", "proc_name": p.name})
@@ -134,6 +312,15 @@ class Orchestrator:
             self._metrics_thread.join(timeout=timeout)
         if self._ping_thread:
             self._ping_thread.join(timeout=timeout)
+        if self._exporter is not None:
+            # let running exports finish so no *.part file is left behind
+            self._exporter.close(wait=True)
+            self._exporter = None
+        if self._spill is not None:
+            self._spill.close()
+        self._frames.close()
+        if self._keypoints is not None:
+            self._keypoints.close()
         try:
             self._logger.info("shutdown complete", extra={"event": "SHUTDOWN_COMPLETE", "workers": len(self._control_queues)})
         finally:
@@ -147,6 +334,34 @@ class Orchestrator:
     def aggregator(self) -> Aggregator:
         return self._aggregator
 
+    @property
+    def frames(self) -> FrameRingHub:
+        """Shared-memory frame hand-off (preview / recorder); populated when frame_ring_slots > 0."""
+        return self._frames
+
+    def export(self, time_range: TimeRange, dest: Path, fmt: Optional[str] = None) -> "Future[ExportReport]":
+        """Export buffered results per camera in the background (fmt defaults to cfg.export_format)."""
+        if self._exporter is None:
+            self._exporter = ResultExporter(self._aggregator)
+        future = self._exporter.submit(fmt or self._cfg.export_format, time_range, dest)
+        future.add_done_callback(self._log_export_done)
+        return future
+
+    def _log_export_done(self, future: "Future[ExportReport]") -> None:
+        exc = future.exception()
+        if exc is not None:
+            self._logger.error("export failed: %s", exc, extra={"event": "EXPORT_FAILED"})
+            return
+        report = future.result()
+        self._logger.info(
+            "export done fmt=%s records=%d bytes=%d dest=%s",
+            report.fmt,
+            report.records,
+            report.bytes_written,
+            report.dest,
+            extra={"event": "EXPORT_DONE"},
+        )
+
     @property
     def health_state(self) -> Dict[str, Dict[str, object]]:
         return {k: dict(v) for k, v in self._ping_state.items()}
@@ -155,12 +370,28 @@ class Orchestrator:
     def exit_notices(self) -> Dict[str, ExitNotice]:
         return dict(self._exit_notices)
 
+    @property
+    def unhandled_messages(self) -> Dict[str, int]:
+        """Count of dropped channel items per message type the dispatcher has no handler for."""
+        return dict(self._unhandled)
+
+    @property
+    def camera_status(self) -> Dict[str, StatusUpdate]:
+        """Latest status transition per camera (restart RETRYING / restart_limit or ping_timeout DOWN)."""
+        return dict(self._camera_status)
+
     @property
     def active_process_count(self) -> int:
         return sum(1 for p in self._worker_procs if p.is_alive())
 
-    def _spawn_thread_worker(self, camera_id: str) -> None:
-        self._control_queues[camera_id] = Queue(maxsize=16)
+    @property
+    def standby_process_count(self) -> int:
+        """Idle hot-standby worker processes currently available for failover."""
+        return sum(1 for s in self._standby if s.process.is_alive())
+
+    def _spawn_thread_worker(self, camera_id: str, scheduler: Optional[WorkerScheduler] = None) -> None:
+        # with the scheduler runtime the control queue wakes the scheduler instead of a per-camera thread
+        self._control_queues[camera_id] = scheduler.control_queue(camera_id) if scheduler else Queue(maxsize=16)
         self._ping_state[camera_id] = {
             "last_id": None,
             "sent_ts": None,
@@ -169,18 +400,22 @@ class Orchestrator:
             "down": False,
             "last_rtt_ms": None,
         }
+        if scheduler is not None:
+            return
         t = Thread(target=self._run_worker_stub, args=(camera_id,), name=f"Worker-{camera_id}", daemon=True)
         t.start()
         self._worker_threads.append(t)
 
     def _spawn_process_workers(self) -> None:  # pragma: no cover
-        from .process_worker_entry import run_capture_inference_worker_process
-        from multiprocessing import Queue as MpQueue
+        ctx = self._mp
+        self._proc_stop_event = ctx.Event()
+        if self._cfg.frame_ring_slots > 0 or self._keypoints is not None:
+            # Share one resource_tracker with the workers so their unlink also clears the parent's attach registration
+            from multiprocessing import resource_tracker
 
-        self._proc_stop_event = MpEvent()
-        for cam in self._cfg.camera_ids:
-            ctrl_q = MpQueue(maxsize=16)
-            self._control_queues[cam] = ctrl_q
+            resource_tracker.ensure_running()
+        for cam in self._channels.camera_ids:
+            self._control_queues[cam] = ctx.Queue(maxsize=16)
             self._ping_state[cam] = {
                 "last_id": None,
                 "sent_ts": None,
@@ -188,67 +423,296 @@ class Orchestrator:
                 "losses": 0,
                 "down": False,
                 "last_rtt_ms": None,
+                "restarts": 0,
+                "failed": False,  # restart limit reached: DOWN for good (no pings, no respawn)
             }
-            extra_args = (
-                cam,
-                self._result_q,
-                ctrl_q,
-                self._proc_stop_event,
-                self._cfg.target_fps,
-                self._cfg.worker_latency_ms,
-                self._cfg.respond_to_ping,
-                self._cfg.simulate_hang_on_stop,
-            )
-            if getattr(self, "_log_queue", None):  # append log queue for worker side config
-                extra_args = extra_args + (self._log_queue,)
-            p = Process(target=run_capture_inference_worker_process, name=f"WProc-{cam}", args=extra_args, daemon=True)
-            p.start()
-            self._worker_procs.append(p)
+        cams = self._channels.camera_ids
+        per_process = max(1, self._cfg.cameras_per_process)
+        for i in range(0, len(cams), per_process):
+            group = cams[i : i + per_process]
+            # K cameras share one interpreter (one thread per camera); queues / ExitNotice stay per camera
+            name = f"WProc-{group[0]}" if per_process == 1 else f"WProc-{group[0]}+{len(group) - 1}"
+            self._proc_groups[name] = group
+            p = self._start_worker_process(name)
+            if self._supervisor is not None:
+                self._supervisor.watch(name, p)
+        self._refill_standby()  # after the cameras so the spares do not delay the first results
+        if self._supervisor is not None:
+            self._supervisor.start()
+
+    def _worker_process_args(self) -> Tuple[tuple, tuple, Dict[str, object]]:  # pragma: no cover
+        # (stop_event .. respond_to_ping, simulate_hang_on_stop [+ log_queue], worker options) shared by all worker processes
+        options: Dict[str, object] = {
+            "batch_max_records": self._cfg.result_batch_max_records,
+            "batch_max_delay_ms": self._cfg.result_batch_max_delay_ms,
+            "pacing_policy": self._cfg.pacing_policy,
+            "frame_prefetch": self._cfg.frame_prefetch,
+            "inference_backend": self._cfg.inference_backend,
+            "inference_batch_size": self._cfg.inference_batch_size,
+            "latency_target_ms": self._cfg.latency_p95_target_ms,
+            "min_fps": self._cfg.min_fps,
+            "frame_ring_slots": self._cfg.frame_ring_slots,
+            "keypoint_mode": self._cfg.keypoint_mode,
+            "keypoint_filter": self._cfg.keypoint_filter,
+        }
+        # worker side log config; the central log queue lives in the default context, so only default-start workers get it
+        log_queue = getattr(self, "_log_queue", None) if self._cfg.worker_start_method == START_DEFAULT else None
+        tail = (self._cfg.simulate_hang_on_stop,) + ((log_queue,) if log_queue else ())
+        common = (self._proc_stop_event, self._cfg.target_fps, self._cfg.worker_latency_ms, self._cfg.respond_to_ping)
+        return common, tail, options
+
+    def _start_worker_process(self, name: str) -> BaseProcess:  # pragma: no cover
+        from .process_worker_entry import run_capture_inference_worker_process, run_multi_camera_worker_process
+
+        group = self._proc_groups[name]
+        sources = self._cfg.camera_sources or {}
+        common, tail, options = self._worker_process_args()
+        # a fresh status channel per (re)start: a process killed mid-put may leave a queue's write lock held,
+        # so a status queue shared across processes would silence every other worker's stats / ping / ExitNotice
+        options["status_queue"] = self._channels.add_status(name)
+        if self._cfg.cameras_per_process <= 1:
+            cam = group[0]
+            target = run_capture_inference_worker_process
+            args = (cam, self._channels.result_queue(cam), self._control_queues[cam]) + common
+            kwargs = {**options, "source_url": sources.get(cam)}
+        else:
+            target = run_multi_camera_worker_process
+            args = (
+                [(cam, self._channels.result_queue(cam), self._control_queues[cam], sources.get(cam)) for cam in group],
+            ) + common
+            kwargs = options
+        p = self._mp.Process(target=target, name=name, args=args + tail, kwargs=kwargs, daemon=True)
+        p.start()
+        self._worker_procs.append(p)
+        return p
+
+    def _start_standby_worker(self) -> None:  # pragma: no cover
+        from .process_worker_entry import run_standby_worker_process
+
+        common, tail, options = self._worker_process_args()
+        result_queue, control_queue = self._mp.Queue(self._cfg.result_queue_maxsize), self._mp.Queue(maxsize=16)
+        options["status_queue"] = status_queue = self._mp.Queue()
+        self._standby_seq += 1
+        p = self._mp.Process(
+            target=run_standby_worker_process,
+            name=f"WStandby-{self._standby_seq}",
+            args=(result_queue, control_queue) + common + tail,
+            kwargs=options,
+            daemon=True,
+        )
+        p.start()
+        self._standby.append(_StandbyWorker(p, result_queue, control_queue, status_queue))
+
+    def _failover_to_standby(self, name: str) -> Optional[BaseProcess]:  # pragma: no cover
+        # supervisor thread; hand the crashed camera to a warm idle worker instead of starting (and loading) a new one.
+        # The whole takeover runs under _standby_lock: the refill timer and stop() use the same list, and stop() must see
+        # a taken spare either in _standby or (with its control queue) in _worker_procs, never in between.
+        with self._standby_lock:
+            if self._standby_closed:
+                return None
+            spare = None
+            while self._standby and spare is None:
+                candidate = self._standby.pop(0)
+                if candidate.process.is_alive():
+                    spare = candidate
+            if spare is None:
+                return None
+            (cam,) = self._proc_groups[name]
+            self._control_queues[cam] = spare.control_queue
+            self._channels.renew(cam, spare.result_queue)
+            self._channels.add_status(name, spare.status_queue)
+            self._exit_notices.pop(cam, None)
+            self._ping_state[cam].update(last_id=None, sent_ts=None, responded=True, losses=0)
+            source_url = (self._cfg.camera_sources or {}).get(cam)
+            spare.control_queue.put_nowait(ControlMessage(type=CONTROL_ASSIGN, payload={"camera_id": cam, "source_url": source_url}))
+            spare.process.name = name
+            self._worker_procs = [p for p in self._worker_procs if p.is_alive()]
+            self._worker_procs.append(spare.process)
+            # refill later: on a busy host a spare loading its backend right now would slow the takeover itself
+            if self._standby_refill is None:
+                self._standby_refill = Timer(self._cfg.standby_refill_delay_sec, self._refill_standby)
+                self._standby_refill.daemon = True
+                self._standby_refill.start()
+        return spare.process
+
+    def _refill_standby(self) -> None:  # pragma: no cover
+        with self._standby_lock:
+            self._standby_refill = None
+            while not self._standby_closed and len(self._standby) < self._cfg.standby_workers:
+                self._start_standby_worker()
+
+    def _respawn_worker_process(self, name: str) -> Optional[BaseProcess]:  # pragma: no cover
+        # supervisor thread; a worker killed mid-get / mid-put may leave its queues' locks held -> fresh queues
+        # (the process's status channel is renewed by _start_worker_process)
+        if self._stop_event.is_set():
+            return None
+        for cam in self._proc_groups[name]:
+            self._control_queues[cam] = self._mp.Queue(maxsize=16)
+            self._channels.renew(cam)
+            self._exit_notices.pop(cam, None)
+            self._ping_state[cam].update(last_id=None, sent_ts=None, responded=True, losses=0)
+        self._worker_procs = [p for p in self._worker_procs if p.is_alive()]
+        return self._start_worker_process(name)
+
+    def _is_clean_worker_exit(self, name: str, exitcode: Optional[int]) -> bool:  # pragma: no cover
+        # a returned worker function (STOP / EOS / SOURCE_OPEN / MODEL_LOAD) exits 0; replaying an ended file source or
+        # retrying a bad URL is not recovery. A graceful ExitNotice (code 0) from every hosted camera also counts as clean.
+        if exitcode == 0:
+            return True
+        notices = [self._exit_notices.get(cam) for cam in self._proc_groups[name]]
+        return all(n is not None and n.code == 0 for n in notices)
+
+    def _on_worker_exit(self, name: str, exitcode: Optional[int], delay: Optional[float]) -> None:  # pragma: no cover
+        for cam in self._proc_groups[name]:
+            st = self._ping_state[cam]
+            st["down"] = True
+            if delay is None:
+                st["failed"] = True
+                self._logger.error(
+                    "worker process exited (exitcode=%s); restart limit reached, camera down", exitcode,
+                    extra={"event": "WORKER_RESTART_LIMIT", "camera": cam, "proc_name": name},
+                )
+                update = StatusUpdate(camera_id=cam, status="DOWN", attempts=int(st["restarts"]), last_error="restart_limit")
+            else:
+                st["restarts"] = int(st["restarts"]) + 1
+                self._logger.warning(
+                    "worker process exited (exitcode=%s); restarting in %.2fs", exitcode, delay,
+                    extra={"event": "WORKER_RESTART", "camera": cam, "proc_name": name},
+                )
+                update = StatusUpdate(camera_id=cam, status="RETRYING", attempts=int(st["restarts"]), last_error=f"exitcode={exitcode}")
+            try:
+                self._channels.status.put_nowait(update)
+            except Exception:
+                pass
 
     def _run_worker_stub(self, camera_id: str) -> None:  # pragma: no cover
-        worker = CaptureInferenceWorker(
+        worker = self._build_thread_worker(camera_id)
+        if worker is None:
+            return
+        while not self._stop_event.is_set():
+            worker.run_loop(iterations=1)
+            if getattr(worker, "is_stopping", False):
+                break
+        worker.close()
+
+    def _run_scheduler(self, scheduler: WorkerScheduler) -> None:  # pragma: no cover
+        # sources / backends are opened here so start() does not block on hundreds of cameras
+        for cam in self._channels.camera_ids:
+            worker = self._build_thread_worker(cam)
+            if worker is not None:
+                scheduler.add(worker)
+        scheduler.run(self._stop_event)
+
+    def _build_thread_worker(self, camera_id: str) -> Optional[CaptureInferenceWorker]:  # pragma: no cover
+        ok, source = open_worker_source(
+            camera_id, (self._cfg.camera_sources or {}).get(camera_id), self._cfg.frame_prefetch, self._channels.status
+        )
+        if not ok:
+            return None
+        ok, backend = open_worker_backend(camera_id, self._cfg.inference_backend if source else BACKEND_STUB, self._channels.status)
+        if not ok:
+            if source is not None:
+                source.close()
+            return None
+        return CaptureInferenceWorker(
             camera_id,
-            self._result_q,
+            self._channels.result_queue(camera_id),
             target_fps=self._cfg.target_fps,
             simulate_latency_ms=self._cfg.worker_latency_ms,
             control_queue=self._control_queues[camera_id],
             respond_to_ping=self._cfg.respond_to_ping,
+            batch_max_records=self._cfg.result_batch_max_records,
+            batch_max_delay_ms=self._cfg.result_batch_max_delay_ms,
+            pacing_policy=self._cfg.pacing_policy,
+            frame_source=source,
+            inference_backend=backend,
+            inference_batch_size=self._cfg.inference_batch_size,
+            latency_target_ms=self._cfg.latency_p95_target_ms,
+            min_fps=self._cfg.min_fps,
+            status_queue=self._channels.status,
+            frame_ring_slots=self._cfg.frame_ring_slots,
+            keypoint_mode=self._cfg.keypoint_mode,
+            keypoint_filter=self._cfg.keypoint_filter,
         )
-        while not self._stop_event.is_set():
-            worker.run_loop(iterations=1)
-            if getattr(worker, "is_stopping", False):
-                break
 
     def _run_dispatcher(self) -> None:  # pragma: no cover
         while not self._stop_event.is_set():
-            try:
-                item = self._result_q.get(timeout=0.2)
-            except Empty:
-                continue
-            if isinstance(item, ResultRecord):
-                self._aggregator.push_result(item)
-            elif isinstance(item, StatsMessage):
-                self._aggregator.apply_stats_message(item)
-            elif isinstance(item, StatusUpdate) and item.ping_response:
-                st = self._ping_state.get(item.camera_id)
-                if st and st.get("last_id") == item.ping_response:
-                    sent_ts = st.get("sent_ts")
-                    if isinstance(sent_ts, float):
-                        rtt_ms = (time.monotonic() - sent_ts) * 1000.0
-                        # 超高速(ほぼ同一 tick)の場合 0.0 になるのを避け、テスト容易性のため最小正値を与える
-                        if rtt_ms <= 0.0:
-                            rtt_ms = 0.001
-                        st["last_rtt_ms"] = rtt_ms
-                    st["responded"] = True
-                    st["losses"] = 0
-                    if st.get("down"):
-                        st["down"] = False
-                        self._logger.info(
-                            "camera recovered after ping losses",
-                            extra={"event": "CAMERA_RECOVER", "camera": item.camera_id},
-                        )
-            elif isinstance(item, ExitNotice):
-                self._exit_notices[item.camera_id] = item
+            # the dispatcher is the only writer, so it also publishes the shared snapshot;
+            # publish() is a cache hit until the next stats tick
+            self._aggregator.publish()
+            self._dispatch_round(timeout=self._dispatch_wait_sec)
+
+    def _dispatch_round(self, timeout: float) -> int:
+        # status channel first, then one fair (deficit round robin) round over the camera result channels;
+        # when the round is empty it waits on the status channel for a few ms (see channels module).
+        # Everything already queued is drained without blocking; the round's results then reach the aggregator at once.
+        handled = self._channels.poll(self._dispatch, timeout=timeout)
+        self._flush_results()
+        return handled
+
+    def _dispatch(self, item: object) -> None:
+        handler = self._handlers.get(type(item))
+        if handler is None:
+            handler = self._resolve_handler(type(item))
+            if handler is None:
+                return
+        handler(item)
+
+    def _resolve_handler(self, cls: type) -> Optional[Callable[[Any], None]]:
+        # table miss: a subclass of a known message uses its nearest base's handler (cached for the next item)
+        for base in cls.__mro__[1:]:
+            handler = self._handlers.get(base)
+            if handler is not None:
+                self._handlers[cls] = handler
+                return handler
+        name = cls.__qualname__
+        count = self._unhandled.get(name, 0)
+        self._unhandled[name] = count + 1
+        if count == 0:
+            self._logger.warning("dispatcher: no handler for message type %s (dropped, counted in unhandled_messages)", name)
+        return None
+
+    def _queue_result(self, record: ResultRecord) -> None:
+        self._pending_results.append(record)
+        if len(self._pending_results) >= self._cfg.dispatch_max_records:
+            self._flush_results()
+
+    def _queue_batch(self, batch: ResultBatch) -> None:
+        self._pending_results.extend(batch.records)
+        if len(self._pending_results) >= self._cfg.dispatch_max_records:
+            self._flush_results()
+
+    def _flush_results(self) -> None:
+        records = self._pending_results
+        if not records:
+            return
+        self._aggregator.push_results(records if self._keypoints is None else self._keypoints.resolve_all(records))
+        records.clear()
+
+    def _handle_status_update(self, item: StatusUpdate) -> None:
+        if not item.ping_response:
+            self._camera_status[item.camera_id] = item
+            return
+        st = self._ping_state.get(item.camera_id)
+        if st and st.get("last_id") == item.ping_response:
+            sent_ts = st.get("sent_ts")
+            if isinstance(sent_ts, float):
+                rtt_ms = (time.monotonic() - sent_ts) * 1000.0
+                # 超高速(ほぼ同一 tick)の場合 0.0 になるのを避け、テスト容易性のため最小正値を与える
+                if rtt_ms <= 0.0:
+                    rtt_ms = 0.001
+                st["last_rtt_ms"] = rtt_ms
+            st["responded"] = True
+            st["losses"] = 0
+            if st.get("down"):
+                st["down"] = False
+                self._logger.info(
+                    "camera recovered after ping losses",
+                    extra={"event": "CAMERA_RECOVER", "camera": item.camera_id},
+                )
+
+    def _record_exit_notice(self, item: ExitNotice) -> None:
+        self._exit_notices[item.camera_id] = item
 
     def _run_ping_loop(self) -> None:  # pragma: no cover
         interval = self._cfg.ping_interval_sec
@@ -256,8 +720,10 @@ class Orchestrator:
         thresh = self._cfg.ping_loss_threshold
         while not self._stop_event.wait(interval):
             now = time.monotonic()
-            for cam, q in self._control_queues.items():
+            for cam, q in list(self._control_queues.items()):
                 st = self._ping_state[cam]
+                if st.get("failed"):
+                    continue
                 last_sent = st["sent_ts"]
                 if st["last_id"] and not st["responded"] and isinstance(last_sent, float):
                     if now - last_sent > timeout:
@@ -272,7 +738,7 @@ class Orchestrator:
                                 "camera down (ping losses >= %s)", thresh, extra={"event": "CAMERA_DOWN", "camera": cam}
                             )
                             try:
-                                self._result_q.put_nowait(
+                                self._channels.status.put_nowait(
                                     StatusUpdate(camera_id=cam, status="DOWN", attempts=0, last_error="ping_timeout")
                                 )
                             except Exception:
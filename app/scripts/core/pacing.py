@@ -0,0 +1,101 @@
+"""絶対期限ベースのフレームペーシング。
+
+従来の「frame_interval - 処理時間 だけ sleep」は sleep の起床遅れが毎フレーム累積し
+(ドリフト)、処理時間の揺らぎがそのまま間隔の揺らぎになる。FramePacer は開始時刻から
+interval 刻みの絶対期限 (モノトニック ns) を保持し、各フレームは期限で開始する。
+起床遅れは次の期限で吸収されるため累積しない。
+
+遅延時の方針 (処理が期限に追い付かない場合):
+    skip: 過ぎた期限のうち最新の 1 つだけを実行し、それ以前は飛ばす (既定)。
+        期限の位相 (開始時刻 + n × interval) は維持する。
+    catch_up: 過ぎた期限を全て連続実行して追い付く。ただし遅れが max_catch_up
+        フレームを超える分は飛ばす (長時間停止後の連続実行を防ぐ)。
+
+利用例:
+    worker.CaptureInferenceWorker (フレーム生成周期と待機中の制御メッセージ受信)。
+"""
+
+from __future__ import annotations
+
+from typing import Final, Optional, Tuple
+
+PACING_SKIP: Final = "skip"
+PACING_CATCH_UP: Final = "catch_up"
+PACING_POLICIES: Final[Tuple[str, ...]] = (PACING_SKIP, PACING_CATCH_UP)
+DEFAULT_MAX_CATCH_UP: Final = 3
+
+
+class FramePacer:
+    """目標 FPS の絶対期限列を管理する。
+
+    Attributes:
+        interval_ns (int): フレーム間隔 (ns)。
+        policy (str): 遅延時の方針 (skip / catch_up)。
+        skipped (int): 方針により実行せず飛ばした期限の累計。
+    """
+
+    __slots__ = ("interval_ns", "policy", "skipped", "_max_catch_up", "_next_ns")
+
+    def __init__(
+        self,
+        target_fps: float,
+        policy: str = PACING_SKIP,
+        max_catch_up: int = DEFAULT_MAX_CATCH_UP,
+    ) -> None:
+        if target_fps <= 0:
+            raise ValueError("target_fps は正数である必要があります")
+        if policy not in PACING_POLICIES:
+            raise ValueError(f"policy が不正: {policy} (有効: {PACING_POLICIES})")
+        if max_catch_up < 1:
+            raise ValueError("max_catch_up は 1 以上である必要があります")
+        self.interval_ns = max(1, round(1_000_000_000 / target_fps))
+        self.policy = policy
+        self.skipped = 0
+        self._max_catch_up = max_catch_up if policy == PACING_CATCH_UP else 1
+        self._next_ns: Optional[int] = None
+
+    @property
+    def next_deadline_ns(self) -> Optional[int]:
+        """次フレームの開始期限 (未開始なら None)。"""
+        return self._next_ns
+
+    def remaining_ns(self, now_ns: int) -> int:
+        """次の期限までの残り時間 (ns, 期限経過済み / 未開始なら 0)。"""
+        if self._next_ns is None:
+            return 0
+        return max(0, self._next_ns - now_ns)
+
+    def advance(self, now_ns: int) -> int:
+        """1 フレームの開始を記録し、次の期限を返す。
+
+        初回呼出し時の now_ns が期限列の起点になる。
+
+        Args:
+            now_ns (int): フレーム開始時刻 (モノトニック ns)。
+
+        Returns:
+            int: 次フレームの開始期限 (ns)。遅延時は now_ns 以下 (即時実行) の場合がある。
+        """
+        interval = self.interval_ns
+        if self._next_ns is None:
+            self._next_ns = now_ns + interval
+            return self._next_ns
+        nxt = self._next_ns + interval
+        if nxt <= now_ns:
+            # now までに過ぎた期限数 (nxt を含む)。max_catch_up を超える分は飛ばす
+            overdue = (now_ns - nxt) // interval + 1
+            drop = overdue - self._max_catch_up
+            if drop > 0:
+                nxt += drop * interval
+                self.skipped += drop
+        self._next_ns = nxt
+        return nxt
+
+
+__all__ = [
+    "PACING_SKIP",
+    "PACING_CATCH_UP",
+    "PACING_POLICIES",
+    "DEFAULT_MAX_CATCH_UP",
+    "FramePacer",
+]
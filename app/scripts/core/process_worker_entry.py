@@ -4,14 +4,75 @@ Purpose:
     * Launch `CaptureInferenceWorker` in a separate process.
     * Support STOP via ControlMessage so that ExitNotice is emitted (parity with thread mode).
     * Retain compatibility with simple run loop used in tests.
+    * Open the camera's FrameSource inside the worker (mmap / prefetch thread belong to the worker side).
+    * Load and warm up the InferenceBackend inside the worker (model memory is per worker process).
+    * Send results on the camera's own result queue and stats / ping replies / ExitNotice on the process's status queue.
+    * Optionally host several cameras per process (one thread per camera) to cut RSS / startup cost for large fleets.
+    * Reuse the backend preloaded by the forkserver template (worker_start_method="forkserver") instead of loading it again.
+    * Run hot-standby workers: started and warmed up ahead of time, they take over a camera when the parent assigns one.
 """
 from __future__ import annotations
 
+from threading import Lock, Thread
 from time import sleep
-from queue import Full
+from queue import Empty, Full
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
+from .errors import ModelLoadError, StreamConnectionError
+from .frame_source import DEFAULT_PREFETCH, FrameSource, open_frame_source
+from .inference import BACKEND_STUB, InferenceBackend, create_inference_backend
+from .keypoint_filter import FILTER_NONE
+from .keypoints import KEYPOINTS_OFF
+from .messages import CONTROL_ASSIGN, CONTROL_STOP, ExitNotice
+from .pacing import PACING_SKIP
 from .worker import CaptureInferenceWorker
-from .messages import CONTROL_STOP
+from .worker_template import template_backend
+
+
+def open_worker_source(
+    camera_id: str, source_url: Optional[str], prefetch: int, status_queue
+) -> Tuple[bool, Optional[FrameSource]]:
+    """Open the frame source of a camera (shared by process and thread workers).
+
+    Returns (ok, source). source is None when no URL is given or the URL has no FrameSource
+    (e.g. rtsp:// or an unsupported file such as .mp4, the worker then keeps producing frameless
+    stub results). When the source cannot
+    be opened, ExitNotice(code=1) is sent and ok is False (the worker must not start).
+    """
+    if not source_url:
+        return True, None
+    try:
+        return True, open_frame_source(source_url, prefetch=prefetch)
+    except (StreamConnectionError, ValueError) as e:
+        try:
+            status_queue.put_nowait(ExitNotice(camera_id=camera_id, code=1, reason=f"SOURCE_OPEN: {e}"))
+        except Full:
+            pass
+        return False, None
+
+
+def open_worker_backend(camera_id: str, name: str, status_queue) -> Tuple[bool, Optional[InferenceBackend]]:
+    """Create, load and warm up the inference backend (shared by process and thread workers).
+
+    Returns (ok, backend). backend is None for the stub backend. When loading fails, ExitNotice(code=1)
+    is sent and ok is False. A backend preloaded by the forkserver template is returned as is (already warm).
+    """
+    preloaded = template_backend(name)
+    if preloaded is not None:
+        return True, preloaded
+    backend = create_inference_backend(name)
+    if backend is None:
+        return True, None
+    try:
+        backend.load()
+        backend.warmup()
+    except ModelLoadError as e:
+        try:
+            status_queue.put_nowait(ExitNotice(camera_id=camera_id, code=1, reason=f"MODEL_LOAD: {e}"))
+        except Full:
+            pass
+        return False, None
+    return True, backend
 
 
 def run_capture_inference_worker_process(
@@ -24,15 +85,169 @@ def run_capture_inference_worker_process(
     respond_to_ping: bool,
     simulate_hang_on_stop: bool = False,
     log_queue=None,
+    batch_max_records: int = 1,
+    batch_max_delay_ms: float = 20.0,
+    pacing_policy: str = PACING_SKIP,
+    source_url: Optional[str] = None,
+    frame_prefetch: int = DEFAULT_PREFETCH,
+    inference_backend: str = BACKEND_STUB,
+    inference_batch_size: int = 1,
+    latency_target_ms: Optional[float] = None,
+    min_fps: float = 1.0,
+    status_queue=None,  # None = stats / ping replies / ExitNotice share result_queue (legacy single queue)
+    frame_ring_slots: int = 0,
+    keypoint_mode: str = KEYPOINTS_OFF,
+    keypoint_filter: str = FILTER_NONE,
 ) -> None:
-    # 中央ログ有効時: 親から渡された log_queue で設定
-    if log_queue is not None:
-        try:  # 遅延 import で起動コスト最小化
-            from .logging_setup import configure_worker_logging
+    _configure_logging(log_queue)
+    run_camera(
+        camera_id,
+        result_queue,
+        control_queue,
+        stop_event,
+        target_fps,
+        latency_ms,
+        respond_to_ping,
+        status_queue=status_queue,
+        source_url=source_url,
+        frame_prefetch=frame_prefetch,
+        inference_backend=inference_backend,
+        batch_max_records=batch_max_records,
+        batch_max_delay_ms=batch_max_delay_ms,
+        pacing_policy=pacing_policy,
+        inference_batch_size=inference_batch_size,
+        latency_target_ms=latency_target_ms,
+        min_fps=min_fps,
+        frame_ring_slots=frame_ring_slots,
+        keypoint_mode=keypoint_mode,
+        keypoint_filter=keypoint_filter,
+    )
+    if simulate_hang_on_stop and not stop_event.is_set():  # テスト用: STOP 後に敢えてハング
+        sleep(10)  # 十分長くして親側 terminate 経路を誘発
 
-            configure_worker_logging(log_queue)
-        except Exception:  # pragma: no cover
-            pass
+
+def run_multi_camera_worker_process(
+    cameras: Sequence[Tuple[str, Any, Any, Optional[str]]],
+    stop_event,
+    target_fps: int,
+    latency_ms: float,
+    respond_to_ping: bool,
+    simulate_hang_on_stop: bool = False,
+    log_queue=None,
+    status_queue=None,
+    **camera_options: Any,
+) -> None:
+    """Host several cameras in one process, one thread per camera (cameras_per_process > 1).
+
+    cameras holds (camera_id, result_queue, control_queue, source_url) per camera. Every camera keeps its own
+    CaptureInferenceWorker, result / control queues and ExitNotice, so ping / STOP / stats stay per camera.
+    camera_options takes the keyword arguments of run_capture_inference_worker_process except source_url.
+    The inference backend is loaded once per process and shared by the camera threads (it is stateless after
+    load and NumPy releases the GIL in its matmuls), so the model memory is per process, not per camera.
+    """
+    _configure_logging(log_queue)
+    loader = _SharedBackendLoader()
+    threads = [
+        Thread(
+            target=run_camera,
+            name=f"Camera-{camera_id}",
+            args=(camera_id, result_queue, control_queue, stop_event, target_fps, latency_ms, respond_to_ping),
+            kwargs={**camera_options, "status_queue": status_queue, "source_url": source_url, "open_backend": loader},
+            daemon=True,
+        )
+        for camera_id, result_queue, control_queue, source_url in cameras
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if simulate_hang_on_stop and not stop_event.is_set():  # テスト用: STOP 後に敢えてハング
+        sleep(10)
+
+
+def run_standby_worker_process(
+    result_queue,
+    control_queue,
+    stop_event,
+    target_fps: int,
+    latency_ms: float,
+    respond_to_ping: bool,
+    simulate_hang_on_stop: bool = False,
+    log_queue=None,
+    *,
+    status_queue=None,
+    inference_backend: str = BACKEND_STUB,
+    **camera_options: Any,
+) -> None:
+    """Hot-standby worker: load and warm up the backend, then idle until the parent assigns a camera.
+
+    On ControlMessage(CONTROL_ASSIGN, {"camera_id", "source_url"}) the process runs that camera exactly like
+    run_capture_inference_worker_process, with result_queue / control_queue becoming the camera's channels (the parent
+    swaps them in before assigning). STOP or stop_event before an assignment ends the process without any message.
+    camera_options takes the keyword arguments of run_capture_inference_worker_process except source_url.
+    """
+    _configure_logging(log_queue)
+    loader = _SharedBackendLoader()
+    loader.load(inference_backend)  # a load error is reported (as MODEL_LOAD) for the camera assigned later
+    while not stop_event.is_set():
+        try:
+            msg = control_queue.get(timeout=0.5)
+        except Empty:
+            continue
+        if msg.type == CONTROL_STOP:
+            return
+        if msg.type != CONTROL_ASSIGN:
+            continue
+        run_camera(
+            msg.payload["camera_id"],
+            result_queue,
+            control_queue,
+            stop_event,
+            target_fps,
+            latency_ms,
+            respond_to_ping,
+            status_queue=status_queue,
+            source_url=msg.payload.get("source_url"),
+            inference_backend=inference_backend,
+            open_backend=loader,
+            **camera_options,
+        )
+        if simulate_hang_on_stop and not stop_event.is_set():  # テスト用: STOP 後に敢えてハング
+            sleep(10)
+        return
+
+
+def run_camera(
+    camera_id: str,
+    result_queue,
+    control_queue,
+    stop_event,
+    target_fps: int,
+    latency_ms: float,
+    respond_to_ping: bool,
+    *,
+    status_queue=None,
+    source_url: Optional[str] = None,
+    frame_prefetch: int = DEFAULT_PREFETCH,
+    inference_backend: str = BACKEND_STUB,
+    open_backend: Callable[[str, str, Any], Tuple[bool, Optional[InferenceBackend]]] = open_worker_backend,
+    **worker_options: Any,
+) -> None:
+    """Run one camera until STOP (ControlMessage) or stop_event (shared by single- and multi-camera processes).
+
+    worker_options are passed to CaptureInferenceWorker (batching / pacing / inference batch / skipping).
+    """
+    if status_queue is None:
+        status_queue = result_queue
+    ok, source = open_worker_source(camera_id, source_url, frame_prefetch, status_queue)
+    if not ok:
+        return
+    # the backend consumes frames, so cameras without a FrameSource keep the stub
+    ok, backend = open_backend(camera_id, inference_backend if source else BACKEND_STUB, status_queue)
+    if not ok:
+        if source is not None:
+            source.close()
+        return
     worker = CaptureInferenceWorker(
         camera_id=camera_id,
         result_queue=result_queue,
@@ -40,18 +255,66 @@ def run_capture_inference_worker_process(
         simulate_latency_ms=latency_ms,
         control_queue=control_queue,
         respond_to_ping=respond_to_ping,
+        frame_source=source,
+        inference_backend=backend,
+        status_queue=status_queue,
+        **worker_options,
     )
-    frame_interval = 1.0 / target_fps
     # ループ: STOP ControlMessage を受けると worker._stopping が True になり run_loop() 側で抜ける。
+    # フレーム間の待機は run_loop 内で制御キューを blocking 受信しながら行う (ポーリングなし)。
     while not stop_event.is_set() and not getattr(worker, "is_stopping", False):
         worker.run_loop(iterations=1)
-        sleep(min(0.001, frame_interval / 10))
-    if simulate_hang_on_stop and not stop_event.is_set():  # テスト用: STOP 後に敢えてハング
-        sleep(10)  # 十分長くして親側 terminate 経路を誘発
     # STOP 経路であれば Worker が自身で StatsMessage/ExitNotice を送信済み。
     # stop_event による強制終了経路 (緊急) の場合のみ最後の統計送信を試みる。
     if not getattr(worker, "is_stopping", False):
+        worker.close()
+        worker.flush()
         try:
-            result_queue.put_nowait(worker.build_stats_message())
+            status_queue.put_nowait(worker.build_stats_message())
         except Full:
             pass
+
+
+class _SharedBackendLoader:
+    """open_worker_backend replacement that loads each backend once per process and shares it."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._loaded: Dict[str, Tuple[Optional[InferenceBackend], Optional[str]]] = {}
+
+    def load(self, name: str) -> Tuple[Optional[InferenceBackend], Optional[str]]:
+        """Load the backend once and return (backend, error message); nothing is reported here."""
+        with self._lock:  # the first camera loads, the others wait for it
+            if name not in self._loaded:
+                backend, error = template_backend(name), None
+                if backend is None:
+                    backend = create_inference_backend(name)
+                    if backend is not None:
+                        try:
+                            backend.load()
+                            backend.warmup()
+                        except ModelLoadError as e:
+                            backend, error = None, str(e)
+                self._loaded[name] = (backend, error)
+            return self._loaded[name]
+
+    def __call__(self, camera_id: str, name: str, status_queue) -> Tuple[bool, Optional[InferenceBackend]]:
+        backend, error = self.load(name)
+        if error is not None:
+            try:
+                status_queue.put_nowait(ExitNotice(camera_id=camera_id, code=1, reason=f"MODEL_LOAD: {error}"))
+            except Full:
+                pass
+            return False, None
+        return True, backend
+
+
+def _configure_logging(log_queue) -> None:
+    # 中央ログ有効時: 親から渡された log_queue で設定
+    if log_queue is not None:
+        try:  # 遅延 import で起動コスト最小化
+            from .logging_setup import configure_worker_logging
+
+            configure_worker_logging(log_queue)
+        except Exception:  # pragma: no cover
+            pass
@@ -0,0 +1,481 @@
+"""Aggregator 用カメラ別結果リングバッファ実装。
+
+2 種類のストアを提供し、いずれも同じインタフェース
+(append / __len__ / __iter__ / record_at / index_range / scan) を持つ。
+
+    ObjectResultRing: ResultRecord オブジェクトをそのまま保持 (既定)。
+    ColumnarResultRing: 列指向 (array モジュール) で保持しメモリを削減。
+        - timestamp: int64 epoch ns
+        - gesture_label: LabelInterner による小整数 ID (uint16)
+        - confidence / latency_ms: float32 (latency None は NaN)
+        - camera_id: リングはカメラ単位のため 1 回だけ保持 (レコード当たり 0 byte)
+        - keypoints (inline の KeypointPayload): 手の数 int8 (-1 = なし) と
+          (MAX_HANDS, K, 3) float32、手毎のトラック ID int32。最初にキーポイント付き
+          レコードを受けた時点で確保する (K=21 で 1 + 504 + 8 byte / レコード)。
+          MAX_HANDS を超える手は先頭 MAX_HANDS 手 (とそのトラック ID) に切り詰めて保持する。
+          K の異なるレコード・未解決の共有メモリ参照・確保前の手なしレコードの
+          キーポイントは保持しない (None で返る)。
+        読出し時に ResultRecord を都度生成する。float32 化により confidence/latency は
+        有効桁 7 桁程度へ丸められる点に注意。
+
+いずれも時刻列 (epoch ns) を保持し、レコードを常に時刻昇順に並べる。
+    - 範囲探索は bisect による O(log n)。
+    - 遅着 (時刻逆転) レコードは挿入位置へシフト挿入 (O(n), 稀なケース)。
+    - capacity 超過時は最古 (時刻順) から上書きする。時刻順に到着する限り
+      deque(maxlen) と同じ意味論。
+外部依存を増やさないため numpy ではなく標準ライブラリ array を使用。
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Any, Dict, Final, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from . import utils_time
+from .messages import KeypointPayload, ResultRecord
+
+STORAGE_OBJECT: Final = "object"
+STORAGE_COLUMNAR: Final = "columnar"
+STORAGE_KINDS: Final = (STORAGE_OBJECT, STORAGE_COLUMNAR)
+
+_MAX_LABELS: Final = 0xFFFF
+# columnar ストアがレコード当たりに保持するキーポイントの手の数上限
+MAX_HANDS: Final = 2
+_NO_TRACK: Final = -2
+
+
+class LabelInterner:
+    """ラベル文字列 <-> 小整数 ID の双方向表 (Aggregator 内で全カメラ共有)。"""
+
+    __slots__ = ("_ids", "_labels")
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._labels: List[str] = []
+
+    def intern(self, label: str) -> int:
+        """ラベル ID を返す (未登録なら採番)。
+
+        Raises:
+            ValueError: 登録ラベル数が uint16 上限を超過。
+        """
+        lid = self._ids.get(label)
+        if lid is None:
+            lid = len(self._labels)
+            if lid > _MAX_LABELS:
+                raise ValueError("ラベル種別数が上限 (65536) を超過しました")
+            self._ids[label] = lid
+            self._labels.append(label)
+        return lid
+
+    def label(self, lid: int) -> str:
+        return self._labels[lid]
+
+    def lookup(self, label: str) -> Optional[int]:
+        """登録済みラベルの ID を返す (未登録は None, 採番しない)。"""
+        return self._ids.get(label)
+
+
+class _RingBase:
+    """固定長リングの位置管理と時刻列 (epoch ns) による範囲探索。
+
+    論理インデックス 0 が最古。保持レコードは常に時刻昇順に並ぶ
+    (遅着レコードは挿入位置以降をシフトして整列を維持する)。
+
+    並行読出し (seqlock 方式):
+        書込みは単一スレッド前提。変更の前後で _seq を 1 ずつ進め (変更中は奇数)、
+        遅着シフトでは _epoch も進める。try_read は読出し前後の値から
+        「読んだスロットが上書きされていないか」を検証し、不整合なら None を返す。
+    """
+
+    __slots__ = ("capacity", "_head", "_size", "_ts_ns", "_seq", "_epoch")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity は正数である必要があります")
+        self.capacity = capacity
+        self._head = 0
+        self._size = 0
+        self._ts_ns = array("q", bytes(8 * capacity))
+        self._seq = 0
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ---- サブクラス実装 ---- #
+    def _write(self, pos: int, record: ResultRecord) -> None:
+        raise NotImplementedError
+
+    def _move(self, src: int, dst: int) -> None:
+        raise NotImplementedError
+
+    def _read(self, pos: int) -> ResultRecord:
+        raise NotImplementedError
+
+    def _read_row(self, pos: int) -> Tuple[int, str, float, Optional[float]]:
+        raise NotImplementedError
+
+    def _label_filter(self, labels: FrozenSet[str]) -> FrozenSet[Any]:
+        """scan 用にラベル集合を内部表現へ変換する (既定は文字列のまま)。"""
+        return labels
+
+    def _matches(
+        self, pos: int, labels: Optional[FrozenSet[Any]], min_confidence: Optional[float]
+    ) -> bool:
+        raise NotImplementedError
+
+    # ---- 追加 ---- #
+    def append(self, record: ResultRecord) -> bool:
+        """レコードを時刻順位置へ追加する。
+
+        Returns:
+            bool: 保持したら True。満杯かつ保持中の全件より古い遅着は破棄し False。
+        """
+        ts = utils_time.to_epoch_ns(record.timestamp_utc)
+        cap = self.capacity
+        size = self._size
+        if size == 0 or ts >= self._ts_ns[(self._head + size - 1) % cap]:
+            self._seq += 1
+            if size < cap:
+                pos = (self._head + size) % cap
+                self._size = size + 1
+            else:
+                pos = self._head
+                self._head = (self._head + 1) % cap
+            self._ts_ns[pos] = ts
+            self._write(pos, record)
+            self._seq += 1
+            return True
+        return self._insert_late(ts, record)
+
+    def _insert_late(self, ts: int, record: ResultRecord) -> bool:
+        # 遅着 (時刻逆転) は稀なため O(n) シフトを許容
+        cap, head, size = self.capacity, self._head, self._size
+        idx = self.bisect_right(ts)
+        if size == cap and idx == 0:
+            return False
+        self._epoch += 1
+        self._seq += 1
+        if size < cap:
+            for i in range(size - 1, idx - 1, -1):
+                self._move_logical(i, i + 1)
+            self._size = size + 1
+        else:
+            # 満杯: 最古 (論理 0) を捨て [1, idx) を 1 つ左へ詰める
+            for i in range(1, idx):
+                self._move_logical(i, i - 1)
+            idx -= 1
+        pos = (head + idx) % cap
+        self._ts_ns[pos] = ts
+        self._write(pos, record)
+        self._seq += 1
+        return True
+
+    def _move_logical(self, src: int, dst: int) -> None:
+        cap, head = self.capacity, self._head
+        s, d = (head + src) % cap, (head + dst) % cap
+        self._ts_ns[d] = self._ts_ns[s]
+        self._move(s, d)
+
+    # ---- 探索 ---- #
+    def _ts_key(self, i: int) -> int:
+        return self._ts_ns[(self._head + i) % self.capacity]
+
+    def bisect_left(self, ts_ns: int) -> int:
+        """ts_ns 以上となる最初の論理インデックス。"""
+        return bisect_left(range(self._size), ts_ns, key=self._ts_key)
+
+    def bisect_right(self, ts_ns: int) -> int:
+        """ts_ns より大きくなる最初の論理インデックス。"""
+        return bisect_right(range(self._size), ts_ns, key=self._ts_key)
+
+    def index_range(
+        self, since_ns: Optional[int], until_ns: Optional[int]
+    ) -> Tuple[int, int]:
+        """[since, until) に該当する論理インデックス範囲 [lo, hi) を返す。"""
+        lo = 0 if since_ns is None else self.bisect_left(since_ns)
+        hi = self._size if until_ns is None else self.bisect_left(until_ns)
+        return lo, max(lo, hi)
+
+    def scan(
+        self,
+        lo: int,
+        hi: int,
+        *,
+        reverse: bool = False,
+        labels: Optional[FrozenSet[str]] = None,
+        min_confidence: Optional[float] = None,
+    ) -> Iterator[ResultRecord]:
+        """論理範囲 [lo, hi) をコピーせず走査し、フィルタ一致レコードを生成する。"""
+        return self._scan_at(self._head, lo, hi, reverse, labels, min_confidence)
+
+    def _scan_at(
+        self,
+        head: int,
+        lo: int,
+        hi: int,
+        reverse: bool,
+        labels: Optional[FrozenSet[str]],
+        min_confidence: Optional[float],
+    ) -> Iterator[ResultRecord]:
+        cap = self.capacity
+        order = range(hi - 1, lo - 1, -1) if reverse else range(lo, hi)
+        label_key = None if labels is None else self._label_filter(labels)
+        filtered = labels is not None or min_confidence is not None
+        for i in order:
+            pos = (head + i) % cap
+            if filtered and not self._matches(pos, label_key, min_confidence):
+                continue
+            yield self._read(pos)
+
+    def try_read(
+        self,
+        since_ns: Optional[int],
+        until_ns: Optional[int],
+        *,
+        limit: Optional[int] = None,
+        reverse: bool = False,
+        labels: Optional[FrozenSet[str]] = None,
+        min_confidence: Optional[float] = None,
+    ) -> Optional[List[ResultRecord]]:
+        """書込みスレッドと並行してロックなしで範囲を読出す (楽観読出し)。
+
+        開始時の (head, size) を固定して探索・コピーし、終了後に
+        「開始後に始まった追加で上書きされた論理インデックス」が読出し/探索した
+        位置に掛かっていないこと、遅着シフトが起きていないことを確認する。
+
+        Returns:
+            Optional[List[ResultRecord]]: 整合した結果。競合を検出したら None (再試行要)。
+        """
+        seq0, epoch0 = self._seq, self._epoch
+        head, size = self._head, self._size
+        if seq0 & 1 or seq0 != self._seq:
+            return None
+        cap, ts_arr = self.capacity, self._ts_ns
+        min_probe = size
+
+        def _key(i: int) -> int:
+            nonlocal min_probe
+            if i < min_probe:
+                min_probe = i
+            return ts_arr[(head + i) % cap]
+
+        idx = range(size)
+        lo = 0 if since_ns is None else bisect_left(idx, since_ns, key=_key)
+        hi = size if until_ns is None else bisect_left(idx, until_ns, key=_key)
+        it = self._scan_at(head, lo, max(lo, hi), reverse, labels, min_confidence)
+        out = list(it if limit is None else islice(it, limit))
+        if self._epoch != epoch0:
+            return None
+        started = (self._seq - seq0 + 1) // 2
+        overwritten = started - (cap - size)
+        if overwritten > min(lo, min_probe):
+            return None
+        return out
+
+    def record_at(self, i: int) -> ResultRecord:
+        """論理インデックス i (0=最古) のレコードを返す。"""
+        if not 0 <= i < self._size:
+            raise IndexError(i)
+        return self._read((self._head + i) % self.capacity)
+
+    def row_at(self, i: int) -> Tuple[int, str, float, Optional[float]]:
+        """論理インデックス i を (epoch ns, ラベル, confidence, latency_ms) で返す。
+
+        ResultRecord を生成しないため、押し出しレコードのディスク退避等に使う。
+        """
+        if not 0 <= i < self._size:
+            raise IndexError(i)
+        return self._read_row((self._head + i) % self.capacity)
+
+    def oldest_ns(self) -> Optional[int]:
+        """最古レコードの epoch ns (空なら None)。"""
+        return self._ts_ns[self._head] if self._size else None
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        return self.scan(0, self._size)
+
+
+class ObjectResultRing(_RingBase):
+    """ResultRecord をそのまま保持するリング。"""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._items: List[Optional[ResultRecord]] = [None] * capacity
+
+    def _write(self, pos: int, record: ResultRecord) -> None:
+        self._items[pos] = record
+
+    def _move(self, src: int, dst: int) -> None:
+        self._items[dst] = self._items[src]
+
+    def _read(self, pos: int) -> ResultRecord:
+        return self._items[pos]  # type: ignore[return-value]
+
+    def _read_row(self, pos: int) -> Tuple[int, str, float, Optional[float]]:
+        rec = self._items[pos]
+        assert rec is not None
+        return (self._ts_ns[pos], rec.gesture_label, rec.confidence, rec.latency_ms)
+
+    def _matches(
+        self, pos: int, labels: Optional[FrozenSet[Any]], min_confidence: Optional[float]
+    ) -> bool:
+        rec = self._items[pos]
+        assert rec is not None
+        if labels is not None and rec.gesture_label not in labels:
+            return False
+        return min_confidence is None or rec.confidence >= min_confidence
+
+
+class ColumnarResultRing(_RingBase):
+    """列指向 (array) でレコードを保持するリング。"""
+
+    __slots__ = (
+        "camera_id",
+        "_labels",
+        "_label_id",
+        "_conf",
+        "_lat",
+        "_hands",
+        "_kp",
+        "_kp_stride",
+        "_track",
+    )
+
+    def __init__(self, camera_id: str, capacity: int, labels: LabelInterner) -> None:
+        super().__init__(capacity)
+        self.camera_id = camera_id
+        self._labels = labels
+        self._label_id = array("H", bytes(2 * capacity))
+        self._conf = array("f", bytes(4 * capacity))
+        self._lat = array("f", bytes(4 * capacity))
+        # キーポイント列 (未受信なら None。_kp は float32 列のバイトビュー)
+        self._hands: Optional[array] = None
+        self._kp: Optional[memoryview] = None
+        self._kp_stride = 0  # 1 レコード分のバイト数 (MAX_HANDS x K x 3 x 4)
+        self._track: Optional[array] = None  # 手毎のトラック ID (先頭 -2 = 対応付けなし)
+
+    @staticmethod
+    def bytes_per_record() -> int:
+        """1 レコード当たりの列データサイズ (byte)。"""
+        return 8 + 2 + 4 + 4
+
+    def _write(self, pos: int, record: ResultRecord) -> None:
+        self._label_id[pos] = self._labels.intern(record.gesture_label)
+        self._conf[pos] = record.confidence
+        self._lat[pos] = math.nan if record.latency_ms is None else record.latency_ms
+        kp = record.keypoints
+        if kp is None or kp.ring_name is not None:
+            if self._hands is not None:
+                self._hands[pos] = -1
+            return
+        if self._hands is None and not self._alloc_keypoints(kp):
+            return
+        assert self._hands is not None and self._kp is not None
+        hand_bytes = self._kp_stride // MAX_HANDS
+        if len(kp.data) != kp.hands * hand_bytes:  # K の異なるレコード
+            self._hands[pos] = -1
+            return
+        hands = min(kp.hands, MAX_HANDS)
+        start = pos * self._kp_stride
+        self._kp[start : start + hands * hand_bytes] = kp.data[: hands * hand_bytes]
+        self._hands[pos] = hands
+        assert self._track is not None
+        base = pos * MAX_HANDS
+        if len(kp.track_ids) >= hands:
+            self._track[base : base + hands] = array("i", kp.track_ids[:hands])
+        else:
+            self._track[base] = _NO_TRACK
+
+    def _alloc_keypoints(self, kp: KeypointPayload) -> bool:
+        # 1 手のバイト数 (K) は最初の手付きレコードから決める (手なしでは確保しない)
+        if kp.hands <= 0 or len(kp.data) % (kp.hands * 12):
+            return False
+        self._kp_stride = MAX_HANDS * len(kp.data) // kp.hands
+        self._hands = array("b", [-1]) * self.capacity
+        kp_col = array("f", bytes(self._kp_stride * self.capacity))
+        self._kp = memoryview(kp_col).cast("B")
+        self._track = array("i", [_NO_TRACK]) * (MAX_HANDS * self.capacity)
+        return True
+
+    def _move(self, src: int, dst: int) -> None:
+        self._label_id[dst] = self._label_id[src]
+        self._conf[dst] = self._conf[src]
+        self._lat[dst] = self._lat[src]
+        if self._hands is not None:
+            assert self._kp is not None
+            self._hands[dst] = self._hands[src]
+            stride = self._kp_stride
+            self._kp[dst * stride : (dst + 1) * stride] = self._kp[
+                src * stride : (src + 1) * stride
+            ]
+            assert self._track is not None
+            for h in range(MAX_HANDS):
+                self._track[dst * MAX_HANDS + h] = self._track[src * MAX_HANDS + h]
+
+    def _keypoints(self, pos: int) -> Optional[KeypointPayload]:
+        if self._hands is None:
+            return None
+        hands = self._hands[pos]
+        if hands < 0:
+            return None
+        assert self._kp is not None and self._track is not None
+        start = pos * self._kp_stride
+        n = hands * (self._kp_stride // MAX_HANDS)
+        ids = tuple(self._track[pos * MAX_HANDS : pos * MAX_HANDS + hands])
+        if ids and ids[0] == _NO_TRACK:
+            ids = ()
+        return KeypointPayload(hands, bytes(self._kp[start : start + n]), track_ids=ids)
+
+    def _read(self, pos: int) -> ResultRecord:
+        lat = self._lat[pos]
+        return ResultRecord(
+            camera_id=self.camera_id,
+            timestamp_utc=utils_time.from_epoch_ns(self._ts_ns[pos]),
+            gesture_label=self._labels.label(self._label_id[pos]),
+            confidence=self._conf[pos],
+            latency_ms=None if math.isnan(lat) else lat,
+            keypoints=self._keypoints(pos),
+        )
+
+    def _read_row(self, pos: int) -> Tuple[int, str, float, Optional[float]]:
+        lat = self._lat[pos]
+        return (
+            self._ts_ns[pos],
+            self._labels.label(self._label_id[pos]),
+            self._conf[pos],
+            None if math.isnan(lat) else lat,
+        )
+
+    def _label_filter(self, labels: FrozenSet[str]) -> FrozenSet[Any]:
+        ids = (self._labels.lookup(label) for label in labels)
+        return frozenset(i for i in ids if i is not None)
+
+    def _matches(
+        self, pos: int, labels: Optional[FrozenSet[Any]], min_confidence: Optional[float]
+    ) -> bool:
+        # ラベルは ID 比較のみで判定しレコード生成を避ける
+        if labels is not None and self._label_id[pos] not in labels:
+            return False
+        return min_confidence is None or self._conf[pos] >= min_confidence
+
+
+ResultRing = Union[ObjectResultRing, ColumnarResultRing]
+
+
+__all__ = [
+    "STORAGE_OBJECT",
+    "STORAGE_COLUMNAR",
+    "STORAGE_KINDS",
+    "MAX_HANDS",
+    "LabelInterner",
+    "ObjectResultRing",
+    "ColumnarResultRing",
+    "ResultRing",
+]
@@ -0,0 +1,121 @@
+"""スレッドモード worker を 1 スレッドで駆動する協調スケジューラ (タイマーヒープ)。
+
+従来のスレッドモードはカメラ毎に OS スレッドを 1 本起動し、各スレッドが自分の期限まで
+制御キューで待機する。低 FPS カメラが数百台になるとスレッド数分の起床・GIL 競合・
+コンテキストスイッチが発生する。WorkerScheduler は全 worker の次フレーム期限をヒープに
+保持し、最も早い期限まで待機して該当 worker の step() を呼ぶ。
+
+制御メッセージ:
+    control_queue() が返すキューは put 時にスケジューラを起こす (カメラ ID を受信箱へ通知)。
+    起床したスケジューラは該当 worker の step() を呼び、PING / STOP を期限を待たずに処理する。
+
+制約:
+    フレーム処理 (取得・推論・擬似レイテンシ) は全てスケジューラスレッド上で直列に実行される。
+    全カメラの 1 秒当たりの処理時間合計が 1 秒を超える構成 (重い推論 / 高 FPS) では
+    期限に追い付かず、各 worker のペーシング方針 (skip / catch_up) に従って期限を飛ばす。
+    多数の軽量・低 FPS カメラ向け。
+
+利用例:
+    orchestrator.Orchestrator (OrchestratorConfig.thread_runtime="scheduler")。
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import queue
+from threading import Event
+from time import monotonic_ns
+from typing import Any, Dict, Final, List, Tuple
+
+from .channels import NotifyingQueue
+from .worker import CaptureInferenceWorker
+
+RUNTIME_THREADS: Final = "threads"
+RUNTIME_SCHEDULER: Final = "scheduler"
+THREAD_RUNTIMES: Final[Tuple[str, ...]] = (RUNTIME_THREADS, RUNTIME_SCHEDULER)
+
+_logger = logging.getLogger(__name__)
+
+
+class WorkerScheduler:
+    """複数の CaptureInferenceWorker をフレーム期限順に 1 スレッドで実行する。
+
+    Attributes:
+        wakeups (int): 期限到達 / 制御メッセージによる step() 呼出しの累計。
+    """
+
+    def __init__(self) -> None:
+        self._inbox: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._workers: Dict[str, CaptureInferenceWorker] = {}
+        self._due: Dict[str, int] = {}  # camera_id -> 有効な期限 (ヒープの古い要素は無視)
+        self._heap: List[Tuple[int, str]] = []
+        self.wakeups = 0
+
+    def control_queue(self, camera_id: str, maxsize: int = 16) -> "queue.Queue[Any]":
+        """camera_id 用の制御キューを返す (put でスケジューラを起こす)。"""
+        return NotifyingQueue(maxsize, camera_id, self._inbox)
+
+    def add(self, worker: CaptureInferenceWorker) -> None:
+        """worker を登録する (run 前にスケジューラスレッドから呼ぶ)。最初のフレームは即時。"""
+        self._workers[worker.camera_id] = worker
+        self._schedule(worker.camera_id, monotonic_ns())
+
+    @property
+    def active(self) -> int:
+        """実行中 (停止していない) の worker 数。"""
+        return len(self._workers)
+
+    def run(self, stop_event: Event) -> None:
+        """全 worker が停止するか stop_event が立つまで実行する (残りの worker は close)。"""
+        try:
+            while self._workers and not stop_event.is_set():
+                now = monotonic_ns()
+                if self._heap and self._heap[0][0] <= now:
+                    due_ns, cam = heapq.heappop(self._heap)
+                    if self._due.get(cam) == due_ns:
+                        del self._due[cam]
+                        self._step(cam)
+                    continue
+                timeout = (self._heap[0][0] - now) / 1e9 if self._heap else 0.2
+                try:
+                    cam = self._inbox.get(timeout=min(timeout, 0.2))
+                except queue.Empty:
+                    continue
+                if cam in self._workers:
+                    self._step(cam)
+        finally:
+            for worker in self._workers.values():
+                worker.close()
+            self._workers.clear()
+
+    def _step(self, camera_id: str) -> None:
+        worker = self._workers[camera_id]
+        self.wakeups += 1
+        try:
+            next_ns = worker.step()
+        except Exception:  # 1 台の異常で他カメラを止めない (スレッドモードの例外終了と同等)
+            _logger.exception(
+                "worker step failed (camera=%s)",
+                camera_id,
+                extra={"event": "WORKER_ERROR", "camera": camera_id},
+            )
+            worker.close()
+            next_ns = None
+        if next_ns is None:
+            del self._workers[camera_id]
+            self._due.pop(camera_id, None)
+        elif next_ns != self._due.get(camera_id):
+            self._schedule(camera_id, next_ns)
+
+    def _schedule(self, camera_id: str, due_ns: int) -> None:
+        self._due[camera_id] = due_ns
+        heapq.heappush(self._heap, (due_ns, camera_id))
+
+
+__all__ = [
+    "RUNTIME_THREADS",
+    "RUNTIME_SCHEDULER",
+    "THREAD_RUNTIMES",
+    "WorkerScheduler",
+]
@@ -0,0 +1,423 @@
+"""リングから押し出された結果を保存するディスク階層 (mmap 固定長セグメント)。
+
+構成:
+    <root>/<camera_id>/labels.txt          ラベル表 (行番号 = ラベル ID, 追記のみ)
+    <root>/<camera_id>/<first_ts_ns>-<base>.seg  固定長セグメント (ファイル名順 = 時刻順)
+
+セグメント形式 (リトルエンディアン):
+    ヘッダ 64 byte: MAGIC(4) u16 version u16 record_size u32 capacity u32 count
+                    i64 first_ts_ns i64 last_ts_ns (残りは 0 埋め)
+    レコード 20 byte: i64 epoch ns, f32 confidence, f32 latency_ms (None は NaN),
+                      u16 ラベル ID, 2 byte パディング
+    ファイルは capacity 分を確保 (truncate による疎ファイル) し、書込み側は mmap へ
+    レコードを書いた後に count を更新する。count が読出し側のコミット点となる。
+
+パーティション:
+    セグメントは満杯になるか、レコード時刻が partition_sec 境界を跨いだ時点で封止し
+    次のセグメントへ移る。1 セグメントは 1 パーティション内に収まるため、
+    保持期間 (max_age_sec) による削除はセグメント単位で行える。
+
+保持ポリシ (カメラ毎):
+    max_age_sec: 最新レコード時刻から max_age_sec より古いセグメントを削除 (データ時刻基準)。
+    max_bytes: 使用量 (ヘッダ + count × レコード長, 書込み中セグメントは満杯時サイズで
+               見積もる) の合計が上限を超える間、最古から削除。
+    書込み中のセグメントは削除しない。判定はセグメント切替え時に行う。
+
+並行性:
+    書込み (append) は単一スレッド (Aggregator の書込み側) 前提。読出し (scan) は
+    セグメント毎に読取専用 mmap を開くため書込みと並行可能。削除済みセグメントは
+    開けなければ読み飛ばす (Linux では mmap 済みなら読出しを継続できる)。
+    レコードには書込み順の通し番号を振り、scan(upto=n) で「n 件目より前」に限定できる。
+    Aggregator はこれを用いてリングとの境界を重複・欠落なく決める。
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import struct
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Final, FrozenSet, Iterator, List, Optional, Tuple
+
+from . import utils_time
+from .messages import ResultRecord
+
+SEGMENT_MAGIC: Final = b"GSEG"
+SEGMENT_VERSION: Final = 1
+DEFAULT_SEGMENT_RECORDS: Final = 65_536
+DEFAULT_PARTITION_SEC: Final = 3600
+
+_HEADER = struct.Struct("<4sHHIIqq")
+_HEADER_SIZE: Final = 64
+_COUNT_OFFSET: Final = 12
+_LAST_TS_OFFSET: Final = 24
+_RECORD = struct.Struct("<qffHxx")
+_TS = struct.Struct("<q")
+_U32 = struct.Struct("<I")
+_NS_PER_SEC: Final = 1_000_000_000
+
+# (epoch ns, ラベル, confidence, latency_ms)
+SpillRow = Tuple[int, str, float, Optional[float]]
+
+
+@dataclass(slots=True)
+class _Segment:
+    """セグメントのメタ情報 (書込み側が保持)。"""
+
+    path: Path
+    base: int  # 先頭レコードの通し番号
+    first_ts: int
+    last_ts: int
+    count: int
+    partition: int
+
+    @property
+    def used_bytes(self) -> int:
+        return _HEADER_SIZE + self.count * _RECORD.size
+
+
+class CameraSpill:
+    """1 カメラ分のセグメント列。
+
+    Attributes:
+        camera_id (str): カメラID。
+        directory (Path): セグメント格納ディレクトリ。
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        camera_id: str,
+        *,
+        segment_records: int = DEFAULT_SEGMENT_RECORDS,
+        partition_sec: int = DEFAULT_PARTITION_SEC,
+        max_bytes: Optional[int] = None,
+        max_age_sec: Optional[float] = None,
+    ) -> None:
+        if segment_records <= 0 or partition_sec <= 0:
+            raise ValueError(
+                "segment_records / partition_sec は正数である必要があります"
+            )
+        self.camera_id = camera_id
+        self.directory = directory
+        self._segment_records = segment_records
+        self._partition_ns = partition_sec * _NS_PER_SEC
+        self._max_bytes = max_bytes
+        self._max_age_ns = (
+            None if max_age_sec is None else int(max_age_sec * _NS_PER_SEC)
+        )
+        self._segments: List[_Segment] = []
+        self._active: Optional[mmap.mmap] = None
+        self._count = 0
+        self._labels: List[str] = []
+        self._label_ids: Dict[str, int] = {}
+        self._labels_path = directory / "labels.txt"
+        directory.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    # ------------------------------ 状態 ------------------------------ #
+    @property
+    def count(self) -> int:
+        """書込み済み通し番号の上限 (次に書くレコードの番号)。"""
+        return self._count
+
+    @property
+    def last_ts_ns(self) -> Optional[int]:
+        """最新レコードの時刻 (空なら None)。"""
+        return self._segments[-1].last_ts if self._segments else None
+
+    @property
+    def used_bytes(self) -> int:
+        return sum(s.used_bytes for s in self._segments)
+
+    def segment_paths(self) -> List[Path]:
+        return [s.path for s in self._segments]
+
+    # ------------------------------ 書込み ------------------------------ #
+    def append(self, row: SpillRow) -> bool:
+        """レコードを末尾へ追記する。
+
+        Returns:
+            bool: 追記したら True。最新レコードより古い (時刻逆転) 場合は破棄し False。
+        """
+        ts, label, conf, lat = row
+        last = self.last_ts_ns
+        if last is not None and ts < last:
+            return False
+        seg = self._segments[-1] if self._segments else None
+        partition = ts // self._partition_ns
+        if (
+            seg is None
+            or self._active is None
+            or seg.count >= self._segment_records
+            or partition != seg.partition
+        ):
+            seg = self._rollover(ts, partition)
+        mm = self._active
+        assert mm is not None
+        lid = self._label_id(label)
+        _RECORD.pack_into(
+            mm,
+            _HEADER_SIZE + seg.count * _RECORD.size,
+            ts,
+            conf,
+            math.nan if lat is None else lat,
+            lid,
+        )
+        _TS.pack_into(mm, _LAST_TS_OFFSET, ts)
+        seg.count += 1
+        seg.last_ts = ts
+        # count 更新がコミット点 (読出し側は count 件までしか読まない)
+        _U32.pack_into(mm, _COUNT_OFFSET, seg.count)
+        self._count += 1
+        if self._max_age_ns is not None and len(self._segments) > 1:
+            if self._segments[0].last_ts < ts - self._max_age_ns:
+                self._enforce_retention()
+        return True
+
+    def _rollover(self, ts: int, partition: int) -> _Segment:
+        self._close_active()
+        # 同時刻で満杯ロールオーバーしても衝突しないよう通し番号を付ける
+        path = self.directory / f"{ts:020d}-{self._count:012d}.seg"
+        size = _HEADER_SIZE + self._segment_records * _RECORD.size
+        with path.open("w+b") as f:
+            f.truncate(size)
+            f.write(
+                _HEADER.pack(
+                    SEGMENT_MAGIC,
+                    SEGMENT_VERSION,
+                    _RECORD.size,
+                    self._segment_records,
+                    0,
+                    ts,
+                    ts,
+                )
+            )
+            f.flush()
+            self._active = mmap.mmap(f.fileno(), size)
+        seg = _Segment(
+            path=path,
+            base=self._count,
+            first_ts=ts,
+            last_ts=ts,
+            count=0,
+            partition=partition,
+        )
+        self._segments.append(seg)
+        self._enforce_retention()
+        return seg
+
+    def _label_id(self, label: str) -> int:
+        lid = self._label_ids.get(label)
+        if lid is None:
+            lid = len(self._labels)
+            if lid > 0xFFFF:
+                raise ValueError("ラベル種別数が上限 (65536) を超過しました")
+            with self._labels_path.open("a", encoding="utf-8") as f:
+                f.write(label + "\n")
+            self._labels.append(label)
+            self._label_ids[label] = lid
+        return lid
+
+    def _enforce_retention(self) -> None:
+        segs = self._segments
+        if self._max_age_ns is not None and segs:
+            cutoff = segs[-1].last_ts - self._max_age_ns
+            while len(segs) > 1 and segs[0].last_ts < cutoff:
+                self._drop_oldest()
+        if self._max_bytes is not None and segs:
+            # 書込み中セグメントは満杯時のサイズで見積もり、上限を常に守る
+            reserve = _HEADER_SIZE + self._segment_records * _RECORD.size
+            total = sum(s.used_bytes for s in segs[:-1]) + reserve
+            while len(segs) > 1 and total > self._max_bytes:
+                total -= segs[0].used_bytes
+                self._drop_oldest()
+
+    def _drop_oldest(self) -> None:
+        seg = self._segments.pop(0)
+        seg.path.unlink(missing_ok=True)
+
+    def _close_active(self) -> None:
+        if self._active is not None:
+            self._active.close()
+            self._active = None
+
+    def close(self) -> None:
+        """書込み中セグメントの mmap を閉じる (以降の append は新セグメントから)。"""
+        self._close_active()
+
+    # ------------------------------ 読込み ------------------------------ #
+    def _load(self) -> None:
+        if self._labels_path.exists():
+            self._labels = self._labels_path.read_text(encoding="utf-8").splitlines()
+            self._label_ids = {label: i for i, label in enumerate(self._labels)}
+        for path in sorted(self.directory.glob("*.seg")):
+            with path.open("rb") as f:
+                head = f.read(_HEADER.size)
+            if len(head) < _HEADER.size:
+                continue
+            magic, version, rsize, _cap, count, first_ts, last_ts = _HEADER.unpack(head)
+            if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION or count == 0:
+                continue
+            if rsize != _RECORD.size:
+                continue
+            self._segments.append(
+                _Segment(
+                    path=path,
+                    base=self._count,
+                    first_ts=first_ts,
+                    last_ts=last_ts,
+                    count=count,
+                    partition=first_ts // self._partition_ns,
+                )
+            )
+            self._count += count
+
+    def scan(
+        self,
+        since_ns: Optional[int] = None,
+        until_ns: Optional[int] = None,
+        *,
+        upto: Optional[int] = None,
+        reverse: bool = False,
+        labels: Optional[FrozenSet[str]] = None,
+        min_confidence: Optional[float] = None,
+    ) -> Iterator[ResultRecord]:
+        """[since, until) のレコードを時刻順 (reverse で逆順) に生成する。
+
+        Args:
+            since_ns (Optional[int]): 下限 epoch ns (含む)。
+            until_ns (Optional[int]): 上限 epoch ns (含まない)。
+            upto (Optional[int]): 通し番号がこの値未満のレコードに限定する。
+            reverse (bool): True なら新しい順。
+            labels (Optional[FrozenSet[str]]): 一致させるラベル集合。
+            min_confidence (Optional[float]): confidence 下限 (含む)。
+        """
+        segs = [
+            s
+            for s in list(self._segments)
+            if (until_ns is None or s.first_ts < until_ns)
+            and (since_ns is None or s.last_ts >= since_ns)
+            and (upto is None or s.base < upto)
+        ]
+        label_ids = None
+        if labels is not None:
+            label_ids = frozenset(
+                self._label_ids[label] for label in labels if label in self._label_ids
+            )
+        for seg in reversed(segs) if reverse else segs:
+            yield from self._scan_segment(
+                seg, since_ns, until_ns, upto, reverse, label_ids, min_confidence
+            )
+
+    def _scan_segment(
+        self,
+        seg: _Segment,
+        since_ns: Optional[int],
+        until_ns: Optional[int],
+        upto: Optional[int],
+        reverse: bool,
+        label_ids: Optional[FrozenSet[int]],
+        min_confidence: Optional[float],
+    ) -> Iterator[ResultRecord]:
+        try:
+            f = seg.path.open("rb")
+        except FileNotFoundError:  # 保持ポリシで削除済み
+            return
+        with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            (count,) = _U32.unpack_from(mm, _COUNT_OFFSET)
+            if upto is not None:
+                count = min(count, upto - seg.base)
+            rsize = _RECORD.size
+
+            def _ts(i: int) -> int:
+                return _TS.unpack_from(mm, _HEADER_SIZE + i * rsize)[0]
+
+            idx = range(count)
+            lo = 0 if since_ns is None else bisect_right(idx, since_ns - 1, key=_ts)
+            hi = count if until_ns is None else bisect_right(idx, until_ns - 1, key=_ts)
+            order = range(hi - 1, lo - 1, -1) if reverse else range(lo, hi)
+            unpack = _RECORD.unpack_from
+            labels = self._labels
+            camera_id = self.camera_id
+            from_ns = utils_time.from_epoch_ns
+            for i in order:
+                ts, conf, lat, lid = unpack(mm, _HEADER_SIZE + i * rsize)
+                if label_ids is not None and lid not in label_ids:
+                    continue
+                if min_confidence is not None and conf < min_confidence:
+                    continue
+                yield ResultRecord(
+                    camera_id=camera_id,
+                    timestamp_utc=from_ns(ts),
+                    gesture_label=labels[lid],
+                    confidence=conf,
+                    latency_ms=None if math.isnan(lat) else lat,
+                )
+
+
+class SpillStore:
+    """カメラ毎の CameraSpill を管理するディスク階層。
+
+    Attributes:
+        root (Path): ルートディレクトリ。
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        segment_records: int = DEFAULT_SEGMENT_RECORDS,
+        partition_sec: int = DEFAULT_PARTITION_SEC,
+        max_bytes_per_camera: Optional[int] = None,
+        max_age_sec: Optional[float] = None,
+    ) -> None:
+        self.root = root
+        self._segment_records = segment_records
+        self._partition_sec = partition_sec
+        self._max_bytes = max_bytes_per_camera
+        self._max_age_sec = max_age_sec
+        self._cameras: Dict[str, CameraSpill] = {}
+        root.mkdir(parents=True, exist_ok=True)
+        # 既存の履歴 (前回起動分) を登録し、以降の get() を辞書参照のみにする
+        for path in sorted(root.iterdir()):
+            if path.is_dir():
+                self.camera(path.name)
+
+    def camera(self, camera_id: str) -> CameraSpill:
+        """カメラのセグメント列を返す (無ければ作成)。書込み側から呼ぶこと。"""
+        spill = self._cameras.get(camera_id)
+        if spill is None:
+            spill = CameraSpill(
+                self.root / camera_id,
+                camera_id,
+                segment_records=self._segment_records,
+                partition_sec=self._partition_sec,
+                max_bytes=self._max_bytes,
+                max_age_sec=self._max_age_sec,
+            )
+            self._cameras[camera_id] = spill
+        return spill
+
+    def get(self, camera_id: str) -> Optional[CameraSpill]:
+        """既存のセグメント列を返す (無ければ None / 作成しない)。"""
+        return self._cameras.get(camera_id)
+
+    def cameras(self) -> List[str]:
+        """セグメント列を持つカメラ一覧 (起動時にディスク上にあったものを含む)。"""
+        return list(self._cameras)
+
+    def close(self) -> None:
+        for spill in self._cameras.values():
+            spill.close()
+
+
+__all__ = [
+    "DEFAULT_SEGMENT_RECORDS",
+    "DEFAULT_PARTITION_SEC",
+    "SpillRow",
+    "CameraSpill",
+    "SpillStore",
+]
@@ -0,0 +1,237 @@
+"""worker プロセスの終了検出と再起動 (<Restart> / RestartConfig の実装)。
+
+検出:
+    ProcessSupervisor は専用スレッドで監視中の全プロセスの sentinel と起床用パイプを
+    multiprocessing.connection.wait で待つ。プロセスが終了すると (異常終了・kill を含む)
+    ポーリング周期を待たずに起床する。待機のタイムアウトは次の再起動予定時刻までのみ。
+
+正常終了:
+    clean_exit が真を返す終了 (既定は exitcode 0: STOP / ファイル終端 / 起動時の
+    SOURCE_OPEN・MODEL_LOAD 失敗で worker 関数が戻った場合) は再起動せず、監視から外すだけに
+    する (予算も消費しない)。終端に達したファイル入力を先頭から再生し直さないため。
+
+再起動:
+    異常終了したプロセスは RestartBudget が返す遅延の後に respawn コールバックで起動し直す。
+    遅延は backoff_base_sec x 2^(window 内の再起動回数) を backoff_max_sec で頭打ちにし、
+    ±jitter の割合でばらつかせる (同時に落ちた多数のプロセスが一斉に起動しないため)。
+    window_sec 内の再起動が max_restarts に達したプロセスは再起動せず、on_exit へ
+    delay=None で通知する (呼出し側で DOWN 固定にする)。
+
+フェイルオーバー:
+    failover コールバックがあれば、予算内の終了では遅延を待たずにまず呼ぶ (待機 worker に
+    引き継がせる)。プロセスが返れば遅延 0 の再起動として扱い、None ならバックオフ後の
+    respawn に戻る。フェイルオーバーも窓内の再起動回数に数える (クラッシュループの上限は同じ)。
+
+停止:
+    stop() 以降に終了したプロセスは再起動しない。Orchestrator は STOP 送信前に stop() を呼ぶ。
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, Pipe, wait
+from multiprocessing.process import BaseProcess
+from threading import Lock, Thread
+from time import monotonic
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RestartPolicy:
+    """再起動の上限とバックオフ。
+
+    Attributes:
+        max_restarts (int): window_sec 内に許す再起動回数 (0 = 再起動しない)。
+        window_sec (float): 再起動回数を数える窓 (秒)。
+        backoff_base_sec (float): 窓内で最初の再起動までの遅延 (秒)。
+        backoff_max_sec (float): 遅延の上限 (秒)。
+        jitter (float): 遅延に掛ける一様乱数の幅 (0.2 = ±20%)。
+    """
+
+    max_restarts: int = 3
+    window_sec: float = 300.0
+    backoff_base_sec: float = 0.5
+    backoff_max_sec: float = 30.0
+    jitter: float = 0.2
+
+    def __post_init__(self) -> None:
+        if self.max_restarts < 0 or self.window_sec <= 0:
+            raise ValueError("max_restarts は 0 以上, window_sec は正数が必要")
+        if self.backoff_base_sec < 0 or self.backoff_max_sec < self.backoff_base_sec:
+            raise ValueError("backoff_max_sec は backoff_base_sec (0 以上) 以上が必要")
+        if not 0.0 <= self.jitter < 1.0:
+            raise ValueError("jitter は 0 以上 1 未満である必要があります")
+
+
+class RestartBudget:
+    """キー (プロセス) 毎の窓内再起動回数から次の再起動遅延を決める。"""
+
+    def __init__(
+        self, policy: RestartPolicy, rng: Optional[random.Random] = None
+    ) -> None:
+        self.policy = policy
+        self._rng = rng or random.Random()
+        self._times: Dict[str, Deque[float]] = {}
+
+    def next_delay(self, key: str, now: float) -> Optional[float]:
+        """再起動 1 回分を記録して遅延 (秒) を返す (上限到達なら記録せず None)。"""
+        p = self.policy
+        times = self._times.setdefault(key, deque())
+        while times and now - times[0] >= p.window_sec:
+            times.popleft()
+        if len(times) >= p.max_restarts:
+            return None
+        delay = min(p.backoff_max_sec, p.backoff_base_sec * 2.0 ** len(times))
+        delay *= 1.0 + p.jitter * (2.0 * self._rng.random() - 1.0)
+        times.append(now)
+        return delay
+
+
+def _exited_zero(key: str, exitcode: Optional[int]) -> bool:
+    return exitcode == 0
+
+
+class ProcessSupervisor:
+    """監視中プロセスの終了を sentinel で即時検出し、バックオフ後に再起動する。
+
+    Args:
+        policy (RestartPolicy): 再起動の上限とバックオフ。
+        respawn (Callable[[str], Optional[BaseProcess]]): キーのプロセスを起動し直して返す
+            (起動済み。None は再起動を取りやめる)。監視スレッドから呼ばれる。
+        on_exit (Callable[[str, Optional[int], Optional[float]], None]): 終了検出時に
+            (キー, exitcode, 再起動までの遅延秒 / 上限到達なら None) で呼ばれる。
+        rng (Optional[random.Random]): ジッタ用乱数 (テスト用)。
+        failover (Optional[Callable[[str], Optional[BaseProcess]]]): 終了検出時に即座に
+            引き継ぐプロセスを返す (なければ None)。監視スレッドから呼ばれる。
+        clean_exit (Optional[Callable[[str, Optional[int]], bool]]): (キー, exitcode) が
+            正常終了なら真 (再起動しない)。None は exitcode == 0 を正常終了とする。
+
+    Attributes:
+        restarts (int): 再起動した累計回数。
+    """
+
+    def __init__(
+        self,
+        policy: RestartPolicy,
+        respawn: Callable[[str], Optional[BaseProcess]],
+        on_exit: Callable[[str, Optional[int], Optional[float]], None],
+        rng: Optional[random.Random] = None,
+        failover: Optional[Callable[[str], Optional[BaseProcess]]] = None,
+        clean_exit: Optional[Callable[[str, Optional[int]], bool]] = None,
+    ) -> None:
+        self._budget = RestartBudget(policy, rng)
+        self._respawn = respawn
+        self._failover = failover
+        self._clean_exit = clean_exit or _exited_zero
+        self._on_exit = on_exit
+        self._lock = Lock()
+        # sentinel -> (キー, プロセス)
+        self._watched: Dict[int, Tuple[str, BaseProcess]] = {}
+        self._pending: List[Tuple[float, str]] = []  # (再起動予定時刻, キー)
+        self._wake_r, self._wake_w = Pipe(duplex=False)
+        self._stopping = False
+        self._thread: Optional[Thread] = None
+        self.restarts = 0
+
+    def watch(self, key: str, process: BaseProcess) -> None:
+        """起動済みのプロセスを監視対象に加える (どのスレッドからでも可)。"""
+        with self._lock:
+            self._watched[process.sentinel] = (key, process)
+        self._wake()
+
+    def start(self) -> None:
+        self._thread = Thread(target=self._run, name="ProcessSupervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """監視を終える (以降の終了は再起動しない)。予定中の再起動も取りやめる。"""
+        with self._lock:
+            self._stopping = True
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():  # pragma: no cover - respawn が戻らない
+                return
+        self._wake_r.close()
+        self._wake_w.close()
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send_bytes(b"\0")
+        except OSError:  # stop 後
+            pass
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopping:
+                    return
+                sentinels = list(self._watched)
+            timeout = None
+            if self._pending:
+                timeout = max(0.0, min(self._pending)[0] - monotonic())
+            ready = wait([self._wake_r, *sentinels], timeout)
+            for obj in ready:
+                if isinstance(obj, Connection):
+                    while self._wake_r.poll():
+                        self._wake_r.recv_bytes()
+                else:
+                    self._handle_exit(int(obj))
+            self._respawn_due()
+
+    def _handle_exit(self, sentinel: int) -> None:
+        with self._lock:
+            if self._stopping:
+                return
+            key, process = self._watched.pop(sentinel)
+        # sentinel は fd のクローズで立つため、回収 (exitcode の確定) まで短く待つ
+        process.join(1.0)
+        if self._clean_exit(key, process.exitcode):
+            _logger.info(
+                "%s exited cleanly (exitcode=%s); not restarting", key, process.exitcode
+            )
+            return
+        delay = self._budget.next_delay(key, monotonic())
+        successor: Optional[BaseProcess] = None
+        if delay is not None and self._failover is not None:
+            try:
+                successor = self._failover(key)
+            except Exception:  # 引継ぎに失敗したら通常の再起動へ
+                _logger.exception("failover of %s failed", key)
+            if successor is not None:
+                delay = 0.0
+        self._on_exit(key, process.exitcode, delay)
+        if successor is not None:
+            self.restarts += 1
+            self.watch(key, successor)
+        elif delay is not None:
+            self._pending.append((monotonic() + delay, key))
+
+    def _respawn_due(self) -> None:
+        now = monotonic()
+        due = [key for at, key in self._pending if at <= now]
+        self._pending = [(at, key) for at, key in self._pending if at > now]
+        for key in due:
+            with self._lock:
+                if self._stopping:
+                    return
+            try:
+                process = self._respawn(key)
+            except Exception:  # 起動失敗も終了と同じく予算内で再試行する
+                _logger.exception("respawn of %s failed", key)
+                delay = self._budget.next_delay(key, monotonic())
+                self._on_exit(key, None, delay)
+                if delay is not None:
+                    self._pending.append((monotonic() + delay, key))
+                continue
+            if process is not None:
+                self.restarts += 1
+                self.watch(key, process)
+
+
+__all__ = ["ProcessSupervisor", "RestartBudget", "RestartPolicy"]
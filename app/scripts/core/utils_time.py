@@ -15,11 +15,13 @@
 from __future__ import annotations
 
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Final
 
 # NOTE: ここでタイムゾーンは UTC 固定 (設計方針に従う)
 UTC: Final = timezone.utc
+EPOCH: Final = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_US: Final = timedelta(microseconds=1)
 
 
 def now_utc() -> datetime:
@@ -45,6 +47,32 @@ def isoformat_utc(dt: datetime) -> str:
     return dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
 
 
+def to_epoch_ns(dt: datetime) -> int:
+    """datetime を UNIX epoch からのナノ秒 (int) へ可逆変換する。
+
+    Args:
+        dt (datetime): 変換対象。naive の場合は UTC と見なす。
+
+    Returns:
+        int: epoch ナノ秒 (datetime の分解能に合わせ 1000 の倍数)。
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return (dt - EPOCH) // _ONE_US * 1000
+
+
+def from_epoch_ns(ns: int) -> datetime:
+    """to_epoch_ns の逆変換 (UTC tz-aware datetime)。
+
+    Args:
+        ns (int): epoch ナノ秒。
+
+    Returns:
+        datetime: UTC datetime (マイクロ秒未満は切り捨て)。
+    """
+    return EPOCH + timedelta(microseconds=ns // 1000)
+
+
 def monotonic_ns() -> int:
     """モノトニックタイマー (ns) を返す。
 
@@ -66,6 +94,8 @@ def perf_counter_ms() -> float:
 __all__ = [
     "now_utc",
     "isoformat_utc",
+    "to_epoch_ns",
+    "from_epoch_ns",
     "monotonic_ns",
     "perf_counter_ms",
 ]
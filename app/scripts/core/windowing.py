@@ -0,0 +1,68 @@
+"""時刻スライス・リング (固定メモリのスライディング窓基盤)。
+
+設計要点:
+    - 窓を slice_sec 幅のスライス N 個で表現し、各スライスに任意の集計オブジェクトを保持。
+    - スライス位置は絶対時刻 ``floor(ts / slice_sec)`` から決まるため、呼出し順に依存しない。
+    - 追加は O(1)、窓読出しは O(N)。メモリは N × 集計オブジェクトで一定。
+    - 窓境界はスライス粒度で丸められる (厳密な (now-窓幅, now] ではない)。
+
+利用例:
+    latency_sketch.WindowedLatencySketch (レイテンシ分布) 等。
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SliceRing(Generic[T]):
+    """絶対時刻インデックスで管理するスライスのリング。
+
+    Attributes:
+        slice_sec (float): 1 スライスの幅 (秒)。
+        slices (int): スライス数 (窓幅 = slice_sec × slices)。
+    """
+
+    def __init__(self, slice_sec: float, slices: int, factory: Callable[[], T]) -> None:
+        if slice_sec <= 0 or slices <= 0:
+            raise ValueError("slice_sec / slices は正数である必要があります")
+        self.slice_sec = slice_sec
+        self.slices = slices
+        self._factory = factory
+        self._items: List[Optional[T]] = [None] * slices
+        self._index: List[int] = [-1] * slices
+
+    @property
+    def window_sec(self) -> float:
+        return self.slice_sec * self.slices
+
+    def slot(self, ts_sec: float) -> Optional[T]:
+        """ts_sec を含むスライスの集計オブジェクトを返す。
+
+        スライスが古い周回のものであれば新規生成で置換する。
+        既に窓から外れた過去時刻 (より新しい周回で上書き済み) の場合は None。
+        """
+        k = int(ts_sec // self.slice_sec)
+        pos = k % self.slices
+        cur = self._index[pos]
+        if cur == k:
+            return self._items[pos]
+        if cur > k:
+            return None
+        item = self._factory()
+        self._items[pos] = item
+        self._index[pos] = k
+        return item
+
+    def live(self, now_sec: float) -> Iterator[T]:
+        """now_sec を末尾とする窓内のスライスを列挙する (順不同)。"""
+        k_now = int(now_sec // self.slice_sec)
+        k_min = k_now - self.slices
+        for k, item in zip(self._index, self._items):
+            if k_min < k <= k_now and item is not None:
+                yield item
+
+
+__all__ = ["SliceRing"]
@@ -15,6 +15,58 @@
 3. 再度 put_nowait() 試行
 4. なお失敗 (理論上並列競合) → drop_counter++ (Result 未投入)
 
+結果バッチ (batch_max_records > 1):
+- ResultRecord を保留し、件数が batch_max_records に達するか、最古の保留から
+  batch_max_delay_ms を経過する前に次フレームが間に合わない時点で ResultBatch として送出。
+- 上記ドロップアルゴリズムはバッチ単位で適用し、投入失敗時は drop_counter にバッチ件数を加算
+  (drop_rate はレコード単位のまま)。
+- 統計メッセージ / ExitNotice の送信前に保留分を送出する。
+
+ステータスチャネル (status_queue, 任意):
+- 指定時は StatsMessage / PING 応答 (StatusUpdate) / ExitNotice を結果キューではなく
+  status_queue へ送る (channels.ResultChannels)。上記ドロップアルゴリズムの最古破棄は
+  結果キュー (自カメラの結果のみ) に作用し、ステータス系メッセージは破棄されない。
+- 未指定時は従来どおり結果キューへ送る。
+
+フレームペーシング (pacing.FramePacer):
+- 各フレームは開始時刻から 1/target_fps 刻みの絶対期限で開始する (sleep 誤差が累積しない)。
+- 期限までの待機は制御キューの blocking get (timeout=残り時間) で行い、PING / STOP は
+  待機中でも即時処理する (制御キューなしの場合は sleep)。
+- 処理が期限に追い付かない場合の方針は pacing_policy (skip / catch_up) で選択。
+
+協調スケジューラ (scheduler.WorkerScheduler, 任意):
+- run_loop の代わりに step() を呼ぶと、待機せずに受信済み制御メッセージと期限到達済みの
+  1 フレームだけを処理し、次の期限を返す (待機はスケジューラが全 worker 分まとめて行う)。
+
+フレーム入力 (frame_source.FrameSource, 任意):
+- 指定時は各フレームの先頭で read() し、取得待ち時間を avg_capture_ms として統計に含める
+  (latency_ms は取得を除いた処理時間)。先読みソースでは取得は処理と並行するため、
+  avg_capture_ms は worker が実際にフレームを待った時間になる。
+- read() が None (終端) を返すと保留結果・統計を送出し ExitNotice(code=0, reason="EOS") で停止。
+  取得エラー (StreamConnectionError) は ExitNotice(code=1) で停止。
+- 未指定時は従来どおりフレームなしの擬似処理のみ。
+
+共有メモリフレームリング (frame_ring.FrameRing, 任意・frame_source 必須):
+- frame_ring_slots > 0 の場合、取得した全フレーム (間引き対象を含む) をリングへ書き、
+  FrameDescriptor を結果キューで送る (録画 / プレビュー用。画素はキューを通らない)。
+  記述子は欠落可のため、キューが満杯なら記述子自体を捨てる (結果を押し出さず、
+  drop_counter にも数えない)。リングは close で削除。
+
+推論バックエンド (inference.InferenceBackend, 任意・frame_source 必須):
+- 取得フレームを inference_batch_size 件ためて infer_batch し、結果毎に ResultRecord を送る
+  (simulate_latency_ms は使わない)。latency_ms はフレーム取得完了 (Frame.captured_ns) から
+  バッチ推論完了までの時間で、バッチが埋まるまでの待ちを含む。timestamp_utc も取得時刻。
+- STOP / 入力終端では端数バッチも推論してから停止する。InferenceError はバッチ件数を drops に加算。
+- keypoint_mode (keypoints.KeypointWriter) が off 以外なら ResultRecord.keypoints に
+  キーポイントを載せる (inline: float32 バイト列 / shared: 共有メモリリングの位置)。
+- keypoint_filter (keypoint_filter.OneEuroKeypointFilter) 指定時は載せる前にフレーム時刻
+  (captured_ns) で平滑化し、手毎のトラック ID を KeypointPayload.track_ids に入れる。
+
+適応フレーム間引き (frame_skip.AdaptiveFrameSkipper, latency_target_ms 指定時):
+- 処理レイテンシ (latency_ms) の p95 が目標を超えるとフレームを取得直後に間引き、推論しない
+  (結果キュー満杯での破棄より前に負荷を落とす)。ヒステリシスと min_fps の下限あり。
+- StatsMessage.effective_fps (現在のサンプリング率) / skipped_frames (窓内の間引き数) で報告。
+
 テスト容易性のため run_loop(iterations=N) を提供し N フレーム生成後に停止できる。
 """
 
@@ -22,11 +74,26 @@ from __future__ import annotations
 
 import queue
 from dataclasses import dataclass
-from time import perf_counter_ns, sleep
-from typing import Any, Optional, Protocol, Sequence
+from datetime import timedelta
+from time import monotonic_ns, perf_counter_ns, sleep
+from typing import Any, List, Optional, Protocol, Sequence, Union
+
+import numpy as np
 
 from . import utils_time
 from .aggregator import ResultRecord
+from .errors import InferenceError, StreamConnectionError
+from .frame_ring import FrameRing
+from .frame_skip import AdaptiveFrameSkipper
+from .frame_source import Frame, FrameSource
+from .inference import InferenceBackend
+from .keypoint_filter import (
+    FILTER_NONE,
+    KEYPOINT_FILTERS,
+    OneEuroKeypointFilter,
+    create_keypoint_filter,
+)
+from .keypoints import KEYPOINTS_OFF, KeypointWriter
 from .messages import (
     StatsMessage,
     StatusUpdate,
@@ -34,12 +101,17 @@ from .messages import (
     CONTROL_STOP,
     ControlMessage,
     ExitNotice,
+    FrameDescriptor,
+    KeypointPayload,
+    ResultBatch,
 )
+from .pacing import DEFAULT_MAX_CATCH_UP, PACING_SKIP, FramePacer
 
 
 class _QueueLike(Protocol):  # pragma: no cover - 型補助
     def put_nowait(self, item: Any) -> None: ...
     def get_nowait(self) -> Any: ...
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any: ...
     def full(self) -> bool: ...
 
 
@@ -48,6 +120,9 @@ class WorkerStats:
     frames: int = 0
     drops: int = 0
     total_latency_ms: float = 0.0
+    total_capture_ms: float = 0.0
+    captures: int = 0
+    skipped: int = 0
 
     def fps(self, elapsed_sec: float) -> float:
         return self.frames / elapsed_sec if elapsed_sec > 0 else 0.0
@@ -55,6 +130,9 @@ class WorkerStats:
     def avg_latency(self) -> Optional[float]:
         return self.total_latency_ms / self.frames if self.frames else None
 
+    def avg_capture(self) -> Optional[float]:
+        return self.total_capture_ms / self.captures if self.captures else None
+
     def drop_rate(self) -> Optional[float]:
         total = self.frames + self.drops
         return (self.drops / total) if total else None
@@ -66,8 +144,21 @@ class CaptureInferenceWorker:
     Attributes:
         camera_id: カメラID
         result_queue: 結果送信先 (queue.Queue or multiprocessing.Queue)
-        target_fps: 目標 FPS (sleep に利用)
+        status_queue: 統計 / PING 応答 / ExitNotice の送信先 (None = result_queue)
+        target_fps: 目標 FPS (フレーム開始期限の間隔)
         simulate_latency_ms: 1フレーム当たりの擬似推論レイテンシ (sleep)
+        batch_max_records: ResultBatch 1 件当たりの最大レコード数 (1 = バッチなし, 1 件ずつ送信)
+        batch_max_delay_ms: 保留レコードの最大送出遅延 (ms)
+        pacing_policy: 期限に追い付かない場合の方針 (skip / catch_up, pacing 参照)
+        max_catch_up: catch_up 時に連続実行する遅延フレーム数の上限
+        frame_source: フレーム入力 (None = フレームなし。worker が close する)
+        inference_backend: 推論バックエンド (load 済み。None = 擬似推論)
+        inference_batch_size: infer_batch 1 回当たりのフレーム数
+        latency_target_ms: 適応フレーム間引きの目標 p95 レイテンシ (None = 間引きなし)
+        min_fps: 間引き時の実効サンプリング率の下限
+        frame_ring_slots: 共有メモリフレームリングのスロット数 (0 = 無効)
+        keypoint_mode: キーポイントの転送方式 (keypoints.KEYPOINT_MODES, 推論バックエンド時のみ)
+        keypoint_filter: キーポイント平滑化 (keypoint_filter.KEYPOINT_FILTERS, 送信時のみ)
     """
 
     _LABELS: Sequence[str] = ("gesture_a", "gesture_b", "gesture_c")
@@ -80,14 +171,54 @@ class CaptureInferenceWorker:
         simulate_latency_ms: float = 2.0,
         control_queue: Optional[_QueueLike] = None,
         respond_to_ping: bool = True,
+        batch_max_records: int = 1,
+        batch_max_delay_ms: float = 20.0,
+        pacing_policy: str = PACING_SKIP,
+        max_catch_up: int = DEFAULT_MAX_CATCH_UP,
+        frame_source: Optional[FrameSource] = None,
+        inference_backend: Optional[InferenceBackend] = None,
+        inference_batch_size: int = 1,
+        latency_target_ms: Optional[float] = None,
+        min_fps: float = 1.0,
+        status_queue: Optional[_QueueLike] = None,
+        frame_ring_slots: int = 0,
+        keypoint_mode: str = KEYPOINTS_OFF,
+        keypoint_filter: str = FILTER_NONE,
     ) -> None:
         if target_fps <= 0:
             raise ValueError("target_fps must be > 0")
+        if batch_max_records < 1:
+            raise ValueError("batch_max_records must be >= 1")
+        if batch_max_delay_ms < 0:
+            raise ValueError("batch_max_delay_ms must be >= 0")
+        if inference_batch_size < 1:
+            raise ValueError("inference_batch_size must be >= 1")
+        if inference_backend is not None and frame_source is None:
+            raise ValueError("inference_backend requires frame_source")
         # 基本設定
         self.camera_id = camera_id
         self._q = result_queue
+        self._status_q = status_queue if status_queue is not None else result_queue
         self._target_fps = target_fps
+        self._pacer = FramePacer(target_fps, pacing_policy, max_catch_up)
         self._simulate_latency = simulate_latency_ms / 1000.0
+        self._source = frame_source
+        self._backend = inference_backend
+        self._infer_batch = inference_batch_size
+        self._frames: List[Frame] = []  # 推論待ちフレーム
+        self._ring: Optional[FrameRing] = None
+        if frame_ring_slots > 0 and frame_source is not None:
+            self._ring = FrameRing.create(frame_source.spec.shape, frame_ring_slots)
+        self._keypoints = KeypointWriter(keypoint_mode)
+        if keypoint_filter not in KEYPOINT_FILTERS:
+            raise ValueError(f"keypoint_filter must be one of {KEYPOINT_FILTERS}")
+        self._kp_filter_name = keypoint_filter
+        self._kp_filter: Optional[OneEuroKeypointFilter] = None  # 初回結果の K で生成
+        self._skipper: Optional[AdaptiveFrameSkipper] = None
+        if latency_target_ms is not None:
+            self._skipper = AdaptiveFrameSkipper(
+                target_fps, latency_target_ms, min_fps=min(min_fps, target_fps)
+            )
         # 統計用
         self._stats = WorkerStats()
         self._start_monotonic_ns: Optional[int] = None
@@ -95,11 +226,27 @@ class CaptureInferenceWorker:
         self._control_q = control_queue
         self._respond_to_ping = respond_to_ping
         self._stopping = False  # STOP 制御受信後 True
+        # 結果バッチ (保留レコードと最古保留の送出期限)
+        self._batch_max = batch_max_records
+        self._batch_delay_ns = int(batch_max_delay_ms * 1_000_000)
+        self._pending: List[ResultRecord] = []
+        self._pending_deadline_ns = 0
+        self._steps = 0  # step() で処理したフレーム数 (ラベル選択用)
 
     @property
     def is_stopping(self) -> bool:
         return self._stopping
 
+    @property
+    def skipper(self) -> Optional[AdaptiveFrameSkipper]:
+        """適応フレーム間引きの制御器 (無効なら None)。"""
+        return self._skipper
+
+    @property
+    def skipped_deadlines(self) -> int:
+        """ペーシング方針により実行しなかったフレーム期限の累計。"""
+        return self._pacer.skipped
+
     # ---------------------------- 公開 API ---------------------------- #
     def run_loop(self, iterations: int) -> None:
         """指定フレーム数だけ生成して終了 (テスト用)。"""
@@ -108,29 +255,36 @@ class CaptureInferenceWorker:
         first = self._start_monotonic_ns is None
         if first:
             self._start_monotonic_ns = perf_counter_ns()
-        frame_interval = 1.0 / self._target_fps
         for i in range(iterations):
-            if self._stopping:  # 早期終了
+            # 期限まで制御メッセージを受けながら待機 (STOP 受信で早期終了)
+            self._wait_next_frame()
+            if self._stopping:
                 break
-            loop_start = perf_counter_ns()
-            self._process_control()
-            self._generate_one(i)
-            # FPS 近似維持 (生成時間 + 推論擬似sleep を考慮)
-            elapsed = (perf_counter_ns() - loop_start) / 1e9
-            remaining = frame_interval - elapsed
-            if remaining > 0:
-                sleep(remaining)
-        # 1秒以上経過 or 初回実行であれば統計メッセージをキューへ送信
-        if self._start_monotonic_ns is not None:
-            elapsed_total = (perf_counter_ns() - self._start_monotonic_ns) / 1e9
-            if elapsed_total >= 1.0:
-                try:
-                    self._q.put_nowait(self.build_stats_message())
-                except queue.Full:  # 統計は落としても致命でない
-                    pass
-                # 次窓へリセット
-                self._start_monotonic_ns = perf_counter_ns()
-                self._stats = WorkerStats()
+            self._run_frame(i)
+            if self._stopping:  # 入力終端 / 取得エラー (_finish で送出済み)
+                break
+        self._send_stats_if_due()
+
+    def step(self) -> Optional[int]:
+        """協調スケジューラ用の非ブロッキング版 run_loop (scheduler.WorkerScheduler)。
+
+        受信済みの制御メッセージを全て処理し、フレーム期限に達していれば 1 フレーム処理する。
+        待機はしない (期限前の呼出しは制御メッセージの処理のみ)。
+
+        Returns:
+            Optional[int]: 次に呼ぶべき時刻 (モノトニック ns)。停止した場合は None。
+        """
+        while not self._stopping and self._process_control():
+            pass
+        if self._stopping:
+            return None
+        if self._start_monotonic_ns is None:
+            self._start_monotonic_ns = perf_counter_ns()
+        if self._pacer.remaining_ns(monotonic_ns()) <= 0:
+            self._run_frame(self._steps)
+            self._steps += 1
+            self._send_stats_if_due()
+        return None if self._stopping else self._pacer.next_deadline_ns
 
     def build_stats_message(self) -> StatsMessage:
         elapsed_sec = 0.0
@@ -141,11 +295,69 @@ class CaptureInferenceWorker:
             fps=self._stats.fps(elapsed_sec),
             avg_latency_ms=self._stats.avg_latency(),
             drop_rate=self._stats.drop_rate(),
+            avg_capture_ms=self._stats.avg_capture() if self._source else None,
+            effective_fps=self._skipper.effective_fps if self._skipper else None,
+            skipped_frames=self._stats.skipped,
         )
 
+    def close(self) -> None:
+        """フレーム入力と共有メモリ (フレーム / キーポイント) を閉じる (冪等。STOP / 終端で自動)。"""
+        if self._source is not None:
+            self._source.close()
+        if self._ring is not None:
+            self._ring.close()
+        self._keypoints.close()
+
     # ---------------------------- 内部処理 ---------------------------- #
+    def _run_frame(self, index: int) -> None:
+        next_ns = self._pacer.advance(monotonic_ns())
+        self._generate_one(index)
+        # 次フレームが送出期限に間に合わない保留分は待機前に送る
+        if self._stopping or not self._pending:
+            return
+        if next_ns >= self._pending_deadline_ns:
+            self.flush()
+
+    def _send_stats_if_due(self) -> None:
+        # 1秒以上経過していれば統計メッセージをキューへ送信
+        if self._start_monotonic_ns is None or self._stopping:
+            return
+        elapsed_total = (perf_counter_ns() - self._start_monotonic_ns) / 1e9
+        if elapsed_total >= 1.0:
+            self.flush()
+            try:
+                self._status_q.put_nowait(self.build_stats_message())
+            except queue.Full:  # 統計は落としても致命でない
+                pass
+            # 次窓へリセット
+            self._start_monotonic_ns = perf_counter_ns()
+            self._stats = WorkerStats()
+
     def _generate_one(self, index: int) -> None:
-        # 擬似キャプチャ & 推論 (sleep でレイテンシ再現)
+        if self._source is not None:
+            c0 = perf_counter_ns()
+            try:
+                frame = self._source.read()
+            except StreamConnectionError as e:
+                self._finish(1, f"SOURCE_ERROR: {e}")
+                return
+            if frame is None:
+                self._finish(0, "EOS")
+                return
+            self._stats.total_capture_ms += (perf_counter_ns() - c0) / 1e6
+            self._stats.captures += 1
+            if self._ring is not None:
+                self._publish_frame(frame)
+        if self._skipper is not None and not self._skipper.admit():
+            self._stats.skipped += 1  # 取得済みフレームを処理せず捨てる
+            return
+        if self._source is not None:
+            if self._backend is not None:
+                self._frames.append(frame)
+                if len(self._frames) >= self._infer_batch:
+                    self._infer_frames()
+                return
+        # 擬似推論 (sleep でレイテンシ再現)
         t0 = perf_counter_ns()
         if self._simulate_latency > 0:
             sleep(self._simulate_latency)
@@ -162,38 +374,162 @@ class CaptureInferenceWorker:
         self._emit(rec)
         self._stats.frames += 1
         self._stats.total_latency_ms += latency_ms
+        if self._skipper is not None:
+            self._skipper.record(latency_ms)
+
+    def _publish_frame(self, frame: Frame) -> None:
+        assert self._ring is not None
+        slot, seq = self._ring.write(
+            frame.data, frame.index, frame.pts_ns, frame.captured_ns
+        )
+        desc = FrameDescriptor(
+            camera_id=self.camera_id,
+            ring_name=self._ring.name,
+            slot=slot,
+            seq=seq,
+            index=frame.index,
+            pts_ns=frame.pts_ns,
+            captured_ns=frame.captured_ns,
+        )
+        try:  # プレビュー用で欠落可: 満杯なら記述子自体を捨てる (結果を押し出さない)
+            self._q.put_nowait(desc)
+        except queue.Full:
+            pass
+
+    def _infer_frames(self) -> None:
+        assert self._backend is not None and self._source is not None
+        frames, self._frames = self._frames, []
+        if not frames:
+            return
+        try:
+            results = self._backend.infer_batch(
+                [f.data for f in frames], self._source.spec.pixel_format
+            )
+        except InferenceError:
+            self._stats.drops += len(frames)
+            return
+        # レイテンシ・時刻はフレーム毎に取得完了 (captured_ns と同じモノトニック時計) から
+        # 求める (先に来たフレームほどバッチが埋まるまで長く待っている)
+        done_ns = utils_time.monotonic_ns()
+        done_utc = utils_time.now_utc()
+        for frame, res in zip(frames, results):
+            waited_ns = max(0, done_ns - frame.captured_ns)
+            latency_ms = waited_ns / 1e6
+            self._emit(
+                ResultRecord(
+                    camera_id=self.camera_id,
+                    timestamp_utc=done_utc - timedelta(microseconds=waited_ns // 1000),
+                    gesture_label=res.label,
+                    confidence=res.confidence,
+                    latency_ms=latency_ms,
+                    keypoints=self._pack_keypoints(frame, res.keypoints),
+                )
+            )
+            self._stats.frames += 1
+            self._stats.total_latency_ms += latency_ms
+            if self._skipper is not None:
+                self._skipper.record(latency_ms)
+
+    def _pack_keypoints(
+        self, frame: Frame, keypoints: np.ndarray
+    ) -> Optional[KeypointPayload]:
+        if self._keypoints.mode == KEYPOINTS_OFF:
+            return None
+        if self._kp_filter_name == FILTER_NONE:
+            return self._keypoints.pack(keypoints)
+        if self._kp_filter is None:
+            self._kp_filter = create_keypoint_filter(
+                self._kp_filter_name, keypoints.shape[-2]
+            )
+        assert self._kp_filter is not None
+        smoothed, ids = self._kp_filter.update(keypoints, frame.captured_ns / 1e9)
+        return self._keypoints.pack(smoothed, ids.tolist())
+
+    def flush(self) -> None:
+        """保留中のレコードを ResultBatch として送出する (保留なしなら何もしない)。"""
+        if not self._pending:
+            return
+        batch = ResultBatch(self.camera_id, tuple(self._pending))
+        self._pending.clear()
+        self._put_result(batch, len(batch))
 
     def _emit(self, rec: ResultRecord) -> None:
+        if self._batch_max <= 1:
+            self._put_result(rec, 1)
+            return
+        if not self._pending:
+            self._pending_deadline_ns = monotonic_ns() + self._batch_delay_ns
+        self._pending.append(rec)
+        if len(self._pending) >= self._batch_max:
+            self.flush()
+
+    def _put_result(self, item: Union[ResultRecord, ResultBatch], records: int) -> None:
         try:
-            self._q.put_nowait(rec)
+            self._q.put_nowait(item)
             return
         except queue.Full:
-            # 古いものを1件破棄して再試行
+            # 古いものを1件破棄して再試行 (破棄した結果のレコード数も drops に数える)
             try:
-                self._q.get_nowait()
+                evicted = self._q.get_nowait()
             except queue.Empty:
                 pass
+            else:
+                if isinstance(evicted, ResultBatch):
+                    self._stats.drops += len(evicted)
+                elif isinstance(evicted, ResultRecord):
+                    self._stats.drops += 1
             try:
-                self._q.put_nowait(rec)
+                self._q.put_nowait(item)
                 return
             except queue.Full:
-                self._stats.drops += 1
+                self._stats.drops += records
                 return
 
     # ---------------------------- 制御処理 ---------------------------- #
-    def _process_control(self) -> None:
-        if not self._control_q:
+    def _wait_next_frame(self) -> None:
+        """次フレームの期限まで待機する (待機中に届いた制御メッセージは即時処理)。
+
+        期限を過ぎている場合も制御メッセージを 1 件だけ確認する (遅延時も応答を止めない)。
+        """
+        remaining_ns = self._pacer.remaining_ns(monotonic_ns())
+        if remaining_ns <= 0:
+            self._process_control()
             return
+        while not self._stopping:
+            if not self._control_q:
+                sleep(remaining_ns / 1e9)
+                return
+            try:
+                msg = self._control_q.get(timeout=remaining_ns / 1e9)
+            except queue.Empty:
+                return
+            except Exception:
+                # 制御キュー異常時は期限まで sleep (ペーシングは維持)
+                sleep(self._pacer.remaining_ns(monotonic_ns()) / 1e9)
+                return
+            self._handle_control(msg)
+            remaining_ns = self._pacer.remaining_ns(monotonic_ns())
+            if remaining_ns <= 0:
+                return
+
+    def _process_control(self) -> bool:
+        """制御メッセージを 1 件処理する (受信できなければ False)。"""
+        if not self._control_q:
+            return False
         try:
             msg = self._control_q.get_nowait()
         except Exception:
-            return
+            return False
+        self._handle_control(msg)
+        return True
+
+    def _handle_control(self, msg: Any) -> None:
         if not isinstance(msg, ControlMessage):
             return
         if msg.type == CONTROL_PING and self._respond_to_ping:
             ping_id = msg.payload.get("id")
             try:
-                self._q.put_nowait(
+                self._status_q.put_nowait(
                     StatusUpdate(
                         camera_id=self.camera_id,
                         status="RUNNING",
@@ -205,17 +541,24 @@ class CaptureInferenceWorker:
             except queue.Full:
                 pass
         elif msg.type == CONTROL_STOP:
-            # Graceful 停止: 統計送信後 ExitNotice
-            self._stopping = True
-            try:
-                # 中途でも現時点統計を送る (best-effort)
-                self._q.put_nowait(self.build_stats_message())
-            except queue.Full:
-                pass
-            try:
-                self._q.put_nowait(ExitNotice(camera_id=self.camera_id, code=0, reason="STOP"))
-            except queue.Full:
-                pass
+            self._finish(0, "STOP")
+
+    def _finish(self, code: int, reason: str) -> None:
+        # Graceful 停止 (STOP / 入力終端): 保留結果・統計送信後 ExitNotice
+        self._stopping = True
+        if self._frames:
+            self._infer_frames()
+        self.flush()
+        try:
+            # 中途でも現時点統計を送る (best-effort)
+            self._status_q.put_nowait(self.build_stats_message())
+        except queue.Full:
+            pass
+        try:
+            self._status_q.put_nowait(ExitNotice(camera_id=self.camera_id, code=code, reason=reason))
+        except queue.Full:
+            pass
+        self.close()
 
 
 __all__ = ["CaptureInferenceWorker", "WorkerStats"]
@@ -0,0 +1,116 @@
+"""worker プロセスの起動方式と forkserver テンプレートでのモデル事前ロード。
+
+spawn はプロセス毎にインタプリタを起動し、worker スタック (NumPy / frame_source /
+inference など) の import と推論モデルのロード・ウォームアップを毎回やり直す。
+forkserver 方式では multiprocessing の forkserver をテンプレートとして使う。forkserver は
+起動時に 1 回だけ worker スタックを import してモデルをロードしておき、カメラ worker は
+そこから fork されるため、import 済み・ロード済み (copy-on-write) の状態で始まる。
+
+起動方式 (WORKER_START_METHODS, OrchestratorConfig.worker_start_method):
+    default: 従来どおり multiprocessing の既定の方式 (Linux は fork)。
+    spawn: プロセス毎に新しいインタプリタ。
+    forkserver: 上記テンプレート。事前ロードするバックエンド名は環境変数
+        TEMPLATE_BACKENDS_ENV で渡す (forkserver は最初のプロセス起動時に親の環境を
+        引き継いで起動し、preload に登録した _template_preload を import する)。
+
+制約:
+    forkserver は親プロセスに 1 つで、起動後は preload / 事前ロードするバックエンドを
+    変更できない。テンプレートにないバックエンドは worker が従来どおり自前でロードする。
+    ロード済みモデルを fork で複製するため、ロード時にスレッドを起動し fork 後に使えない
+    ネイティブ推論ランタイムでは forkserver を使わない。
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from multiprocessing.context import BaseContext
+from typing import Dict, Final, List, Optional, Sequence, Tuple
+
+from .errors import ModelLoadError
+from .inference import BACKEND_STUB, InferenceBackend, create_inference_backend
+
+START_DEFAULT: Final = "default"
+START_SPAWN: Final = "spawn"
+START_FORKSERVER: Final = "forkserver"
+WORKER_START_METHODS: Final[Tuple[str, ...]] = (
+    START_DEFAULT,
+    START_SPAWN,
+    START_FORKSERVER,
+)
+TEMPLATE_BACKENDS_ENV: Final = "GESTURE_WORKER_TEMPLATE_BACKENDS"
+_PRELOAD_MODULE: Final = f"{__package__}._template_preload"
+
+_logger = logging.getLogger(__name__)
+# テンプレート (forkserver) でロード済みのバックエンド。fork された worker が引き継ぐ
+_preloaded: Dict[str, InferenceBackend] = {}
+
+
+def worker_context(method: str, backends: Sequence[str] = ()) -> BaseContext:
+    """起動方式の multiprocessing コンテキストを返す。
+
+    forkserver の場合は preload と事前ロードするバックエンド (環境変数) を設定する
+    (forkserver が未起動の場合のみ有効)。
+
+    Args:
+        method (str): WORKER_START_METHODS のいずれか。
+        backends (Sequence[str]): テンプレートで事前ロードするバックエンド名 (stub は無視)。
+
+    Raises:
+        ValueError: 未知の起動方式。
+    """
+    if method not in WORKER_START_METHODS:
+        raise ValueError(
+            f"worker_start_method が不正: {method} (有効: {WORKER_START_METHODS})"
+        )
+    if method == START_DEFAULT:
+        return multiprocessing.get_context()
+    ctx = multiprocessing.get_context(method)
+    if method == START_FORKSERVER:
+        names = [name for name in backends if name != BACKEND_STUB]
+        os.environ[TEMPLATE_BACKENDS_ENV] = ",".join(names)
+        ctx.set_forkserver_preload([_PRELOAD_MODULE])
+    return ctx
+
+
+def preload_template_backends() -> List[str]:
+    """TEMPLATE_BACKENDS_ENV のバックエンドをロード・ウォームアップして保持する。
+
+    forkserver 内で _template_preload から呼ばれる。失敗したバックエンドは保持しない
+    (worker が自前でロードし、MODEL_LOAD の ExitNotice を送る)。
+
+    Returns:
+        List[str]: 保持しているバックエンド名。
+    """
+    for name in os.environ.get(TEMPLATE_BACKENDS_ENV, "").split(","):
+        if not name or name in _preloaded:
+            continue
+        try:
+            backend = create_inference_backend(name)
+            if backend is None:
+                continue
+            backend.load()
+            backend.warmup()
+        except (ModelLoadError, ValueError) as e:
+            _logger.warning("template preload of %s failed: %s", name, e)
+            continue
+        _preloaded[name] = backend
+    return list(_preloaded)
+
+
+def template_backend(name: str) -> Optional[InferenceBackend]:
+    """テンプレートから引き継いだロード済みバックエンドを返す (なければ None)。"""
+    return _preloaded.get(name)
+
+
+__all__ = [
+    "START_DEFAULT",
+    "START_SPAWN",
+    "START_FORKSERVER",
+    "WORKER_START_METHODS",
+    "TEMPLATE_BACKENDS_ENV",
+    "preload_template_backends",
+    "template_backend",
+    "worker_context",
+]
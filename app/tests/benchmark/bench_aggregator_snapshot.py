@@ -0,0 +1,100 @@
+"""Aggregator.snapshot_stats のコスト vs capacity ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_aggregator_snapshot``
+
+比較対象:
+    legacy: 旧実装 (毎回バッファ全走査 + max() で last_update 算出) を本ファイル内で再現
+    current: Aggregator.snapshot_stats (push_result で窓状態を増分更新, 毎回新 tick で全計算)
+    cached: 同一 tick 内の Aggregator.publish (tick キャッシュ命中)
+
+条件: 32 カメラ × 30fps 相当。各 capacity までバッファを満たした状態で snapshot を繰返し計測。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from itertools import count
+from typing import Any, Deque, Dict, List
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+
+CAMERAS = 32
+FPS = 30
+CAPACITIES = (256, 1024, 4096, 16384)
+REPEAT = 50
+
+
+def _legacy_snapshot(
+    buffers: Dict[str, Deque[ResultRecord]], now: datetime
+) -> Dict[str, Dict[str, Any]]:
+    window_start = now - timedelta(seconds=1)
+    out: Dict[str, Dict[str, Any]] = {}
+    for cam, buf in buffers.items():
+        recent = [r for r in buf if r.timestamp_utc > window_start]
+        latencies = [r.latency_ms for r in recent if r.latency_ms is not None]
+        avg = sum(latencies) / len(latencies) if latencies else None
+        last_ts = max(r.timestamp_utc for r in buf)
+        out[cam] = {"fps": float(len(recent)), "avg_latency_ms": avg, "last": last_ts}
+    return out
+
+
+def _fill(capacity: int) -> tuple[Aggregator, datetime]:
+    agg = Aggregator(capacity=capacity)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    step = timedelta(seconds=1.0 / FPS)
+    for i in range(capacity):
+        ts = base + step * i
+        for c in range(CAMERAS):
+            agg.push_result(
+                ResultRecord(
+                    camera_id=f"cam{c:02d}",
+                    timestamp_utc=ts,
+                    gesture_label="g",
+                    confidence=0.9,
+                    latency_ms=5.0 + (i % 7),
+                )
+            )
+    return agg, base + step * capacity
+
+
+def _measure_us(fn: Any) -> float:
+    t0 = perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (perf_counter() - t0) / REPEAT * 1e6
+
+
+def main() -> List[Dict[str, float]]:
+    rows: List[Dict[str, float]] = []
+    print(f"cameras={CAMERAS} fps={FPS} repeat={REPEAT}")
+    print(
+        f"{'capacity':>9} {'legacy_us':>12} {'current_us':>12} {'speedup':>8}"
+        f" {'cached_us':>10}"
+    )
+    for cap in CAPACITIES:
+        agg, now = _fill(cap)
+        legacy = _measure_us(lambda: _legacy_snapshot(agg._buffers, now))
+        # stats_refresh_sec=0 では now 毎に tick が進むため 1us ずつずらして全計算させる
+        ticks = count(1)
+        current = _measure_us(
+            lambda: agg.snapshot_stats(now=now + timedelta(microseconds=next(ticks)))
+        )
+        cached = _measure_us(lambda: agg.publish(now))
+        rows.append(
+            {
+                "capacity": cap,
+                "legacy_us": legacy,
+                "current_us": current,
+                "cached_us": cached,
+            }
+        )
+        print(
+            f"{cap:>9} {legacy:>12.1f} {current:>12.1f} {legacy / current:>7.1f}x"
+            f" {cached:>10.2f}"
+        )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
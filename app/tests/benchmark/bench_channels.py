@@ -0,0 +1,230 @@
+"""共有結果キュー vs カメラ別結果チャネル (ResultChannels) の過負荷カメラ耐性ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_channels``
+
+条件:
+    spawn プロセスの worker (擬似推論) を FLOOD_FPS のカメラ 1 台と NORMAL_FPS のカメラ
+    NORMALS 台で DURATION_SEC 動かす。親は受信 1 レコード毎に DISPATCH_COST_MS の処理
+    (集約相当のビジーループ) を行い、流入が処理能力を超える。PING_INTERVAL_SEC 毎に
+    通常カメラへ PING を送る。
+    shared: 全 worker が 1 本のキュー (QUEUE_MAXSIZE, 満杯時は最古破棄) へ結果・統計・
+        PING 応答を送る従来構成。
+    channels: カメラ毎の結果キュー (各 QUEUE_MAXSIZE) + プロセス毎のステータスキュー。
+計測 (通常カメラ平均):
+    normal_s: 親へ届いた結果 / 秒 (生成は NORMAL_FPS)
+    flood_s: 過負荷カメラの結果 / 秒
+    rtt_p50_ms / rtt_max_ms: PING 応答の往復時間
+    lost: 応答が返らなかった PING 数
+
+アイドル時 (_idle):
+    IDLE_CAMERAS 台分 (結果キュー + ステータスキュー) の ResultChannels を書込みなしで
+    IDLE_SEC 間 poll(timeout=0.2) し続ける。
+    pipes: multiprocessing.Queue (受信側パイプを connection.wait で同時に待つ)
+    backoff: queue.Queue (パイプなし。ステータス待ちを idle_wait_sec から倍々に延ばす)
+    probes_s: カメラキューの空読み回数 / 秒, cpu_ms_s: 受信スレッドの CPU 時間 / 秒
+    wake_ms: アイドル中に 1 件書いてから受信するまで
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import queue
+import threading
+from datetime import datetime, timezone
+from queue import Empty
+from time import monotonic, perf_counter, thread_time
+from typing import Any, Dict, List, Optional
+
+from app.scripts.core.channels import ResultChannels
+from app.scripts.core.messages import (
+    CONTROL_PING,
+    CONTROL_STOP,
+    ControlMessage,
+    ExitNotice,
+    ResultRecord,
+    StatusUpdate,
+)
+from app.scripts.core.process_worker_entry import run_capture_inference_worker_process
+
+FLOOD_FPS = 2000
+NORMAL_FPS = 30
+NORMALS = 4
+DURATION_SEC = 5.0
+QUEUE_MAXSIZE = 256
+DISPATCH_COST_MS = 1.5
+PING_INTERVAL_SEC = 0.5
+IDLE_CAMERAS = 200
+IDLE_SEC = 2.0
+
+
+def _busy(ms: float) -> None:
+    until = perf_counter() + ms / 1e3
+    while perf_counter() < until:
+        pass
+
+
+def _run(mode: str) -> Dict[str, float]:
+    ctx = mp.get_context("spawn")
+    channels = ResultChannels(lambda n: ctx.Queue(maxsize=n), QUEUE_MAXSIZE)
+    shared = ctx.Queue(maxsize=QUEUE_MAXSIZE)
+    stop_event = ctx.Event()
+    cams = {"flood": FLOOD_FPS, **{f"cam{i}": NORMAL_FPS for i in range(NORMALS)}}
+    ctrl: Dict[str, Any] = {}
+    procs = []
+    for cam, fps in cams.items():
+        ctrl[cam] = ctx.Queue(maxsize=16)
+        if mode == "shared":
+            result_q, status_q = shared, None
+        else:
+            result_q, status_q = channels.add(cam), channels.add_status(cam)
+        procs.append(
+            ctx.Process(
+                target=run_capture_inference_worker_process,
+                args=(cam, result_q, ctrl[cam], stop_event, fps, 0.0, True),
+                kwargs={"status_queue": status_q},
+                daemon=True,
+            )
+        )
+    for p in procs:
+        p.start()
+    delivered: Dict[str, int] = {cam: 0 for cam in cams}
+    sent: Dict[str, float] = {}
+    rtts: List[float] = []
+    pings = 0
+    exited = 0
+
+    def handle(item: Any) -> None:
+        nonlocal exited
+        if isinstance(item, ResultRecord):
+            delivered[item.camera_id] += 1
+            _busy(DISPATCH_COST_MS)
+        elif isinstance(item, StatusUpdate) and item.ping_response:
+            ts = sent.pop(item.ping_response, None)
+            if ts is not None:
+                rtts.append((monotonic() - ts) * 1e3)
+        elif isinstance(item, ExitNotice):
+            exited += 1
+
+    def poll() -> None:
+        if mode == "channels":
+            channels.poll(handle, timeout=0.2)
+            return
+        try:
+            handle(shared.get(timeout=0.2))
+        except Empty:
+            pass
+
+    # 起動 (spawn + import) を待ってから計測
+    started = monotonic()
+    while not all(delivered.values()) and monotonic() - started < 30:
+        poll()
+    for cam in delivered:
+        delivered[cam] = 0
+    until = monotonic() + DURATION_SEC
+    next_ping = monotonic()
+    while monotonic() < until:
+        if monotonic() >= next_ping:
+            next_ping += PING_INTERVAL_SEC
+            for cam in cams:
+                if cam != "flood":
+                    ping_id = f"{cam}-{pings}"
+                    sent[ping_id] = monotonic()
+                    ctrl[cam].put_nowait(
+                        ControlMessage(type=CONTROL_PING, payload={"id": ping_id})
+                    )
+            pings += 1
+        poll()
+    counts = dict(delivered)
+    for cam in cams:
+        ctrl[cam].put_nowait(ControlMessage(type=CONTROL_STOP, payload={}))
+    stop_at = monotonic() + 10
+    while exited < len(cams) and monotonic() < stop_at:
+        poll()
+    stop_event.set()
+    for p in procs:
+        p.join(2)
+        if p.is_alive():  # pragma: no cover
+            p.terminate()
+    rtts.sort()
+    normal = [counts[c] for c in cams if c != "flood"]
+    return {
+        "normal_s": sum(normal) / len(normal) / DURATION_SEC,
+        "flood_s": counts["flood"] / DURATION_SEC,
+        "rtt_p50_ms": rtts[len(rtts) // 2] if rtts else float("nan"),
+        "rtt_max_ms": rtts[-1] if rtts else float("nan"),
+        "lost": float(pings * NORMALS - len(rtts)),
+    }
+
+
+def _idle(kind: str) -> Dict[str, float]:
+    factory = mp.get_context().Queue if kind == "pipes" else queue.Queue
+    channels = ResultChannels(factory, QUEUE_MAXSIZE)
+    cams = [f"cam{i:03d}" for i in range(IDLE_CAMERAS)]
+    for cam in cams:
+        channels.add(cam)
+        channels.add_status(cam)
+    probes = 0
+    serve = channels._serve
+
+    def counting(camera_id: str, handle: Any) -> int:
+        nonlocal probes
+        probes += 1
+        return serve(camera_id, handle)
+
+    channels._serve = counting  # type: ignore[method-assign]
+    c0, t0 = thread_time(), monotonic()
+    while monotonic() - t0 < IDLE_SEC:
+        channels.poll(lambda item: None, timeout=0.2)
+    elapsed = monotonic() - t0
+    cpu_ms_s = (thread_time() - c0) * 1e3 / elapsed
+    probes_s = probes / elapsed
+    sent: List[float] = []
+
+    def put() -> None:
+        sent.append(monotonic())
+        channels.result_queue(cams[-1]).put_nowait(
+            ResultRecord(cams[-1], datetime.now(timezone.utc), "none", 1.0, 0.0)
+        )
+
+    threading.Timer(0.5, put).start()
+    while not channels.poll(lambda item: None, timeout=0.2):
+        pass
+    return {
+        "probes_s": probes_s,
+        "cpu_ms_s": cpu_ms_s,
+        "wake_ms": (monotonic() - sent[0]) * 1e3,
+    }
+
+
+def main(modes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(
+        f"flood={FLOOD_FPS}fps normals={NORMALS}x{NORMAL_FPS}fps queue={QUEUE_MAXSIZE}"
+        f" dispatch_cost={DISPATCH_COST_MS}ms duration={DURATION_SEC}s"
+    )
+    print(
+        f"{'mode':>9} {'normal_s':>9} {'flood_s':>8} {'rtt_p50_ms':>11}"
+        f" {'rtt_max_ms':>11} {'lost':>5}"
+    )
+    for mode in modes or ["shared", "channels"]:
+        row = {"mode": mode, **_run(mode)}
+        rows.append(row)
+        print(
+            f"{mode:>9} {row['normal_s']:>9.1f} {row['flood_s']:>8.1f}"
+            f" {row['rtt_p50_ms']:>11.1f} {row['rtt_max_ms']:>11.1f}"
+            f" {row['lost']:>5.0f}"
+        )
+    print(f"idle: cameras={IDLE_CAMERAS} duration={IDLE_SEC}s")
+    print(f"{'idle':>9} {'probes_s':>9} {'cpu_ms_s':>9} {'wake_ms':>8}")
+    for kind in ("pipes", "backoff"):
+        row = {"mode": f"idle-{kind}", **_idle(kind)}
+        rows.append(row)
+        print(
+            f"{kind:>9} {row['probes_s']:>9.0f} {row['cpu_ms_s']:>9.1f}"
+            f" {row['wake_ms']:>8.1f}"
+        )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,186 @@
+"""結果 dispatcher の最大持続スループット (1 件毎 isinstance 振分け vs 型テーブル + 一括反映) ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_dispatcher``
+
+条件:
+    Orchestrator を起動せずに作り、dispatcher の 1 巡 (Aggregator.publish + ResultChannels.poll)
+    だけを繰り返す。CAMERAS 台、メッセージは ResultRecord 単体 (batch=1) または
+    BATCH 件の ResultBatch。
+    per_item: 従来の振分け (isinstance の連鎖、ResultRecord 毎に push_result = ロック 1 回)。
+    bulk: Orchestrator._dispatch_round (型 -> ハンドラ表、巡毎に push_results 1 回)。
+    thread: 同一プロセス内チャネル (スレッドモード) に MESSAGES 件を事前投入し、空になる
+        までの時間を測る (dispatcher 側の CPU コストのみ)。REPEATS 回の最良値。
+    process: 生成プロセス (カメラ毎 1 つ) が multiprocessing.Queue へ全速で put し続け
+        (満杯時は破棄)、DURATION_SEC 間に dispatcher が処理した件数を数える。1 CPU 環境
+        では生成側と CPU を分け合う。
+計測:
+    msgs_s: 処理したキューメッセージ / 秒
+    records_s: Aggregator に反映したレコード / 秒
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from datetime import datetime, timezone
+from queue import Full
+from time import monotonic, perf_counter
+from typing import Any, Callable, Dict, List
+
+from app.scripts.core.messages import (
+    ExitNotice,
+    FrameDescriptor,
+    ResultBatch,
+    ResultRecord,
+    StatsMessage,
+    StatusUpdate,
+)
+from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
+
+CAMERAS = 8
+MESSAGES = 200_000
+BATCHES = (1, 16)
+DURATION_SEC = 3.0
+MODES = ("per_item", "bulk")
+REPEATS = 3
+
+
+def _record(cam: str) -> ResultRecord:
+    return ResultRecord(cam, datetime.now(timezone.utc), "open_palm", 0.9, 1.0)
+
+
+def _message(cam: str, batch: int) -> Any:
+    if batch == 1:
+        return _record(cam)
+    return ResultBatch(cam, tuple(_record(cam) for _ in range(batch)))
+
+
+def _per_item_round(orch: Orchestrator) -> Callable[[float], int]:
+    """変更前の _dispatch 相当 (ResultRecord 毎に Aggregator のロックを取る)。"""
+    agg = orch.aggregator
+    exits: Dict[str, ExitNotice] = {}
+
+    def dispatch(item: object) -> None:
+        if isinstance(item, ResultRecord):
+            agg.push_result(item)
+        elif isinstance(item, ResultBatch):
+            agg.push_results(item.records)
+        elif isinstance(item, StatsMessage):
+            agg.apply_stats_message(item)
+        elif isinstance(item, StatusUpdate) and item.ping_response:
+            pass
+        elif isinstance(item, FrameDescriptor):
+            pass
+        elif isinstance(item, ExitNotice):
+            exits[item.camera_id] = item
+
+    return lambda timeout: orch._channels.poll(dispatch, timeout)
+
+
+def _round(orch: Orchestrator, mode: str) -> Callable[[float], int]:
+    if mode == "per_item":
+        return _per_item_round(orch)
+    return orch._dispatch_round
+
+
+def _orchestrator(use_process: bool) -> Orchestrator:
+    cams = [f"cam{i}" for i in range(CAMERAS)]
+    return Orchestrator(
+        OrchestratorConfig(
+            camera_ids=cams,
+            use_process=use_process,
+            aggregator_capacity=4096,
+            result_queue_maxsize=0 if not use_process else 256,
+        )
+    )
+
+
+def _thread(mode: str, batch: int) -> Dict[str, float]:
+    runs = [_thread_once(mode, batch) for _ in range(REPEATS)]
+    return max(runs, key=lambda r: r["msgs_s"])
+
+
+def _thread_once(mode: str, batch: int) -> Dict[str, float]:
+    orch = _orchestrator(False)
+    cams = orch._channels.camera_ids
+    per_cam = MESSAGES // batch // CAMERAS
+    for cam in cams:  # 時刻順 (遅着の挿入経路を通さない)
+        q = orch._channels.result_queue(cam)
+        for _ in range(per_cam):
+            q.put_nowait(_message(cam, batch))
+    step = _round(orch, mode)
+    publish = orch.aggregator.publish
+    handled = 0
+    t0 = perf_counter()
+    while True:
+        publish()
+        n = step(0.0)
+        if not n:
+            break
+        handled += n
+    elapsed = perf_counter() - t0
+    return {"msgs_s": handled / elapsed, "records_s": handled * batch / elapsed}
+
+
+def _produce(q: Any, cam: str, batch: int, stop: Any) -> None:
+    while not stop.is_set():
+        try:
+            q.put_nowait(_message(cam, batch))
+        except Full:
+            stop.wait(0.0005)
+
+
+def _process(mode: str, batch: int) -> Dict[str, float]:
+    orch = _orchestrator(True)
+    ctx = orch._mp
+    stop = ctx.Event()
+    procs = [
+        ctx.Process(
+            target=_produce,
+            args=(orch._channels.result_queue(cam), cam, batch, stop),
+            daemon=True,
+        )
+        for cam in orch._channels.camera_ids
+    ]
+    for p in procs:
+        p.start()
+    step = _round(orch, mode)
+    publish = orch.aggregator.publish
+    warm_until = monotonic() + 1.0
+    while monotonic() < warm_until:  # 生成プロセスの起動と満杯になるのを待つ
+        publish()
+        step(0.005)
+    handled = 0
+    t0 = perf_counter()
+    until = monotonic() + DURATION_SEC
+    while monotonic() < until:
+        publish()
+        handled += step(0.005)
+    elapsed = perf_counter() - t0
+    stop.set()
+    for p in procs:  # 満杯のキューへ書込み中の feeder を残さない
+        while p.is_alive():
+            step(0.0)
+            p.join(0.01)
+    return {"msgs_s": handled / elapsed, "records_s": handled * batch / elapsed}
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(f"cameras={CAMERAS} messages={MESSAGES} duration={DURATION_SEC}s")
+    print(f"{'channels':>8} {'batch':>5} {'mode':>8} {'msgs_s':>10} {'records_s':>10}")
+    for name, run in (("thread", _thread), ("process", _process)):
+        for batch in BATCHES:
+            for mode in MODES:
+                row = {"channels": name, "batch": batch, "mode": mode}
+                row.update(run(mode, batch))
+                rows.append(row)
+                print(
+                    f"{name:>8} {batch:>5} {mode:>8} {row['msgs_s']:>10.0f}"
+                    f" {row['records_s']:>10.0f}"
+                )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    mp.freeze_support()
+    main()
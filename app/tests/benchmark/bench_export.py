@@ -0,0 +1,103 @@
+"""Aggregator.export のスループット (records/s, MB/s) とピークメモリのベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_export``
+
+条件:
+    4 カメラ × 500,000 件 (計 2,000,000 件) を columnar ストアへ投入し、
+    csv / jsonl / bin の各形式を並列ワーカー数 1 / 4 で一時ディレクトリへ書出す。
+ピークメモリ:
+    tracemalloc の peak (Python ヒープ増分)。計測オーバーヘッドがあるため
+    スループットとは別の実行で計測する (ワーカー 4 のみ)。
+    チャンク単位の書出しなので総件数ではなく chunk_records × 並列数で上限が決まる。
+"""
+
+from __future__ import annotations
+
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+from app.scripts.core.exporter import EXPORT_FORMATS, ExportReport, TimeRange
+
+CAMERAS = 4
+RECORDS_PER_CAMERA = 500_000
+WORKERS = (1, 4)
+CHUNK_RECORDS = 8192
+LABELS = ("gesture_a", "gesture_b", "gesture_c")
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _fill() -> Aggregator:
+    agg = Aggregator(capacity=RECORDS_PER_CAMERA, storage="columnar", thread_safe=True)
+    step = timedelta(microseconds=33_333)
+    for i in range(RECORDS_PER_CAMERA):
+        ts = BASE + step * i
+        for c in range(CAMERAS):
+            agg.push_result(
+                ResultRecord(
+                    camera_id=f"cam{c:02d}",
+                    timestamp_utc=ts,
+                    gesture_label=LABELS[i % 3],
+                    confidence=0.5 + (i % 50) / 100.0,
+                    latency_ms=3.0 + (i % 17) * 0.25,
+                )
+            )
+    return agg
+
+
+def _export(agg: Aggregator, fmt: str, workers: int) -> ExportReport:
+    with tempfile.TemporaryDirectory() as tmp:
+        return agg.export(
+            fmt,
+            TimeRange(),
+            Path(tmp),
+            chunk_records=CHUNK_RECORDS,
+            max_workers=workers,
+        )
+
+
+def _peak_mb(agg: Aggregator, fmt: str, workers: int) -> float:
+    tracemalloc.start()
+    _export(agg, fmt, workers)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main() -> List[Dict[str, Any]]:
+    agg = _fill()
+    rows: List[Dict[str, Any]] = []
+    print(
+        f"cameras={CAMERAS} records={CAMERAS * RECORDS_PER_CAMERA:,}"
+        f" chunk={CHUNK_RECORDS}"
+    )
+    print(
+        f"{'fmt':>6} {'workers':>7} {'rec/s':>12} {'MB/s':>8} {'MB':>8}"
+        f" {'peak_MB':>8}"
+    )
+    for fmt in EXPORT_FORMATS:
+        for workers in WORKERS:
+            report = _export(agg, fmt, workers)
+            peak = _peak_mb(agg, fmt, workers) if workers == max(WORKERS) else None
+            row = {
+                "fmt": fmt,
+                "workers": workers,
+                "records_per_s": report.records / report.elapsed_sec,
+                "mb_per_s": report.bytes_written / 1e6 / report.elapsed_sec,
+                "mb": report.bytes_written / 1e6,
+                "peak_mb": peak,
+            }
+            rows.append(row)
+            peak_s = "-" if peak is None else f"{peak:.1f}"
+            print(
+                f"{fmt:>6} {workers:>7} {row['records_per_s']:>12,.0f}"
+                f" {row['mb_per_s']:>8.1f} {row['mb']:>8.1f} {peak_s:>8}"
+            )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,133 @@
+"""カメラ worker の異常終了時のフェイルオーバー間隔 (待機 worker あり / なし) ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_failover``
+
+条件:
+    Orchestrator (use_process=True, max_restarts_per_camera > KILLS) で CAMERAS 台を起動し、
+    1 台目の worker プロセスを SIGKILL する操作を KILLS 回繰り返す (前回の復旧と予備の補充・
+    ウォームアップを待った後)。
+    standby=0: supervisor がバックオフ 0 で新しいプロセスを起動する (運用時は設定した
+        バックオフ分が加わる)。
+    standby=1: standby_workers=1。モデルをロード済みで待機する予備プロセスが引き継ぐ。
+    各カメラは SyntheticFrameSource (WIDTH x HEIGHT) + NumpyKeypointBackend (TARGET_FPS)。
+    起動方式 (METHODS) と standby の組毎に新しいインタプリタで計測する。
+計測:
+    gap_ms: kill 前の最後の結果から kill 後の最初の結果までの時刻差 (結果の timestamp 基準、
+    フレーム周期 1000 / TARGET_FPS ms を含む)。KILLS 回の中央値と最大。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, List
+
+from app.scripts.core.inference import BACKEND_NUMPY_KEYPOINT
+from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
+from app.scripts.core.worker_template import (
+    START_DEFAULT,
+    START_FORKSERVER,
+    START_SPAWN,
+)
+
+CAMERAS = 4
+KILLS = 5
+TARGET_FPS = 30
+WIDTH, HEIGHT = 320, 240
+METHODS = (START_DEFAULT, START_SPAWN, START_FORKSERVER)
+STANDBY = (0, 1)
+SETTLE_SEC = 1.5  # 補充された予備のロード / ウォームアップ待ち
+
+
+def _wait(cond: Callable[[], bool], timeout: float = 60.0) -> None:
+    deadline = monotonic() + timeout
+    while not cond():
+        if monotonic() > deadline:
+            raise TimeoutError("worker did not recover")
+        sleep(0.001)
+
+
+def _measure(method: str, standby: int) -> Dict[str, Any]:
+    cams = [f"cam{i:02d}" for i in range(CAMERAS)]
+    orch = Orchestrator(
+        OrchestratorConfig(
+            camera_ids=cams,
+            use_process=True,
+            worker_start_method=method,
+            target_fps=TARGET_FPS,
+            worker_latency_ms=0.0,
+            ping_interval_sec=0.5,
+            ping_timeout_sec=60.0,
+            camera_sources={c: f"synthetic://{WIDTH}x{HEIGHT}" for c in cams},
+            inference_backend=BACKEND_NUMPY_KEYPOINT,
+            max_restarts_per_camera=KILLS + 1,
+            restart_backoff_sec=0.0,
+            standby_workers=standby,
+        )
+    )
+    cam = cams[0]
+    last = orch.aggregator.last_update_dt
+    gaps: List[float] = []
+    orch.start()
+    try:
+        _wait(lambda: all(last(c) is not None for c in cams))
+        for _ in range(KILLS):
+            _wait(lambda: orch.standby_process_count == standby)
+            sleep(SETTLE_SEC)
+            procs = orch._worker_procs
+            proc = next(p for p in procs if p.name == f"WProc-{cam}" and p.is_alive())
+            killed_at = datetime.now(timezone.utc)
+            os.kill(proc.pid, signal.SIGKILL)
+            before = last(cam)
+            _wait(lambda: (last(cam) or killed_at) > killed_at)
+            after = last(cam)
+            assert before is not None and after is not None
+            gaps.append((after - before).total_seconds() * 1000)
+    finally:
+        orch.stop()
+    return {
+        "method": method,
+        "standby": standby,
+        "gap_p50_ms": statistics.median(gaps),
+        "gap_max_ms": max(gaps),
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(f"cameras={CAMERAS} kills={KILLS} fps={TARGET_FPS} backoff=0")
+    print(f"{'method':>10} {'standby':>7} {'gap_p50':>8} {'gap_max':>8}  (ms)")
+    for method in METHODS:
+        for standby in STANDBY:
+            proc = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    __spec__.name,  # type: ignore[name-defined]
+                    method,
+                    str(standby),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            row = json.loads(proc.stdout.strip().splitlines()[-1])
+            rows.append(row)
+            print(
+                f"{method:>10} {standby:>7} {row['gap_p50_ms']:>8.1f}"
+                f" {row['gap_max_ms']:>8.1f}"
+            )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    if len(sys.argv) > 1:
+        print(json.dumps(_measure(sys.argv[1], int(sys.argv[2]))))
+    else:
+        main()
@@ -0,0 +1,100 @@
+"""フリート集計 (fleet_stats) のコスト vs カメラ数ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_fleet_stats``
+
+比較対象:
+    caller: 呼出し側で snapshot_stats() の per-camera 辞書を再走査して合計し、悪化カメラは全件ソート、
+            全体分位点は latency_quantiles(None) (全カメラのスライスを再マージ) で求める従来方式
+    publish: 新 tick の publish() 全体 (per-camera 統計 + フリート集計)
+    fleet: 上記のうち summarize_fleet 部分のみ (per-camera ヒストグラムの再利用 + サイズ K ヒープ)
+
+条件: 各カメラ 30fps × 1 秒分 (latency は 20 種) を投入, top_k=5。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from time import perf_counter
+from typing import Any, Dict, List
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+from app.scripts.core.fleet_stats import summarize_fleet
+
+CAMERA_COUNTS = (32, 128, 512, 1024)
+FPS = 30
+TOP_K = 5
+REPEAT = 20
+
+
+def _fill(cameras: int) -> tuple[Aggregator, datetime]:
+    agg = Aggregator(capacity=256, fleet_top_k=TOP_K)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    step = timedelta(seconds=1.0 / FPS)
+    for i in range(FPS):
+        ts = base + step * i
+        for c in range(cameras):
+            agg.push_result(
+                ResultRecord(
+                    camera_id=f"cam{c:04d}",
+                    timestamp_utc=ts,
+                    gesture_label="g",
+                    confidence=0.9,
+                    latency_ms=5.0 + (i + c) % 20,
+                )
+            )
+    return agg, base + step * FPS
+
+
+def _caller_side(agg: Aggregator, now: datetime) -> Dict[str, Any]:
+    stats = agg.snapshot_stats(now=now)
+    total_fps = sum(e["fps"] for e in stats.values())
+    worst = sorted(
+        ((e["latency_p95_ms"], cam) for cam, e in stats.items()), reverse=True
+    )[:TOP_K]
+    p95 = agg.latency_quantiles(None, "1s", (0.95,), now=now)["p95"]
+    return {"fps": total_fps, "worst": worst, "p95": p95}
+
+
+def _measure_us(fn: Any) -> float:
+    t0 = perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (perf_counter() - t0) / REPEAT * 1e6
+
+
+def main() -> List[Dict[str, float]]:
+    rows: List[Dict[str, float]] = []
+    print(f"fps={FPS} top_k={TOP_K} repeat={REPEAT}")
+    print(f"{'cameras':>8} {'caller_us':>10} {'publish_us':>11} {'fleet_us':>9}")
+    for cams in CAMERA_COUNTS:
+        agg, now = _fill(cams)
+        # stats_refresh_sec=0 では now 毎に tick が進むため 1us ずつずらして全計算させる
+        ticks = count(1)
+        caller = _measure_us(
+            lambda: _caller_side(agg, now + timedelta(microseconds=next(ticks)))
+        )
+        publish = _measure_us(
+            lambda: agg.publish(now + timedelta(microseconds=next(ticks)))
+        )
+        snap = agg.publish(now + timedelta(microseconds=next(ticks)))
+        hists = agg._latency_hists
+        fleet = _measure_us(
+            lambda: summarize_fleet(
+                snap.stats, (hists[c] for c in snap.stats), TOP_K
+            )
+        )
+        rows.append(
+            {
+                "cameras": cams,
+                "caller_us": caller,
+                "publish_us": publish,
+                "fleet_us": fleet,
+            }
+        )
+        print(f"{cams:>8} {caller:>10.0f} {publish:>11.0f} {fleet:>9.0f}")
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
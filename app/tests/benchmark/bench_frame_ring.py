@@ -0,0 +1,162 @@
+"""worker→親 フレーム受け渡し (Queue で画素を送る vs 共有メモリリング + 記述子) ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_frame_ring``
+
+条件:
+    CAMERAS 個の worker プロセス (spawn) が WIDTH x HEIGHT の bgr24 フレーム (合成) を
+    TARGET_FPS で DURATION_SEC 送り、親 1 スレッドが受け取る (親は画素を読むだけ = プレビュー相当)。
+    queue: multiprocessing.Queue でフレーム (numpy 配列) を送る (pickle + パイプ, 親で復元)
+    ring:  FrameRing.write + FrameDescriptor を Queue で送る (親は FrameRingHub でビュー参照)
+計測:
+    fps: 親が受け取ったカメラ当たりのフレーム / 秒 (最後の受信まで。親が追い付かないと低下)
+    lat_p50_ms / lat_p99_ms: captured_ns (worker で書込み直前) → 親で画素参照可能になるまで
+    parent_cpu_%: 親プロセスの CPU 使用率 / child_cpu_%: worker プロセス合計 (1 CPU = 100%)
+    stale: ring で参照時に既に上書きされていたフレーム数 (is_current 不一致)
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import queue
+from time import monotonic, monotonic_ns, sleep
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from app.scripts.core.frame_ring import DEFAULT_RING_SLOTS, FrameRing, FrameRingHub
+from app.scripts.core.messages import FrameDescriptor
+
+CAMERAS = 8
+WIDTH, HEIGHT = 1920, 1080
+TARGET_FPS = 30
+DURATION_SEC = 5.0
+MODES = ("queue", "ring")
+
+
+def _child_cpu_sec() -> float:
+    t = os.times()
+    return t.children_user + t.children_system
+
+
+def _cpu_sec() -> float:
+    t = os.times()
+    return t.user + t.system
+
+
+def _producer(mode: str, camera_id: str, out: Any, start: Any) -> None:
+    base = np.zeros((HEIGHT, WIDTH, 3), np.uint8)
+    ring = FrameRing.create(base.shape, DEFAULT_RING_SLOTS) if mode == "ring" else None
+    start.wait()
+    period = 1.0 / TARGET_FPS
+    t0 = monotonic()
+    index = 0
+    while monotonic() - t0 < DURATION_SEC:
+        base[0, 0, 0] = index % 256
+        captured = monotonic_ns()
+        if ring is None:
+            out.put((camera_id, index, captured, base))
+        else:
+            slot, seq = ring.write(base, index, None, captured)
+            desc = FrameDescriptor(
+                camera_id, ring.name, slot, seq, index, None, captured
+            )
+            out.put(desc)
+        index += 1
+        sleep(max(0.0, t0 + index * period - monotonic()))
+    out.put(None)
+    out.close()
+    out.join_thread()
+    if ring is not None:
+        sleep(0.5)  # 親が残りの記述子を処理するまでリングを残す
+        ring.close()
+
+
+def _run(mode: str) -> Dict[str, Any]:
+    ctx = mp.get_context("spawn")
+    out = ctx.Queue()
+    start = ctx.Event()
+    procs = [
+        ctx.Process(target=_producer, args=(mode, f"cam{i}", out, start), daemon=True)
+        for i in range(CAMERAS)
+    ]
+    for p in procs:
+        p.start()
+    hub = FrameRingHub()
+    sleep(1.0)  # 子の起動 (import) を計測から外す
+    cpu0, child0 = _cpu_sec(), _child_cpu_sec()
+    start.set()
+    t0 = last = monotonic()
+    latencies: List[int] = []
+    stale, done, received = 0, 0, 0
+    checksum = 0
+    while done < CAMERAS:
+        try:
+            item = out.get(timeout=5.0)
+        except queue.Empty:
+            break
+        if item is None:
+            done += 1
+            continue
+        if isinstance(item, FrameDescriptor):
+            ring = hub.ring(item)
+            if ring is None:
+                continue
+            checksum += int(ring.view(item.slot)[0, 0, 0])
+            if not ring.is_current(item.slot, item.seq):
+                stale += 1
+                continue
+            captured = item.captured_ns
+        else:
+            _, _, captured, frame = item
+            checksum += int(frame[0, 0, 0])
+        latencies.append(monotonic_ns() - captured)
+        received += 1
+        last = monotonic()
+    elapsed = last - t0
+    for p in procs:
+        p.join(timeout=5)
+    cpu1, child1 = _cpu_sec(), _child_cpu_sec()
+    hub.close()
+    lat = np.array(latencies, dtype=np.float64) / 1e6
+    return {
+        "fps": received / CAMERAS / max(elapsed, DURATION_SEC),
+        "lat_p50_ms": float(np.percentile(lat, 50)) if lat.size else float("nan"),
+        "lat_p99_ms": float(np.percentile(lat, 99)) if lat.size else float("nan"),
+        "parent_cpu_pct": (cpu1 - cpu0) / elapsed * 100,
+        "child_cpu_pct": (child1 - child0) / elapsed * 100,
+        "stale": stale,
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    mb = WIDTH * HEIGHT * 3 / 1e6
+    print(
+        f"cameras={CAMERAS} frame={WIDTH}x{HEIGHT} bgr24 ({mb:.1f} MB)"
+        f" target={TARGET_FPS}fps duration={DURATION_SEC}s"
+    )
+    header: Tuple[str, ...] = (
+        "mode",
+        "fps",
+        "lat_p50_ms",
+        "lat_p99_ms",
+        "parent_cpu_%",
+        "child_cpu_%",
+        "stale",
+    )
+    print(" ".join(f"{h:>12}" for h in header))
+    for mode in MODES:
+        row: Dict[str, Any] = {"mode": mode}
+        row.update(_run(mode))
+        rows.append(row)
+        print(
+            f"{mode:>12} {row['fps']:>12.1f} {row['lat_p50_ms']:>12.2f}"
+            f" {row['lat_p99_ms']:>12.2f} {row['parent_cpu_pct']:>12.1f}"
+            f" {row['child_cpu_pct']:>12.1f} {row['stale']:>12}"
+        )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
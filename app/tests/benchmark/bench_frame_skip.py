@@ -0,0 +1,142 @@
+"""適応フレーム間引き (AdaptiveFrameSkipper) の過負荷時ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_frame_skip``
+
+条件:
+    WORKERS 個の spawn プロセスが SyntheticFrameSource (WIDTH x HEIGHT) を TARGET_FPS で取得し
+    NumpyKeypointBackend で推論する (約 5ms / フレーム)。CPU 需要 (約 1.2 CPU) が供給を超える
+    過負荷条件 (1 CPU 環境)。各 worker のフレーム位相は 1 / (WORKERS x TARGET_FPS) 秒ずつずらす。
+    結果キューは QUEUE_MAXSIZE (満杯時は最古破棄)、親は ResultRecord を全件受信する。
+    off: 間引きなし / on: latency_target_ms=TARGET_P95_MS, min_fps=MIN_FPS。
+計測 (全 worker 合計 / 平均):
+    processed_s: 推論したフレーム数 / 秒
+    delivered_s: 親へ届いた結果 / 秒
+    wasted_pct: 推論したが結果キューで破棄された割合 (%)
+    p95_ms: 届いた結果の latency_ms の p95 (制御が収束した WARMUP_SEC 以降の定常状態)
+    skipped_s: 取得後に間引いたフレーム数 / 秒
+    late_s: 期限に追い付かずペーシングで飛ばしたフレーム期限数 / 秒 (FramePacer skip)
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from queue import Empty
+from datetime import timedelta
+from time import monotonic, sleep
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.scripts.core import utils_time
+from app.scripts.core.frame_source import SyntheticFrameSource
+from app.scripts.core.inference import NumpyKeypointBackend
+from app.scripts.core.messages import ResultRecord
+from app.scripts.core.worker import CaptureInferenceWorker
+
+WORKERS = 8
+TARGET_FPS = 30
+WIDTH, HEIGHT = 640, 480
+DURATION_SEC = 8.0
+QUEUE_MAXSIZE = 256
+TARGET_P95_MS = 30.0
+MIN_FPS = 2.0
+WARMUP_SEC = 3.0
+
+
+class _CountingBackend(NumpyKeypointBackend):
+    """推論したフレーム数を数える (worker の統計は 1 秒窓でリセットされるため)。"""
+
+    inferred = 0
+
+    def infer_batch(self, frames: Sequence[Any], pixel_format: str) -> Any:
+        self.inferred += len(frames)
+        return super().infer_batch(frames, pixel_format)
+
+
+def _worker_main(index: int, q: Any, target_ms: Optional[float]) -> None:
+    backend = _CountingBackend()
+    backend.load()
+    backend.warmup()
+    backend.inferred = 0
+    worker = CaptureInferenceWorker(
+        f"cam{index}",
+        q,
+        target_fps=TARGET_FPS,
+        frame_source=SyntheticFrameSource(WIDTH, HEIGHT, prefetch=0),
+        inference_backend=backend,
+        latency_target_ms=target_ms,
+        min_fps=MIN_FPS,
+    )
+    # 実カメラ同様にフレーム位相をずらす (全 worker が同時に推論しないように)
+    sleep(index / WORKERS / TARGET_FPS)
+    until = monotonic() + DURATION_SEC
+    while monotonic() < until:
+        worker.run_loop(iterations=1)
+    worker.close()
+    skipped = worker.skipper.skipped if worker.skipper else 0
+    q.put(("done", backend.inferred, skipped, worker.skipped_deadlines))
+
+
+def _run(target_ms: Optional[float]) -> Dict[str, float]:
+    ctx = mp.get_context("spawn")
+    q = ctx.Queue(maxsize=QUEUE_MAXSIZE)
+    procs = [
+        ctx.Process(target=_worker_main, args=(i, q, target_ms))
+        for i in range(WORKERS)
+    ]
+    for p in procs:
+        p.start()
+    steady_from = utils_time.now_utc() + timedelta(seconds=WARMUP_SEC)
+    delivered = 0
+    latencies: List[float] = []
+    done: List[Any] = []
+    while len(done) < WORKERS:
+        try:
+            item = q.get(timeout=0.5)
+        except Empty:
+            if not any(p.is_alive() for p in procs):
+                break
+            continue
+        if isinstance(item, ResultRecord):
+            delivered += 1
+            if item.timestamp_utc >= steady_from:
+                latencies.append(item.latency_ms or 0.0)
+        elif isinstance(item, tuple) and item[0] == "done":
+            done.append(item)
+    for p in procs:
+        p.join()
+    processed = sum(d[1] for d in done)
+    skipped = sum(d[2] for d in done)
+    late = sum(d[3] for d in done)
+    latencies.sort()
+    return {
+        "processed_s": processed / DURATION_SEC,
+        "delivered_s": delivered / DURATION_SEC,
+        "wasted_pct": (processed - delivered) / processed * 100 if processed else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+        "skipped_s": skipped / DURATION_SEC,
+        "late_s": late / DURATION_SEC,
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(
+        f"workers={WORKERS} fps={TARGET_FPS} {WIDTH}x{HEIGHT} duration={DURATION_SEC}s"
+        f" queue={QUEUE_MAXSIZE} target_p95={TARGET_P95_MS}ms min_fps={MIN_FPS}"
+    )
+    print(
+        f"{'mode':>5} {'processed_s':>12} {'delivered_s':>12} {'wasted_%':>9}"
+        f" {'p95_ms':>8} {'skipped_s':>10} {'late_s':>7}"
+    )
+    for mode, target in (("off", None), ("on", TARGET_P95_MS)):
+        row = {"mode": mode, **_run(target)}
+        rows.append(row)
+        print(
+            f"{mode:>5} {row['processed_s']:>12.1f} {row['delivered_s']:>12.1f}"
+            f" {row['wasted_pct']:>9.1f} {row['p95_ms']:>8.1f}"
+            f" {row['skipped_s']:>10.1f} {row['late_s']:>7.1f}"
+        )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
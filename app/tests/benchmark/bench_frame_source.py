@@ -0,0 +1,123 @@
+"""フレーム入力 (frame_source) の取得コストと先読みの効果ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_frame_source``
+
+比較対象:
+    read_copy: 生映像ファイルを f.read() で 1 フレームずつ bytes へ読み ndarray 化 (コピーあり)
+    raw_mmap: RawVideoSource (mmap 上のビュー, コピーなし)
+    y4m_mmap: Y4MSource (同上, FRAME ヘッダ付き)
+    npy_seq: ImageSequenceSource (.npy, mmap_mode="r")
+    synthetic: SyntheticFrameSource (gradient, 毎フレーム生成)
+条件:
+    WIDTH x HEIGHT (i420, 合成は bgr24) を FRAMES フレーム。各フレームで擬似処理
+    (PROC_MS の sleep + 画素の総和 = 全ページ参照) を行う。prefetch=0 / 2 を比較。
+計測:
+    wait_us: read() の待ち時間 / フレーム (処理と重ならなかった取得コスト)
+    total_ms: 取得 + 処理の 1 フレーム当たり時間
+"""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from time import perf_counter_ns, sleep
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from app.scripts.core.frame_source import (
+    PIXEL_I420,
+    ImageSequenceSource,
+    RawVideoSource,
+    SyntheticFrameSource,
+    Y4MSource,
+    frame_shape,
+)
+
+WIDTH, HEIGHT = 1280, 720
+FRAMES = 120
+PROC_MS = 5.0
+PREFETCH_LEVELS = (0, 2)
+
+
+def _write_inputs(root: Path) -> Dict[str, Path]:
+    shape = frame_shape(PIXEL_I420, WIDTH, HEIGHT)
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, shape, dtype=np.uint8) for _ in range(8)]
+    raw, y4m, seq = root / "clip.yuv", root / "clip.y4m", root / "seq"
+    seq.mkdir()
+    with raw.open("wb") as r, y4m.open("wb") as y:
+        y.write(f"YUV4MPEG2 W{WIDTH} H{HEIGHT} F30:1 C420jpeg\n".encode())
+        for i in range(FRAMES):
+            data = frames[i % len(frames)].tobytes()
+            r.write(data)
+            y.write(b"FRAME\n" + data)
+            np.save(seq / f"{i:05d}.npy", frames[i % len(frames)])
+    return {"raw": raw, "y4m": y4m, "seq": seq}
+
+
+def _read_copy(path: Path) -> Iterator[Optional[np.ndarray]]:
+    shape = frame_shape(PIXEL_I420, WIDTH, HEIGHT)
+    size = int(np.prod(shape))
+    with path.open("rb") as f:
+        while len(buf := f.read(size)) == size:
+            yield np.frombuffer(buf, np.uint8).reshape(shape)
+    while True:
+        yield None
+
+
+def _measure(read: Callable[[], Any]) -> Dict[str, float]:
+    wait_ns = 0
+    frames = 0
+    t0 = perf_counter_ns()
+    while True:
+        r0 = perf_counter_ns()
+        frame = read()
+        wait_ns += perf_counter_ns() - r0
+        if frame is None:
+            break
+        data = frame if isinstance(frame, np.ndarray) else frame.data
+        sleep(PROC_MS / 1000)
+        int(data.sum(dtype=np.uint64))  # 全画素参照 (ページフォールト込み)
+        frames += 1
+    total = perf_counter_ns() - t0
+    return {"wait_us": wait_ns / frames / 1e3, "total_ms": total / frames / 1e6}
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(f"{WIDTH}x{HEIGHT} frames={FRAMES} proc={PROC_MS}ms")
+    print(f"{'source':>10} {'prefetch':>9} {'wait_us':>9} {'total_ms':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_inputs(Path(tmp))
+        factories: Dict[str, Callable[[int], Any]] = {
+            "raw_mmap": lambda p: RawVideoSource(
+                paths["raw"], WIDTH, HEIGHT, PIXEL_I420, prefetch=p
+            ),
+            "y4m_mmap": lambda p: Y4MSource(paths["y4m"], prefetch=p),
+            "npy_seq": lambda p: ImageSequenceSource(paths["seq"], prefetch=p),
+            "synthetic": lambda p: SyntheticFrameSource(
+                WIDTH, HEIGHT, frames=FRAMES, prefetch=p
+            ),
+        }
+        copy = _read_copy(paths["raw"])
+        cases: List[tuple[str, int, Callable[[], Any], Callable[[], None]]] = [
+            ("read_copy", 0, lambda: next(copy), lambda: None)
+        ]
+        for name, factory in factories.items():
+            for prefetch in PREFETCH_LEVELS:
+                src = factory(prefetch)
+                cases.append((name, prefetch, src.read, src.close))
+        for name, prefetch, read, close in cases:
+            row = {"source": name, "prefetch": prefetch, **_measure(read)}
+            close()
+            rows.append(row)
+            print(
+                f"{name:>10} {prefetch:>9} {row['wait_us']:>9.1f}"
+                f" {row['total_ms']:>9.2f}"
+            )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
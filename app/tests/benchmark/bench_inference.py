@@ -0,0 +1,89 @@
+"""NumPy 参照キーポイントモデルのバッチサイズ別 推論コスト / メモリベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_inference``
+
+条件:
+    SyntheticFrameSource (noise) の WIDTH x HEIGHT フレームを BATCH_SIZES 件ずつ
+    NumpyKeypointBackend (既定構成: input_size=192, keypoints=21) へ渡す。
+計測:
+    pre_ms: 前処理 (輝度抽出 + 縮小 + 正規化) / フレーム
+    total_ms: infer_batch 全体 / フレーム (前処理 + 畳込み + 後処理)
+    peak_mb: infer_batch 1 回のピーク追加メモリ (tracemalloc, numpy 配列を含む)
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from time import perf_counter
+from typing import Any, Dict, List
+
+from app.scripts.core.frame_source import PIXEL_BGR24, PIXEL_I420, SyntheticFrameSource
+from app.scripts.core.inference import NumpyKeypointBackend
+
+WIDTH, HEIGHT = 1280, 720
+BATCH_SIZES = (1, 2, 4, 8, 16)
+PIXEL_FORMATS = (PIXEL_BGR24, PIXEL_I420)
+FRAMES = 64
+
+
+def _frames(pixel_format: str) -> List[Any]:
+    src = SyntheticFrameSource(
+        WIDTH, HEIGHT, pixel_format, frames=16, pattern="noise", prefetch=0
+    )
+    frames = [f.data for f in iter(src.read, None)]
+    src.close()
+    return frames
+
+
+def _per_frame_ms(fn: Any, batches: int, batch: int) -> float:
+    t0 = perf_counter()
+    for _ in range(batches):
+        fn()
+    return (perf_counter() - t0) / (batches * batch) * 1e3
+
+
+def main() -> List[Dict[str, Any]]:
+    backend = NumpyKeypointBackend()
+    backend.load()
+    backend.warmup(3)
+    rows: List[Dict[str, Any]] = []
+    print(
+        f"{WIDTH}x{HEIGHT} input={backend.input_size}"
+        f" weights={backend.weight_bytes}B"
+    )
+    print(
+        f"{'format':>7} {'batch':>6} {'pre_ms':>7} {'total_ms':>9} {'fps_1cpu':>9}"
+        f" {'peak_mb':>8}"
+    )
+    for pixel_format in PIXEL_FORMATS:
+        pool = _frames(pixel_format)
+        for batch in BATCH_SIZES:
+            frames = [pool[i % len(pool)] for i in range(batch)]
+            batches = max(1, FRAMES // batch)
+            pre = _per_frame_ms(
+                lambda: backend.preprocess(frames, pixel_format), batches, batch
+            )
+            total = _per_frame_ms(
+                lambda: backend.infer_batch(frames, pixel_format), batches, batch
+            )
+            tracemalloc.start()
+            backend.infer_batch(frames, pixel_format)
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+            row = {
+                "format": pixel_format,
+                "batch": batch,
+                "pre_ms": pre,
+                "total_ms": total,
+                "peak_mb": peak,
+            }
+            rows.append(row)
+            print(
+                f"{pixel_format:>7} {batch:>6} {pre:>7.2f} {total:>9.2f}"
+                f" {1e3 / total:>9.0f} {peak:>8.1f}"
+            )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,137 @@
+"""キーポイント平滑化 (One-Euro) のフレーム当たりコスト ベンチマーク (ベクトル化 vs 点毎ループ)。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_keypoint_filter``
+
+条件:
+    HANDS 手 x 21 点の手が円運動 (SCENARIOS: 周波数 Hz, 半径) し、座標にガウスノイズ
+    (NOISE) を加えたフレームを FPS 間隔の時刻で FRAMES フレーム与える。
+    vector: OneEuroKeypointFilter.update (対応付け込み, 1 フレーム 1 回の配列演算)
+    loop: 同じ式を点 x 座標毎の Python スカラー計算で行う参照実装 (対応付けなし)
+計測:
+    us_frame: フレーム当たりの処理時間 (µs, slow シナリオ)
+    cams_at_10pct: 30fps のカメラを CPU 1 コアの 10% で何台平滑化できるか (us_frame から換算)
+    err_raw / err_smooth: 真値との平均絶対誤差 (正規化座標, 先頭 1 秒を除く。vector, 1 手)
+"""
+
+from __future__ import annotations
+
+import math
+from time import perf_counter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from app.scripts.core.keypoint_filter import (
+    DEFAULT_BETA,
+    DEFAULT_D_CUTOFF,
+    DEFAULT_MIN_CUTOFF,
+    OneEuroKeypointFilter,
+)
+
+K = 21
+FPS = 30.0
+FRAMES = 3000
+NOISE = 0.01
+HANDS_LIST = (1, 2)
+# 名前 -> (円運動の周波数 Hz, 半径)。fast は約 0.9 / 秒 (手を振る程度)
+SCENARIOS: Dict[str, Tuple[float, float]] = {
+    "static": (0.0, 0.0),
+    "slow": (0.25, 0.1),
+    "fast": (1.0, 0.15),
+}
+
+
+class _LoopOneEuro:
+    """点 x 座標毎にスカラーの One-Euro を持つ素朴な実装 (比較用)。"""
+
+    def __init__(self, hands: int) -> None:
+        n = hands * K * 2
+        self._x: List[float] = [0.0] * n
+        self._dx: List[float] = [0.0] * n
+        self._t = -1.0
+
+    @staticmethod
+    def _alpha(cutoff: float, dt: float) -> float:
+        return 1.0 / (1.0 + 1.0 / (2.0 * math.pi * cutoff * dt))
+
+    def update(self, keypoints: np.ndarray, t: float) -> np.ndarray:
+        out = keypoints.copy()
+        flat = keypoints[..., :2].reshape(-1).tolist()
+        if self._t < 0:
+            self._x = flat
+            self._t = t
+            return out
+        dt = max(t - self._t, 1e-4)
+        a_d = self._alpha(DEFAULT_D_CUTOFF, dt)
+        res = []
+        for i, x in enumerate(flat):
+            x_prev = self._x[i]
+            dx = a_d * ((x - x_prev) / dt) + (1.0 - a_d) * self._dx[i]
+            a = self._alpha(DEFAULT_MIN_CUTOFF + DEFAULT_BETA * abs(dx), dt)
+            x_hat = x_prev + a * (x - x_prev)
+            self._x[i] = x_hat
+            self._dx[i] = dx
+            res.append(x_hat)
+        self._t = t
+        out[..., :2] = np.asarray(res, np.float32).reshape(keypoints[..., :2].shape)
+        return out
+
+
+def _frames(hands: int, scenario: str) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    t = np.arange(FRAMES) / FPS
+    hz, radius = SCENARIOS[scenario]
+    base = np.zeros((FRAMES, hands, K, 3), np.float32)
+    for h in range(hands):
+        cx = 0.3 + 0.4 * h + radius * np.cos(t * 2 * math.pi * hz)
+        cy = 0.5 + radius * np.sin(t * 2 * math.pi * hz)
+        base[:, h, :, 0] = cx[:, None] + np.linspace(-0.03, 0.03, K)
+        base[:, h, :, 1] = cy[:, None]
+        base[:, h, :, 2] = 0.9
+    noisy = base.copy()
+    noisy[..., :2] += rng.normal(0, NOISE, noisy[..., :2].shape).astype(np.float32)
+    return base, noisy
+
+
+def _run(kind: str, hands: int, scenario: str = "slow") -> Dict[str, Any]:
+    truth, noisy = _frames(hands, scenario)
+    filt: Any = OneEuroKeypointFilter(K) if kind == "vector" else _LoopOneEuro(hands)
+    out = np.empty_like(noisy)
+    t0 = perf_counter()
+    for i in range(FRAMES):
+        res = filt.update(noisy[i], i / FPS)
+        out[i] = res[0] if kind == "vector" else res
+    us = (perf_counter() - t0) / FRAMES * 1e6
+    skip = int(FPS)
+    return {
+        "us_frame": us,
+        "cams_at_10pct": 0.1 * 1e6 / (us * FPS),
+        "err_raw": float(np.abs(noisy - truth)[skip:, ..., :2].mean()),
+        "err_smooth": float(np.abs(out - truth)[skip:, ..., :2].mean()),
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(f"keypoints={K} fps={FPS} frames={FRAMES} noise={NOISE}")
+    print(f"{'hands':>5} {'impl':>6} {'us_frame':>9} {'cams_at_10pct':>14}")
+    for hands in HANDS_LIST:
+        for kind in ("loop", "vector"):
+            row: Dict[str, Any] = {"hands": hands, "impl": kind}
+            row.update(_run(kind, hands))
+            rows.append(row)
+            print(
+                f"{hands:>5} {kind:>6} {row['us_frame']:>9.1f}"
+                f" {row['cams_at_10pct']:>14.0f}"
+            )
+    print(f"{'scenario':>8} {'err_raw':>8} {'err_smooth':>11}")
+    for scenario in SCENARIOS:
+        row = {"scenario": scenario}
+        row.update(_run("vector", 1, scenario))
+        rows.append(row)
+        print(f"{scenario:>8} {row['err_raw']:>8.4f} {row['err_smooth']:>11.4f}")
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,154 @@
+"""キーポイント付き結果のシリアライズ / 集約メモリ ベンチマーク (タプル列 vs 固定 dtype 配列)。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_keypoints``
+
+条件:
+    1 レコードに HANDS 手 x 21 点 x (x, y, score) のキーポイントを載せる。
+    naive: Python のタプル列 (手毎に 21 個の (x, y, score) タプル) を ResultRecord に載せる
+    inline: KeypointPayload (float32 バイト列)
+    shared: KeypointPayload (共有メモリリングの位置のみ。親で inline へ解決)
+    none: キーポイントなし (基準)
+計測:
+    pickle_B: ResultBatch (BATCH 件) の pickle サイズをレコード当たりに換算
+    ser_us: ResultBatch の dumps + loads 時間 (レコード当たり)
+    resolve_us: shared の親側解決 (KeypointResolver.resolve_all) 時間 (レコード当たり)
+    agg_B (object / columnar): Aggregator に RECORDS 件保持した際の増分メモリ (レコード当たり,
+        tracemalloc)。naive は columnar に保持できない (キーポイントを捨てる) ため object のみ
+"""
+
+from __future__ import annotations
+
+import gc
+import pickle
+import tracemalloc
+from datetime import timedelta
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.scripts.core import utils_time
+from app.scripts.core.aggregator import Aggregator
+from app.scripts.core.keypoints import (
+    KEYPOINTS_INLINE,
+    KEYPOINTS_SHARED,
+    KeypointResolver,
+    KeypointWriter,
+)
+from app.scripts.core.messages import ResultBatch, ResultRecord
+from app.scripts.core.result_store import STORAGE_COLUMNAR, STORAGE_OBJECT
+
+BATCH = 32
+RECORDS = 20_000
+SER_REPEAT = 300
+HANDS_LIST = (1, 2)
+KEYPOINTS = 21
+FORMATS = ("none", "naive", "inline", "shared")
+
+
+def _naive(arr: np.ndarray) -> Any:
+    return [[tuple(float(v) for v in point) for point in hand] for hand in arr]
+
+
+def _records(
+    fmt: str, hands: int, n: int, writer: Optional[KeypointWriter]
+) -> List[ResultRecord]:
+    rng = np.random.default_rng(0)
+    t0 = utils_time.now_utc()
+    out: List[ResultRecord] = []
+    for i in range(n):
+        arr = rng.random((hands, KEYPOINTS, 3), dtype=np.float32)
+        if fmt == "naive":
+            kp: Any = _naive(arr)
+        elif writer is not None:
+            kp = writer.pack(arr)
+        else:
+            kp = None
+        ts = t0 + timedelta(microseconds=i)
+        out.append(ResultRecord("cam", ts, "gesture_a", 0.9, 1.0, kp))
+    return out
+
+
+def _per_record_us(fn: Callable[[], Any], records: int) -> float:
+    t0 = perf_counter()
+    for _ in range(SER_REPEAT):
+        fn()
+    return (perf_counter() - t0) / SER_REPEAT / records * 1e6
+
+
+def _agg_bytes(storage: str, make: Callable[[int], Sequence[ResultRecord]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    agg = Aggregator(capacity=RECORDS, storage=storage)
+    base = tracemalloc.get_traced_memory()[0]
+    for _ in range(RECORDS // 1000):
+        agg.push_results(make(1000))
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del agg
+    return used / RECORDS
+
+
+def _writer(fmt: str) -> Optional[KeypointWriter]:
+    mode = {"inline": KEYPOINTS_INLINE, "shared": KEYPOINTS_SHARED}.get(fmt)
+    return None if mode is None else KeypointWriter(mode, slots=RECORDS)
+
+
+def _run(fmt: str, hands: int) -> Dict[str, Any]:
+    writer = _writer(fmt)
+    resolver = KeypointResolver()
+    try:
+        recs = tuple(_records(fmt, hands, BATCH, writer))
+        batch = ResultBatch("cam", recs)
+        row: Dict[str, Any] = {
+            "pickle_B": len(pickle.dumps(batch)) / BATCH,
+            "ser_us": _per_record_us(
+                lambda: pickle.loads(pickle.dumps(batch)), BATCH
+            ),
+            "resolve_us": (
+                _per_record_us(lambda: resolver.resolve_all(recs), BATCH)
+                if fmt == "shared"
+                else float("nan")
+            ),
+        }
+
+        def make(n: int) -> Sequence[ResultRecord]:
+            made = _records(fmt, hands, n, writer)
+            if fmt != "shared":
+                return made
+            return list(resolver.resolve_all(made))  # 親で解決済みを保持
+
+        row["agg_object_B"] = _agg_bytes(STORAGE_OBJECT, make)
+        row["agg_columnar_B"] = (
+            float("nan") if fmt == "naive" else _agg_bytes(STORAGE_COLUMNAR, make)
+        )
+        return row
+    finally:
+        resolver.close()
+        if writer is not None:
+            writer.close()
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(f"keypoints={KEYPOINTS} batch={BATCH} records={RECORDS}")
+    print(
+        f"{'hands':>5} {'format':>7} {'pickle_B':>9} {'ser_us':>7} {'resolve_us':>11}"
+        f" {'agg_object_B':>13} {'agg_columnar_B':>15}"
+    )
+    for hands in HANDS_LIST:
+        for fmt in FORMATS:
+            row: Dict[str, Any] = {"hands": hands, "format": fmt}
+            row.update(_run(fmt, hands))
+            rows.append(row)
+            print(
+                f"{hands:>5} {fmt:>7} {row['pickle_B']:>9.0f} {row['ser_us']:>7.2f}"
+                f" {row['resolve_us']:>11.2f} {row['agg_object_B']:>13.0f}"
+                f" {row['agg_columnar_B']:>15.0f}"
+            )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
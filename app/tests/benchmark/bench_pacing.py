@@ -0,0 +1,150 @@
+"""worker フレームペーシングの精度 / ジッタ / 待機 CPU ベンチマーク (50 プロセス)。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_pacing``
+
+比較対象:
+    legacy: 旧実装 (1 フレーム毎に frame_interval - 処理時間 だけ sleep、制御キューは
+            get_nowait ポーリング、プロセスループで sleep(min(1ms, interval/10))) を本ファイル内で再現
+    pacer: CaptureInferenceWorker.run_loop (絶対期限 + 制御キュー blocking 待機)
+条件:
+    WORKERS 個の spawn プロセスが FPS_LEVELS の各 FPS で DURATION_SEC 秒フレームを生成
+    (擬似推論 SIM_LATENCY_MS)。各プロセスは実キュー (multiprocessing.Queue) を制御キューに持つ。
+    結果は送信せずプロセス内で生成時刻のみ記録する。
+計測 (全 worker 平均):
+    fps_err_pct: 実測 FPS の目標からの誤差 (%)
+    jitter_ms: フレーム間隔の目標間隔からの偏差の標準偏差 / p99 (ms)
+    cpu_pct: worker 1 プロセス当たりの CPU 使用率 (%)
+    wakeups_s: worker 1 プロセス当たりの自発的コンテキストスイッチ数 / 秒 (待機からの起床回数)
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import queue
+import resource
+import statistics
+from time import monotonic, monotonic_ns, perf_counter_ns, sleep
+from typing import Any, Dict, List
+
+from app.scripts.core.messages import ResultBatch, ResultRecord
+from app.scripts.core.worker import CaptureInferenceWorker
+
+WORKERS = 50
+FPS_LEVELS = (30, 5)
+DURATION_SEC = 5.0
+SIM_LATENCY_MS = 2.0
+
+
+class _Sink:
+    """結果キューの代替: 送信せずレコード生成時刻 (ns) のみ記録する。"""
+
+    def __init__(self) -> None:
+        self.stamps: List[int] = []
+
+    def put_nowait(self, item: Any) -> None:
+        if isinstance(item, (ResultRecord, ResultBatch)):
+            self.stamps.append(monotonic_ns())
+
+    def get_nowait(self) -> Any:
+        raise queue.Empty
+
+    def full(self) -> bool:
+        return False
+
+
+def _legacy_loop(worker: CaptureInferenceWorker, fps: int, until: float) -> None:
+    interval = 1.0 / fps
+    i = 0
+    while monotonic() < until:
+        loop_start = perf_counter_ns()
+        worker._process_control()
+        worker._generate_one(i)
+        remaining = interval - (perf_counter_ns() - loop_start) / 1e9
+        if remaining > 0:
+            sleep(remaining)
+        sleep(min(0.001, interval / 10))
+        i += 1
+
+
+def _worker_main(mode: str, target_fps: int, control: Any, out: Any) -> None:
+    sink = _Sink()
+    worker = CaptureInferenceWorker(
+        "cam",
+        sink,
+        target_fps=target_fps,
+        simulate_latency_ms=SIM_LATENCY_MS,
+        control_queue=control,
+    )
+    usage0 = resource.getrusage(resource.RUSAGE_SELF)
+    t0 = monotonic()
+    until = t0 + DURATION_SEC
+    if mode == "legacy":
+        _legacy_loop(worker, target_fps, until)
+    else:
+        while monotonic() < until:
+            worker.run_loop(iterations=1)
+    wall = monotonic() - t0
+    usage1 = resource.getrusage(resource.RUSAGE_SELF)
+    cpu = (usage1.ru_utime - usage0.ru_utime) + (usage1.ru_stime - usage0.ru_stime)
+    interval_ns = 1e9 / target_fps
+    stamps = sink.stamps
+    dev_ms = [((b - a) - interval_ns) / 1e6 for a, b in zip(stamps, stamps[1:])]
+    fps = (len(stamps) - 1) / ((stamps[-1] - stamps[0]) / 1e9)
+    out.put(
+        {
+            "fps": fps,
+            "jitter_sd": statistics.pstdev(dev_ms),
+            "jitter_p99": sorted(abs(d) for d in dev_ms)[int(len(dev_ms) * 0.99)],
+            "cpu_pct": cpu / wall * 100,
+            "wakeups_s": (usage1.ru_nvcsw - usage0.ru_nvcsw) / wall,
+        }
+    )
+
+
+def _run(mode: str, target_fps: int) -> Dict[str, float]:
+    ctx = mp.get_context("spawn")
+    out = ctx.Queue()
+    controls = [ctx.Queue(maxsize=16) for _ in range(WORKERS)]
+    procs = [
+        ctx.Process(target=_worker_main, args=(mode, target_fps, controls[i], out))
+        for i in range(WORKERS)
+    ]
+    for p in procs:
+        p.start()
+    rows = [out.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return {
+        "fps_err_pct": statistics.mean(
+            abs(r["fps"] - target_fps) / target_fps * 100 for r in rows
+        ),
+        "jitter_sd_ms": statistics.mean(r["jitter_sd"] for r in rows),
+        "jitter_p99_ms": statistics.mean(r["jitter_p99"] for r in rows),
+        "cpu_pct": statistics.mean(r["cpu_pct"] for r in rows),
+        "wakeups_s": statistics.mean(r["wakeups_s"] for r in rows),
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(
+        f"workers={WORKERS} duration={DURATION_SEC}s sim_latency={SIM_LATENCY_MS}ms"
+    )
+    print(
+        f"{'fps':>4} {'mode':>7} {'fps_err_%':>10} {'jitter_sd_ms':>13}"
+        f" {'jitter_p99_ms':>14} {'cpu_%':>7} {'wakeups_s':>10}"
+    )
+    for fps in FPS_LEVELS:
+        for mode in ("legacy", "pacer"):
+            row = {"fps": fps, "mode": mode, **_run(mode, fps)}
+            rows.append(row)
+            print(
+                f"{fps:>4} {mode:>7} {row['fps_err_pct']:>10.2f}"
+                f" {row['jitter_sd_ms']:>13.3f} {row['jitter_p99_ms']:>14.3f}"
+                f" {row['cpu_pct']:>7.2f} {row['wakeups_s']:>10.1f}"
+            )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,102 @@
+"""cameras_per_process (1 プロセス当たりのカメラ数) 別の worker メモリ / 起動時間ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_process_packing``
+
+条件:
+    Orchestrator (use_process=True) で CAMERAS 台を起動する。開始方式は START_METHODS
+    (Orchestrator は設定済みの方式を使う。Linux の既定は fork, Windows / macOS は spawn)。
+    stub: フレーム入力なしの擬似推論 / numpy: SyntheticFrameSource (WIDTH x HEIGHT) +
+    NumpyKeypointBackend (プロセス当たり 1 回 load)。いずれも TARGET_FPS。
+計測:
+    procs: worker プロセス数
+    ready_s: start() から全カメラが PING に応答するまでの時間
+    rss_mb: worker プロセス RSS の合計 (起動後 SETTLE_SEC)
+    pss_mb: worker プロセス PSS の合計 (共有ページを按分, /proc/<pid>/smaps_rollup)
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from pathlib import Path
+from time import monotonic, sleep
+from typing import Any, Dict, List, Sequence, Tuple
+
+from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
+
+CAMERAS = 32
+TARGET_FPS = 5
+WIDTH, HEIGHT = 320, 240
+SETTLE_SEC = 2.0
+START_METHODS = ("spawn", "fork")
+SCENARIOS: Sequence[Tuple[str, int]] = (
+    ("stub", 1),
+    ("stub", 4),
+    ("stub", 8),
+    ("stub", 32),
+    ("numpy", 1),
+    ("numpy", 8),
+)
+
+
+def _proc_kb(pid: int, path: str, key: str) -> int:
+    for line in Path(f"/proc/{pid}/{path}").read_text().splitlines():
+        if line.startswith(key):
+            return int(line.split()[1])
+    return 0
+
+
+def _run(backend: str, per_process: int) -> Dict[str, Any]:
+    cams = [f"cam{i:02d}" for i in range(CAMERAS)]
+    numpy = backend == "numpy"
+    cfg = OrchestratorConfig(
+        camera_ids=cams,
+        use_process=True,
+        cameras_per_process=per_process,
+        target_fps=TARGET_FPS,
+        worker_latency_ms=0.0,
+        ping_interval_sec=0.1,
+        ping_timeout_sec=30.0,
+        camera_sources=(
+            {c: f"synthetic://{WIDTH}x{HEIGHT}" for c in cams} if numpy else None
+        ),
+        inference_backend="numpy_keypoint" if numpy else "stub",
+    )
+    orch = Orchestrator(cfg)
+    t0 = monotonic()
+    orch.start()
+    while any(s["last_rtt_ms"] is None for s in orch.health_state.values()):
+        if monotonic() - t0 > 120:
+            break
+        sleep(0.02)
+    ready = monotonic() - t0
+    sleep(SETTLE_SEC)
+    pids = [p.pid for p in orch._worker_procs if p.pid]
+    rss = sum(_proc_kb(pid, "status", "VmRSS:") for pid in pids) / 1024
+    pss = sum(_proc_kb(pid, "smaps_rollup", "Pss:") for pid in pids) / 1024
+    orch.stop()
+    return {"procs": len(pids), "ready_s": ready, "rss_mb": rss, "pss_mb": pss}
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(f"cameras={CAMERAS} fps={TARGET_FPS} settle={SETTLE_SEC}s")
+    print(
+        f"{'start':>6} {'backend':>8} {'per_proc':>9} {'procs':>6} {'ready_s':>8}"
+        f" {'rss_mb':>8} {'pss_mb':>8} {'pss_mb/cam':>11}"
+    )
+    for method in START_METHODS:
+        mp.set_start_method(method, force=True)
+        for backend, per_process in SCENARIOS:
+            row = {"start": method, "backend": backend, "per_process": per_process}
+            row.update(_run(backend, per_process))
+            rows.append(row)
+            print(
+                f"{method:>6} {backend:>8} {per_process:>9} {row['procs']:>6}"
+                f" {row['ready_s']:>8.2f} {row['rss_mb']:>8.0f} {row['pss_mb']:>8.0f}"
+                f" {row['pss_mb'] / CAMERAS:>11.1f}"
+            )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,148 @@
+"""worker プロセスの異常終了から再起動後の最初の結果までの時間 ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_restart``
+
+条件:
+    Orchestrator (use_process=True, max_restarts_per_camera > KILLS) で CAMERAS 台を起動し、
+    1 台目の worker プロセスを SIGKILL する操作を KILLS 回繰り返す (前回の復旧後)。
+    バックオフは 0 (restart_backoff_sec=0) とし、検出と再起動そのものの時間を測る
+    (運用時は設定したバックオフ分が加わる)。
+    各カメラは SyntheticFrameSource (WIDTH x HEIGHT) + NumpyKeypointBackend (TARGET_FPS)。
+    起動方式 (METHODS) 毎に新しいインタプリタで計測する。
+計測:
+    detect_ms: kill から supervisor が終了を検出するまで (health_state の restarts 増加)
+    first_result_ms: kill から再起動した worker の最初の結果が Aggregator に届くまで
+    others_ping_ms: kill から他の全カメラが kill 後に送られた PING に応答するまで
+        (ステータスチャネルはプロセス毎。kill されたプロセスが書込み中に保持した
+        キューのロックが他 worker の PING 応答 / 統計を止めないことの確認。
+        PING 周期 ping_interval_sec=0.5 が下限の目安)
+    (いずれも KILLS 回の中央値と最大)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from time import monotonic, perf_counter, sleep
+from typing import Any, Callable, Dict, List
+
+from app.scripts.core.inference import BACKEND_NUMPY_KEYPOINT
+from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
+from app.scripts.core.worker_template import (
+    START_DEFAULT,
+    START_FORKSERVER,
+    START_SPAWN,
+)
+
+CAMERAS = 4
+KILLS = 5
+TARGET_FPS = 10
+WIDTH, HEIGHT = 320, 240
+METHODS = (START_DEFAULT, START_SPAWN, START_FORKSERVER)
+
+
+def _wait(cond: Callable[[], bool], timeout: float = 60.0) -> None:
+    deadline = monotonic() + timeout
+    while not cond():
+        if monotonic() > deadline:
+            raise TimeoutError("worker did not recover")
+        sleep(0.001)
+
+
+def _answered_ping_since(st: Dict[str, object], since: float) -> bool:
+    sent = st["sent_ts"]
+    return isinstance(sent, float) and sent > since and bool(st["responded"])
+
+
+def _measure(method: str) -> Dict[str, Any]:
+    cams = [f"cam{i:02d}" for i in range(CAMERAS)]
+    orch = Orchestrator(
+        OrchestratorConfig(
+            camera_ids=cams,
+            use_process=True,
+            worker_start_method=method,
+            target_fps=TARGET_FPS,
+            worker_latency_ms=0.0,
+            ping_interval_sec=0.5,
+            ping_timeout_sec=60.0,
+            camera_sources={c: f"synthetic://{WIDTH}x{HEIGHT}" for c in cams},
+            inference_backend=BACKEND_NUMPY_KEYPOINT,
+            max_restarts_per_camera=KILLS + 1,
+            restart_backoff_sec=0.0,
+        )
+    )
+    cam = cams[0]
+    last = orch.aggregator.last_update_dt
+    detect: List[float] = []
+    first: List[float] = []
+    others: List[float] = []
+    orch.start()
+    try:
+        _wait(lambda: all(last(c) is not None for c in cams))
+        for k in range(KILLS):
+            procs = orch._worker_procs
+            proc = next(p for p in procs if p.name == f"WProc-{cam}" and p.is_alive())
+            killed_at = datetime.now(timezone.utc)
+            killed_mono = monotonic()
+            t0 = perf_counter()
+            os.kill(proc.pid, signal.SIGKILL)
+            _wait(lambda: orch.health_state[cam]["restarts"] == k + 1)
+            detect.append((perf_counter() - t0) * 1000)
+            _wait(lambda: (last(cam) or killed_at) > killed_at)
+            first.append((perf_counter() - t0) * 1000)
+            _wait(
+                lambda: all(
+                    _answered_ping_since(st, killed_mono)
+                    for c, st in orch.health_state.items()
+                    if c != cam
+                )
+            )
+            others.append((perf_counter() - t0) * 1000)
+    finally:
+        orch.stop()
+    return {
+        "method": method,
+        "detect_p50_ms": statistics.median(detect),
+        "detect_max_ms": max(detect),
+        "first_result_p50_ms": statistics.median(first),
+        "first_result_max_ms": max(first),
+        "others_ping_p50_ms": statistics.median(others),
+        "others_ping_max_ms": max(others),
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(f"cameras={CAMERAS} kills={KILLS} fps={TARGET_FPS} backoff=0")
+    print(
+        f"{'method':>10} {'detect_p50':>10} {'detect_max':>10}"
+        f" {'first_p50':>10} {'first_max':>10}"
+        f" {'others_p50':>10} {'others_max':>10}  (ms)"
+    )
+    for method in METHODS:
+        proc = subprocess.run(
+            [sys.executable, "-m", __spec__.name, method],  # type: ignore[name-defined]
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        row = json.loads(proc.stdout.strip().splitlines()[-1])
+        rows.append(row)
+        print(
+            f"{method:>10} {row['detect_p50_ms']:>10.1f} {row['detect_max_ms']:>10.1f}"
+            f" {row['first_result_p50_ms']:>10.1f} {row['first_result_max_ms']:>10.1f}"
+            f" {row['others_ping_p50_ms']:>10.1f} {row['others_ping_max_ms']:>10.1f}"
+        )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    if len(sys.argv) > 1:
+        print(json.dumps(_measure(sys.argv[1])))
+    else:
+        main()
@@ -0,0 +1,112 @@
+"""worker→親 結果転送 (プロセスモード) のバッチ有無ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_result_batch``
+
+条件:
+    CAMERAS 個の worker プロセス (spawn) が CaptureInferenceWorker で結果を全速生成し
+    (擬似推論 0ms)、multiprocessing.Queue へ送る。親は dispatcher と同じ振分けで
+    Aggregator (thread_safe) へ投入する。batch=1 は従来の 1 レコード 1 メッセージ。
+計測:
+    unbounded: キュー上限なし (破棄なし) での到達レコード数 / 秒 (転送経路の処理能力)
+    bounded: maxsize=256 (Orchestrator 既定) での到達レコード数 / 秒と未到達率
+             (worker 側の満杯時破棄。全速生成のため親の処理能力を超えた分が破棄される)
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from queue import Empty
+from time import perf_counter
+from typing import Any, Dict, List
+
+from app.scripts.core.aggregator import Aggregator
+from app.scripts.core.messages import ResultBatch, ResultRecord
+from app.scripts.core.worker import CaptureInferenceWorker
+
+CAMERAS = 4
+RECORDS_PER_CAMERA = 50_000
+QUEUE_MAXSIZE = 256  # bounded 条件 (0 = 上限なし)
+BATCH_SIZES = (1, 8, 32, 128)
+
+
+def _produce(camera_id: str, q: Any, records: int, batch: int) -> None:
+    worker = CaptureInferenceWorker(
+        camera_id,
+        q,
+        target_fps=1_000_000,
+        simulate_latency_ms=0.0,
+        batch_max_records=batch,
+    )
+    worker.run_loop(iterations=records)
+    worker.flush()
+
+
+def _run(batch: int, maxsize: int) -> Dict[str, Any]:
+    ctx = mp.get_context("spawn")
+    q = ctx.Queue(maxsize=maxsize)
+    procs = [
+        ctx.Process(target=_produce, args=(f"cam{i}", q, RECORDS_PER_CAMERA, batch))
+        for i in range(CAMERAS)
+    ]
+    for p in procs:
+        p.start()
+    agg = Aggregator(capacity=1024, thread_safe=True)
+    received = 0
+    t0 = t1 = perf_counter()
+    # 終了通知は worker 側の満杯時破棄 (最古 1 件) で他カメラに消される可能性があるため、
+    # 全プロセス終了 (feeder の送出完了) 後にキューが空になるまで受信する
+    while True:
+        try:
+            item = q.get(timeout=0.2)
+        except Empty:
+            if not any(p.is_alive() for p in procs):
+                break
+            continue
+        if received == 0:
+            t0 = perf_counter()
+        if isinstance(item, ResultRecord):
+            agg.push_result(item)
+            received += 1
+        elif isinstance(item, ResultBatch):
+            agg.push_results(item.records)
+            received += len(item)
+        t1 = perf_counter()
+    elapsed = t1 - t0
+    for p in procs:
+        p.join()
+    produced = CAMERAS * RECORDS_PER_CAMERA
+    return {
+        "recv_per_s": received / elapsed if elapsed > 0 else 0.0,
+        "drop_pct": (produced - received) / produced * 100,
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(
+        f"cameras={CAMERAS} records/camera={RECORDS_PER_CAMERA:,}"
+        f" queue_maxsize={QUEUE_MAXSIZE}"
+    )
+    print(
+        f"{'batch':>6} {'unbounded_rec_s':>16} {'bounded_rec_s':>14}"
+        f" {'bounded_drop':>13}"
+    )
+    for batch in BATCH_SIZES:
+        free = _run(batch, 0)
+        bounded = _run(batch, QUEUE_MAXSIZE)
+        row = {
+            "batch": batch,
+            "unbounded_rec_s": free["recv_per_s"],
+            "bounded_rec_s": bounded["recv_per_s"],
+            "bounded_drop_pct": bounded["drop_pct"],
+        }
+        rows.append(row)
+        print(
+            f"{batch:>6} {free['recv_per_s']:>16,.0f}"
+            f" {bounded['recv_per_s']:>14,.0f} {bounded['drop_pct']:>12.1f}%"
+        )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
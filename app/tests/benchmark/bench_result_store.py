@@ -0,0 +1,87 @@
+"""結果ストアのメモリ (byte/レコード) と push スループット比較ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_result_store``
+
+比較対象:
+    deque: 旧実装相当 deque(maxlen) + ResultRecord
+    object: ObjectResultRing (ResultRecord 保持)
+    columnar: ColumnarResultRing (int64 ns / uint16 label / float32 ×2)
+
+メモリは tracemalloc で「ストア生成 + capacity 件投入」後の増分を計測する。
+入力レコードは投入毎に生成し、ストアが保持する分だけがメモリとして残るようにする。
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+from app.scripts.core.aggregator import ResultRecord
+from app.scripts.core.result_store import (
+    ColumnarResultRing,
+    LabelInterner,
+    ObjectResultRing,
+)
+
+CAPACITY = 100_000
+PUSHES = 300_000
+LABELS = ("gesture_a", "gesture_b", "gesture_c")
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _make(i: int) -> ResultRecord:
+    return ResultRecord(
+        camera_id="cam01",
+        timestamp_utc=BASE + timedelta(microseconds=33_333 * i),
+        gesture_label=LABELS[i % 3],
+        confidence=0.5 + (i % 50) / 100.0,
+        latency_ms=3.0 + (i % 17) * 0.25,
+    )
+
+
+FACTORIES: Dict[str, Callable[[], Any]] = {
+    "deque": lambda: deque(maxlen=CAPACITY),
+    "object": lambda: ObjectResultRing(CAPACITY),
+    "columnar": lambda: ColumnarResultRing("cam01", CAPACITY, LabelInterner()),
+}
+
+
+def _bytes_per_record(factory: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    store = factory()
+    for i in range(CAPACITY):
+        store.append(_make(i))
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del store
+    return used / CAPACITY
+
+
+def _push_rate(factory: Callable[[], Any], records: List[ResultRecord]) -> float:
+    store = factory()
+    append = store.append
+    t0 = perf_counter()
+    for r in records:
+        append(r)
+    return len(records) / (perf_counter() - t0)
+
+
+def main() -> List[Dict[str, Any]]:
+    records = [_make(i) for i in range(PUSHES)]
+    rows: List[Dict[str, Any]] = []
+    print(f"capacity={CAPACITY} pushes={PUSHES}")
+    print(f"{'store':>9} {'bytes/rec':>10} {'push/s':>12}")
+    for name, factory in FACTORIES.items():
+        bpr = _bytes_per_record(factory)
+        rate = _push_rate(factory, records)
+        rows.append({"store": name, "bytes_per_record": bpr, "push_per_s": rate})
+        print(f"{name:>9} {bpr:>10.1f} {rate:>12,.0f}")
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
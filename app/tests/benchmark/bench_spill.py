@@ -0,0 +1,94 @@
+"""ディスク階層 (spill) の push コスト / 履歴クエリ / 常駐メモリのベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_spill``
+
+条件:
+    1 カメラ 30fps 相当で 1,000,000 件 (約 9.3 時間分) を capacity 10,000 の columnar
+    リングへ投入。spill なし (押し出しは破棄) / spill あり を比較する。
+計測:
+    push_us: 1 件当たり push_result 時間
+    rss_mb: 投入後の最大常駐メモリ増分 (ru_maxrss)。spill ありでも履歴はディスク側のため
+            リング分のみで頭打ちになることを確認する。
+    query_ms: 過去 1 時間分 (約 108,000 件) の範囲クエリ時間 (mmap 読出し)
+"""
+
+from __future__ import annotations
+
+import resource
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+from app.scripts.core.spill_store import SpillStore
+
+RECORDS = 1_000_000
+CAPACITY = 10_000
+FPS = 30
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _maxrss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run(spill_root: Optional[Path]) -> Dict[str, Any]:
+    spill = None if spill_root is None else SpillStore(spill_root)
+    agg = Aggregator(capacity=CAPACITY, storage="columnar", spill=spill)
+    step = timedelta(seconds=1 / FPS)
+    rss0 = _maxrss_mb()
+    t0 = perf_counter()
+    for i in range(RECORDS):
+        agg.push_result(
+            ResultRecord(
+                camera_id="cam01",
+                timestamp_utc=BASE + step * i,
+                gesture_label=("a", "b", "c")[i % 3],
+                confidence=0.9,
+                latency_ms=5.0,
+            )
+        )
+    push_us = (perf_counter() - t0) / RECORDS * 1e6
+    rss = _maxrss_mb() - rss0
+    since = BASE + timedelta(hours=2)
+    t0 = perf_counter()
+    n = len(agg.query("cam01", since, since + timedelta(hours=1)))
+    query_ms = (perf_counter() - t0) * 1e3
+    disk_mb = 0.0
+    if spill is not None:
+        tier = spill.get("cam01")
+        assert tier is not None
+        disk_mb = tier.used_bytes / 1e6
+        spill.close()
+    return {
+        "push_us": push_us,
+        "rss_mb": rss,
+        "query_records": n,
+        "query_ms": query_ms,
+        "disk_mb": disk_mb,
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(f"records={RECORDS:,} capacity={CAPACITY:,} fps={FPS}")
+    print(
+        f"{'mode':>6} {'push_us':>8} {'rss_MB':>7} {'disk_MB':>8}"
+        f" {'1h_query_rec':>12} {'query_ms':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, root in (("ring", None), ("spill", Path(tmp))):
+            row = {"mode": mode, **_run(root)}
+            rows.append(row)
+            print(
+                f"{mode:>6} {row['push_us']:>8.2f} {row['rss_mb']:>7.1f}"
+                f" {row['disk_mb']:>8.1f} {row['query_records']:>12,}"
+                f" {row['query_ms']:>9.1f}"
+            )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
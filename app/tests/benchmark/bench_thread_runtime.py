@@ -0,0 +1,112 @@
+"""スレッドモード worker の実行方式 (カメラ毎スレッド vs 単一スケジューラ) ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_thread_runtime``
+
+条件:
+    Orchestrator (スレッドモード) で CAMERAS 台を TARGET_FPS 毎に起動し、起動 WARMUP_SEC 後から
+    DURATION_SEC 計測する。worker は擬似推論 (LATENCIES_MS の sleep。0 は実行方式自体のコスト)。
+    threads: カメラ毎に OS スレッド (従来) / scheduler: WorkerScheduler 1 スレッド
+    (擬似推論の sleep もスケジューラ上で直列に実行される)。
+計測 (プロセス全体):
+    threads: プロセスのスレッド数
+    ctxsw_s: コンテキストスイッチ / 秒 (全スレッドの voluntary + nonvoluntary 合計)
+    cpu_pct: CPU 使用率 (user + sys, 1 CPU = 100%)
+    fps: 集約側で観測したカメラ当たりの結果 / 秒 (平均)
+    fps_min: 同 最小カメラ
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from time import sleep
+from typing import Any, Dict, List, Tuple
+
+from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
+
+CAMERAS = 200
+TARGET_FPS_LIST = (5, 15)
+LATENCIES_MS = (0.0, 0.2)
+WARMUP_SEC = 2.0
+DURATION_SEC = 5.0
+RUNTIMES = ("threads", "scheduler")
+
+
+def _ctx_switches() -> Tuple[int, int]:
+    total, threads = 0, 0
+    for task in Path("/proc/self/task").iterdir():
+        try:
+            text = (task / "status").read_text()
+        except OSError:  # 計測中に終了したスレッド
+            continue
+        threads += 1
+        for line in text.splitlines():
+            if "ctxt_switches:" in line:  # voluntary_ / nonvoluntary_
+                total += int(line.split()[1])
+    return total, threads
+
+
+def _cpu_sec() -> float:
+    t = os.times()
+    return t.user + t.system
+
+
+def _run(runtime: str, fps: int, latency_ms: float) -> Dict[str, float]:
+    cams = [f"cam{i:03d}" for i in range(CAMERAS)]
+    orch = Orchestrator(
+        OrchestratorConfig(
+            camera_ids=cams,
+            target_fps=fps,
+            worker_latency_ms=latency_ms,
+            thread_runtime=runtime,
+            aggregator_capacity=CAMERAS * fps * 4,
+        )
+    )
+    orch.start()
+    sleep(WARMUP_SEC)
+    ctx0, _ = _ctx_switches()
+    cpu0 = _cpu_sec()
+    samples: List[Dict[str, Any]] = []
+    for _ in range(int(DURATION_SEC)):
+        sleep(1.0)
+        samples.append(orch.aggregator.snapshot_stats())
+    ctx1, threads = _ctx_switches()
+    cpu1 = _cpu_sec()
+    orch.stop()
+    per_cam = [
+        sum(s.get(c, {}).get("fps") or 0 for s in samples) / len(samples) for c in cams
+    ]
+    return {
+        "threads": threads,
+        "ctxsw_s": (ctx1 - ctx0) / DURATION_SEC,
+        "cpu_pct": (cpu1 - cpu0) / DURATION_SEC * 100,
+        "fps": sum(per_cam) / len(per_cam),
+        "fps_min": min(per_cam),
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    logging.disable(logging.WARNING)  # 起動直後の stalled 警告などを抑止
+    rows: List[Dict[str, Any]] = []
+    print(f"cameras={CAMERAS} duration={DURATION_SEC}s")
+    print(
+        f"{'runtime':>9} {'lat_ms':>7} {'target':>7} {'threads':>8} {'ctxsw_s':>9}"
+        f" {'cpu_%':>6} {'fps':>6} {'fps_min':>8}"
+    )
+    for latency in LATENCIES_MS:
+        for fps in TARGET_FPS_LIST:
+            for runtime in RUNTIMES:
+                row = {"runtime": runtime, "latency_ms": latency, "target_fps": fps}
+                row.update(_run(runtime, fps, latency))
+                rows.append(row)
+                print(
+                    f"{runtime:>9} {latency:>7.1f} {fps:>7} {row['threads']:>8.0f}"
+                    f" {row['ctxsw_s']:>9.0f} {row['cpu_pct']:>6.1f}"
+                    f" {row['fps']:>6.2f} {row['fps_min']:>8.2f}"
+                )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,144 @@
+"""worker プロセスの起動方式別 コールドスタート / 再起動から最初の結果までの時間 ベンチマーク。
+
+実行: プロジェクトルートで ``python -m app.tests.benchmark.bench_worker_start``
+
+条件:
+    各カメラは SyntheticFrameSource (WIDTH x HEIGHT) + NumpyKeypointBackend (TARGET_FPS)。
+    起動方式 (METHODS) 毎に新しいインタプリタで計測する (forkserver テンプレートを
+    使い回さないため)。default は Linux の既定 (fork)。
+    cold: Orchestrator (use_process=True) で CAMERAS 台を start() し、全カメラの最初の結果が
+        Aggregator に届くまで。
+    restart: 続けて同じ親から 1 カメラ分の worker プロセスを RESTARTS 回起動し直し
+        (前回を STOP → join した後)、起動から最初の結果が結果キューに届くまで。
+        forkserver は cold でテンプレートが起動済み (モデルもロード済み)。
+計測:
+    cold_s: cold の所要時間
+    restart_p50_ms / restart_max_ms: restart の所要時間
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+import sys
+from time import monotonic, perf_counter, sleep
+from typing import Any, Dict, List
+
+from app.scripts.core.inference import BACKEND_NUMPY_KEYPOINT
+from app.scripts.core.messages import (
+    CONTROL_STOP,
+    ControlMessage,
+    ResultBatch,
+    ResultRecord,
+)
+from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
+from app.scripts.core.process_worker_entry import run_capture_inference_worker_process
+from app.scripts.core.worker_template import (
+    START_DEFAULT,
+    START_FORKSERVER,
+    START_SPAWN,
+    worker_context,
+)
+
+CAMERAS = 8
+RESTARTS = 10
+TARGET_FPS = 10
+WIDTH, HEIGHT = 320, 240
+METHODS = (START_DEFAULT, START_SPAWN, START_FORKSERVER)
+SOURCE = f"synthetic://{WIDTH}x{HEIGHT}"
+
+
+def _cold(method: str) -> float:
+    cams = [f"cam{i:02d}" for i in range(CAMERAS)]
+    cfg = OrchestratorConfig(
+        camera_ids=cams,
+        use_process=True,
+        worker_start_method=method,
+        target_fps=TARGET_FPS,
+        worker_latency_ms=0.0,
+        ping_interval_sec=0.5,
+        ping_timeout_sec=60.0,
+        camera_sources={c: SOURCE for c in cams},
+        inference_backend=BACKEND_NUMPY_KEYPOINT,
+    )
+    orch = Orchestrator(cfg)
+    t0 = perf_counter()
+    orch.start()
+    try:
+        while not all(c in orch.aggregator.snapshot_stats() for c in cams):
+            sleep(0.005)
+        return perf_counter() - t0
+    finally:
+        orch.stop()
+
+
+def _restart_ms(method: str) -> List[float]:
+    ctx = worker_context(method, (BACKEND_NUMPY_KEYPOINT,))
+    out: List[float] = []
+    for _ in range(RESTARTS):
+        results, control, status = ctx.Queue(), ctx.Queue(), ctx.Queue()
+        stop = ctx.Event()
+        t0 = perf_counter()
+        p = ctx.Process(
+            target=run_capture_inference_worker_process,
+            args=("cam", results, control, stop, TARGET_FPS, 0.0, True),
+            kwargs={
+                "source_url": SOURCE,
+                "inference_backend": BACKEND_NUMPY_KEYPOINT,
+                "status_queue": status,
+            },
+            daemon=True,
+        )
+        p.start()
+        while not isinstance(results.get(timeout=60), (ResultRecord, ResultBatch)):
+            pass
+        out.append((perf_counter() - t0) * 1000)
+        control.put(ControlMessage(type=CONTROL_STOP, payload={}))
+        deadline = monotonic() + 5
+        while p.is_alive() and monotonic() < deadline:  # STOP 処理中の put を詰まらせない
+            while not results.empty():
+                results.get_nowait()
+            p.join(0.05)
+        stop.set()
+        p.join()
+    return out
+
+
+def _measure(method: str) -> Dict[str, Any]:
+    cold = _cold(method)
+    restarts = _restart_ms(method)
+    return {
+        "method": method,
+        "cold_s": cold,
+        "restart_p50_ms": statistics.median(restarts),
+        "restart_max_ms": max(restarts),
+    }
+
+
+def main() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    print(f"cameras={CAMERAS} restarts={RESTARTS} fps={TARGET_FPS} source={SOURCE}")
+    print(f"{'method':>10} {'cold_s':>7} {'restart_p50_ms':>15} {'restart_max_ms':>15}")
+    for method in METHODS:
+        # 方式毎に新しいインタプリタ (forkserver / import 済みモジュールを持ち越さない)
+        proc = subprocess.run(
+            [sys.executable, "-m", __spec__.name, method],  # type: ignore[name-defined]
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        row = json.loads(proc.stdout.strip().splitlines()[-1])
+        rows.append(row)
+        print(
+            f"{method:>10} {row['cold_s']:>7.2f} {row['restart_p50_ms']:>15.1f}"
+            f" {row['restart_max_ms']:>15.1f}"
+        )
+    return rows
+
+
+if __name__ == "__main__":  # pragma: no cover
+    if len(sys.argv) > 1:
+        print(json.dumps(_measure(sys.argv[1])))
+    else:
+        main()
@@ -63,3 +63,47 @@ def test_query_since_filter() -> None:
     filtered = agg.query("cam", since=base + timedelta(microseconds=1))
     assert len(filtered) == 1
     assert filtered[0].timestamp_utc == base + timedelta(seconds=1)
+
+
+def test_snapshot_window_matches_capacity_eviction() -> None:
+    # 窓内 5 件でも capacity=3 でバッファから押し出された分は fps に含めない
+    agg = Aggregator(capacity=3)
+    base = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    for i in range(5):
+        agg.push_result(_rec("c", base + timedelta(milliseconds=100 * i), lat=float(i)))
+    st = agg.snapshot_stats(now=base + timedelta(milliseconds=450))["c"]
+    assert st["fps"] == 3.0
+    assert abs(st["avg_latency_ms"] - 3.0) < 1e-9  # (2+3+4)/3
+
+
+def test_snapshot_window_expires_incrementally() -> None:
+    agg = Aggregator(capacity=100)
+    base = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    agg.push_result(_rec("c", base + timedelta(milliseconds=500), lat=None))
+    agg.push_result(_rec("c", base, lat=4.0))  # 遅着 (時刻逆転)
+    st = agg.snapshot_stats(now=base + timedelta(milliseconds=900))["c"]
+    assert st["fps"] == 2.0
+    assert st["avg_latency_ms"] == 4.0
+    assert st["last_update"].startswith("2025-01-01T00:00:00.500000Z")
+    # 窓外へ移動すると件数/平均が減算される
+    st = agg.snapshot_stats(now=base + timedelta(milliseconds=1200))["c"]
+    assert st["fps"] == 1.0
+    assert st["avg_latency_ms"] is None
+    assert agg.last_update_dt("c") == base + timedelta(milliseconds=500)
+
+
+def test_push_results_matches_push_result() -> None:
+    base = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    recs = [
+        _rec("ab"[i % 3 == 0], base + timedelta(milliseconds=10 * i), label=str(i))
+        for i in range(12)
+    ]
+    one, bulk = Aggregator(capacity=4), Aggregator(capacity=4)
+    for r in recs:
+        one.push_result(r)
+    bulk.push_results(recs)
+    now = base + timedelta(milliseconds=200)
+    assert sorted(bulk.cameras()) == ["a", "b"]
+    for cam in ("a", "b"):
+        assert bulk.query(cam) == one.query(cam)
+    assert bulk.snapshot_stats(now=now) == one.snapshot_stats(now=now)
@@ -0,0 +1,109 @@
+"""thread_safe Aggregator の並行読出しストレステスト。
+
+目的:
+    - 単一書込みスレッドが高頻度 push (capacity 周回 + 遅着レコード) する間、
+      多数の読者スレッドが query / latest_snapshot / snapshot_stats を呼んでも
+      例外が出ず、読出し結果が常に整合 (時刻順 / レコード内容が破損していない) すること。
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+
+import pytest
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+CAMERAS = ("c0", "c1", "c2")
+
+
+def _rec(cam: str, n: int) -> ResultRecord:
+    # timestamp から n を復元し label / latency の整合 (torn read 無し) を検証できるようにする
+    return ResultRecord(
+        cam, BASE + timedelta(microseconds=n), f"g{n % 7}", 0.5, float(n % 1000)
+    )
+
+
+def _check(records: list[ResultRecord], reverse: bool = False) -> None:
+    ts = [r.timestamp_utc for r in records]
+    assert ts == sorted(ts, reverse=reverse)
+    for r in records:
+        n = (r.timestamp_utc - BASE) // timedelta(microseconds=1)
+        assert r.gesture_label == f"g{n % 7}"
+        assert r.latency_ms == float(n % 1000)
+
+
+@pytest.mark.timeout(30)
+@pytest.mark.parametrize("storage", ["object", "columnar"])
+def test_many_readers_during_high_rate_pushes(storage: str) -> None:
+    agg = Aggregator(capacity=256, storage=storage, thread_safe=True)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    reads = [0]
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)  # スレッド切替を頻発させ競合を誘発
+
+    def writer() -> None:
+        n = 0
+        while not stop.is_set():
+            n += 1
+            for cam in CAMERAS:
+                agg.push_result(_rec(cam, n * 10))
+                if n % 50 == 0:
+                    agg.push_result(_rec(cam, n * 10 - 25))  # 遅着
+            if n % 200 == 0:
+                agg.publish(BASE + timedelta(microseconds=n * 10))
+
+    def reader(idx: int) -> None:
+        try:
+            while not stop.is_set():
+                cam = CAMERAS[idx % len(CAMERAS)]
+                last = agg.last_update_dt(cam)
+                if last is not None:
+                    _check(agg.query(cam, since=last - timedelta(microseconds=500)))
+                    _check(agg.query(cam, limit=20, reverse=True), reverse=True)
+                    _check(list(agg.iter_query(cam, labels={"g3"})))
+                snap = agg.latest_snapshot()
+                if snap is not None:
+                    assert all("fps" in v for v in snap.stats.values())
+                reads[0] += 1
+        except BaseException as e:  # noqa: BLE001 - 読者スレッドの失敗をテストへ伝播
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(8)]
+    w = threading.Thread(target=writer)
+    try:
+        w.start()
+        for t in threads:
+            t.start()
+        deadline = monotonic() + 1.0
+        while monotonic() < deadline and not errors:
+            agg.snapshot_stats()
+    finally:
+        stop.set()
+        w.join()
+        for t in threads:
+            t.join()
+        sys.setswitchinterval(old_interval)
+    assert not errors, errors[0]
+    assert reads[0] > 0
+    assert all(len(agg.query(cam)) == 256 for cam in CAMERAS)
+
+
+def test_publish_and_latest_snapshot_immutable() -> None:
+    agg = Aggregator(capacity=10, thread_safe=True)
+    assert agg.latest_snapshot() is None
+    agg.push_result(_rec("c0", 1))
+    snap = agg.publish(BASE + timedelta(milliseconds=1))
+    assert agg.latest_snapshot() is snap and snap.seq == 1
+    assert snap.stats["c0"]["fps"] == 1.0
+    with pytest.raises(TypeError):
+        snap.stats["c0"]["fps"] = 2.0  # type: ignore[index]
+    # snapshot_stats は公開も行い、呼出し側へは変更可能なコピーを返す
+    out = agg.snapshot_stats(BASE + timedelta(milliseconds=2))
+    out["c0"]["fps"] = -1.0
+    assert agg.latest_snapshot().stats["c0"]["fps"] == 1.0  # type: ignore[union-attr]
@@ -1,6 +1,6 @@
 """Aggregator の StatsMessage 統合 & 追加統計(p50/p95/EMA) テスト。"""
 
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.scripts.core.aggregator import Aggregator, ResultRecord
 from app.scripts.core.messages import StatsMessage
@@ -56,3 +56,115 @@ def test_aggregator_apply_stats_message_and_percentiles() -> None:
     # EMA は override fps 方向へ移動 (alpha=0.2)
     assert cam["ema_fps"] > base_ema
     assert cam["ema_fps"] < cam["fps"]  # まだ完全には追随しない
+
+
+def _push(agg: Aggregator, ts) -> None:
+    agg.push_result(
+        ResultRecord(
+            camera_id="cam1",
+            timestamp_utc=ts,
+            gesture_label="g",
+            confidence=0.9,
+            latency_ms=10.0,
+        )
+    )
+
+
+def test_snapshot_cached_within_tick_and_ema_advances_once() -> None:
+    """同一 tick 内の呼出しはキャッシュを返し、EMA は tick 毎に 1 回だけ進む。"""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    agg = Aggregator(capacity=100, stats_refresh_sec=1.0)
+    _push(agg, base + timedelta(milliseconds=100))
+    first = agg.publish(base + timedelta(milliseconds=200))
+    # tick 内で何度呼んでも再計算も EMA 更新も起きない (消費者数に依存しない)
+    for ms in (300, 500, 900):
+        _push(agg, base + timedelta(milliseconds=ms))
+        assert agg.publish(base + timedelta(milliseconds=ms)) is first
+        stats = agg.snapshot_stats(base + timedelta(milliseconds=ms))
+        assert stats["cam1"]["fps"] == 1.0
+    assert first.stats["cam1"]["ema_fps"] == 1.0
+    # 次 tick で 1 回だけ前進 (窓 (100ms, 1100ms] は 3 件): 1.0 + 0.2 * (3 - 1)
+    nxt = agg.publish(base + timedelta(milliseconds=1100))
+    assert nxt.seq == first.seq + 1
+    assert nxt.stats["cam1"]["fps"] == 3.0
+    assert abs(nxt.stats["cam1"]["ema_fps"] - 1.4) < 1e-9
+    for _ in range(3):
+        again = agg.snapshot_stats(base + timedelta(milliseconds=1500))
+        assert abs(again["cam1"]["ema_fps"] - 1.4) < 1e-9
+
+
+def test_stats_message_recomputes_camera_within_tick() -> None:
+    """tick 内の StatsMessage は該当カメラのみ同一 EMA 起点から再計算される。"""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    agg = Aggregator(capacity=100, stats_refresh_sec=1.0)
+    _push(agg, base)
+    agg.publish(base + timedelta(milliseconds=10))
+    now = base + timedelta(milliseconds=1010)
+    _push(agg, now)
+    assert agg.publish(now).stats["cam1"]["ema_fps"] == 1.0
+    for _ in range(2):
+        agg.apply_stats_message(
+            StatsMessage(camera_id="cam1", fps=6.0, avg_latency_ms=None, drop_rate=None)
+        )
+        cam = agg.publish(now + timedelta(milliseconds=100)).stats["cam1"]
+        # 起点 1.0 -> 窓 fps 1.0 -> override 6.0 で 1.0 + 0.2 * 5 = 2.0 (繰返しても同値)
+        assert cam["fps"] == 6.0
+        assert abs(cam["ema_fps"] - 2.0) < 1e-9
+
+
+def test_new_camera_appears_within_current_tick() -> None:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    agg = Aggregator(capacity=100, stats_refresh_sec=1.0)
+    _push(agg, base)
+    first = agg.publish(base + timedelta(milliseconds=10))
+    agg.push_result(
+        ResultRecord(
+            camera_id="cam2",
+            timestamp_utc=base + timedelta(milliseconds=20),
+            gesture_label="g",
+            confidence=0.9,
+            latency_ms=10.0,
+        )
+    )
+    snap = agg.publish(base + timedelta(milliseconds=30))
+    assert set(snap.stats) == {"cam1", "cam2"}
+    # 既存カメラは再計算されない (同一 tick の値を維持)
+    assert snap.stats["cam1"] == first.stats["cam1"]
+
+
+def test_push_results_matches_push_result_sequence() -> None:
+    """一括反映 (run 単位の窓更新) が 1 件ずつの push_result と同じ統計になる。"""
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    records = [
+        ResultRecord(
+            camera_id=f"cam{(i // 7) % 2}",  # 7 件毎にカメラが切り替わる run
+            timestamp_utc=base + timedelta(milliseconds=37 * i),  # スライス境界を跨ぐ
+            gesture_label=("open", "fist", "point")[i % 3],
+            confidence=0.5 + (i % 5) / 10,
+            latency_ms=None if i % 11 == 0 else 1.0 + i % 23,
+        )
+        for i in range(600)
+    ]
+    records.insert(300, records[290])  # 遅着 1 件
+    one, bulk = Aggregator(capacity=1000), Aggregator(capacity=1000)
+    for r in records:
+        one.push_result(r)
+    for i in range(0, len(records), 50):
+        bulk.push_results(records[i : i + 50])
+    now = records[-1].timestamp_utc
+    assert bulk.snapshot_stats(now=now) == one.snapshot_stats(now=now)
+    for cam in ("cam0", "cam1"):
+        assert [r.timestamp_utc for r in bulk.query(cam)] == [
+            r.timestamp_utc for r in one.query(cam)
+        ]
+        w1, w2 = one._windows[cam], bulk._windows[cam]
+        assert list(w1.entries) == list(w2.entries)
+        assert w1.latency_count == w2.latency_count
+        assert abs(w1.latency_sum - w2.latency_sum) < 1e-9
+        for window in ("1m", "10m"):
+            a = w1.labels.window(window, now.timestamp())
+            b = w2.labels.window(window, now.timestamp())
+            assert a.counts() == b.counts() and a.transitions() == b.transitions()
+        h1 = w1.sketch.histogram("60s", now.timestamp())
+        h2 = w2.sketch.histogram("60s", now.timestamp())
+        assert h1.quantiles((0.5, 0.99)) == h2.quantiles((0.5, 0.99))
@@ -0,0 +1,241 @@
+"""channels.ResultChannels (カメラ別結果チャネル + 優先ステータスチャネル) のテスト。"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+import pytest
+
+from app.scripts.core import utils_time
+from app.scripts.core.channels import ResultChannels
+from app.scripts.core.messages import (
+    CONTROL_PING,
+    ControlMessage,
+    FrameDescriptor,
+    ResultBatch,
+    ResultRecord,
+    StatsMessage,
+    StatusUpdate,
+)
+from app.scripts.core.worker import CaptureInferenceWorker
+
+
+def _rec(cam: str) -> ResultRecord:
+    return ResultRecord(
+        camera_id=cam,
+        timestamp_utc=utils_time.now_utc(),
+        gesture_label="x",
+        confidence=0.5,
+        latency_ms=1.0,
+    )
+
+
+def _stats(cam: str) -> StatsMessage:
+    return StatsMessage(camera_id=cam, fps=1.0, avg_latency_ms=None, drop_rate=None)
+
+
+def test_frame_descriptors_do_not_consume_result_quantum() -> None:
+    ch = ResultChannels(queue.Queue, 0, quantum=3)
+    ch.add("a")
+    q = ch.result_queue("a")
+    for item in ("d", "r", "d", "r", "r", "r"):
+        if item == "d":
+            q.put_nowait(FrameDescriptor("a", "ring", 0, 1, 0, None, 0))
+        else:
+            q.put_nowait(_rec("a"))
+    got: List[object] = []
+    assert ch.poll(got.append, timeout=0.01) == 5  # 記述子 2 件 + 結果 3 件 (枠 3)
+    assert sum(isinstance(i, ResultRecord) for i in got) == 3
+    for _ in range(5):
+        q.put_nowait(FrameDescriptor("a", "ring", 0, 1, 0, None, 0))
+    got.clear()
+    ch.poll(got.append, timeout=0.01)
+    assert sum(isinstance(i, FrameDescriptor) for i in got) <= 3  # 記述子は 1 巡 quantum 件まで
+
+
+def test_poll_serves_status_first_then_round_robin_by_quantum() -> None:
+    ch = ResultChannels(queue.Queue, 0, quantum=2)
+    for cam in ("a", "b"):
+        ch.add(cam)
+    for _ in range(5):
+        ch.result_queue("a").put_nowait(_rec("a"))
+    ch.result_queue("b").put_nowait(_rec("b"))
+    ch.status.put_nowait(_stats("b"))
+    got: List[object] = []
+    assert ch.poll(got.append, timeout=0.01) == 4
+    assert isinstance(got[0], StatsMessage)
+    cams = [r.camera_id for r in got[1:]]  # type: ignore[attr-defined]
+    assert cams == ["a", "a", "b"]
+    got.clear()
+    ch.poll(got.append, timeout=0.01)  # 開始カメラは巡毎にずれる (b は空)
+    assert [r.camera_id for r in got] == ["a", "a"]  # type: ignore[attr-defined]
+    with pytest.raises(ValueError):
+        ResultChannels(queue.Queue, 0, quantum=0)
+
+
+def test_worker_process_status_channels_are_drained_and_renewed() -> None:
+    ch = ResultChannels(queue.Queue, 0)
+    ch.add("a")
+    old = ch.add_status("WProc-a")
+    other = ch.add_status("WProc-b")
+    old.put_nowait(_stats("a"))
+    other.put_nowait(_stats("b"))
+    ch.status.put_nowait(StatusUpdate("a", "RETRYING", 1, "exitcode=-9"))
+    got: List[object] = []
+    assert ch.poll(got.append, timeout=0.01) == 3
+    assert isinstance(got[0], StatusUpdate)  # 親プロセス内の共有チャネルが先
+    # 再起動: 旧キュー (書込み中に kill されロックが残り得る) は読まず新キューへ置換
+    old.put_nowait(_stats("a"))
+    new = ch.add_status("WProc-a")
+    assert new is not old
+    new.put_nowait(_stats("a"))
+    got.clear()
+    assert ch.poll(got.append, timeout=0.01) == 1
+    spare: "queue.Queue[object]" = queue.Queue()
+    assert ch.add_status("WProc-a", spare) is spare
+
+
+def test_idle_poll_waits_on_queue_pipes_without_probing() -> None:
+    ctx = multiprocessing.get_context()
+    ch = ResultChannels(ctx.Queue, 0)
+    for cam in ("a", "b"):
+        ch.add(cam)
+    ch.add_status("WProc-a")
+    rounds = 0
+    serve = ch._serve
+
+    def counting(camera_id, handle):  # type: ignore[no-untyped-def]
+        nonlocal rounds
+        rounds += 1
+        return serve(camera_id, handle)
+
+    ch._serve = counting  # type: ignore[method-assign]
+    t0 = time.monotonic()
+    assert ch.poll(lambda item: None, timeout=0.1) == 0
+    assert time.monotonic() - t0 >= 0.09 and rounds == 2  # 待ちの間は空読みしない
+    threading.Timer(0.02, ch.result_queue("b").put_nowait, args=(_rec("b"),)).start()
+    got: List[object] = []
+    t0 = time.monotonic()
+    assert ch.poll(got.append, timeout=1.0) == 1
+    assert time.monotonic() - t0 < 0.5 and isinstance(got[0], ResultRecord)
+
+
+def test_idle_wait_backs_off_without_queue_pipes() -> None:
+    ch = ResultChannels(queue.Queue, 0, idle_wait_sec=0.01)
+    ch.add("a")
+    t0 = time.monotonic()
+    for _ in range(4):  # 0.01 + 0.02 + 0.04 + 0.08 (timeout で頭打ち)
+        assert ch.poll(lambda item: None, timeout=0.08) == 0
+    assert time.monotonic() - t0 >= 0.13
+    ch.result_queue("a").put_nowait(_rec("a"))
+    assert ch.poll(lambda item: None, timeout=0.08) == 1
+    t0 = time.monotonic()
+    assert ch.poll(lambda item: None, timeout=0.08) == 0  # 受信で初期値へ戻る
+    assert time.monotonic() - t0 < 0.05
+
+
+def test_batches_consume_quantum_by_record_count() -> None:
+    ch = ResultChannels(queue.Queue, 0, quantum=4)
+    q = ch.add("a")
+    assert ch.add("a") is q
+    for _ in range(3):
+        q.put_nowait(ResultBatch(camera_id="a", records=(_rec("a"),) * 3))
+    counts = [ch.poll(lambda item: None, timeout=0.01) for _ in range(3)]
+    # 1 巡目: 3 件 + 3 件 (枠 4 を超えた分は次巡の枠から差し引く) / 2 巡目: 枠 2 で 1 件
+    assert counts == [2, 1, 0]
+
+
+def test_idle_poll_waits_on_status_channel() -> None:
+    ch = ResultChannels(queue.Queue, 0, idle_wait_sec=0.5)
+    ch.add("a")
+    threading.Timer(0.02, ch.status.put_nowait, args=(_stats("a"),)).start()
+    got: List[object] = []
+    t0 = time.monotonic()
+    assert ch.poll(got.append, timeout=1.0) == 1
+    assert time.monotonic() - t0 < 0.4 and isinstance(got[0], StatsMessage)
+    assert ch.poll(got.append, timeout=0.01) == 0
+
+
+def test_flooding_camera_does_not_starve_others_or_ping() -> None:
+    """1 台が過負荷 (dispatcher の処理能力超え) でも他カメラの結果と PING RTT を保つ。"""
+    ch = ResultChannels(queue.Queue, 32, quantum=8)
+    cams = {"flood": 1000, "c1": 40, "c2": 40}  # camera_id -> target_fps
+    ctrl: Dict[str, "queue.Queue[object]"] = {}
+    stop = threading.Event()
+    delivered: Counter[str] = Counter()
+    rtt_ms: Dict[str, float] = {}
+    ping_sent: Dict[str, float] = {}
+
+    def handle(item: object) -> None:
+        if isinstance(item, ResultRecord):
+            delivered[item.camera_id] += 1
+            time.sleep(0.002)  # 集約コスト (処理能力 約 500 件/秒 < 流入)
+        elif isinstance(item, StatusUpdate) and item.ping_response:
+            sent = ping_sent[item.camera_id]
+            rtt_ms[item.camera_id] = (time.monotonic() - sent) * 1e3
+
+    def run_worker(cam: str, fps: int) -> None:
+        ctrl[cam] = queue.Queue()
+        worker = CaptureInferenceWorker(
+            cam,
+            ch.add(cam),
+            target_fps=fps,
+            simulate_latency_ms=0.0,
+            control_queue=ctrl[cam],
+            status_queue=ch.status,
+        )
+        while not stop.is_set():
+            worker.run_loop(iterations=1)
+
+    threads = [
+        threading.Thread(target=run_worker, args=item, daemon=True)
+        for item in cams.items()
+    ]
+    for t in threads:
+        t.start()
+    duration = 1.5
+    until = time.monotonic() + duration
+    pinged = False
+    while time.monotonic() < until:
+        if not pinged and time.monotonic() > until - duration / 2:
+            for cam in ("c1", "c2"):
+                ping_sent[cam] = time.monotonic()
+                ctrl[cam].put_nowait(
+                    ControlMessage(type=CONTROL_PING, payload={"id": cam})
+                )
+            pinged = True
+        ch.poll(handle, timeout=0.01)
+    stop.set()
+    for t in threads:
+        t.join(timeout=2)
+    assert delivered["flood"] > delivered["c1"]  # 過負荷カメラも処理は続く
+    for cam in ("c1", "c2"):
+        # 40fps x 1.5s = 60 件のほぼ全てが届く (共有キューでは flood に押し出される)
+        assert delivered[cam] >= 0.8 * cams[cam] * duration, delivered
+        assert rtt_ms[cam] < 100.0, rtt_ms
+
+
+def test_in_process_mode_serves_only_notified_cameras() -> None:
+    ch = ResultChannels(None, 0, quantum=2)
+    for cam in ("a", "b", "idle"):
+        ch.add(cam)
+    for _ in range(5):
+        ch.result_queue("a").put_nowait(_rec("a"))
+    ch.result_queue("b").put_nowait(_rec("b"))
+    ch.status.put_nowait(_stats("b"))
+    got: List[object] = []
+    assert ch.poll(got.append, timeout=0.01) == 4
+    assert isinstance(got[0], StatsMessage)
+    cams = [r.camera_id for r in got[1:]]  # type: ignore[attr-defined]
+    assert cams == ["a", "a", "b"]
+    assert [ch.poll(lambda item: None, timeout=0.01) for _ in range(3)] == [2, 1, 0]
+    # put で待機中の poll が起きる (走査・ポーリングなし)
+    threading.Timer(0.05, ch.result_queue("b").put_nowait, args=(_rec("b"),)).start()
+    t0 = time.monotonic()
+    assert ch.poll(got.append, timeout=1.0) == 1
+    assert time.monotonic() - t0 < 0.5
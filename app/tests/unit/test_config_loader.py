@@ -37,6 +37,70 @@ def test_load_success(tmp_path: Path) -> None:
     cfg = loader.load(path)
     assert cfg.inference.target_fps == 5
     assert cfg.cameras[0].id == "c1"
+    assert cfg.inference.pacing == "skip"
+    # 結果バッチ属性は省略可 (1 = バッチなし)
+    assert cfg.buffer.result_batch_records == 1
+    assert cfg.buffer.result_batch_max_delay_ms == 20.0
+    assert cfg.buffer.frame_prefetch == 2
+    assert cfg.buffer.frame_ring_slots == 0
+    batched = xml.replace(
+        "results_max_entries='10'",
+        "results_max_entries='10' result_batch_records='32'"
+        " result_batch_max_delay_ms='5.5' frame_prefetch='0'"
+        " frame_ring_slots='6' results_storage='columnar'",
+    )
+    cfg = loader.load(_write(tmp_path, batched))
+    assert cfg.buffer.result_batch_records == 32
+    assert cfg.buffer.result_batch_max_delay_ms == 5.5
+    assert cfg.buffer.frame_prefetch == 0
+    assert cfg.buffer.frame_ring_slots == 6
+    assert cfg.buffer.results_storage == "columnar"
+    with pytest.raises(ConfigValidationError):
+        loader.load(
+            _write(tmp_path, xml.replace("'10'/>", "'10' result_batch_records='0'/>"))
+        )
+    paced = xml.replace("device='CPU'", "device='CPU' pacing='catch_up'")
+    assert loader.load(_write(tmp_path, paced)).inference.pacing == "catch_up"
+    assert (cfg.inference.backend, cfg.inference.batch_size) == ("stub", 1)
+    backed = xml.replace(
+        "device='CPU'", "device='CPU' backend='numpy_keypoint' batch_size='4'"
+    )
+    cfg = loader.load(_write(tmp_path, backed))
+    assert (cfg.inference.backend, cfg.inference.batch_size) == ("numpy_keypoint", 4)
+    assert cfg.inference.keypoints == "off"
+    shared = backed.replace(
+        "batch_size='4'", "batch_size='4' keypoints='shared' keypoint_filter='one_euro'"
+    )
+    inference = loader.load(_write(tmp_path, shared)).inference
+    assert (inference.keypoints, inference.keypoint_filter) == ("shared", "one_euro")
+    assert cfg.inference.keypoint_filter == "none"
+    with pytest.raises(ConfigValidationError):
+        loader.load(_write(tmp_path, backed.replace("'4'", "'4' keypoints='list'")))
+    assert (cfg.perf.adaptive_skip, cfg.perf.min_fps) == (False, 1.0)
+    assert (cfg.restart.backoff_base_sec, cfg.restart.backoff_max_sec) == (0.5, 30.0)
+    assert cfg.restart.standby_workers == 0
+    backoff = xml.replace(
+        "restart_window_sec='300'", "restart_window_sec='300' backoff_base_sec='2'"
+    )
+    assert loader.load(_write(tmp_path, backoff)).restart.backoff_base_sec == 2.0
+    standby = backoff.replace("'2'", "'2' standby_workers='2'")
+    assert loader.load(_write(tmp_path, standby)).restart.standby_workers == 2
+    with pytest.raises(ConfigValidationError):
+        loader.load(
+            _write(tmp_path, backoff.replace("'2'", "'2' backoff_max_sec='1'"))
+        )
+    skipping = xml.replace(
+        "drop_rate_warn='0.05'",
+        "drop_rate_warn='0.05' adaptive_skip='true' min_fps='2.5'",
+    )
+    cfg = loader.load(_write(tmp_path, skipping))
+    assert (cfg.perf.adaptive_skip, cfg.perf.min_fps) == (True, 2.5)
+    with pytest.raises(ConfigValidationError):
+        loader.load(
+            _write(tmp_path, xml.replace("device='CPU'", "device='CPU' backend='ov'"))
+        )
+    with pytest.raises(ConfigValidationError):
+        loader.load(_write(tmp_path, xml.replace("device='CPU'", "device='CPU' pacing='fast'")))
 
 
 def test_missing_camera_raises(tmp_path: Path) -> None:
@@ -81,3 +145,33 @@ def test_invalid_int_attr(tmp_path: Path) -> None:
     path = _write(tmp_path, xml)
     with pytest.raises(ConfigValidationError):
         loader.load(path)
+
+
+def test_spill_optional_element(tmp_path: Path) -> None:
+    body = """\
+    <ApplicationConfig>
+      <Cameras><Camera id='c1' url='rtsp://x'/></Cameras>
+      <Model xml='m.xml' bin='m.bin' metadata='m.meta'/>
+      <Inference target_fps='5' device='CPU'/>
+      <Retry connect_max_attempts='2' connect_backoff_sec='0.5'/>
+      <Buffer results_max_entries='10'/>
+      <Recording enabled='true' output_dir='out'/>
+      <Export default_format='csv'/>
+      {spill}
+      <Restart max_restarts_per_camera='3' restart_window_sec='300'/>
+      <Health ping_interval_sec='5' ping_timeout_sec='10' ping_loss_threshold='3'/>
+      <Perf latency_p95_target_ms='500' drop_rate_warn='0.05'/>
+      <GUI theme='dark'/>
+      <Logging dir='logs' level='INFO'/>
+    </ApplicationConfig>
+    """
+    cfg = loader.load(_write(tmp_path, body.format(spill="")))
+    assert cfg.spill.enabled is False
+    spill = "<Spill enabled='true' dir='sp' max_age_sec='60'/>"
+    cfg = loader.load(_write(tmp_path, body.format(spill=spill)))
+    assert cfg.spill.enabled and cfg.spill.dir == "sp"
+    assert cfg.spill.max_age_sec == 60 and cfg.spill.max_mb_per_camera == 0
+    assert cfg.spill.segment_records == 65_536
+    bad = "<Spill enabled='true' dir='sp' segment_records='0'/>"
+    with pytest.raises(ConfigValidationError):
+        loader.load(_write(tmp_path, body.format(spill=bad)))
@@ -0,0 +1,95 @@
+"""exporter (CSV / JSONL / バイナリのストリーミング出力) の単体テスト。"""
+
+import csv
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+from app.scripts.core.exporter import (
+    CSV_COLUMNS,
+    ResultExporter,
+    TimeRange,
+    iter_chunks,
+    read_binary,
+)
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _rec(cam: str, ms: int, i: int, lat: float | None = 5.0) -> ResultRecord:
+    return ResultRecord(
+        camera_id=cam,
+        timestamp_utc=BASE + timedelta(milliseconds=ms),
+        gesture_label=f"g{i % 3}",
+        confidence=0.5,
+        latency_ms=lat,
+    )
+
+
+def _filled(storage: str = "object") -> Aggregator:
+    agg = Aggregator(capacity=1000, storage=storage, thread_safe=True)
+    for i in range(100):
+        agg.push_result(_rec("camA", 10 * i, i, None if i % 10 == 0 else 5.0))
+        agg.push_result(_rec("camB", 10 * i, i))
+    return agg
+
+
+def test_iter_chunks_splits_equal_timestamps_without_duplicates() -> None:
+    agg = Aggregator(capacity=100)
+    # 同時刻 5 件が chunk 境界 (3 件) を跨ぐ
+    for i, ms in enumerate([0, 10, 10, 10, 10, 10, 20, 30]):
+        agg.push_result(_rec("c", ms, i))
+    chunks = list(iter_chunks(agg, "c", TimeRange(), chunk_records=3))
+    assert [len(c) for c in chunks] == [3, 3, 2]
+    flat = [r for c in chunks for r in c]
+    assert flat == agg.query("c")
+    with pytest.raises(ValueError):
+        next(iter_chunks(agg, "c", TimeRange(), chunk_records=0))
+
+
+@pytest.mark.parametrize("storage", ["object", "columnar"])
+def test_export_binary_roundtrip_per_camera(tmp_path: Path, storage: str) -> None:
+    agg = _filled(storage)
+    rng = TimeRange(BASE + timedelta(milliseconds=200), BASE + timedelta(seconds=1))
+    report = agg.export("bin", rng, tmp_path, chunk_records=7)
+    assert [f.camera_id for f in report.files] == ["camA", "camB"]
+    assert report.records == 160
+    for f in report.files:
+        assert f.path == tmp_path / f"{f.camera_id}.bin"
+        assert f.bytes_written == f.path.stat().st_size
+        assert list(read_binary(f.path)) == agg.query(f.camera_id, rng.since, rng.until)
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_export_csv_and_jsonl_contents(tmp_path: Path) -> None:
+    agg = _filled()
+    agg.export("csv", TimeRange(), tmp_path, cameras=["camA"], chunk_records=16)
+    agg.export("jsonl", TimeRange(), tmp_path, cameras=["camA"], chunk_records=16)
+    with (tmp_path / "camA.csv").open(newline="") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == CSV_COLUMNS
+    assert len(rows) == 101
+    assert rows[1] == ["camA", "2025-01-01T00:00:00Z", "g0", "0.5", ""]
+    assert rows[2][4] == "5.0"
+    lines = (tmp_path / "camA.jsonl").read_text().splitlines()
+    assert len(lines) == 100
+    assert json.loads(lines[0])["latency_ms"] is None
+    assert json.loads(lines[-1])["timestamp_utc"] == "2025-01-01T00:00:00.990000Z"
+    assert not (tmp_path / "camB.csv").exists()
+
+
+def test_exporter_background_submit_and_errors(tmp_path: Path) -> None:
+    agg = _filled()
+    with ResultExporter(agg, max_workers=2, chunk_records=10) as exporter:
+        with pytest.raises(ValueError):
+            exporter.submit("xml", TimeRange(), tmp_path)
+        report = exporter.submit("jsonl", TimeRange(), tmp_path / "out").result(5)
+        assert report.records == 200
+        # 書込み失敗 (ここでは .part がディレクトリ) は Future 経由で OSError を伝播
+        (tmp_path / "camB.csv.part").mkdir()
+        with pytest.raises(OSError):
+            exporter.submit("csv", TimeRange(), tmp_path).result(5)
+        assert not (tmp_path / "camA.csv.part").exists()
@@ -0,0 +1,85 @@
+"""fleet_stats (全カメラ集計) と Aggregator スナップショットへの同梱のテスト。"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+from app.scripts.core.fleet_stats import summarize_fleet
+from app.scripts.core.latency_sketch import LatencyHistogram
+from app.scripts.core.messages import StatsMessage
+
+NOW = datetime(2025, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+
+
+def _push(agg: Aggregator, cam: str, latencies: list[float]) -> None:
+    for i, lat in enumerate(latencies):
+        agg.push_result(
+            ResultRecord(
+                camera_id=cam,
+                timestamp_utc=NOW - timedelta(milliseconds=10 * (i + 1)),
+                gesture_label="g",
+                confidence=0.9,
+                latency_ms=lat,
+            )
+        )
+
+
+def test_summarize_fleet_top_k_and_merged_quantiles() -> None:
+    stats = {
+        f"cam{i}": {"fps": 10.0, "ema_fps": 9.0, "latency_p95_ms": float(i)}
+        for i in range(10)
+    }
+    stats["cam3"] = {**stats["cam3"], "drop_rate": 0.5}
+    stats["cam7"] = {**stats["cam7"], "drop_rate": 0.1}
+    hists = []
+    for v in (10.0, 20.0, 30.0, 40.0):
+        h = LatencyHistogram()
+        h.record(v)
+        hists.append(h)
+    fleet = summarize_fleet(stats, hists, top_k=3)
+    assert fleet.cameras == 10
+    assert fleet.total_fps == 100.0 and fleet.total_ema_fps == 90.0
+    assert fleet.worst_latency == (("cam9", 9.0), ("cam8", 8.0), ("cam7", 7.0))
+    assert fleet.worst_drop_rate == (("cam3", 0.5), ("cam7", 0.1))
+    assert fleet.mean_drop_rate == pytest.approx(0.3)
+    assert fleet.latency_count == 4
+    assert fleet.latency_p50_ms == pytest.approx(25.0)
+    assert summarize_fleet(stats, hists, top_k=0).worst_latency == ()
+    assert summarize_fleet({}, []).latency_p95_ms is None
+
+
+def test_snapshot_includes_fleet_summary() -> None:
+    agg = Aggregator(capacity=100, fleet_top_k=2)
+    _push(agg, "fast", [5.0] * 20)
+    _push(agg, "slow", [50.0, 60.0, 70.0])
+    _push(agg, "mid", [20.0] * 5)
+    snap = agg.publish(NOW)
+    fleet = snap.fleet
+    assert fleet.cameras == 3
+    assert fleet.total_fps == 28.0
+    assert [cam for cam, _ in fleet.worst_latency] == ["slow", "mid"]
+    # 全体 p95 はカメラ毎 p95 の平均ではなく、マージした分布から求める
+    merged = agg.latency_quantiles(None, "1s", (0.5, 0.95), now=NOW)
+    assert fleet.latency_p95_ms == pytest.approx(merged["p95"])
+    assert fleet.latency_count == 28
+    # 同一 tick 内の StatsMessage は該当カメラの再計算とともにフリート値へも反映
+    agg.apply_stats_message(
+        StatsMessage(camera_id="fast", fps=30.0, avg_latency_ms=None, drop_rate=0.2)
+    )
+    fleet = agg.fleet_summary(NOW)
+    assert fleet.total_fps == 38.0
+    assert fleet.worst_drop_rate == (("fast", 0.2),)
+    assert agg.latest_snapshot() is not None
+    assert agg.latest_snapshot().fleet is fleet  # type: ignore[union-attr]
+    # tick 内の再計算は全カメラを再マージせず、差替えた結果が全体再計算と一致する
+    _push(agg, "new", [90.0] * 4)
+    fleet = agg.fleet_summary(NOW)
+    full = summarize_fleet(
+        agg.latest_snapshot().stats,  # type: ignore[union-attr]
+        agg._latency_hists.values(),
+    )
+    assert fleet.cameras == 4 and fleet.latency_count == full.latency_count == 32
+    assert fleet.latency_p99_ms == pytest.approx(full.latency_p99_ms)
+    with pytest.raises(ValueError):
+        Aggregator(capacity=1, fleet_top_k=-1)
@@ -0,0 +1,119 @@
+"""frame_ring.FrameRing / FrameRingHub (共有メモリフレーム受け渡し) のテスト。"""
+
+from __future__ import annotations
+
+import queue
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from app.scripts.core.frame_ring import FrameRing, FrameRingHub
+from app.scripts.core.frame_source import SyntheticFrameSource
+from app.scripts.core.messages import FrameDescriptor, ResultBatch, ResultRecord
+from app.scripts.core.worker import CaptureInferenceWorker
+
+
+def _frame(value: int, shape: Tuple[int, ...] = (4, 6, 3)) -> np.ndarray:
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def _desc(ring: FrameRing, slot: int, seq: int) -> FrameDescriptor:
+    return FrameDescriptor("cam", ring.name, slot, seq, 0, None, 0)
+
+
+def test_ring_roundtrip_zero_copy_and_wraparound() -> None:
+    ring = FrameRing.create((4, 6, 3), slots=2)
+    reader = FrameRing.attach(ring.name)
+    try:
+        assert (reader.slots, reader.shape) == (2, (4, 6, 3))
+        s0, q0 = ring.write(_frame(1), index=0, pts_ns=None, captured_ns=10)
+        view = reader.view(s0)
+        assert not view.flags.writeable and int(view[0, 0, 0]) == 1
+        assert np.shares_memory(view, reader.view(s0))  # 同じバッファを指す
+        copy = reader.read(s0, q0)
+        assert copy is not None and not np.shares_memory(copy, view)
+        assert q0 % 2 == 0 and reader.is_current(s0, q0)
+        ring.write(_frame(2), index=1, pts_ns=5, captured_ns=11)
+        s2, q2 = ring.write(_frame(3), index=2, pts_ns=None, captured_ns=12)
+        assert s2 == s0 and q2 == q0 + 2  # 2 スロットを一周して上書き
+        assert not reader.is_current(s0, q0) and reader.read(s0, q0) is None
+        assert int(view[0, 0, 0]) == 3  # ビューは上書き後の内容を指す
+        with pytest.raises(ValueError):
+            reader.write(_frame(0), index=0, pts_ns=None, captured_ns=0)
+    finally:
+        reader.close()
+        ring.close()
+        ring.close()  # 冪等
+    with pytest.raises(FileNotFoundError):
+        FrameRing.attach(ring.name)
+
+
+def test_hub_attaches_lazily_and_serves_latest() -> None:
+    ring = FrameRing.create((2, 2), slots=3)
+    hub = FrameRingHub()
+    seen: List[int] = []
+    hub.add_listener(lambda d, view: seen.append(int(view[0, 0])))
+    try:
+        assert hub.latest("cam") is None
+        for v in (7, 8):
+            slot, seq = ring.write(_frame(v, (2, 2)), v, None, 0)
+            hub.publish(_desc(ring, slot, seq))
+        latest = hub.latest("cam")
+        assert latest is not None and int(latest[1][0, 0]) == 8 and seen == [7, 8]
+        for v in (9, 10, 11):  # 最新スロットを上書き
+            ring.write(_frame(v, (2, 2)), index=v, pts_ns=None, captured_ns=0)
+        assert hub.latest("cam") is None
+        # unlink 済みのリングの記述子は無視する
+        hub.publish(FrameDescriptor("gone", "frng_missing", 0, 2, 0, None, 0))
+        assert hub.latest("gone") is None
+    finally:
+        hub.close()
+        ring.close()
+
+
+def test_worker_publishes_frame_descriptors() -> None:
+    q: "queue.Queue[object]" = queue.Queue()
+    worker = CaptureInferenceWorker(
+        "cam",
+        q,
+        target_fps=1000,
+        frame_source=SyntheticFrameSource(8, 4, frames=10, prefetch=0),
+        frame_ring_slots=4,
+    )
+    hub = FrameRingHub()
+    try:
+        worker.run_loop(iterations=3)
+        items = [q.get_nowait() for _ in range(q.qsize())]
+        descs = [i for i in items if isinstance(i, FrameDescriptor)]
+        assert [d.index for d in descs] == [0, 1, 2]
+        assert sum(isinstance(i, ResultRecord) for i in items) == 3
+        for d in descs:
+            hub.publish(d)
+        latest = hub.latest("cam")
+        assert latest is not None and latest[1].shape == (4, 8, 3)
+    finally:
+        hub.close()
+        worker.close()
+    assert hub.ring(descs[0]) is None  # worker の close で削除済み
+
+
+def test_full_queue_drops_descriptor_not_results() -> None:
+    q: "queue.Queue[object]" = queue.Queue(maxsize=3)
+    worker = CaptureInferenceWorker(
+        "cam",
+        q,
+        target_fps=1000,
+        frame_source=SyntheticFrameSource(8, 4, frames=10, prefetch=0),
+        frame_ring_slots=4,
+        batch_max_records=2,
+    )
+    try:
+        worker.run_loop(iterations=6)
+        items = [q.get_nowait() for _ in range(q.qsize())]
+        # 満杯時の記述子は捨てられ、結果バッチは記述子だけを押し出す (3 バッチとも残る)
+        assert all(isinstance(i, ResultBatch) for i in items)
+        assert [len(i) for i in items] == [2, 2, 2]  # type: ignore[arg-type]
+        assert worker.build_stats_message().drop_rate in (None, 0.0)
+    finally:
+        worker.close()
@@ -0,0 +1,111 @@
+"""frame_skip.AdaptiveFrameSkipper と worker の適応フレーム間引きのテスト。"""
+
+from __future__ import annotations
+
+import queue
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pytest
+
+from app.scripts.core.frame_skip import AdaptiveFrameSkipper
+from app.scripts.core.frame_source import SyntheticFrameSource
+from app.scripts.core.inference import InferenceResult
+from app.scripts.core.messages import ResultRecord
+from app.scripts.core.worker import CaptureInferenceWorker
+
+
+def _feed(skipper: AdaptiveFrameSkipper, latency_ms: float, n: int = 4) -> None:
+    for _ in range(n):
+        skipper.record(latency_ms)
+
+
+def test_overload_doubles_stride_up_to_min_fps_floor() -> None:
+    skipper = AdaptiveFrameSkipper(30, 100.0, min_fps=5.0, window=4)
+    assert skipper.admit() and skipper.stride == 1
+    strides = []
+    for _ in range(4):
+        _feed(skipper, 150.0)
+        strides.append(skipper.stride)
+    # 30 / 5 = 6 が上限
+    assert strides == [2, 4, 6, 6]
+    assert skipper.effective_fps == 5.0 and skipper.latency_p95_ms == 150.0
+
+
+def test_hysteresis_band_holds_and_recovery_is_gradual() -> None:
+    skipper = AdaptiveFrameSkipper(30, 100.0, window=4, low_ratio=0.7)
+    _feed(skipper, 150.0)
+    _feed(skipper, 150.0)
+    assert skipper.stride == 4
+    _feed(skipper, 80.0)  # 70 <= p95 <= 100: 維持
+    assert skipper.stride == 4
+    _feed(skipper, 50.0)
+    assert skipper.stride == 3
+    _feed(skipper, 50.0)
+    _feed(skipper, 50.0)
+    _feed(skipper, 50.0)
+    assert skipper.stride == 1
+
+
+def test_admit_keeps_one_frame_per_stride() -> None:
+    skipper = AdaptiveFrameSkipper(30, 100.0, window=1)
+    skipper.record(200.0)
+    skipper.record(200.0)
+    assert skipper.stride == 4
+    assert [skipper.admit() for _ in range(8)] == [True, False, False, False] * 2
+    assert skipper.skipped == 6
+    with pytest.raises(ValueError):
+        AdaptiveFrameSkipper(10, 100.0, min_fps=20.0)
+
+
+class _Q:
+    def __init__(self) -> None:
+        self.items: List[object] = []
+
+    def put_nowait(self, item: object) -> None:
+        self.items.append(item)
+
+    def get_nowait(self) -> object:
+        raise queue.Empty
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> object:
+        raise queue.Empty
+
+    def full(self) -> bool:
+        return False
+
+
+class _SlowBackend:
+    def load(self) -> None:
+        pass
+
+    def warmup(self, runs: int = 1) -> None:
+        pass
+
+    def infer_batch(
+        self, frames: Sequence[np.ndarray], pixel_format: str
+    ) -> List[InferenceResult]:
+        from time import sleep
+
+        sleep(0.003)
+        return [InferenceResult("x", 0.5, np.zeros((1, 3), np.float32)) for _ in frames]
+
+
+def test_worker_skips_frames_before_inference_under_overload() -> None:
+    q = _Q()
+    worker = CaptureInferenceWorker(
+        "cam",
+        q,
+        target_fps=1000,
+        frame_source=SyntheticFrameSource(4, 4, prefetch=0),
+        inference_backend=_SlowBackend(),
+        latency_target_ms=1.0,  # 3ms の推論は常に過負荷
+        min_fps=250.0,
+    )
+    worker.run_loop(iterations=200)
+    processed = sum(isinstance(i, ResultRecord) for i in q.items)
+    stats = worker.build_stats_message()
+    assert worker.skipper is not None and worker.skipper.stride == 4
+    assert stats.effective_fps == 250.0
+    assert stats.skipped_frames == 200 - processed > 100
+    assert stats.drop_rate == 0.0  # 間引きはドロップではない
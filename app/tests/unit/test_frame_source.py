@@ -0,0 +1,217 @@
+"""frame_source (合成 / raw / Y4M / 画像列) と worker のフレーム入力のテスト。"""
+
+from __future__ import annotations
+
+import queue
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from app.scripts.core.errors import StreamConnectionError
+from app.scripts.core.frame_source import (
+    PIXEL_GRAY,
+    PIXEL_I420,
+    PIXEL_YUV444P,
+    Frame,
+    FrameSource,
+    ImageSequenceSource,
+    RawVideoSource,
+    SyntheticFrameSource,
+    Y4MSource,
+    open_frame_source,
+)
+from app.scripts.core.messages import ExitNotice, ResultRecord, StatsMessage
+from app.scripts.core.worker import CaptureInferenceWorker
+
+
+def _read_all(src: FrameSource) -> List[Frame]:
+    frames = []
+    while (frame := src.read()) is not None:
+        frames.append(frame)
+    src.close()
+    return frames
+
+
+def _write_y4m(path: Path, frames: List[bytes], header: str) -> Path:
+    with path.open("wb") as f:
+        f.write(f"YUV4MPEG2 {header}\n".encode())
+        for i, data in enumerate(frames):
+            f.write(b"FRAME Ixyz\n" if i % 2 else b"FRAME\n")
+            f.write(data)
+    return path
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_synthetic_frames_and_end_of_stream(prefetch: int) -> None:
+    src = SyntheticFrameSource(8, 4, frames=3, fps=10.0, prefetch=prefetch)
+    frames = _read_all(src)
+    assert [f.index for f in frames] == [0, 1, 2]
+    assert [f.pts_ns for f in frames] == [0, 100_000_000, 200_000_000]
+    assert frames[0].data.shape == (4, 8, 3) and frames[0].data.dtype == np.uint8
+    # gradient: フレーム毎に明るさが 1 ずつ変わる
+    assert int(frames[2].data[0, 0, 0]) - int(frames[0].data[0, 0, 0]) == 2
+    assert src.read() is None  # close 後も None
+
+
+def test_raw_video_zero_copy_views(tmp_path: Path) -> None:
+    planes = [bytes([i]) * 24 for i in range(3)]  # 4x4 i420 = 24 byte
+    path = tmp_path / "clip.yuv"
+    path.write_bytes(b"".join(planes) + b"\x00" * 5)  # 末尾の端数は無視
+    src = RawVideoSource(path, 4, 4, PIXEL_I420, prefetch=0)
+    assert src.spec.frame_count == 3
+    frame = src.read()
+    assert frame is not None and frame.data.shape == (6, 4)
+    assert not frame.data.flags.writeable and not frame.data.flags.owndata
+    assert [int(f.data[0, 0]) for f in [frame, *_read_all(src)]] == [0, 1, 2]
+
+
+def test_y4m_header_and_frame_parameters(tmp_path: Path) -> None:
+    path = _write_y4m(
+        tmp_path / "a.y4m",
+        [bytes([i]) * 48 for i in range(3)],
+        "W4 H4 F25:1 Ip A1:1 C444 XYSCSS=444",
+    )
+    src = Y4MSource(path, prefetch=1)
+    assert src.spec.pixel_format == PIXEL_YUV444P and src.spec.fps == 25.0
+    frames = _read_all(src)
+    assert [int(f.data[2, 3, 3]) for f in frames] == [0, 1, 2]
+    assert frames[0].data.shape == (3, 4, 4)
+
+
+def test_y4m_truncated_tail_and_loop(tmp_path: Path) -> None:
+    path = _write_y4m(tmp_path / "b.y4m", [b"\x07" * 8, b"\x08" * 3], "W4 H2 Cmono")
+    src = Y4MSource(path, loop=True, prefetch=0)
+    assert src.spec.pixel_format == PIXEL_GRAY and src.spec.frame_count is None
+    # 書込み途中の 2 フレーム目は無視し、1 フレーム目を繰り返す
+    assert [src.read().index for _ in range(3)] == [0, 1, 2]  # type: ignore[union-attr]
+    src.close()
+
+
+def test_y4m_invalid_header_raises(tmp_path: Path) -> None:
+    bad = tmp_path / "bad.y4m"
+    bad.write_bytes(b"RIFF....\n")
+    with pytest.raises(StreamConnectionError):
+        Y4MSource(bad)
+    with pytest.raises(StreamConnectionError):
+        _write_y4m(tmp_path / "c.y4m", [], "W4 H4 C411")
+        Y4MSource(tmp_path / "c.y4m")
+    with pytest.raises(StreamConnectionError):
+        Y4MSource(tmp_path / "missing.y4m")
+
+
+def test_image_sequence_npy_and_pnm(tmp_path: Path) -> None:
+    for i in range(2):
+        np.save(tmp_path / f"f{i:02d}.npy", np.full((2, 3), i, dtype=np.uint8))
+    frames = _read_all(ImageSequenceSource(tmp_path, prefetch=2))
+    assert [int(f.data[1, 2]) for f in frames] == [0, 1]
+    ppm = tmp_path / "p" / "x.ppm"
+    ppm.parent.mkdir()
+    ppm.write_bytes(b"P6\n# comment\n2 1\n255\n" + bytes(range(6)))
+    (frame,) = _read_all(ImageSequenceSource(tmp_path / "p" / "*.ppm"))
+    assert frame.data.shape == (1, 2, 3) and frame.data[0, 1].tolist() == [3, 4, 5]
+
+
+def test_image_sequence_custom_decoder_and_size_mismatch(tmp_path: Path) -> None:
+    paths = [tmp_path / "a.jpg", tmp_path / "b.jpg"]
+    shapes = {"a.jpg": (2, 2), "b.jpg": (3, 3)}
+    src = ImageSequenceSource(
+        paths, decoder=lambda p: np.zeros(shapes[p.name], np.uint8), prefetch=0
+    )
+    assert src.read() is not None
+    with pytest.raises(StreamConnectionError):
+        src.read()
+    with pytest.raises(StreamConnectionError):
+        ImageSequenceSource(paths)  # 拡張子に対応するデコーダなし
+
+
+def test_image_sequence_directory_suffix_and_decoder(tmp_path: Path) -> None:
+    np.save(tmp_path / "a.npy", np.zeros((2, 2), np.uint8))
+    with (tmp_path / "b.NPY").open("wb") as f:  # np.save はパス指定だと .npy を付ける
+        np.save(f, np.ones((2, 2), np.uint8))
+    (tmp_path / "c.jpg").write_bytes(b"jpeg")
+    (tmp_path / "sub").mkdir()
+    # decoder 省略: 対応拡張子 (大文字含む) のみ
+    frames = _read_all(ImageSequenceSource(tmp_path, prefetch=0))
+    assert [int(f.data[0, 0]) for f in frames] == [0, 1]
+    # decoder 指定: 全ての通常ファイル (ディレクトリは除く)
+    seen: List[str] = []
+
+    def decode(p: Path) -> np.ndarray:
+        seen.append(p.name)
+        return np.zeros((2, 2, 3), np.uint8)
+
+    frames = _read_all(ImageSequenceSource(tmp_path, decoder=decode, prefetch=0))
+    assert len(frames) == 3 and seen == ["a.npy", "b.NPY", "c.jpg"]
+    with pytest.raises(StreamConnectionError):  # 4 チャネル (RGBA) は未対応
+        ImageSequenceSource(
+            tmp_path, decoder=lambda p: np.zeros((2, 2, 4), np.uint8), prefetch=0
+        )
+
+
+def test_prefetch_forwards_errors_and_close_stops_thread(tmp_path: Path) -> None:
+    np.save(tmp_path / "a.npy", np.zeros((2, 2), np.uint8))
+    (tmp_path / "b.npy").write_bytes(b"broken")
+    src = ImageSequenceSource(tmp_path, prefetch=2)
+    assert src.read() is not None
+    with pytest.raises(StreamConnectionError):
+        src.read()
+    src.close()
+    endless = SyntheticFrameSource(4, 4, prefetch=2)
+    assert endless.read() is not None
+    endless.close()  # バッファ満杯で待機中の先読みスレッドも停止する
+    assert endless._thread is not None and not endless._thread.is_alive()
+
+
+def test_open_frame_source_urls(tmp_path: Path) -> None:
+    src = open_frame_source("synthetic://16x8?frames=2&format=gray&fps=5")
+    assert src is not None and src.spec.shape == (8, 16) and src.spec.fps == 5.0
+    src.close()
+    raw = tmp_path / "c.bin"
+    raw.write_bytes(bytes(48))
+    src = open_frame_source(f"file://{raw}?size=4x2&format=rgb24", prefetch=0)
+    assert isinstance(src, RawVideoSource) and src.spec.frame_count == 2
+    src.close()
+    assert open_frame_source("rtsp://example.invalid/stream1") is None
+    # 未対応のファイル形式は画像列とみなさずスタブ (None)
+    assert open_frame_source(str(tmp_path / "cam1.mp4")) is None
+    assert open_frame_source(f"file://{tmp_path}/cam1.mp4") is None
+    np.save(tmp_path / "f0.npy", np.zeros((2, 3), np.uint8))
+    src = open_frame_source(str(tmp_path / "*.npy"), prefetch=0)
+    assert isinstance(src, ImageSequenceSource) and src.spec.shape == (2, 3)
+    src.close()
+    with pytest.raises(ValueError):
+        open_frame_source("synthetic://640")
+
+
+class _Q:
+    def __init__(self) -> None:
+        self.items: List[object] = []
+
+    def put_nowait(self, item: object) -> None:
+        self.items.append(item)
+
+    def get_nowait(self) -> object:
+        raise queue.Empty
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> object:
+        raise queue.Empty
+
+    def full(self) -> bool:
+        return False
+
+
+def test_worker_consumes_source_until_end_of_stream() -> None:
+    q = _Q()
+    source = SyntheticFrameSource(4, 4, frames=3, prefetch=1)
+    worker = CaptureInferenceWorker(
+        "cam", q, target_fps=1000, simulate_latency_ms=0.0, frame_source=source
+    )
+    worker.run_loop(iterations=10)
+    assert worker.is_stopping
+    assert sum(isinstance(i, ResultRecord) for i in q.items) == 3
+    stats, notice = q.items[-2:]
+    assert isinstance(stats, StatsMessage) and stats.avg_capture_ms is not None
+    assert isinstance(notice, ExitNotice) and (notice.code, notice.reason) == (0, "EOS")
+    assert source.read() is None  # worker が close 済み
@@ -0,0 +1,197 @@
+"""inference (NumPy 参照キーポイントモデル) と worker のバッチ推論のテスト。"""
+
+from __future__ import annotations
+
+import queue
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pytest
+
+from app.scripts.core.errors import InferenceError, ModelLoadError
+from app.scripts.core.frame_source import (
+    PIXEL_BGR24,
+    PIXEL_GRAY,
+    PIXEL_I420,
+    SyntheticFrameSource,
+)
+from app.scripts.core.inference import (
+    DEFAULT_LABELS,
+    InferenceResult,
+    NumpyKeypointBackend,
+    create_inference_backend,
+)
+from app.scripts.core.messages import ExitNotice, ResultRecord
+from app.scripts.core.process_worker_entry import _SharedBackendLoader
+from app.scripts.core.worker import CaptureInferenceWorker
+
+
+def _backend(**kwargs: object) -> NumpyKeypointBackend:
+    backend = NumpyKeypointBackend(
+        input_size=32, keypoints=5, **kwargs  # type: ignore[arg-type]
+    )
+    backend.load()
+    return backend
+
+
+def test_infer_batch_matches_single_frame_inference() -> None:
+    backend = _backend()
+    rng = np.random.default_rng(1)
+    frames = [rng.integers(0, 256, (48, 64, 3), dtype=np.uint8) for _ in range(3)]
+    batched = backend.infer_batch(frames, PIXEL_BGR24)
+    single = [backend.infer_batch([f], PIXEL_BGR24)[0] for f in frames]
+    assert len(batched) == 3
+    for a, b in zip(batched, single):
+        assert a.label == b.label and a.label in DEFAULT_LABELS
+        assert a.confidence == pytest.approx(b.confidence, rel=1e-5)
+        np.testing.assert_allclose(a.keypoints, b.keypoints, rtol=1e-5)
+    kps = batched[0].keypoints
+    assert kps.shape == (5, 3) and kps.dtype == np.float32
+    assert ((kps >= 0) & (kps <= 1)).all()
+
+
+def test_luma_extraction_per_pixel_format() -> None:
+    backend = _backend()
+    y = np.random.default_rng(2).integers(0, 256, (16, 16), dtype=np.uint8)
+    i420 = np.concatenate([y, np.full((8, 16), 255, np.uint8)])  # Y 面 + 色差
+    gray = backend.preprocess([y], PIXEL_GRAY)
+    np.testing.assert_array_equal(backend.preprocess([i420], PIXEL_I420), gray)
+    assert gray.shape == (1, 32, 32) and -0.5 <= gray.min() <= gray.max() <= 0.5
+    with pytest.raises(InferenceError):
+        backend.infer_batch([y], PIXEL_BGR24)
+
+
+def test_weights_are_deterministic_and_roundtrip(tmp_path: Path) -> None:
+    frame = np.full((8, 8), 100, np.uint8)
+    a, b = _backend(seed=3), _backend(seed=3)
+    (ra,) = a.infer_batch([frame], PIXEL_GRAY)
+    (rb,) = b.infer_batch([frame], PIXEL_GRAY)
+    assert ra.confidence == rb.confidence
+    np.testing.assert_array_equal(ra.keypoints, rb.keypoints)
+    path = tmp_path / "w.npz"
+    a.save_weights(path)
+    c = _backend(weights_path=path)
+    assert c.weight_bytes == a.weight_bytes > 0
+    assert (
+        c.infer_batch([frame], PIXEL_GRAY)[0].confidence
+        == a.infer_batch([frame], PIXEL_GRAY)[0].confidence
+    )
+    with pytest.raises(ModelLoadError):
+        NumpyKeypointBackend(input_size=32, keypoints=7, weights_path=path).load()
+    with pytest.raises(ModelLoadError):
+        NumpyKeypointBackend(weights_path=tmp_path / "missing.npz").load()
+
+
+def test_unloaded_backend_and_factory() -> None:
+    with pytest.raises(InferenceError):
+        NumpyKeypointBackend().infer_batch([np.zeros((8, 8), np.uint8)], PIXEL_GRAY)
+    assert create_inference_backend("stub") is None
+    assert isinstance(create_inference_backend("numpy_keypoint"), NumpyKeypointBackend)
+    with pytest.raises(ValueError):
+        create_inference_backend("openvino")
+
+
+class _Q:
+    def __init__(self) -> None:
+        self.items: List[object] = []
+
+    def put_nowait(self, item: object) -> None:
+        self.items.append(item)
+
+    def get_nowait(self) -> object:
+        raise queue.Empty
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> object:
+        raise queue.Empty
+
+    def full(self) -> bool:
+        return False
+
+
+class _CountingBackend:
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: List[int] = []
+        self.fail = fail
+
+    def load(self) -> None:
+        pass
+
+    def warmup(self, runs: int = 1) -> None:
+        pass
+
+    def infer_batch(
+        self, frames: Sequence[np.ndarray], pixel_format: str
+    ) -> List[InferenceResult]:
+        self.batches.append(len(frames))
+        if self.fail:
+            raise InferenceError("boom")
+        return [InferenceResult("x", 0.5, np.zeros((1, 3), np.float32)) for _ in frames]
+
+
+def test_worker_batches_frames_and_infers_tail_on_eos() -> None:
+    q = _Q()
+    backend = _CountingBackend()
+    worker = CaptureInferenceWorker(
+        "cam",
+        q,
+        target_fps=1000,
+        frame_source=SyntheticFrameSource(8, 8, frames=5, prefetch=0),
+        inference_backend=backend,
+        inference_batch_size=2,
+    )
+    worker.run_loop(iterations=10)
+    assert backend.batches == [2, 2, 1]
+    records = [i for i in q.items if isinstance(i, ResultRecord)]
+    assert [r.gesture_label for r in records] == ["x"] * 5
+    assert isinstance(q.items[-1], ExitNotice) and q.items[-1].reason == "EOS"
+
+
+def test_batched_latency_includes_wait_for_batch() -> None:
+    q = _Q()
+    backend = _CountingBackend()
+    worker = CaptureInferenceWorker(
+        "cam",
+        q,
+        target_fps=50,
+        frame_source=SyntheticFrameSource(8, 8, frames=3, prefetch=0),
+        inference_backend=backend,
+        inference_batch_size=3,
+    )
+    worker.run_loop(iterations=3)
+    assert backend.batches == [3]
+    records = [i for i in q.items if isinstance(i, ResultRecord)]
+    lat = [r.latency_ms for r in records]
+    # 先頭フレームはバッチが埋まるまで 2 フレーム間隔 (約 40ms) 待つ
+    assert lat[0] > lat[1] > lat[2] and lat[0] - lat[2] >= 30.0
+    ts = [r.timestamp_utc for r in records]
+    assert ts[0] < ts[1] < ts[2]  # 取得時刻 (推論完了時刻ではない)
+    stats = worker.build_stats_message()
+    assert stats.avg_latency_ms == pytest.approx(sum(lat) / 3)
+
+
+def test_worker_inference_error_counts_drops() -> None:
+    q = _Q()
+    worker = CaptureInferenceWorker(
+        "cam",
+        q,
+        target_fps=1000,
+        frame_source=SyntheticFrameSource(8, 8, frames=10, prefetch=0),
+        inference_backend=_CountingBackend(fail=True),
+        inference_batch_size=4,
+    )
+    worker.run_loop(iterations=4)
+    assert not any(isinstance(i, ResultRecord) for i in q.items)
+    assert worker.build_stats_message().drop_rate == 1.0
+    with pytest.raises(ValueError):
+        CaptureInferenceWorker("cam", q, inference_backend=_CountingBackend())
+
+
+def test_multi_camera_process_loads_backend_once() -> None:
+    q = _Q()
+    loader = _SharedBackendLoader()
+    ok_a, a = loader("a", "numpy_keypoint", q)
+    ok_b, b = loader("b", "numpy_keypoint", q)
+    assert ok_a and ok_b and a is b and isinstance(a, NumpyKeypointBackend)
+    assert loader("c", "stub", q) == (True, None)
+    assert not q.items
@@ -0,0 +1,96 @@
+"""keypoint_filter.OneEuroKeypointFilter (平滑化 + 手の対応付け) のテスト。"""
+
+from __future__ import annotations
+
+import queue
+
+import numpy as np
+import pytest
+
+from app.scripts.core.frame_source import SyntheticFrameSource
+from app.scripts.core.inference import NumpyKeypointBackend
+from app.scripts.core.keypoint_filter import (
+    FILTER_ONE_EURO,
+    OneEuroKeypointFilter,
+    create_keypoint_filter,
+)
+from app.scripts.core.keypoints import KEYPOINTS_INLINE
+from app.scripts.core.messages import ResultRecord
+from app.scripts.core.worker import CaptureInferenceWorker
+
+K = 21
+FPS = 30.0
+
+
+def _hand(cx: float, cy: float) -> np.ndarray:
+    hand = np.zeros((K, 3), np.float32)
+    hand[:, 0] = cx + np.linspace(-0.02, 0.02, K)
+    hand[:, 1] = cy
+    hand[:, 2] = 0.8
+    return hand
+
+
+def test_smoothing_reduces_jitter_and_follows_motion() -> None:
+    rng = np.random.default_rng(0)
+    filt = OneEuroKeypointFilter(K)
+    raw_err, smooth_err = [], []
+    for i in range(90):  # 静止した手 + ノイズ
+        truth = _hand(0.5, 0.5)
+        noisy = truth.copy()
+        noisy[:, :2] += rng.normal(0, 0.01, (K, 2))
+        out, ids = filt.update(noisy, i / FPS)
+        assert out.shape == (1, K, 3) and ids.tolist() == [0]
+        assert out[0, 0, 2] == pytest.approx(0.8)  # score はそのまま
+        if i >= 30:
+            raw_err.append(np.abs(noisy[:, :2] - truth[:, :2]).mean())
+            smooth_err.append(np.abs(out[0, :, :2] - truth[:, :2]).mean())
+    assert np.mean(smooth_err) < 0.5 * np.mean(raw_err)
+    speed = 0.6  # 正規化座標 / 秒
+    for i in range(90, 120):  # 移動中は遅れ 2 フレーム分未満で追従する
+        x = 0.5 + speed * (i - 89) / FPS
+        out, _ = filt.update(_hand(x, 0.5), i / FPS)
+    assert abs(out[0, :, 0].mean() - x) < 2 * speed / FPS
+
+
+def test_tracks_keep_identity_across_order_and_expire() -> None:
+    filt = OneEuroKeypointFilter(K, max_tracks=2, max_missed=2)
+    left, right = _hand(0.2, 0.5), _hand(0.8, 0.5)
+    _, ids = filt.update(np.stack([left, right]), 0.0)
+    assert ids.tolist() == [0, 1]
+    _, ids = filt.update(np.stack([right, left]), 1 / FPS)  # 順序が入れ替わっても同じ ID
+    assert ids.tolist() == [1, 0]
+    _, ids = filt.update(np.stack([left, right, _hand(0.5, 0.1)]), 2 / FPS)
+    assert ids.tolist() == [0, 1, -1]  # 空きトラックなし
+    for i in range(3, 6):  # right が max_missed を超えて不在
+        _, ids = filt.update(left, i / FPS)
+    assert filt.active_tracks == 1
+    _, ids = filt.update(np.stack([left, right]), 6 / FPS)
+    assert ids.tolist() == [0, 2]  # 新しい ID で再開
+    with pytest.raises(ValueError):
+        filt.update(np.zeros((5, 3)), 7 / FPS)
+    with pytest.raises(ValueError):
+        create_keypoint_filter("kalman")
+
+
+def test_worker_smooths_and_tags_emitted_keypoints() -> None:
+    q: "queue.Queue[object]" = queue.Queue()
+    backend = NumpyKeypointBackend(input_size=32)
+    backend.load()
+    worker = CaptureInferenceWorker(
+        "cam",
+        q,
+        target_fps=1000,
+        frame_source=SyntheticFrameSource(16, 16, frames=8, prefetch=0),
+        inference_backend=backend,
+        inference_batch_size=4,
+        keypoint_mode=KEYPOINTS_INLINE,
+        keypoint_filter=FILTER_ONE_EURO,
+    )
+    worker.run_loop(iterations=8)
+    items = [q.get_nowait() for _ in range(q.qsize())]
+    records = [i for i in items if isinstance(i, ResultRecord)]
+    assert len(records) == 8
+    assert all(r.keypoints is not None for r in records)
+    assert {r.keypoints.track_ids for r in records if r.keypoints} == {(0,)}
+    with pytest.raises(ValueError):
+        CaptureInferenceWorker("cam", q, keypoint_filter="median")
@@ -0,0 +1,123 @@
+"""keypoints (KeypointPayload の生成・共有メモリ参照・columnar 保持) のテスト。"""
+
+from __future__ import annotations
+
+import pickle
+import queue
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from app.scripts.core.frame_source import SyntheticFrameSource
+from app.scripts.core.inference import NumpyKeypointBackend
+from app.scripts.core.keypoints import (
+    KEYPOINTS_INLINE,
+    KEYPOINTS_SHARED,
+    KeypointResolver,
+    KeypointWriter,
+    pack_keypoints,
+    unpack_keypoints,
+)
+from app.scripts.core.messages import KeypointPayload, ResultBatch, ResultRecord
+from app.scripts.core.result_store import (
+    MAX_HANDS,
+    ColumnarResultRing,
+    LabelInterner,
+)
+from app.scripts.core.worker import CaptureInferenceWorker
+
+_TS = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _hands(n: int, k: int = 21) -> np.ndarray:
+    return np.arange(n * k * 3, dtype=np.float32).reshape(n, k, 3) / 100
+
+
+def _rec(kp: "KeypointPayload | None") -> ResultRecord:
+    return ResultRecord("cam", _TS, "a", 0.5, 1.0, kp)
+
+
+def test_pack_roundtrip_and_batch_pickle() -> None:
+    kp = pack_keypoints(_hands(1)[0])  # (K, 3) は 1 手
+    assert kp.hands == 1 and len(kp.data) == 21 * 3 * 4
+    np.testing.assert_array_equal(unpack_keypoints(kp), _hands(1))
+    assert unpack_keypoints(KeypointPayload(0)).shape == (0, 21, 3)
+    with pytest.raises(ValueError):
+        pack_keypoints(np.zeros((21, 2)))
+    with pytest.raises(ValueError):
+        unpack_keypoints(KeypointPayload(1, ring_name="x", slot=0, seq=2))
+    batch = ResultBatch("cam", (_rec(kp), _rec(None)))
+    back = pickle.loads(pickle.dumps(batch))
+    assert back.records[0].keypoints == kp and back.records[1].keypoints is None
+    # キーポイントなしのバッチは列を持たない (従来と同じ転送量)
+    plain = ResultBatch("cam", (_rec(None),))
+    assert plain.__reduce__()[1][5] is None
+
+
+def test_columnar_ring_stores_keypoints() -> None:
+    ring = ColumnarResultRing("cam", 3, LabelInterner())
+    ring.append(_rec(KeypointPayload(0)))  # 確保前の手なしは保持しない
+    ring.append(_rec(pack_keypoints(_hands(1), track_ids=(7,))))
+    ring.append(_rec(pack_keypoints(_hands(MAX_HANDS + 1))))  # 上限超過は切り捨て
+    ring.append(_rec(None))  # 先頭を上書き
+    got = [r.keypoints for r in ring]
+    assert got[0] is not None and got[0].hands == 1 and got[0].track_ids == (7,)
+    np.testing.assert_array_equal(unpack_keypoints(got[0]), _hands(1))
+    assert got[1] is not None and got[1].hands == MAX_HANDS and not got[1].track_ids
+    np.testing.assert_array_equal(
+        unpack_keypoints(got[1]), _hands(MAX_HANDS + 1)[:MAX_HANDS]
+    )
+    assert got[2] is None
+    ring.append(_rec(pack_keypoints(_hands(1, k=5))))  # K が異なる
+    assert ring.record_at(2).keypoints is None
+    # 上限超過の手はトラック ID も先頭 MAX_HANDS 手分に切り詰める (レコードは保持)
+    ids = tuple(range(1, MAX_HANDS + 2))
+    ring.append(_rec(pack_keypoints(_hands(MAX_HANDS + 1), track_ids=ids)))
+    kp = ring.record_at(2).keypoints
+    assert kp is not None and kp.hands == MAX_HANDS
+    assert kp.track_ids == ids[:MAX_HANDS]
+
+
+def test_shared_writer_and_resolver() -> None:
+    writer = KeypointWriter(KEYPOINTS_SHARED, slots=2)
+    resolver = KeypointResolver()
+    try:
+        refs = [writer.pack(_hands(1) + i) for i in range(3)]
+        assert all(r is not None and r.ring_name and not r.data for r in refs)
+        # 3 件目が 1 件目のスロットを上書き済み
+        out = list(resolver.resolve_all([_rec(r) for r in refs]))
+        assert out[0].keypoints is None and resolver.stale == 1
+        for i in (1, 2):
+            kp = out[i].keypoints
+            assert kp is not None and kp.ring_name is None
+            np.testing.assert_array_equal(unpack_keypoints(kp), _hands(1) + i)
+        plain = [_rec(pack_keypoints(_hands(1)))]
+        assert resolver.resolve_all(plain) is plain
+    finally:
+        resolver.close()
+        writer.close()
+    with pytest.raises(ValueError):
+        KeypointWriter("msgpack")
+
+
+def test_worker_attaches_inline_keypoints() -> None:
+    q: "queue.Queue[object]" = queue.Queue()
+    backend = NumpyKeypointBackend(input_size=32)
+    backend.load()
+    worker = CaptureInferenceWorker(
+        "cam",
+        q,
+        target_fps=1000,
+        frame_source=SyntheticFrameSource(16, 16, frames=4, prefetch=0),
+        inference_backend=backend,
+        keypoint_mode=KEYPOINTS_INLINE,
+    )
+    worker.run_loop(iterations=2)
+    worker.close()
+    items = [q.get_nowait() for _ in range(q.qsize())]
+    records = [i for i in items if isinstance(i, ResultRecord)]
+    assert len(records) == 2
+    for rec in records:
+        assert rec.keypoints is not None
+        assert unpack_keypoints(rec.keypoints).shape == (1, backend.keypoints, 3)
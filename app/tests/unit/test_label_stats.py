@@ -0,0 +1,70 @@
+"""label_stats (ラベル件数 / 平均信頼度 / 遷移回数) と Aggregator.label_stats のテスト。"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+from app.scripts.core.label_stats import LabelCounts, WindowedLabelStats
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _rec(cam: str, sec: float, label: str, conf: float = 0.5) -> ResultRecord:
+    return ResultRecord(
+        camera_id=cam,
+        timestamp_utc=BASE + timedelta(seconds=sec),
+        gesture_label=label,
+        confidence=conf,
+        latency_ms=1.0,
+    )
+
+
+def test_label_counts_merge_and_transitions() -> None:
+    a, b = LabelCounts(), LabelCounts()
+    prev = None
+    for label, conf in (("x", 0.2), ("y", 0.4), ("x", 0.6)):
+        a.record(label, conf, prev)
+        prev = label
+    b.record("y", 1.0, "x")
+    m = LabelCounts.merged([a, b])
+    assert m.total == 4
+    assert m.counts() == {"x": 2, "y": 2}
+    assert m.mean_confidence() == pytest.approx({"x": 0.4, "y": 0.7})
+    assert m.transitions() == {"x": {"y": 2}, "y": {"x": 1}}
+
+
+def test_windows_expire_by_slice() -> None:
+    stats = WindowedLabelStats()
+    t0 = BASE.timestamp()
+    stats.record(t0, "a", 1.0)
+    stats.record(t0 + 120, "b", 1.0)
+    now = t0 + 121
+    assert stats.window("1m", now).counts() == {"b": 1}
+    ten = stats.window("10m", now)
+    assert ten.counts() == {"a": 1, "b": 1}
+    assert ten.transitions() == {"a": {"b": 1}}
+    with pytest.raises(ValueError):
+        stats.window("2m", now)
+
+
+def test_aggregator_label_stats_per_camera_and_fleet() -> None:
+    agg = Aggregator(capacity=4, thread_safe=True)
+    seq = ["a", "a", "b", "a", "c", "b"]
+    for i, label in enumerate(seq):
+        agg.push_result(_rec("cam01", 10 * i, label, conf=0.1 * (i + 1)))
+    agg.push_result(_rec("cam02", 30, "b", conf=0.9))
+    now = BASE + timedelta(seconds=60)
+    st = agg.label_stats("cam01", "10m", now=now)
+    # リング capacity (4) を超えて押し出された分も集計に残る
+    assert st["count"] == 6
+    assert st["counts"] == {"a": 3, "b": 2, "c": 1}
+    assert st["mean_confidence"]["b"] == pytest.approx((0.3 + 0.6) / 2)
+    assert st["transitions"]["a"] == {"a": 1, "b": 1, "c": 1}
+    fleet = agg.label_stats(window="10m", now=now)
+    assert fleet["counts"]["b"] == 3 and fleet["count"] == 7
+    assert agg.label_stats("nope", now=now)["count"] == 0
+    with pytest.raises(ValueError):
+        agg.label_stats("cam01", "5s")
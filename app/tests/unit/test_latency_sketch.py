@@ -0,0 +1,101 @@
+"""latency_sketch / windowing の単体テスト。"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+from app.scripts.core.latency_sketch import (
+    LatencyHistogram,
+    WindowedLatencySketch,
+    quantile_key,
+)
+from app.scripts.core.windowing import SliceRing
+
+
+def test_histogram_exact_for_distinct_buckets() -> None:
+    h = LatencyHistogram()
+    for v in (10.0, 30.0):
+        h.record(v)
+    p50, p95 = h.quantiles((0.5, 0.95))
+    assert p50 == 20.0
+    assert p95 == pytest.approx(29.0)
+
+
+def test_histogram_relative_error_bounded() -> None:
+    rng = random.Random(1)
+    values = [rng.lognormvariate(2.0, 0.8) for _ in range(20000)]
+    h = LatencyHistogram()
+    for v in values:
+        h.record(v)
+    exact = sorted(values)
+    for q, est in zip((0.5, 0.95, 0.99), h.quantiles((0.5, 0.95, 0.99))):
+        truth = exact[int((len(exact) - 1) * q)]
+        assert est == pytest.approx(truth, rel=0.03)
+
+
+def test_histogram_merge_equals_combined() -> None:
+    a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i in range(1, 200):
+        (a if i % 2 else b).record(float(i))
+        both.record(float(i))
+    merged = LatencyHistogram.merged([a, b])
+    assert merged.count == both.count
+    assert merged.quantiles((0.5, 0.99)) == both.quantiles((0.5, 0.99))
+    assert merged.subtract(b).quantiles((0.5, 0.99)) == a.quantiles((0.5, 0.99))
+    assert merged.count == a.count
+
+
+def test_empty_histogram_returns_none() -> None:
+    assert LatencyHistogram().quantiles((0.5,)) == [None]
+
+
+def test_slice_ring_expires_old_slices() -> None:
+    ring: SliceRing[list] = SliceRing(1.0, 3, list)
+    ring.slot(10.5).append(1)  # type: ignore[union-attr]
+    ring.slot(12.2).append(2)  # type: ignore[union-attr]
+    assert sorted(x for s in ring.live(12.9) for x in s) == [1, 2]
+    assert [x for s in ring.live(13.0) for x in s] == [2]
+    ring.slot(13.1).append(3)  # type: ignore[union-attr]  # 10 の位置を再利用
+    assert ring.slot(10.0) is None  # 上書き済みの過去スライス
+
+
+def test_windowed_sketch_windows_and_invalid() -> None:
+    sk = WindowedLatencySketch()
+    sk.record(100.0, 5.0)
+    sk.record(108.0, 50.0)
+    assert sk.histogram("1s", 108.5).count == 1
+    assert sk.histogram("10s", 108.5).count == 2
+    with pytest.raises(ValueError):
+        sk.histogram("2h", 108.5)
+
+
+def test_quantile_key() -> None:
+    assert [quantile_key(q) for q in (0.5, 0.95, 0.99, 0.999)] == [
+        "p50",
+        "p95",
+        "p99",
+        "p999",
+    ]
+
+
+def test_aggregator_latency_quantiles_fleet_merge() -> None:
+    agg = Aggregator(capacity=100)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i, cam in enumerate(("a", "b")):
+        for j in range(10):
+            agg.push_result(
+                ResultRecord(cam, base + timedelta(seconds=j), "g", 0.9, 10.0 * (i + 1))
+            )
+    now = base + timedelta(seconds=9, milliseconds=500)
+    one = agg.latency_quantiles("a", window="10s", now=now)
+    fleet = agg.latency_quantiles(None, window="10s", now=now)
+    assert one["p50"] == 10.0 and one["count"] == 10
+    assert fleet["count"] == 20
+    assert fleet["p999"] == pytest.approx(20.0)
+    assert agg.latency_quantiles("missing", now=now)["p50"] is None
+    with pytest.raises(ValueError):
+        Aggregator(capacity=1, latency_window="7s")
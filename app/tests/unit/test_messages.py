@@ -32,3 +32,18 @@ def test_exit_notice_repr() -> None:
     en = m.ExitNotice(camera_id="cam01", code=0, reason="ok")
     r = repr(en)
     assert "ExitNotice" in r and "cam01" in r
+
+
+def test_result_batch_pickle_roundtrip() -> None:
+    import pickle
+    from datetime import datetime, timezone
+
+    ts = datetime(2025, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc)
+    recs = tuple(
+        m.ResultRecord("cam01", ts, f"g{i}", 0.5, None if i == 1 else float(i))
+        for i in range(3)
+    )
+    batch = m.ResultBatch(camera_id="cam01", records=recs)
+    again = pickle.loads(pickle.dumps(batch))
+    assert again == batch and len(again) == 3
+    assert again.records[0].timestamp_utc == ts
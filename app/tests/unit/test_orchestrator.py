@@ -5,11 +5,30 @@
 - Worker スレッドが結果をキュー経由で Aggregator に反映
 """
 
+from datetime import datetime, timedelta, timezone
 from time import sleep
+from typing import List
 
+import pytest
+
+from app.scripts.core.messages import (
+    ExitNotice,
+    ResultBatch,
+    ResultRecord,
+    StatusUpdate,
+)
 from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
 
 
+class _Notice(ExitNotice):
+    pass
+
+
+def _record(cam: str, i: int) -> ResultRecord:
+    ts = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(milliseconds=i)
+    return ResultRecord(cam, ts, "none", 0.5, 1.0)
+
+
 def test_orchestrator_start_and_collect_results() -> None:
     cfg = OrchestratorConfig(
         camera_ids=["camA"],
@@ -43,3 +62,51 @@ def test_orchestrator_multiple_cameras() -> None:
     r1 = orch.aggregator.query("c1")
     r2 = orch.aggregator.query("c2")
     assert r1 and r2
+
+
+def test_dispatch_round_drains_and_pushes_results_in_bulk(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    orch = Orchestrator(OrchestratorConfig(camera_ids=["d1", "d2"]))
+    pushes: List[int] = []
+    push_results = orch.aggregator.push_results
+
+    def counting(records):  # type: ignore[no-untyped-def]
+        records = list(records)
+        pushes.append(len(records))
+        push_results(records)
+
+    monkeypatch.setattr(orch.aggregator, "push_results", counting)
+    channels = orch._channels
+    for i in range(5):
+        channels.result_queue("d1").put_nowait(_record("d1", i))
+    batch = tuple(_record("d2", i) for i in range(3))
+    channels.result_queue("d2").put_nowait(ResultBatch("d2", batch))
+    channels.status.put_nowait(ExitNotice("d1", 0, "STOP"))
+    channels.status.put_nowait(StatusUpdate("d2", "RETRYING", 1, "exitcode=-9"))
+    channels.status.put_nowait(object())  # 未知の型は破棄し件数を数える
+    channels.status.put_nowait(_Notice("d2", 1, "SOURCE_OPEN"))  # 派生型は基底の処理へ
+    assert orch._dispatch_round(timeout=0.01) == 10
+    assert orch.unhandled_messages == {"object": 1}
+    assert orch.exit_notices["d2"].reason == "SOURCE_OPEN"
+    assert pushes == [8]  # 1 巡分をまとめて 1 回
+    assert orch.camera_status["d2"].status == "RETRYING"
+    assert len(orch.aggregator.query("d1")) == 5
+    assert len(orch.aggregator.query("d2")) == 3
+    assert orch.exit_notices["d1"].reason == "STOP"
+    assert orch._dispatch_round(timeout=0.01) == 0 and pushes == [8]
+    capped = Orchestrator(OrchestratorConfig(camera_ids=["d3"], dispatch_max_records=2))
+    for i in range(5):
+        capped._channels.result_queue("d3").put_nowait(_record("d3", i))
+    capped._dispatch_round(timeout=0.01)
+    assert len(capped.aggregator.query("d3")) == 5
+    with pytest.raises(ValueError):
+        Orchestrator(OrchestratorConfig(camera_ids=["x"], dispatch_max_records=0))
+
+
+def test_dispatcher_wait_never_zero() -> None:
+    # stats_refresh_sec=0 (tick cache なし) でも dispatcher が busy-spin しない
+    orch = Orchestrator(OrchestratorConfig(camera_ids=["w"], stats_refresh_sec=0.0))
+    assert orch._dispatch_wait_sec == 0.2
+    orch = Orchestrator(OrchestratorConfig(camera_ids=["w"], stats_refresh_sec=0.05))
+    assert orch._dispatch_wait_sec == 0.05
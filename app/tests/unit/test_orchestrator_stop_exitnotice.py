@@ -21,3 +21,20 @@ def test_orchestrator_stop_collects_exitnotice_thread_mode():
     en = notices["camA"]
     assert en.code == 0
     assert en.reason == "STOP"
+
+
+def test_orchestrator_frame_source_eos_and_open_failure_thread_mode(tmp_path):
+    cfg = OrchestratorConfig(
+        camera_ids=["camS", "camX"],
+        target_fps=100,
+        worker_latency_ms=0.0,
+        camera_sources={"camS": "synthetic://8x8?frames=5", "camX": str(tmp_path / "none.y4m")},
+    )
+    orch = Orchestrator(cfg)
+    orch.start()
+    sleep(0.4)
+    notices = orch.exit_notices
+    orch.stop()
+    # 入力終端で自発停止 / 開けないソースは起動せず code=1
+    assert (notices["camS"].code, notices["camS"].reason) == (0, "EOS")
+    assert notices["camX"].code == 1 and notices["camX"].reason.startswith("SOURCE_OPEN")
@@ -0,0 +1,66 @@
+"""pacing.FramePacer (絶対期限ペーシング) と worker の待機中制御受信のテスト。"""
+
+from __future__ import annotations
+
+import queue
+from time import monotonic
+
+import pytest
+
+from app.scripts.core.messages import CONTROL_PING, ControlMessage, StatusUpdate
+from app.scripts.core.pacing import PACING_CATCH_UP, FramePacer
+from app.scripts.core.worker import CaptureInferenceWorker
+
+MS = 1_000_000
+
+
+def test_deadlines_do_not_drift_with_late_wakeups() -> None:
+    pacer = FramePacer(100)  # 10ms
+    assert pacer.remaining_ns(0) == 0 and pacer.next_deadline_ns is None
+    now = 1_000 * MS
+    deadlines = [pacer.advance(now)]
+    for _ in range(5):
+        # 毎回 3ms 遅れて起床しても期限は開始時刻 + n × 10ms のまま
+        now = deadlines[-1] + 3 * MS
+        deadlines.append(pacer.advance(now))
+    assert deadlines == [1_000 * MS + 10 * MS * n for n in range(1, 7)]
+    assert pacer.remaining_ns(deadlines[-1] - 4 * MS) == 4 * MS
+    assert pacer.skipped == 0
+
+
+def test_skip_and_catch_up_policies() -> None:
+    skip = FramePacer(100)
+    skip.advance(0)
+    # 期限 10ms のフレームが 45ms に開始 -> 20/30/40ms を過ぎている: 最新 (40ms) のみ実行
+    assert skip.advance(45 * MS) == 40 * MS
+    assert skip.skipped == 2
+    catch = FramePacer(100, PACING_CATCH_UP, max_catch_up=2)
+    catch.advance(0)
+    # 連続実行は 2 フレームまで: 20/30/40ms のうち 20ms を飛ばし 30ms から追い付く
+    assert catch.advance(45 * MS) == 30 * MS
+    assert catch.advance(46 * MS) == 40 * MS
+    assert catch.advance(47 * MS) == 50 * MS
+    assert catch.skipped == 1
+    with pytest.raises(ValueError):
+        FramePacer(0)
+    with pytest.raises(ValueError):
+        FramePacer(10, "fast")
+
+
+def test_worker_answers_ping_while_waiting_for_deadline() -> None:
+    results: queue.Queue = queue.Queue()
+    control: queue.Queue = queue.Queue()
+    worker = CaptureInferenceWorker(
+        "camP", results, target_fps=2, simulate_latency_ms=0.0, control_queue=control
+    )
+    worker.run_loop(iterations=1)
+    control.put(ControlMessage(type=CONTROL_PING, payload={"id": "p1"}))
+    t0 = monotonic()
+    # 2 フレーム目の期限 (500ms 後) を待つ間に PING を受信・応答する
+    worker.run_loop(iterations=1)
+    elapsed = monotonic() - t0
+    items = list(results.queue)  # type: ignore[attr-defined]
+    pongs = [i for i in items if isinstance(i, StatusUpdate)]
+    assert [p.ping_response for p in pongs] == ["p1"]
+    assert items.index(pongs[0]) == 1  # 2 フレーム目より前に応答
+    assert 0.4 < elapsed < 0.7
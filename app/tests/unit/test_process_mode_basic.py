@@ -23,3 +23,32 @@ def test_process_mode_start_stop_and_results():
     hs = orch.health_state["pc1"]
     assert hs["losses"] == 0
     orch.stop()
+
+
+def test_process_mode_packs_cameras_per_process():
+    cams = ["pk1", "pk2", "pk3"]
+    cfg = OrchestratorConfig(
+        camera_ids=cams,
+        use_process=True,
+        cameras_per_process=2,
+        ping_interval_sec=0.1,
+        ping_timeout_sec=0.5,
+        worker_latency_ms=0.0,
+        # pk2 cannot open its source: only that camera exits, its process-mate keeps running
+        camera_sources={"pk2": "missing-dir/*.npy"},
+    )
+    orch = Orchestrator(cfg)
+    orch.start()
+    assert orch.active_process_count == 2  # [pk1, pk2] + [pk3]
+    sleep(1.5)
+    snap = orch.aggregator.snapshot_stats()
+    hs = orch.health_state
+    for cam in ("pk1", "pk3"):
+        assert cam in snap
+        assert hs[cam]["losses"] == 0 and hs[cam]["last_rtt_ms"] is not None
+    assert orch.exit_notices["pk2"].reason.startswith("SOURCE_OPEN")
+    orch.stop()
+    notices = orch.exit_notices
+    for cam in ("pk1", "pk3"):
+        assert (notices[cam].code, notices[cam].reason) == (0, "STOP")
+    assert orch.active_process_count == 0
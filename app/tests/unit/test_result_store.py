@@ -0,0 +1,103 @@
+"""result_store (Object / Columnar リング) の単体テスト。"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+from app.scripts.core.result_store import (
+    ColumnarResultRing,
+    LabelInterner,
+    ObjectResultRing,
+)
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _rec(i: int, lat: float | None = 1.5) -> ResultRecord:
+    return ResultRecord("cam", BASE + timedelta(microseconds=i), f"g{i % 3}", 0.5, lat)
+
+
+@pytest.mark.parametrize(
+    "ring",
+    [ObjectResultRing(3), ColumnarResultRing("cam", 3, LabelInterner())],
+)
+def test_ring_evicts_oldest_like_deque(ring) -> None:
+    for i in range(5):
+        ring.append(_rec(i))
+    assert len(ring) == 3
+    assert [r.timestamp_utc.microsecond for r in ring] == [2, 3, 4]
+    assert ring.record_at(0).gesture_label == "g2"
+    with pytest.raises(IndexError):
+        ring.record_at(3)
+
+
+def test_columnar_roundtrip_preserves_fields() -> None:
+    ring = ColumnarResultRing("cam", 4, LabelInterner())
+    src = [_rec(1), _rec(2, lat=None)]
+    for r in src:
+        ring.append(r)
+    out = list(ring)
+    assert out == src  # 0.5 / 1.5 は float32 で厳密表現可能
+    assert out[1].latency_ms is None
+    assert ColumnarResultRing.bytes_per_record() == 18
+
+
+def test_label_interner_shared_ids() -> None:
+    labels = LabelInterner()
+    assert labels.intern("a") == 0
+    assert labels.intern("b") == 1
+    assert labels.intern("a") == 0
+    assert labels.label(1) == "b"
+
+
+def test_aggregator_columnar_query_and_invalid_storage() -> None:
+    agg = Aggregator(capacity=2, storage="columnar")
+    for i in range(3):
+        agg.push_result(_rec(i))
+    res = agg.query("cam", since=BASE + timedelta(microseconds=2))
+    assert [r.gesture_label for r in res] == ["g2"]
+    assert len(agg.query("cam")) == 2
+    with pytest.raises(ValueError):
+        Aggregator(capacity=2, storage="parquet")
+
+
+@pytest.mark.parametrize("storage", ["object", "columnar"])
+def test_late_record_inserted_in_time_order(storage: str) -> None:
+    agg = Aggregator(capacity=4, storage=storage)
+    for i in (0, 2, 4):
+        agg.push_result(_rec(i))
+    agg.push_result(_rec(1))  # 遅着
+    assert [r.timestamp_utc.microsecond for r in agg.query("cam")] == [0, 1, 2, 4]
+    # 満杯時の遅着: 最古を捨てて整列維持
+    agg.push_result(_rec(3))
+    assert [r.timestamp_utc.microsecond for r in agg.query("cam")] == [1, 2, 3, 4]
+    # 保持中の全件より古い遅着は破棄
+    agg.push_result(_rec(0))
+    assert [r.timestamp_utc.microsecond for r in agg.query("cam")] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("storage", ["object", "columnar"])
+def test_range_query_filters(storage: str) -> None:
+    agg = Aggregator(capacity=100, storage=storage)
+    for i in range(30):
+        agg.push_result(_rec(i))
+    us = lambda n: BASE + timedelta(microseconds=n)  # noqa: E731
+
+    def ids(**kw) -> list[int]:
+        return [r.timestamp_utc.microsecond for r in agg.query("cam", **kw)]
+
+    assert ids(since=us(10), until=us(13)) == [10, 11, 12]
+    assert ids(since=us(10), limit=2) == [10, 11]
+    assert ids(limit=3, reverse=True) == [29, 28, 27]
+    assert ids(until=us(9), labels={"g0"}) == [0, 3, 6]
+    assert ids(labels={"unknown"}) == []
+    assert ids(since=us(5), until=us(5)) == []
+    assert ids(min_confidence=0.6) == []
+    assert ids(limit=0) == []
+    it = agg.iter_query("cam", since=us(28))
+    assert next(it).timestamp_utc == us(28)
+    with pytest.raises(ValueError):
+        agg.iter_query("cam", limit=-1)
@@ -0,0 +1,120 @@
+"""scheduler.WorkerScheduler (スレッドモード worker の単一スレッド駆動) のテスト。"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import Counter
+from typing import List
+
+import pytest
+
+from app.scripts.core.messages import (
+    CONTROL_PING,
+    CONTROL_STOP,
+    ControlMessage,
+    ExitNotice,
+    ResultRecord,
+    StatusUpdate,
+)
+from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
+from app.scripts.core.scheduler import WorkerScheduler
+from app.scripts.core.worker import CaptureInferenceWorker
+
+
+def _drain(q: "queue.Queue[object]") -> List[object]:
+    items: List[object] = []
+    while True:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            return items
+
+
+def test_scheduler_paces_workers_and_handles_control_promptly() -> None:
+    results: "queue.Queue[object]" = queue.Queue()
+    status: "queue.Queue[object]" = queue.Queue()
+    sched = WorkerScheduler()
+    fps = {"a": 50, "b": 20, "c": 5}
+    ctrl = {cam: sched.control_queue(cam) for cam in fps}
+    for cam, f in fps.items():
+        sched.add(
+            CaptureInferenceWorker(
+                cam,
+                results,
+                target_fps=f,
+                simulate_latency_ms=0.0,
+                control_queue=ctrl[cam],
+                status_queue=status,
+            )
+        )
+    stop = threading.Event()
+    t = threading.Thread(target=sched.run, args=(stop,), daemon=True)
+    t.start()
+    time.sleep(1.0)
+    # c の次期限 (最大 200ms 先) を待たずに PING へ応答する
+    sent = time.monotonic()
+    ctrl["c"].put_nowait(ControlMessage(type=CONTROL_PING, payload={"id": "p1"}))
+    reply = None
+    while reply is None and time.monotonic() - sent < 1.0:
+        reply = next(
+            (
+                m
+                for m in _drain(status)
+                if isinstance(m, StatusUpdate) and m.ping_response == "p1"
+            ),
+            None,
+        )
+        time.sleep(0.001)
+    assert reply is not None and time.monotonic() - sent < 0.1
+    for q in ctrl.values():
+        q.put_nowait(ControlMessage(type=CONTROL_STOP, payload={}))
+    t.join(timeout=2)
+    assert not t.is_alive() and sched.active == 0  # 全 worker の STOP で終了
+    counts = Counter(
+        r.camera_id for r in _drain(results) if isinstance(r, ResultRecord)
+    )
+    for cam, f in fps.items():
+        assert f * 0.9 <= counts[cam] <= f * 1.3, counts
+    notices = [m for m in _drain(status) if isinstance(m, ExitNotice)]
+    assert sorted(n.camera_id for n in notices) == ["a", "b", "c"]
+
+
+def test_scheduler_drops_failing_worker_only() -> None:
+    results: "queue.Queue[object]" = queue.Queue()
+    sched = WorkerScheduler()
+    good, bad = (
+        CaptureInferenceWorker(cam, results, target_fps=100, simulate_latency_ms=0)
+        for cam in ("good", "bad")
+    )
+    bad.step = lambda: 1 // 0  # type: ignore[method-assign]
+    sched.add(good)
+    sched.add(bad)
+    stop = threading.Event()
+    threading.Timer(0.2, stop.set).start()
+    sched.run(stop)
+    assert sched.wakeups > 10 and not results.empty()
+
+
+def test_orchestrator_scheduler_runtime() -> None:
+    cams = [f"s{i}" for i in range(5)]
+    cfg = OrchestratorConfig(
+        camera_ids=cams,
+        thread_runtime="scheduler",
+        target_fps=20,
+        worker_latency_ms=0.0,
+        ping_interval_sec=0.1,
+        ping_timeout_sec=0.5,
+    )
+    orch = Orchestrator(cfg)
+    orch.start()
+    time.sleep(0.6)
+    assert len(orch._worker_threads) == 1
+    for cam in cams:
+        assert orch.health_state[cam]["last_rtt_ms"] is not None
+    orch.stop()
+    assert all(orch.exit_notices[c].reason == "STOP" for c in cams)
+    assert not orch._worker_threads[0].is_alive()
+    with pytest.raises(ValueError):
+        Orchestrator(OrchestratorConfig(camera_ids=cams, thread_runtime="asyncio"))
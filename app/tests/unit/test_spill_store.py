@@ -0,0 +1,139 @@
+"""spill_store (ディスク階層) と Aggregator の階層透過クエリのテスト。"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from app.scripts.core import utils_time
+from app.scripts.core.aggregator import Aggregator, ResultRecord
+from app.scripts.core.exporter import TimeRange, read_binary
+from app.scripts.core.spill_store import CameraSpill, SpillStore
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+BASE_NS = utils_time.to_epoch_ns(BASE)
+SEC = 1_000_000_000
+
+
+def _rec(i: int, cam: str = "c") -> ResultRecord:
+    return ResultRecord(
+        camera_id=cam,
+        timestamp_utc=BASE + timedelta(milliseconds=10 * i),
+        gesture_label=f"g{i % 3}",
+        confidence=0.5 + (i % 4) * 0.125,
+        latency_ms=None if i % 5 == 0 else float(i),
+    )
+
+
+def test_camera_spill_roundtrip_rollover_and_reload(tmp_path: Path) -> None:
+    spill = CameraSpill(tmp_path / "c", "c", segment_records=4, partition_sec=1)
+    for i in range(10):
+        assert spill.append((BASE_NS + i * 100_000_000, f"g{i % 2}", 0.5, float(i)))
+    # 0.0-0.9s は同一パーティション: 4 件毎に封止 -> 3 セグメント
+    assert len(spill.segment_paths()) == 3
+    # 次パーティション (1s 以降) は件数に関係なく新セグメント
+    assert spill.append((BASE_NS + SEC, "g0", 0.5, None))
+    assert len(spill.segment_paths()) == 4
+    # 時刻逆転は拒否
+    assert not spill.append((BASE_NS, "g0", 0.5, 1.0))
+    recs = list(spill.scan(BASE_NS + 250_000_000, BASE_NS + SEC + 1))
+    assert [r.latency_ms for r in recs] == [3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, None]
+    assert recs[-1].timestamp_utc == BASE + timedelta(seconds=1)
+    assert [r.latency_ms for r in spill.scan(upto=2)] == [0.0, 1.0]
+    labels = spill.scan(labels=frozenset({"g1"}), reverse=True)
+    assert [r.latency_ms for r in labels] == [9.0, 7.0, 5.0, 3.0, 1.0]
+    spill.close()
+    # 再起動相当: ディスクから履歴とラベル表を復元
+    store = SpillStore(tmp_path)
+    again = store.get("c")
+    assert again is not None and again.count == 11
+    assert [r.gesture_label for r in again.scan()][:3] == ["g0", "g1", "g0"]
+    assert store.get("missing") is None
+
+
+def test_retention_by_age_and_size(tmp_path: Path) -> None:
+    aged = CameraSpill(
+        tmp_path / "a", "a", segment_records=100, partition_sec=10, max_age_sec=25
+    )
+    for i in range(8):
+        aged.append((BASE_NS + i * 10 * SEC, "g", 0.5, 1.0))
+    # 最新 70s から 25s 以上古いパーティション (0-40s) のセグメントは削除
+    kept_sec = [(r.timestamp_utc - BASE).total_seconds() for r in aged.scan()]
+    assert kept_sec == [50, 60, 70]
+    sized = CameraSpill(tmp_path / "s", "s", segment_records=10, max_bytes=500)
+    for i in range(100):
+        sized.append((BASE_NS + i, "g", 0.5, 1.0))
+    assert sized.used_bytes <= 500
+    kept = list(sized.scan())
+    assert kept and kept[-1].timestamp_utc == utils_time.from_epoch_ns(BASE_NS + 99)
+    assert len(list((tmp_path / "s").glob("*.seg"))) == len(sized.segment_paths())
+
+
+@pytest.mark.parametrize("storage", ["object", "columnar"])
+def test_aggregator_query_spans_both_tiers(tmp_path: Path, storage: str) -> None:
+    spill = SpillStore(tmp_path, segment_records=8)
+    agg = Aggregator(capacity=5, storage=storage, spill=spill)
+    for i in range(40):
+        agg.push_result(_rec(i))
+    assert len(agg._buffers["c"]) == 5
+    full = agg.query("c")
+    assert [r.latency_ms for r in full] == [_rec(i).latency_ms for i in range(40)]
+    since = BASE + timedelta(milliseconds=300)
+    until = BASE + timedelta(milliseconds=370)
+    assert [r.timestamp_utc for r in agg.query("c", since, until)] == [
+        BASE + timedelta(milliseconds=10 * i) for i in range(30, 37)
+    ]
+    newest = agg.query("c", limit=7, reverse=True)
+    assert [r.timestamp_utc for r in newest] == [
+        BASE + timedelta(milliseconds=10 * i) for i in range(39, 32, -1)
+    ]
+    assert len(agg.query("c", labels=["g1"], min_confidence=0.75)) == len(
+        [i for i in range(40) if i % 3 == 1 and 0.5 + (i % 4) * 0.125 >= 0.75]
+    )
+    report = agg.export("bin", TimeRange(), tmp_path / "out")
+    assert report.records == 40
+    assert list(read_binary(tmp_path / "out" / "c.bin")) == full
+
+
+def test_late_record_older_than_spill_tier_is_counted(tmp_path: Path) -> None:
+    agg = Aggregator(capacity=2, spill=SpillStore(tmp_path))
+    for i in (10, 11, 12, 13):
+        agg.push_result(_rec(i))  # 10, 11 を退避
+    agg.push_result(_rec(5))  # リング最古より古く、退避先の最新 (11) より古い
+    assert agg.spill_dropped("c") == 1
+    agg.push_result(_rec(11))  # 退避先の最新と同時刻は追記できる
+    assert agg.spill_dropped("c") == 1
+    assert [r.timestamp_utc for r in agg.query("c")][:3] == [
+        BASE + timedelta(milliseconds=10 * i) for i in (10, 11, 11)
+    ]
+    assert agg.snapshot_stats(BASE + timedelta(seconds=1))["c"]["spill_dropped"] == 1
+    assert "spill_dropped" not in Aggregator(capacity=2).snapshot_stats()
+
+
+def test_concurrent_reader_sees_no_gap_or_duplicate(tmp_path: Path) -> None:
+    agg = Aggregator(
+        capacity=64, thread_safe=True, spill=SpillStore(tmp_path, segment_records=128)
+    )
+    total = 3000
+    stop = threading.Event()
+    errors: list[str] = []
+
+    def _reader() -> None:
+        while not stop.is_set():
+            got = [r.timestamp_utc for r in agg.query("c")]
+            expect = [BASE + timedelta(milliseconds=10 * i) for i in range(len(got))]
+            if got != expect:
+                errors.append(f"len={len(got)}")
+                return
+
+    readers = [threading.Thread(target=_reader) for _ in range(3)]
+    for t in readers:
+        t.start()
+    for i in range(total):
+        agg.push_result(_rec(i))
+    stop.set()
+    for t in readers:
+        t.join()
+    assert not errors
+    assert len(agg.query("c")) == total
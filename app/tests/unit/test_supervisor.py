@@ -0,0 +1,227 @@
+"""supervisor (worker プロセスの終了検出・再起動・上限) のテスト。"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import random
+import signal
+from datetime import datetime, timezone
+from threading import Event
+from time import monotonic, sleep
+from typing import List, Optional, Tuple
+
+import pytest
+
+from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
+from app.scripts.core.supervisor import (
+    ProcessSupervisor,
+    RestartBudget,
+    RestartPolicy,
+)
+
+_CTX = multiprocessing.get_context()
+
+
+def _exit_with(code: int) -> None:
+    raise SystemExit(code)
+
+
+def _exit_after(sec: float, code: int) -> None:
+    sleep(sec)
+    raise SystemExit(code)
+
+
+def _wait_until(cond, timeout: float = 10.0) -> bool:  # type: ignore[no-untyped-def]
+    deadline = monotonic() + timeout
+    while monotonic() < deadline:
+        if cond():
+            return True
+        sleep(0.005)
+    return cond()
+
+
+def test_budget_backoff_and_window() -> None:
+    policy = RestartPolicy(max_restarts=3, window_sec=10.0, jitter=0.0)
+    budget = RestartBudget(policy)
+    delays = [budget.next_delay("w", t) for t in (0.0, 1.0, 2.0, 3.0)]
+    assert delays == [0.5, 1.0, 2.0, None]
+    assert budget.next_delay("w", 10.5) == 2.0  # 0.0 の分が窓から外れた (窓内 2 回)
+    assert budget.next_delay("other", 3.0) == 0.5  # キー毎に独立
+    capped = RestartBudget(
+        RestartPolicy(max_restarts=10, backoff_max_sec=1.0, jitter=0.0)
+    )
+    assert max(capped.next_delay("w", float(t)) or 0 for t in range(10)) == 1.0
+    jittered = RestartBudget(RestartPolicy(jitter=0.2), random.Random(1))
+    delays = [jittered.next_delay(str(i), 0.0) for i in range(50)]
+    assert all(d is not None and 0.4 <= d <= 0.6 for d in delays)
+    assert len(set(delays)) > 1
+    with pytest.raises(ValueError):
+        RestartPolicy(backoff_base_sec=2.0, backoff_max_sec=1.0)
+
+
+def test_supervisor_detects_exit_and_gives_up_after_limit() -> None:
+    exits: List[Tuple[str, Optional[int], Optional[float], float]] = []
+    gave_up = Event()
+
+    def on_exit(key: str, code: Optional[int], delay: Optional[float]) -> None:
+        exits.append((key, code, delay, monotonic()))
+        if delay is None:
+            gave_up.set()
+
+    def respawn(key: str) -> multiprocessing.process.BaseProcess:
+        p = _CTX.Process(target=_exit_with, args=(3,), daemon=True)
+        p.start()
+        return p
+
+    policy = RestartPolicy(max_restarts=2, backoff_base_sec=0.05, jitter=0.0)
+    sup = ProcessSupervisor(policy, respawn, on_exit)
+    sup.start()
+    first = _CTX.Process(target=_exit_after, args=(0.2, 2), daemon=True)
+    first.start()
+    sup.watch("w", first)
+    ended = monotonic() + 0.2
+    assert gave_up.wait(10.0)
+    sup.stop()
+    assert [(k, c, d) for k, c, d, _ in exits] == [
+        ("w", 2, 0.05),
+        ("w", 3, 0.1),
+        ("w", 3, None),
+    ]
+    assert exits[0][3] - ended < 0.5  # sentinel で即時に検出 (ポーリング周期なし)
+    assert sup.restarts == 2
+
+
+def test_supervisor_does_not_restart_clean_exit() -> None:
+    exits: List[Tuple[str, Optional[int], Optional[float]]] = []
+    respawns: List[str] = []
+
+    def respawn(key: str) -> None:
+        respawns.append(key)
+
+    policy = RestartPolicy(max_restarts=3, backoff_base_sec=0.0, jitter=0.0)
+    sup = ProcessSupervisor(
+        policy,
+        respawn,
+        lambda k, c, d: exits.append((k, c, d)),
+        failover=lambda k: respawns.append(k),  # type: ignore[func-returns-value]
+        clean_exit=lambda k, c: c == 0 or k == "notified",
+    )
+    sup.start()
+    procs = {
+        "eos": _CTX.Process(target=_exit_with, args=(0,), daemon=True),
+        "notified": _CTX.Process(target=_exit_with, args=(5,), daemon=True),
+    }
+    for key, p in procs.items():
+        p.start()
+        sup.watch(key, p)
+    assert _wait_until(lambda: all(p.exitcode is not None for p in procs.values()))
+    sleep(0.2)  # 再起動されるならこの間に起きる (バックオフ 0)
+    sup.stop()
+    assert exits == [] and respawns == [] and sup.restarts == 0
+
+
+def test_orchestrator_respawns_killed_worker_then_marks_down() -> None:
+    cfg = OrchestratorConfig(
+        camera_ids=["rs1"],
+        use_process=True,
+        target_fps=20,
+        worker_latency_ms=0.0,
+        ping_interval_sec=0.1,
+        ping_timeout_sec=30.0,
+        max_restarts_per_camera=1,
+        restart_backoff_sec=0.05,
+    )
+    orch = Orchestrator(cfg)
+    orch.start()
+    try:
+        assert _wait_until(lambda: orch.aggregator.last_update_dt("rs1") is not None)
+        (proc,) = orch._worker_procs
+        killed_at = datetime.now(timezone.utc)
+        os.kill(proc.pid, signal.SIGKILL)
+        assert _wait_until(lambda: orch.health_state["rs1"]["restarts"] == 1)
+        assert _wait_until(lambda: "rs1" in orch.camera_status)
+        assert orch.camera_status["rs1"].status == "RETRYING"
+        last = orch.aggregator.last_update_dt
+        assert _wait_until(lambda: (last("rs1") or killed_at) > killed_at)
+        assert orch.active_process_count == 1
+        (proc,) = [p for p in orch._worker_procs if p.is_alive()]
+        os.kill(proc.pid, signal.SIGKILL)  # 2 回目は上限超過
+        assert _wait_until(lambda: orch.health_state["rs1"]["failed"])
+        sleep(0.2)
+        assert orch.active_process_count == 0 and orch.health_state["rs1"]["down"]
+        assert orch.camera_status["rs1"].last_error == "restart_limit"
+    finally:
+        orch.stop()
+
+
+def test_supervisor_fails_over_immediately_then_falls_back_to_respawn() -> None:
+    exits: List[Tuple[str, Optional[int], Optional[float]]] = []
+    spares = [_CTX.Process(target=_exit_with, args=(4,), daemon=True)]
+    respawned = Event()
+
+    def failover(key: str) -> Optional[multiprocessing.process.BaseProcess]:
+        if not spares:
+            return None
+        p = spares.pop()
+        p.start()
+        return p
+
+    def respawn(key: str) -> multiprocessing.process.BaseProcess:
+        respawned.set()
+        p = _CTX.Process(target=sleep, args=(5.0,), daemon=True)
+        p.start()
+        return p
+
+    policy = RestartPolicy(max_restarts=3, backoff_base_sec=0.05, jitter=0.0)
+    sup = ProcessSupervisor(
+        policy, respawn, lambda k, c, d: exits.append((k, c, d)), failover=failover
+    )
+    sup.start()
+    first = _CTX.Process(target=_exit_with, args=(3,), daemon=True)
+    first.start()
+    sup.watch("w", first)
+    assert respawned.wait(10.0)
+    sup.stop()
+    # 1 回目は待機プロセスへ遅延 0 で引継ぎ、予備が尽きた 2 回目はバックオフ後の respawn
+    assert exits == [("w", 3, 0.0), ("w", 4, 0.1)]
+    assert sup.restarts == 2
+
+
+def test_orchestrator_standby_worker_takes_over_killed_camera() -> None:
+    with pytest.raises(ValueError):
+        Orchestrator(OrchestratorConfig(["x"], use_process=True, standby_workers=1))
+    cfg = OrchestratorConfig(
+        camera_ids=["sb1"],
+        use_process=True,
+        target_fps=20,
+        worker_latency_ms=0.0,
+        ping_interval_sec=0.1,
+        ping_timeout_sec=30.0,
+        max_restarts_per_camera=3,
+        restart_backoff_sec=5.0,  # respawn 経路なら 5 秒かかる
+        standby_workers=1,
+    )
+    orch = Orchestrator(cfg)
+    orch.start()
+    try:
+        last = orch.aggregator.last_update_dt
+        assert _wait_until(lambda: last("sb1") is not None)
+        assert _wait_until(lambda: orch.standby_process_count == 1)
+        (proc,) = orch._worker_procs
+        spare = orch._standby[0].process
+        killed_at = datetime.now(timezone.utc)
+        os.kill(proc.pid, signal.SIGKILL)
+        assert _wait_until(lambda: (last("sb1") or killed_at) > killed_at, 3.0)
+        assert [p for p in orch._worker_procs if p.is_alive()] == [spare]
+        assert spare.name == "WProc-sb1"
+        assert orch.health_state["sb1"]["restarts"] == 1
+        assert _wait_until(lambda: orch.standby_process_count == 1)  # 補充済み
+        assert orch._standby[0].process is not spare
+    finally:
+        orch.stop()
+    assert not spare.is_alive() and orch.standby_process_count == 0
+    # stop 後の引継ぎは待機列に触れない (_standby_lock 内で closed を確認)
+    remaining = list(orch._standby)
+    assert orch._failover_to_standby("WProc-sb1") is None
+    assert orch._standby == remaining
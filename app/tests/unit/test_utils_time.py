@@ -31,3 +31,12 @@ def test_monotonic_ns_increasing() -> None:
 def test_perf_counter_ms_positive() -> None:
     v = ut.perf_counter_ms()
     assert v > 0.0
+
+
+def test_epoch_ns_roundtrip() -> None:
+    dt = datetime(2025, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+    ns = ut.to_epoch_ns(dt)
+    assert ns % 1000 == 0
+    assert ut.from_epoch_ns(ns) == dt
+    # naive は UTC 扱い
+    assert ut.to_epoch_ns(dt.replace(tzinfo=None)) == ns
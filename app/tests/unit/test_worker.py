@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import queue
 
-from app.scripts.core.messages import StatsMessage
+from app.scripts.core.messages import ResultBatch, StatsMessage
 from app.scripts.core.worker import CaptureInferenceWorker
 
 
@@ -45,3 +45,52 @@ def test_stats_message_latency_and_fps_nonzero() -> None:
     if stats.avg_latency_ms is not None:
         assert stats.avg_latency_ms >= 0.5  # 擬似1ms以上
     assert stats.fps >= 0.0
+
+
+def test_batches_flush_by_size_and_before_stats() -> None:
+    q: queue.Queue = queue.Queue()
+    worker = CaptureInferenceWorker(
+        "camB", q, target_fps=1000, simulate_latency_ms=0.0, batch_max_records=4
+    )
+    worker.run_loop(iterations=10)
+    items = list(q.queue)  # type: ignore[attr-defined]
+    assert [len(b) for b in items[:2]] == [4, 4]
+    assert all(isinstance(b, ResultBatch) for b in items[:2])
+    # 端数は保留 -> flush で送出 (レコード順は生成順)
+    worker.flush()
+    batches = list(q.queue)  # type: ignore[attr-defined]
+    labels = [r.gesture_label for b in batches for r in b.records]
+    assert len(labels) == 10 and labels[:3] == ["gesture_a", "gesture_b", "gesture_c"]
+
+
+def test_batch_flushes_before_deadline_at_low_fps() -> None:
+    q: queue.Queue = queue.Queue()
+    worker = CaptureInferenceWorker(
+        "camL",
+        q,
+        target_fps=20,
+        simulate_latency_ms=0.0,
+        batch_max_records=64,
+        batch_max_delay_ms=10.0,
+    )
+    # 50ms 間隔 > 10ms 期限のため次フレームを待たずに 1 件ずつ送出される
+    worker.run_loop(iterations=2)
+    assert [len(b) for b in list(q.queue)] == [1, 1]  # type: ignore[attr-defined]
+
+
+def test_batch_drop_counts_every_record() -> None:
+    class _AlwaysFull(queue.Queue):
+        def put_nowait(self, item: object) -> None:
+            raise queue.Full
+
+    worker = CaptureInferenceWorker(
+        "camF",
+        _AlwaysFull(),
+        target_fps=1000,
+        simulate_latency_ms=0.0,
+        batch_max_records=5,
+    )
+    worker.run_loop(iterations=10)
+    stats = worker.build_stats_message()
+    # 10 件生成, 5 件バッチ x2 が投入失敗 -> drop_rate = 10 / (10 + 10)
+    assert stats.drop_rate == 0.5
@@ -0,0 +1,78 @@
+"""worker_template (起動方式 / forkserver テンプレートの事前ロード) のテスト。"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+from time import monotonic, sleep
+
+import pytest
+
+from app.scripts.core import worker_template
+from app.scripts.core.inference import BACKEND_NUMPY_KEYPOINT
+from app.scripts.core.orchestrator import Orchestrator, OrchestratorConfig
+from app.scripts.core.process_worker_entry import (
+    _SharedBackendLoader,
+    open_worker_backend,
+)
+from app.scripts.core.worker_template import (
+    START_DEFAULT,
+    START_FORKSERVER,
+    TEMPLATE_BACKENDS_ENV,
+    preload_template_backends,
+    template_backend,
+    worker_context,
+)
+
+
+def test_worker_context_selects_start_method(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(TEMPLATE_BACKENDS_ENV, "")  # worker_context が書き換えた値を戻す
+    assert worker_context(START_DEFAULT) is multiprocessing.get_context()
+    ctx = worker_context(START_FORKSERVER, ("stub", BACKEND_NUMPY_KEYPOINT))
+    assert ctx.get_start_method() == "forkserver"
+    assert os.environ[TEMPLATE_BACKENDS_ENV] == BACKEND_NUMPY_KEYPOINT
+    with pytest.raises(ValueError):
+        worker_context("fork_template")
+    with pytest.raises(ValueError):
+        Orchestrator(OrchestratorConfig(camera_ids=["c"], worker_start_method="x"))
+
+
+def test_preloaded_backend_is_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(worker_template, "_preloaded", {})
+    monkeypatch.setenv(TEMPLATE_BACKENDS_ENV, f"{BACKEND_NUMPY_KEYPOINT},unknown,")
+    assert preload_template_backends() == [BACKEND_NUMPY_KEYPOINT]  # 未知名は無視
+    backend = template_backend(BACKEND_NUMPY_KEYPOINT)
+    assert backend is not None and backend.weight_bytes > 0
+    status: "queue.Queue[object]" = queue.Queue()
+    assert open_worker_backend("cam", BACKEND_NUMPY_KEYPOINT, status) == (True, backend)
+    shared = _SharedBackendLoader()
+    assert shared("cam", BACKEND_NUMPY_KEYPOINT, status) == (True, backend)
+    assert status.empty()
+
+
+def test_forkserver_workers_produce_results() -> None:
+    cfg = OrchestratorConfig(
+        camera_ids=["fs1", "fs2"],
+        use_process=True,
+        worker_start_method=START_FORKSERVER,
+        worker_latency_ms=0.0,
+        camera_sources={"fs1": "synthetic://32x32"},
+        inference_backend=BACKEND_NUMPY_KEYPOINT,
+        ping_interval_sec=0.1,
+        ping_timeout_sec=30.0,
+    )
+    orch = Orchestrator(cfg)
+    orch.start()
+    try:
+        deadline = monotonic() + 30.0
+        while monotonic() < deadline:
+            snap = orch.aggregator.snapshot_stats()
+            if all(c in snap for c in ("fs1", "fs2")):
+                break
+            sleep(0.1)
+        snap = orch.aggregator.snapshot_stats()
+        assert all(c in snap for c in ("fs1", "fs2"))
+    finally:
+        orch.stop()
+    assert {n.reason for n in orch.exit_notices.values()} == {"STOP"}